@@ -79,6 +79,21 @@ class Settings(BaseSettings):
         default=50,
         description="Maximum Neo4j connection pool size"
     )
+    neo4j_connection_acquisition_timeout: float = Field(
+        default=60.0,
+        description="Seconds to wait for a free connection from the Neo4j pool"
+    )
+    neo4j_fetch_size: int = Field(
+        default=1000,
+        description="Number of records fetched per batch from Neo4j query results"
+    )
+    neo4j_thread_pool_size: int = Field(
+        default=40,
+        description=(
+            "Worker threads running blocking endpoints and Neo4j calls off the event loop; "
+            "keep at or below neo4j_max_connection_pool_size"
+        )
+    )
 
     # File Storage Settings
     projects_directory: str = Field(
@@ -140,15 +155,43 @@ class Settings(BaseSettings):
         description="Prefer Redis over in-memory cache when available"
     )
 
+    # Search Index Settings
+    search_index_enabled: bool = Field(
+        default=True,
+        description="Keep in-memory search indexes updated as entities change"
+    )
+    search_index_snapshot_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for search index snapshots. If not set, indexes are rebuilt after a restart."
+    )
+
     # Memory Limit Settings for In-Memory Caches (Phase 12: Performance Optimization)
     # JobRunner memory limits
     job_runner_max_jobs: int = Field(
         default=1000,
-        description="Maximum number of jobs to store in memory"
+        description="Maximum number of jobs to store (in memory or in the Redis job queue)"
     )
     job_runner_max_results: int = Field(
         default=1000,
-        description="Maximum number of job results to store in memory"
+        description="Maximum number of job results to store (in memory or in the Redis job queue)"
+    )
+
+    # JobRunner queue shared through Redis
+    job_queue_prefer_redis: bool = Field(
+        default=False,
+        description="Share background jobs between workers and across restarts through Redis (requires redis_url)"
+    )
+    job_queue_prefix: str = Field(
+        default="basset:jobs:",
+        description="Key prefix of the Redis job queue"
+    )
+    job_queue_lease_seconds: float = Field(
+        default=60.0,
+        description="Seconds a claimed job stays leased to a worker without renewal before another worker may claim it"
+    )
+    job_queue_poll_interval: float = Field(
+        default=1.0,
+        description="Seconds between checks of the Redis job queue for jobs enqueued by other workers"
     )
 
     # ReportStorage memory limits
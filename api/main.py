@@ -12,6 +12,7 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Callable
 
+import anyio
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -26,6 +27,17 @@ from api.dependencies import (
     set_neo4j_handler,
     set_app_config,
 )
+from api.services.cache_service import RedisCache
+from api.services.job_queue import RedisJobQueue
+from api.services.job_runner import JobRunner, set_job_runner
+from api.services.neo4j_service import add_change_reporter, remove_change_reporter
+from api.services.query_cache import (
+    get_query_cache_service,
+    initialize_query_cache,
+    initialize_shared_query_cache,
+    reset_query_cache_service,
+)
+from api.services.search_service import get_search_service
 from neo4j_handler import Neo4jHandler
 from config_loader import load_config
 
@@ -47,6 +59,8 @@ async def lifespan(app: FastAPI):
     - Neo4j connection initialization
     - Configuration loading
     - Schema setup
+    - Query cache and search index setup
+    - Shared job queue setup
     - Graceful shutdown and resource cleanup
     """
     settings = get_settings()
@@ -56,13 +70,30 @@ async def lifespan(app: FastAPI):
     neo4j_handler = None
     try:
         logger.info(f"Connecting to Neo4j at {settings.neo4j_uri}...")
-        neo4j_handler = Neo4jHandler()
+        neo4j_handler = Neo4jHandler(
+            max_connection_pool_size=settings.neo4j_max_connection_pool_size,
+            connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
+            connection_timeout=settings.neo4j_connection_timeout,
+            fetch_size=settings.neo4j_fetch_size,
+        )
         set_neo4j_handler(neo4j_handler)
         logger.info("Neo4j connection established")
+
+        # Writes through the async service reach the handler's caches and listeners
+        add_change_reporter(neo4j_handler.report_change)
     except Exception as e:
         logger.error(f"Failed to connect to Neo4j: {e}")
         raise
 
+    # Sync endpoints and Neo4j calls run in this worker pool, never on the event loop
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.neo4j_thread_pool_size
+    if settings.neo4j_thread_pool_size > settings.neo4j_max_connection_pool_size:
+        logger.warning(
+            f"neo4j_thread_pool_size ({settings.neo4j_thread_pool_size}) exceeds "
+            f"neo4j_max_connection_pool_size ({settings.neo4j_max_connection_pool_size}); "
+            "workers may wait for Neo4j connections"
+        )
+
     # Load and setup configuration
     try:
         logger.info(f"Loading configuration from {settings.data_config_path}")
@@ -74,6 +105,48 @@ async def lifespan(app: FastAPI):
         logger.warning(f"Error loading configuration: {e}")
         set_app_config({"sections": []})
 
+    # Keep in-memory search indexes in sync with entity changes
+    search_service = None
+    if settings.search_index_enabled:
+        search_service = get_search_service(
+            neo4j_handler,
+            get_app_config(),
+            snapshot_dir=settings.search_index_snapshot_dir
+        )
+        search_service.enable_incremental_indexing()
+
+    # Cache expensive graph analytics; entity changes invalidate the project
+    if settings.cache_enabled:
+        if settings.redis_url and settings.cache_prefer_redis:
+            query_cache = await initialize_shared_query_cache(
+                settings.redis_url,
+                max_entries=settings.cache_max_memory_entries
+            )
+        else:
+            query_cache = initialize_query_cache(
+                max_entries=settings.cache_max_memory_entries
+            )
+        query_cache.enable_change_invalidation(neo4j_handler)
+
+    # Share background jobs with the other workers through Redis
+    job_queue = None
+    if settings.redis_url and settings.job_queue_prefer_redis:
+        job_queue = RedisJobQueue(
+            settings.redis_url,
+            prefix=settings.job_queue_prefix,
+            poll_interval=settings.job_queue_poll_interval,
+            max_jobs=settings.job_runner_max_jobs,
+            max_results=settings.job_runner_max_results
+        )
+        if job_queue.connect():
+            set_job_runner(JobRunner(
+                queue_backend=job_queue,
+                lease_seconds=settings.job_queue_lease_seconds
+            ))
+        else:
+            logger.warning("Redis job queue unavailable; jobs stay in this process")
+            job_queue = None
+
     # Ensure projects directory exists
     projects_dir = Path(settings.projects_directory)
     projects_dir.mkdir(parents=True, exist_ok=True)
@@ -86,9 +159,28 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application...")
 
+    # Persist search indexes so a restart does not rebuild them
+    if search_service:
+        saved = search_service.save_text_index_snapshots()
+        if saved:
+            logger.info(f"Saved {saved} search index snapshot(s)")
+
+    # Release the shared query cache connection
+    query_cache = get_query_cache_service()
+    if query_cache:
+        if isinstance(query_cache.backend, RedisCache):
+            await query_cache.backend.disconnect()
+        reset_query_cache_service()
+
+    # Release the shared job queue connection
+    if job_queue is not None:
+        job_queue.disconnect()
+        set_job_runner(None)
+
     # Close Neo4j connection
     if neo4j_handler:
         logger.info("Closing Neo4j connection...")
+        remove_change_reporter(neo4j_handler.report_change)
         neo4j_handler.close()
         set_neo4j_handler(None)
         logger.info("Neo4j connection closed")
@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..dependencies import get_neo4j_handler
+from ..services.query_cache import QueryType, cached_query
 
 
 router = APIRouter(
@@ -165,6 +166,8 @@ class ClustersResponse(BaseModel):
     isolated_count: int = Field(..., description="Number of isolated entities")
     connected_clusters: int = Field(..., description="Number of clusters with 2+ entities")
     total_entities: int = Field(..., description="Total entities in project")
+    offset: int = Field(default=0, description="Number of clusters skipped")
+    limit: Optional[int] = Field(default=None, description="Maximum clusters returned")
     clusters: list[ClusterInfo] = Field(default_factory=list, description="List of clusters")
 
 
@@ -185,7 +188,13 @@ class ErrorResponse(BaseModel):
         404: {"description": "Project or entity not found"},
     }
 )
-async def find_shortest_path(
+@cached_query(
+    QueryType.PATH_FINDING,
+    project_id_param="project_safe_name",
+    entity_id_params=["entity1", "entity2"],
+    exclude_params=["neo4j_handler"],
+)
+def find_shortest_path(
     project_safe_name: str,
     entity1: str,
     entity2: str,
@@ -252,7 +261,13 @@ async def find_shortest_path(
         404: {"description": "Project or entity not found"},
     }
 )
-async def find_all_paths(
+@cached_query(
+    QueryType.PATH_FINDING,
+    project_id_param="project_safe_name",
+    entity_id_params=["entity1", "entity2"],
+    exclude_params=["neo4j_handler"],
+)
+def find_all_paths(
     project_safe_name: str,
     entity1: str,
     entity2: str,
@@ -314,7 +329,13 @@ async def find_all_paths(
         404: {"description": "Project or entity not found"},
     }
 )
-async def get_entity_centrality(
+@cached_query(
+    QueryType.INFLUENCE_METRICS,
+    project_id_param="project_safe_name",
+    entity_id_params=["entity_id"],
+    exclude_params=["neo4j_handler"],
+)
+def get_entity_centrality(
     project_safe_name: str,
     entity_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -366,7 +387,12 @@ async def get_entity_centrality(
         404: {"description": "Project not found"},
     }
 )
-async def get_most_connected(
+@cached_query(
+    QueryType.INFLUENCE_METRICS,
+    project_id_param="project_safe_name",
+    exclude_params=["neo4j_handler"],
+)
+def get_most_connected(
     project_safe_name: str,
     limit: int = Query(default=10, ge=1, le=100, description="Maximum number of entities to return"),
     neo4j_handler=Depends(get_neo4j_handler)
@@ -409,7 +435,13 @@ async def get_most_connected(
         404: {"description": "Project or entity not found"},
     }
 )
-async def get_entity_neighborhood(
+@cached_query(
+    QueryType.ENTITY_NEIGHBORHOOD,
+    project_id_param="project_safe_name",
+    entity_id_params=["entity_id"],
+    exclude_params=["neo4j_handler"],
+)
+def get_entity_neighborhood(
     project_safe_name: str,
     entity_id: str,
     depth: int = Query(default=2, ge=1, le=5, description="Maximum number of hops"),
@@ -463,12 +495,30 @@ async def get_entity_neighborhood(
         404: {"description": "Project not found"},
     }
 )
-async def get_clusters(
+@cached_query(
+    QueryType.COMMUNITY_DETECTION,
+    project_id_param="project_safe_name",
+    exclude_params=["neo4j_handler"],
+)
+def get_clusters(
     project_safe_name: str,
     include_isolated: bool = Query(
         default=True,
         description="Include isolated entities as single-entity clusters"
     ),
+    include_entities: bool = Query(
+        default=True,
+        description="Attach full entity data to each returned cluster"
+    ),
+    offset: int = Query(default=0, ge=0, description="Number of clusters to skip"),
+    limit: Optional[int] = Query(
+        default=None, ge=1, le=1000,
+        description="Maximum number of clusters to return (largest first)"
+    ),
+    member_limit: Optional[int] = Query(
+        default=None, ge=1, le=10000,
+        description="Maximum entities to include per cluster"
+    ),
     neo4j_handler=Depends(get_neo4j_handler)
 ):
     """
@@ -480,6 +530,9 @@ async def get_clusters(
 
     - **project_safe_name**: The URL-safe identifier for the project
     - **include_isolated**: Whether to include isolated entities (default: True)
+    - **include_entities**: Whether to include full entity data (default: True)
+    - **offset** / **limit**: Page through clusters, largest first
+    - **member_limit**: Cap the entity data loaded per cluster
     """
     # Verify project exists
     project = neo4j_handler.get_project(project_safe_name)
@@ -490,12 +543,19 @@ async def get_clusters(
         )
 
     try:
-        result = neo4j_handler.find_clusters(project_safe_name)
+        result = neo4j_handler.find_clusters(
+            project_safe_name,
+            include_entities=include_entities,
+            include_isolated=include_isolated,
+            offset=offset,
+            limit=limit,
+            member_limit=member_limit,
+        )
 
         if not include_isolated:
             # Filter out isolated entities
             result["clusters"] = [c for c in result["clusters"] if not c["is_isolated"]]
-            result["cluster_count"] = len(result["clusters"])
+            result["cluster_count"] = result.get("connected_clusters", len(result["clusters"]))
 
         return result
 
@@ -289,7 +289,7 @@ def get_linker_with_handler(neo4j_handler) -> AutoLinker:
         404: {"description": "Project not found"},
     }
 )
-async def find_project_duplicates(
+def find_project_duplicates(
     project_safe_name: str,
     min_confidence: float = Query(
         5.0,
@@ -351,7 +351,7 @@ async def find_project_duplicates(
         404: {"description": "Project or entity not found"},
     }
 )
-async def find_entity_duplicates(
+def find_entity_duplicates(
     project_safe_name: str,
     entity_id: str,
     min_confidence: float = Query(
@@ -410,7 +410,7 @@ async def find_entity_duplicates(
         404: {"description": "Project or entity not found"},
     }
 )
-async def get_suggested_links(
+def get_suggested_links(
     project_safe_name: str,
     entity_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -456,7 +456,7 @@ async def get_suggested_links(
         404: {"description": "Project or entity not found"},
     }
 )
-async def merge_entities(
+def merge_entities(
     project_safe_name: str,
     merge_request: MergeRequest,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -538,7 +538,7 @@ async def merge_entities(
         404: {"description": "Project not found"},
     }
 )
-async def scan_project_for_links(
+def scan_project_for_links(
     project_safe_name: str,
     create_links: bool = Query(
         False,
@@ -585,6 +585,49 @@ async def scan_project_for_links(
         )
 
 
+@router.post(
+    "/identifier-keys/rebuild",
+    summary="Rebuild identifier keys",
+    description="Rebuild the indexed identifier keys used for link suggestions.",
+    responses={
+        200: {"description": "Identifier keys rebuilt successfully"},
+        404: {"description": "Project not found"},
+    }
+)
+def rebuild_identifier_keys(
+    project_safe_name: str,
+    neo4j_handler=Depends(get_neo4j_handler)
+):
+    """
+    Rebuild the identifier key layer for a project.
+
+    Required once for projects created before identifier keys were
+    maintained, and after identifier fields change in the schema.
+
+    - **project_safe_name**: The URL-safe identifier for the project
+    """
+    # Verify project exists
+    project = neo4j_handler.get_project(project_safe_name)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project '{project_safe_name}' not found"
+        )
+
+    try:
+        keys_linked = neo4j_handler.rebuild_identifier_keys(project_safe_name)
+        return {
+            "project_id": project_safe_name,
+            "identifier_keys": keys_linked
+        }
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to rebuild identifier keys: {str(e)}"
+        )
+
+
 @router.get(
     "/identifier-fields",
     response_model=List[IdentifierFieldInfo],
@@ -594,7 +637,7 @@ async def scan_project_for_links(
         200: {"description": "Identifier fields retrieved successfully"},
     }
 )
-async def get_identifier_fields(
+def get_identifier_fields(
     project_safe_name: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -637,7 +680,7 @@ async def get_identifier_fields(
         503: {"description": "Fuzzy matching not available"},
     }
 )
-async def find_fuzzy_matches(
+def find_fuzzy_matches(
     project_safe_name: str,
     entity_id: str,
     threshold: float = Query(
@@ -749,7 +792,7 @@ async def find_fuzzy_matches(
         404: {"description": "Project not found"},
     }
 )
-async def get_fuzzy_config(
+def get_fuzzy_config(
     project_safe_name: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -97,6 +97,10 @@ class BulkImportResultResponse(BaseModel):
         default_factory=list,
         description="List of IDs for successfully created/updated entities"
     )
+    batches: List[dict] = Field(
+        default_factory=list,
+        description="Per-batch sizes, outcomes and timings (duration_ms, entities_per_second)"
+    )
 
 
 class CSVImportRequest(BaseModel):
@@ -189,7 +193,7 @@ class CSVExportRequest(BaseModel):
         404: {"description": "Project not found"},
     }
 )
-async def bulk_import_entities(
+def bulk_import_entities(
     project_safe_name: str,
     request: BulkImportRequest,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -228,7 +232,8 @@ async def bulk_import_entities(
             successful=result.successful,
             failed=result.failed,
             errors=result.errors,
-            created_ids=result.created_ids
+            created_ids=result.created_ids,
+            batches=result.batches
         )
 
     except HTTPException:
@@ -251,7 +256,7 @@ async def bulk_import_entities(
         404: {"description": "Project not found"},
     }
 )
-async def bulk_import_csv(
+def bulk_import_csv(
     project_safe_name: str,
     request: CSVImportRequest,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -302,7 +307,8 @@ async def bulk_import_csv(
             successful=result.successful,
             failed=result.failed,
             errors=result.errors,
-            created_ids=result.created_ids
+            created_ids=result.created_ids,
+            batches=result.batches
         )
 
     except HTTPException:
@@ -331,7 +337,7 @@ async def bulk_import_csv(
         404: {"description": "Project not found"},
     }
 )
-async def bulk_export_entities(
+def bulk_export_entities(
     project_safe_name: str,
     format: str = Query(
         "json",
@@ -428,7 +434,7 @@ async def bulk_export_entities(
         404: {"description": "Project not found"},
     }
 )
-async def export_entities_to_csv(
+def export_entities_to_csv(
     project_safe_name: str,
     request: CSVExportRequest,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -477,7 +483,7 @@ async def export_entities_to_csv(
         400: {"description": "Invalid request data"},
     }
 )
-async def validate_import_data(
+def validate_import_data(
     project_safe_name: str,
     request: ValidationRequest,
     neo4j_handler=Depends(get_neo4j_handler)
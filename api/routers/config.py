@@ -111,7 +111,7 @@ async def get_enhanced_config():
 
 
 @router.put("/", response_model=ConfigResponse)
-async def update_config(
+def update_config(
     config: DataConfig,
     neo4j: Neo4jDep
 ):
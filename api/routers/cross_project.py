@@ -9,6 +9,7 @@ for investigations that span multiple projects.
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, ConfigDict
 
 from ..dependencies import get_neo4j_handler
@@ -363,7 +364,7 @@ async def find_potential_matches(
     ranked by confidence.
     """
     # Verify entity exists
-    entity = await neo4j_handler.get_person(project_id, entity_id)
+    entity = await run_in_threadpool(neo4j_handler.get_person, project_id, entity_id)
     if not entity:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -435,7 +436,7 @@ async def get_entity_cross_project_links(
     and incoming links (where this entity is the target).
     """
     # Verify entity exists
-    entity = await neo4j_handler.get_person(project_id, entity_id)
+    entity = await run_in_threadpool(neo4j_handler.get_person, project_id, entity_id)
     if not entity:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -488,7 +489,7 @@ async def get_all_linked_entities(
     link metadata.
     """
     # Verify entity exists
-    entity = await neo4j_handler.get_person(project_id, entity_id)
+    entity = await run_in_threadpool(neo4j_handler.get_person, project_id, entity_id)
     if not entity:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -117,6 +117,8 @@ class FindAllDuplicatesResponse(BaseModel):
     duplicate_groups: Dict[str, List[DuplicateCandidateResponse]]
     total_groups: int
     total_duplicates: int
+    pairs_considered: int = 0
+    pairs_pruned: int = 0
 
 
 class PreviewMergeRequest(BaseModel):
@@ -210,6 +212,8 @@ class DeduplicationReportResponse(BaseModel):
     low_confidence_matches: int
     top_duplicate_fields: Dict[str, int]
     estimated_reduction: float
+    pairs_considered: int = 0
+    pairs_pruned: int = 0
     generated_at: str
 
 
@@ -339,7 +343,7 @@ async def find_all_duplicates(
     """Find all duplicates in a set of entities."""
     match_types = parse_match_types(request.match_types)
 
-    all_duplicates = await service.find_all_duplicates(
+    all_duplicates, blocking_stats = await service.find_all_duplicates_with_stats(
         project_id=request.project_id,
         entities=request.entities,
         match_types=match_types,
@@ -357,6 +361,8 @@ async def find_all_duplicates(
         duplicate_groups=duplicate_groups,
         total_groups=len(duplicate_groups),
         total_duplicates=total_duplicates,
+        pairs_considered=blocking_stats.pairs_considered,
+        pairs_pruned=blocking_stats.pairs_pruned,
     )
 
 
@@ -603,7 +609,7 @@ async def scan_project(
     """Scan all entities in a project for duplicates."""
     parsed_match_types = parse_match_types(match_types)
 
-    all_duplicates = await service.find_all_duplicates(
+    all_duplicates, blocking_stats = await service.find_all_duplicates_with_stats(
         project_id=project_id,
         entities=entities,
         match_types=parsed_match_types,
@@ -620,4 +626,6 @@ async def scan_project(
         duplicate_groups=duplicate_groups,
         total_groups=len(duplicate_groups),
         total_duplicates=total_duplicates,
+        pairs_considered=blocking_stats.pairs_considered,
+        pairs_pruned=blocking_stats.pairs_pruned,
     )
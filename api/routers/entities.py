@@ -14,7 +14,8 @@ from typing import Optional, Any
 from datetime import datetime
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -115,6 +116,16 @@ class EntityListResponse(BaseModel):
     count: int = Field(0, description="Total number of entities")
 
 
+class EntityPageResponse(BaseModel):
+    """Schema for one page of entities from cursor pagination."""
+    entities: list[EntityResponse] = Field(default_factory=list)
+    count: int = Field(0, description="Number of entities in this page")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor for the next page; null on the last page"
+    )
+
+
 class SuccessResponse(BaseModel):
     """Generic success response."""
     success: bool = True
@@ -136,6 +147,13 @@ def generate_file_id() -> str:
     return hashlib.sha256(os.urandom(32)).hexdigest()[:12]
 
 
+def parse_projection(value: Optional[str]) -> Optional[list[str]]:
+    """Split a comma-separated projection parameter; None means no restriction."""
+    if value is None:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
 # ----- Endpoints -----
 
 @router.get(
@@ -148,17 +166,28 @@ def generate_file_id() -> str:
         404: {"description": "Project not found"},
     }
 )
-async def list_entities(
+def list_entities(
     project_safe_name: str,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated section.field IDs to include (e.g. core.name,core.email)"
+    ),
+    sections: Optional[str] = Query(
+        None,
+        description="Comma-separated section IDs to include in full (e.g. core,social)"
+    ),
     neo4j_handler=Depends(get_neo4j_handler)
 ):
     """
     List all entities in a project.
 
     Returns all people/entities associated with the specified project
-    including their complete profile data.
+    including their complete profile data, or only the requested fields
+    and sections when a projection is given.
 
     - **project_safe_name**: The URL-safe identifier for the project
+    - **fields**: Optional section.field IDs to load
+    - **sections**: Optional section IDs to load
     """
     # Verify project exists
     project = neo4j_handler.get_project(project_safe_name)
@@ -169,7 +198,11 @@ async def list_entities(
         )
 
     try:
-        people = neo4j_handler.get_all_people(project_safe_name)
+        people = neo4j_handler.get_all_people(
+            project_safe_name,
+            fields=parse_projection(fields),
+            sections=parse_projection(sections),
+        )
         return people if people else []
     except Exception as e:
         raise HTTPException(
@@ -178,6 +211,74 @@ async def list_entities(
         )
 
 
+@router.get(
+    "/page",
+    response_model=EntityPageResponse,
+    summary="List entities page by page",
+    description="Retrieve entities of a project with cursor-based pagination, newest first.",
+    responses={
+        200: {"description": "Page of entities retrieved successfully"},
+        400: {"description": "Invalid cursor"},
+        404: {"description": "Project not found"},
+    }
+)
+def list_entities_page(
+    project_safe_name: str,
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor returned as next_cursor by the previous page"
+    ),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum entities per page"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated section.field IDs to include (e.g. core.name,core.email)"
+    ),
+    sections: Optional[str] = Query(
+        None,
+        description="Comma-separated section IDs to include in full (e.g. core,social)"
+    ),
+    neo4j_handler=Depends(get_neo4j_handler)
+):
+    """
+    List entities in a project one page at a time.
+
+    Pages are ordered newest first and continue after the last entity of
+    the previous page, so deep pages are as fast as the first and are not
+    shifted by entities created or deleted in between.
+
+    - **project_safe_name**: The URL-safe identifier for the project
+    - **cursor**: next_cursor of the previous page (omit for the first page)
+    - **limit**: Maximum entities per page (1-1000, default: 100)
+    - **fields**: Optional section.field IDs to load
+    - **sections**: Optional section IDs to load
+    """
+    # Verify project exists
+    project = neo4j_handler.get_project(project_safe_name)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project '{project_safe_name}' not found"
+        )
+
+    try:
+        people, next_cursor = neo4j_handler.get_people_page(
+            project_safe_name,
+            cursor=cursor,
+            limit=limit,
+            fields=parse_projection(fields),
+            sections=parse_projection(sections),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve entities: {str(e)}"
+        )
+
+    return EntityPageResponse(entities=people, count=len(people), next_cursor=next_cursor)
+
+
 @router.post(
     "/",
     response_model=EntityResponse,
@@ -190,7 +291,7 @@ async def list_entities(
         404: {"description": "Project not found"},
     }
 )
-async def create_entity(
+def create_entity(
     project_safe_name: str,
     entity_data: EntityCreate,
     neo4j_handler=Depends(get_neo4j_handler),
@@ -263,20 +364,36 @@ async def create_entity(
         404: {"description": "Entity or project not found"},
     }
 )
-async def get_entity(
+def get_entity(
     project_safe_name: str,
     entity_id: str,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated section.field IDs to include (e.g. core.name,core.email)"
+    ),
+    sections: Optional[str] = Query(
+        None,
+        description="Comma-separated section IDs to include in full (e.g. core,social)"
+    ),
     neo4j_handler=Depends(get_neo4j_handler)
 ):
     """
     Get an entity by ID.
 
-    Returns the complete entity data including all profile information.
+    Returns the complete entity data including all profile information,
+    or only the requested fields and sections when a projection is given.
 
     - **project_safe_name**: The URL-safe identifier for the project
     - **entity_id**: The unique identifier for the entity
+    - **fields**: Optional section.field IDs to load
+    - **sections**: Optional section IDs to load
     """
-    person = neo4j_handler.get_person(project_safe_name, entity_id)
+    person = neo4j_handler.get_person(
+        project_safe_name,
+        entity_id,
+        fields=parse_projection(fields),
+        sections=parse_projection(sections),
+    )
 
     if not person:
         raise HTTPException(
@@ -298,7 +415,7 @@ async def get_entity(
         404: {"description": "Entity or project not found"},
     }
 )
-async def update_entity(
+def update_entity(
     project_safe_name: str,
     entity_id: str,
     entity_data: EntityUpdate,
@@ -359,7 +476,7 @@ async def update_entity(
         404: {"description": "Entity or project not found"},
     }
 )
-async def delete_entity(
+def delete_entity(
     project_safe_name: str,
     entity_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -413,14 +530,14 @@ async def export_entity(
     - **Request body**: Optional markdown content for the profile report
     """
     # Get project to verify and get project_id
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project '{project_safe_name}' not found"
         )
 
-    person = neo4j_handler.get_person(project_safe_name, entity_id)
+    person = await run_in_threadpool(neo4j_handler.get_person, project_safe_name, entity_id)
     if not person:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -484,7 +601,7 @@ async def export_entity(
         404: {"description": "Entity or project not found"},
     }
 )
-async def explore_entity_files(
+def explore_entity_files(
     project_safe_name: str,
     entity_id: str,
     path: str = "/",
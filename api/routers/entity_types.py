@@ -160,7 +160,7 @@ class FieldsResponse(BaseModel):
         }
     }
 )
-async def list_entity_types(
+def list_entity_types(
     neo4j=Depends(get_neo4j_handler),
     include_fields: bool = Query(
         False,
@@ -237,7 +237,7 @@ async def list_entity_types(
         404: {"description": "Entity type not found"}
     }
 )
-async def get_entity_type(
+def get_entity_type(
     entity_type: str,
     neo4j=Depends(get_neo4j_handler)
 ):
@@ -308,7 +308,7 @@ async def get_entity_type(
         404: {"description": "Entity type not found"}
     }
 )
-async def get_entity_type_icon(
+def get_entity_type_icon(
     entity_type: str,
     neo4j=Depends(get_neo4j_handler)
 ):
@@ -376,7 +376,7 @@ async def get_entity_type_icon(
         404: {"description": "Entity type not found"}
     }
 )
-async def get_entity_type_color(
+def get_entity_type_color(
     entity_type: str,
     neo4j=Depends(get_neo4j_handler)
 ):
@@ -454,7 +454,7 @@ async def get_entity_type_color(
         404: {"description": "Entity type not found"}
     }
 )
-async def get_entity_type_fields(
+def get_entity_type_fields(
     entity_type: str,
     neo4j=Depends(get_neo4j_handler),
     required_only: bool = Query(
@@ -540,7 +540,7 @@ async def get_entity_type_fields(
         404: {"description": "Entity type not found"}
     }
 )
-async def get_cross_type_relationships(
+def get_cross_type_relationships(
     source_type: str,
     target_type: str,
     neo4j=Depends(get_neo4j_handler)
@@ -632,7 +632,7 @@ async def get_cross_type_relationships(
         404: {"description": "Entity type not found"}
     }
 )
-async def validate_entity(
+def validate_entity(
     entity_type: str,
     request: EntityValidationRequest,
     neo4j=Depends(get_neo4j_handler)
@@ -715,7 +715,7 @@ async def validate_entity(
         }
     }
 )
-async def get_project_entity_type_stats(
+def get_project_entity_type_stats(
     project_safe_name: str,
     neo4j=Depends(get_neo4j_handler)
 ):
@@ -229,7 +229,7 @@ def _get_file_extension(format: ReportFormat) -> str:
         404: {"description": "Project not found"},
     }
 )
-async def generate_report(
+def generate_report(
     project_safe_name: str,
     request: GenerateReportRequest,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -334,7 +334,7 @@ async def generate_report(
         404: {"description": "Project not found"},
     }
 )
-async def generate_project_summary(
+def generate_project_summary(
     project_safe_name: str,
     format: str,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -408,7 +408,7 @@ entity_export_router = APIRouter(
         404: {"description": "Entity not found"},
     }
 )
-async def export_entity(
+def export_entity(
     project_safe_name: str,
     entity_id: str,
     format: str,
@@ -12,6 +12,7 @@ from typing import Optional
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -188,7 +189,7 @@ async def upload_files(
     - **path**: Target directory path (must be within 'files' folder)
     """
     # Get project for project_id
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -196,7 +197,7 @@ async def upload_files(
         )
 
     # Verify entity exists
-    person = neo4j_handler.get_person(project_safe_name, entity_id)
+    person = await run_in_threadpool(neo4j_handler.get_person, project_safe_name, entity_id)
     if not person:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -262,7 +263,7 @@ async def upload_files(
         404: {"description": "Entity or project not found"},
     }
 )
-async def list_entity_files(
+def list_entity_files(
     project_safe_name: str,
     entity_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -346,7 +347,7 @@ async def list_entity_files(
         404: {"description": "File not found"},
     }
 )
-async def download_file(
+def download_file(
     project_safe_name: str,
     entity_id: str,
     filename: str,
@@ -424,7 +425,7 @@ async def download_file(
         404: {"description": "File not found"},
     }
 )
-async def delete_file(
+def delete_file(
     project_safe_name: str,
     entity_id: str,
     file_id: str,
@@ -495,7 +496,7 @@ file_serve_router = APIRouter(
         404: {"description": "File not found"},
     }
 )
-async def serve_entity_file(
+def serve_entity_file(
     project_id: str,
     person_id: str,
     filename: str,
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse
 from fastapi.templating import Jinja2Templates
 
@@ -91,7 +92,7 @@ async def osint_page(request: Request):
 
 
 @router.get("/dashboard", response_class=HTMLResponse, name="dashboard")
-async def dashboard(
+def dashboard(
     request: Request,
     neo4j_handler: Neo4jHandler = Depends(get_neo4j_handler),
     config: dict = Depends(get_app_config),
@@ -151,7 +152,7 @@ async def new_project(
 
     try:
         # Create project in Neo4j
-        project = neo4j_handler.create_project(project_name, project_safe_name)
+        project = await run_in_threadpool(neo4j_handler.create_project, project_name, project_safe_name)
 
         if not project:
             return {"success": False, "error": "Failed to create project"}
@@ -180,7 +181,7 @@ async def new_project(
 
 
 @router.get("/get_projects")
-async def get_projects(
+def get_projects(
     neo4j_handler: Neo4jHandler = Depends(get_neo4j_handler),
 ):
     """
@@ -215,7 +216,7 @@ async def set_current_project_route(
     if not safe_name:
         return {"success": False, "error": "No project specified"}
 
-    project = neo4j_handler.get_project(safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -277,7 +278,7 @@ async def save_config(
     set_app_config(config_data)
 
     # Update Neo4j schema
-    neo4j_handler.setup_schema_from_config(config_data)
+    await run_in_threadpool(neo4j_handler.setup_schema_from_config, config_data)
 
     return {"success": True}
 
@@ -287,7 +288,7 @@ async def save_config(
 # =============================================================================
 
 @router.get("/download_project")
-async def download_project(
+def download_project(
     neo4j_handler: Neo4jHandler = Depends(get_neo4j_handler),
 ):
     """
@@ -340,7 +341,8 @@ async def tag_person(
         return {"success": False, "error": "Invalid request data"}
 
     try:
-        updated_person = neo4j_handler.update_person(
+        updated_person = await run_in_threadpool(
+            neo4j_handler.update_person,
             project_ctx["safe_name"],
             person_id,
             {
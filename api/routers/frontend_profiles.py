@@ -29,6 +29,7 @@ from typing import Optional
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse, FileResponse
 from fastapi.templating import Jinja2Templates
 
@@ -55,7 +56,7 @@ def is_image_file(filename: str) -> bool:
 # =============================================================================
 
 @router.get("/get_people")
-async def get_people(
+def get_people(
     neo4j_handler: Neo4jHandler = Depends(get_neo4j_handler),
 ):
     """
@@ -71,7 +72,7 @@ async def get_people(
 
 
 @router.get("/get_person/{person_id}")
-async def get_person(
+def get_person(
     person_id: str,
     neo4j_handler: Neo4jHandler = Depends(get_neo4j_handler),
 ):
@@ -183,7 +184,7 @@ async def add_person(
                     person_data["profile"][section_id][field_id] = field_data
 
     # Create person in Neo4j
-    person = neo4j_handler.create_person(project_ctx["safe_name"], person_data)
+    person = await run_in_threadpool(neo4j_handler.create_person, project_ctx["safe_name"], person_data)
 
     if not person:
         return RedirectResponse(url="/dashboard", status_code=302)
@@ -271,7 +272,7 @@ async def update_person(
         raise HTTPException(status_code=404, detail="No project safe name")
 
     # Get existing person
-    person = neo4j_handler.get_person(project_ctx["safe_name"], person_id)
+    person = await run_in_threadpool(neo4j_handler.get_person, project_ctx["safe_name"], person_id)
     if not person:
         raise HTTPException(status_code=404, detail="Person not found")
 
@@ -279,7 +280,12 @@ async def update_person(
     content_type = request.headers.get("content-type", "")
     if "application/json" in content_type:
         updated_data = await request.json()
-        updated_person = neo4j_handler.update_person(project_ctx["safe_name"], person_id, updated_data)
+        updated_person = await run_in_threadpool(
+            neo4j_handler.update_person,
+            project_ctx["safe_name"],
+            person_id,
+            updated_data
+        )
         return {"success": bool(updated_person)}
 
     # Handle form submission
@@ -354,7 +360,12 @@ async def update_person(
                     updated_data["profile"][section_id][field_id] = field_data
 
     # Update person in Neo4j
-    updated_person = neo4j_handler.update_person(project_ctx["safe_name"], person_id, updated_data)
+    updated_person = await run_in_threadpool(
+        neo4j_handler.update_person,
+        project_ctx["safe_name"],
+        person_id,
+        updated_data
+    )
 
     if not updated_person:
         return {"success": False}
@@ -363,7 +374,7 @@ async def update_person(
 
 
 @router.post("/delete_person/{person_id}")
-async def delete_person(
+def delete_person(
     person_id: str,
     request: Request,
     neo4j_handler: Neo4jHandler = Depends(get_neo4j_handler),
@@ -407,7 +418,7 @@ async def zip_user_files(
     body = await request.body()
     markdown_content = body.decode('utf-8')
 
-    person = neo4j_handler.get_person(project_ctx["safe_name"], person_id)
+    person = await run_in_threadpool(neo4j_handler.get_person, project_ctx["safe_name"], person_id)
     if not person:
         raise HTTPException(status_code=404, detail="Person not found")
 
@@ -19,6 +19,7 @@ from pathlib import Path
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 
 from api.dependencies import get_neo4j_handler
@@ -133,7 +134,8 @@ async def create_report(
 
     # Register report in Neo4j
     try:
-        neo4j_handler.add_report_to_person(
+        await run_in_threadpool(
+            neo4j_handler.add_report_to_person,
             project_ctx["safe_name"],
             person_id,
             {
@@ -188,7 +190,7 @@ async def update_report(
 
 
 @router.delete("/person/{person_id}/reports/{report_name}")
-async def delete_report(
+def delete_report(
     person_id: str,
     report_name: str,
     neo4j_handler: Neo4jHandler = Depends(get_neo4j_handler),
@@ -172,7 +172,7 @@ def _format_graph_response(graph_data: dict[str, Any], format_type: str) -> dict
         }
     }
 )
-async def get_project_graph(
+def get_project_graph(
     project_safe_name: str,
     neo4j=Depends(get_neo4j_handler),
     format: Literal["d3", "vis", "cytoscape", "raw"] = Query(
@@ -227,7 +227,7 @@ async def get_project_graph(
         404: {"description": "Entity not found"}
     }
 )
-async def get_entity_subgraph(
+def get_entity_subgraph(
     project_safe_name: str,
     entity_id: str,
     neo4j=Depends(get_neo4j_handler),
@@ -295,7 +295,7 @@ async def get_entity_subgraph(
         404: {"description": "Cluster not found"}
     }
 )
-async def get_cluster_graph(
+def get_cluster_graph(
     project_safe_name: str,
     cluster_id: str,
     neo4j=Depends(get_neo4j_handler),
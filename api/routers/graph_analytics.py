@@ -8,6 +8,7 @@ Provides REST API endpoints for advanced graph analytics including:
 - Temporal relationship patterns
 """
 
+import heapq
 from typing import Optional, Any, Literal
 from enum import Enum
 
@@ -15,6 +16,9 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..dependencies import get_neo4j_handler
+from ..services.community_engine import get_project_communities
+from ..services.influence_engine import get_metric_scores
+from ..services.query_cache import QueryType, cached_query
 
 
 # =============================================================================
@@ -46,6 +50,14 @@ class InfluenceMetric(str, Enum):
     DEGREE = "degree"
 
 
+# Metric that ranks /key-entities for each analysis type
+KEY_ENTITY_METRICS = {
+    "structural": InfluenceMetric.PAGERANK,
+    "hub": InfluenceMetric.DEGREE,
+    "bridge": InfluenceMetric.BETWEENNESS,
+}
+
+
 class TemporalPatternType(str, Enum):
     """Types of temporal patterns to detect."""
     BURST = "burst"
@@ -598,6 +610,21 @@ def _verify_entity(neo4j_handler, project_safe_name: str, entity_id: str):
     return entity
 
 
+def _community_partition(neo4j_handler, project_safe_name: str,
+                         algorithm: CommunityAlgorithm, resolution: float):
+    """Get the cached community partition of a project."""
+    if algorithm == CommunityAlgorithm.GIRVAN_NEWMAN:
+        algorithm = CommunityAlgorithm.LOUVAIN
+    return get_project_communities(neo4j_handler, project_safe_name, algorithm.value, resolution)
+
+
+def _get_entities(neo4j_handler, project_safe_name: str, entity_ids: list[str]) -> dict[str, dict]:
+    """Fetch the core section of the given entities in one query."""
+    if not entity_ids:
+        return {}
+    return neo4j_handler.get_people_batch(project_safe_name, entity_ids, sections=["core"]) or {}
+
+
 def _get_entity_label(entity: dict) -> str:
     """Extract a display label from an entity."""
     profile = entity.get("profile", {})
@@ -636,7 +663,12 @@ def _get_entity_label(entity: dict) -> str:
         404: {"description": "Project not found"},
     }
 )
-async def detect_communities(
+@cached_query(
+    QueryType.COMMUNITY_DETECTION,
+    project_id_param="project",
+    exclude_params=["neo4j_handler"],
+)
+def detect_communities(
     project: str,
     algorithm: CommunityAlgorithm = Query(
         default=CommunityAlgorithm.LOUVAIN,
@@ -664,7 +696,9 @@ async def detect_communities(
     Detect communities in the entity graph.
 
     Uses the specified algorithm to find groups of densely connected entities.
-    Supports multiple algorithms optimized for different graph characteristics.
+    Detection runs in process on the project's graph snapshot and is cached
+    until the graph changes. Girvan-Newman is too slow for large graphs and
+    is answered with Louvain; the response reports the algorithm that ran.
 
     - **project**: Project safe name
     - **algorithm**: Detection algorithm (louvain, label_propagation, etc.)
@@ -675,65 +709,31 @@ async def detect_communities(
     _verify_project(neo4j_handler, project)
 
     try:
-        # Use existing cluster detection as base and enhance it
-        cluster_result = neo4j_handler.find_clusters(project)
-
-        if not cluster_result:
-            return CommunitiesResponse(
-                algorithm=algorithm.value,
-                community_count=0,
-                modularity=0.0,
-                coverage=0.0,
-                communities=[],
-                total_entities=0
-            )
-
-        # Convert clusters to communities
-        communities = []
-        total_entities = cluster_result.get("total_entities", 0)
-
-        for cluster_data in cluster_result.get("clusters", []):
-            size = cluster_data.get("size", 0)
-
-            # Filter by minimum size
-            if size < min_community_size:
-                if not include_isolated:
-                    continue
-
-            # Skip isolated if not requested
-            if cluster_data.get("is_isolated", False) and not include_isolated:
-                continue
-
-            entity_ids = cluster_data.get("entity_ids", [])
-            internal_edges = cluster_data.get("internal_edges", 0)
-
-            # Calculate density
-            max_edges = size * (size - 1) / 2 if size > 1 else 0
-            density = internal_edges / max_edges if max_edges > 0 else 0.0
-
-            community = CommunityInfo(
-                community_id=cluster_data.get("cluster_id", f"community_{len(communities)}"),
-                size=size,
-                density=round(density, 4),
-                cohesion=density,  # Simplified cohesion metric
-                member_ids=entity_ids,
-                hub_entities=entity_ids[:1] if entity_ids else [],  # First entity as hub
-                bridge_entities=[]
+        partition = _community_partition(neo4j_handler, project, algorithm, resolution)
+
+        communities = [
+            CommunityInfo(
+                community_id=community.community_id,
+                size=community.size,
+                density=round(community.density, 4),
+                cohesion=round(community.cohesion, 4),
+                member_ids=community.member_ids,
+                hub_entities=community.hub_entities,
+                bridge_entities=community.bridge_entities
             )
-            communities.append(community)
+            for community in partition.communities
+            if community.size >= min_community_size
+            or (include_isolated and community.is_isolated)
+        ]
 
-        # Calculate modularity estimate
-        connected_clusters = [c for c in communities if c.size > 1]
-        modularity = len(connected_clusters) / max(len(communities), 1) * 0.5
-
-        # Calculate coverage
+        total_entities = partition.total_entities
         assigned_entities = sum(c.size for c in communities)
         coverage = assigned_entities / total_entities if total_entities > 0 else 0.0
 
         return CommunitiesResponse(
-            algorithm=algorithm.value,
+            algorithm=partition.algorithm,
             community_count=len(communities),
-            modularity=round(modularity, 4),
+            modularity=round(partition.modularity, 4),
             coverage=round(coverage, 4),
             communities=communities,
             total_entities=total_entities
@@ -758,13 +758,28 @@ async def detect_communities(
         404: {"description": "Project or community not found"},
     }
 )
-async def get_community_details(
+@cached_query(
+    QueryType.COMMUNITY_DETECTION,
+    project_id_param="project",
+    exclude_params=["neo4j_handler"],
+)
+def get_community_details(
     project: str,
     community_id: str,
     include_member_details: bool = Query(
         default=True,
         description="Include detailed member information"
     ),
+    algorithm: CommunityAlgorithm = Query(
+        default=CommunityAlgorithm.LOUVAIN,
+        description="Community detection algorithm the community IDs refer to"
+    ),
+    resolution: float = Query(
+        default=1.0,
+        ge=0.1,
+        le=5.0,
+        description="Resolution parameter the community IDs refer to"
+    ),
     neo4j_handler=Depends(get_neo4j_handler)
 ):
     """
@@ -776,66 +791,50 @@ async def get_community_details(
     - **project**: Project safe name
     - **community_id**: Community identifier
     - **include_member_details**: Include detailed member info
+    - **algorithm**: Detection algorithm used for /communities
+    - **resolution**: Resolution used for /communities
     """
     _verify_project(neo4j_handler, project)
 
     try:
-        # Find the cluster/community
-        cluster_result = neo4j_handler.find_clusters(project)
-
-        if not cluster_result:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Community '{community_id}' not found"
-            )
+        partition = _community_partition(neo4j_handler, project, algorithm, resolution)
+        community = partition.get_community(community_id)
 
-        # Find matching community
-        community_data = None
-        for cluster in cluster_result.get("clusters", []):
-            if cluster.get("cluster_id") == community_id:
-                community_data = cluster
-                break
-
-        if not community_data:
+        if community is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Community '{community_id}' not found"
             )
 
         # Build member details
-        members = []
-        entity_ids = community_data.get("entity_ids", [])
-
+        entities = {}
         if include_member_details:
-            for entity_id in entity_ids:
-                entity = neo4j_handler.get_person(project, entity_id)
-                if entity:
-                    member = CommunityMember(
-                        entity_id=entity_id,
-                        label=_get_entity_label(entity),
-                        membership_score=1.0,
-                        role="member"
-                    )
-                    members.append(member)
-        else:
-            members = [
-                CommunityMember(entity_id=eid, label="", membership_score=1.0, role="member")
-                for eid in entity_ids
-            ]
-
-        size = community_data.get("size", len(entity_ids))
-        internal_edges = community_data.get("internal_edges", 0)
-        max_edges = size * (size - 1) / 2 if size > 1 else 0
-        density = internal_edges / max_edges if max_edges > 0 else 0.0
+            entities = _get_entities(neo4j_handler, project, list(community.member_ids))
+
+        members = []
+        for entity_id in community.member_ids:
+            membership = partition.entity_membership(entity_id)
+            label = ""
+            if include_member_details:
+                entity = entities.get(entity_id)
+                if not entity:
+                    continue
+                label = _get_entity_label(entity)
+            members.append(CommunityMember(
+                entity_id=entity_id,
+                label=label,
+                membership_score=membership["membership_score"],
+                role=membership["role"]
+            ))
 
         return CommunityDetailResponse(
             community_id=community_id,
-            size=size,
-            density=round(density, 4),
+            size=community.size,
+            density=round(community.density, 4),
             members=members,
-            internal_edges=internal_edges,
-            external_edges=0,  # Would need additional calculation
-            connected_communities=[]  # Would need additional calculation
+            internal_edges=community.internal_edges,
+            external_edges=community.external_edges,
+            connected_communities=community.connected_communities
         )
 
     except HTTPException:
@@ -857,9 +856,25 @@ async def get_community_details(
         404: {"description": "Project or entity not found"},
     }
 )
-async def get_entity_community(
+@cached_query(
+    QueryType.COMMUNITY_DETECTION,
+    project_id_param="project",
+    entity_id_params=["entity_id"],
+    exclude_params=["neo4j_handler"],
+)
+def get_entity_community(
     project: str,
     entity_id: str,
+    algorithm: CommunityAlgorithm = Query(
+        default=CommunityAlgorithm.LOUVAIN,
+        description="Community detection algorithm the community IDs refer to"
+    ),
+    resolution: float = Query(
+        default=1.0,
+        ge=0.1,
+        le=5.0,
+        description="Resolution parameter the community IDs refer to"
+    ),
     neo4j_handler=Depends(get_neo4j_handler)
 ):
     """
@@ -870,15 +885,17 @@ async def get_entity_community(
 
     - **project**: Project safe name
     - **entity_id**: Entity identifier
+    - **algorithm**: Detection algorithm used for /communities
+    - **resolution**: Resolution used for /communities
     """
     _verify_project(neo4j_handler, project)
     _verify_entity(neo4j_handler, project, entity_id)
 
     try:
-        # Find communities and locate entity
-        cluster_result = neo4j_handler.find_clusters(project)
+        partition = _community_partition(neo4j_handler, project, algorithm, resolution)
+        membership = partition.entity_membership(entity_id)
 
-        if not cluster_result:
+        if membership is None:
             return EntityCommunityResponse(
                 entity_id=entity_id,
                 community_id=None,
@@ -887,28 +904,7 @@ async def get_entity_community(
                 overlapping_communities=[]
             )
 
-        # Find entity's community
-        community_id = None
-        role = "member"
-
-        for cluster in cluster_result.get("clusters", []):
-            if entity_id in cluster.get("entity_ids", []):
-                community_id = cluster.get("cluster_id")
-
-                # Determine role
-                if cluster.get("is_isolated", False):
-                    role = "isolated"
-                elif entity_id == cluster.get("entity_ids", [None])[0]:
-                    role = "hub"
-                break
-
-        return EntityCommunityResponse(
-            entity_id=entity_id,
-            community_id=community_id,
-            membership_score=1.0 if community_id else 0.0,
-            role=role,
-            overlapping_communities=[]
-        )
+        return EntityCommunityResponse(entity_id=entity_id, **membership)
 
     except HTTPException:
         raise
@@ -933,7 +929,13 @@ async def get_entity_community(
         404: {"description": "Project or entity not found"},
     }
 )
-async def find_similar_entities(
+@cached_query(
+    QueryType.SIMILARITY_ANALYSIS,
+    project_id_param="project",
+    entity_id_params=["entity_id"],
+    exclude_params=["neo4j_handler"],
+)
+def find_similar_entities(
     project: str,
     entity_id: str,
     metric: SimilarityMetric = Query(
@@ -1037,21 +1039,23 @@ async def find_similar_entities(
                 score = intersection / magnitude if magnitude > 0 else 0.0
 
             if score >= min_similarity:
-                # Get entity label
-                other_entity = neo4j_handler.get_person(project, other_id)
-                label = _get_entity_label(other_entity) if other_entity else other_id[:8]
-
-                similarities.append(SimilarEntityResult(
-                    entity_id=other_id,
-                    label=label,
-                    similarity_score=round(score, 4),
-                    common_neighbors=len(source_neighbors & other_neighbors),
-                    shared_attributes=[]
-                ))
-
-        # Sort by similarity and limit
-        similarities.sort(key=lambda x: x.similarity_score, reverse=True)
-        similarities = similarities[:limit]
+                similarities.append((round(score, 4), other_id))
+
+        # Keep the top entries before loading labels for them
+        top = heapq.nlargest(limit, enumerate(similarities), key=lambda item: (item[1][0], -item[0]))
+        entities = _get_entities(neo4j_handler, project, [other_id for _, (_, other_id) in top])
+        similarities = []
+        for _, (score, other_id) in top:
+            other_entity = entities.get(other_id)
+            label = _get_entity_label(other_entity) if other_entity else other_id[:8]
+
+            similarities.append(SimilarEntityResult(
+                entity_id=other_id,
+                label=label,
+                similarity_score=score,
+                common_neighbors=len(source_neighbors & entity_neighbors[other_id]),
+                shared_attributes=[]
+            ))
 
         return SimilarEntitiesResponse(
             entity_id=entity_id,
@@ -1079,7 +1083,13 @@ async def find_similar_entities(
         404: {"description": "Project or entity not found"},
     }
 )
-async def compare_entities(
+@cached_query(
+    QueryType.SIMILARITY_ANALYSIS,
+    project_id_param="project",
+    entity_id_params=["entity1_id", "entity2_id"],
+    exclude_params=["neo4j_handler"],
+)
+def compare_entities(
     project: str,
     entity1_id: str,
     entity2_id: str,
@@ -1131,13 +1141,11 @@ async def compare_entities(
             path_distance = path_result.get("path_length")
 
         # Get shared communities
-        cluster_result = neo4j_handler.find_clusters(project)
+        partition = _community_partition(neo4j_handler, project, CommunityAlgorithm.LOUVAIN, 1.0)
+        community1 = partition.community_of(entity1_id)
         shared_communities = []
-        if cluster_result:
-            for cluster in cluster_result.get("clusters", []):
-                entity_ids = cluster.get("entity_ids", [])
-                if entity1_id in entity_ids and entity2_id in entity_ids:
-                    shared_communities.append(cluster.get("cluster_id", ""))
+        if community1 is not None and community1 is partition.community_of(entity2_id):
+            shared_communities.append(community1.community_id)
 
         return EntityComparisonResponse(
             entity1_id=entity1_id,
@@ -1171,7 +1179,13 @@ async def compare_entities(
         404: {"description": "Project or entity not found"},
     }
 )
-async def get_common_neighbors(
+@cached_query(
+    QueryType.COMMON_NEIGHBORS,
+    project_id_param="project",
+    entity_id_params=["entity1_id", "entity2_id"],
+    exclude_params=["neo4j_handler"],
+)
+def get_common_neighbors(
     project: str,
     entity1_id: str,
     entity2_id: str,
@@ -1223,8 +1237,9 @@ async def get_common_neighbors(
         import math
         adamic_adar_score = 0.0
 
+        entities = _get_entities(neo4j_handler, project, list(common_neighbor_ids))
         for neighbor_id in common_neighbor_ids:
-            neighbor_entity = neo4j_handler.get_person(project, neighbor_id)
+            neighbor_entity = entities.get(neighbor_id)
             label = _get_entity_label(neighbor_entity) if neighbor_entity else neighbor_id[:8]
 
             rel_to_1 = neighbor_map.get(entity1_id, {}).get(neighbor_id, "RELATED_TO")
@@ -1273,7 +1288,12 @@ async def get_common_neighbors(
         404: {"description": "Project not found"},
     }
 )
-async def get_influence_rankings(
+@cached_query(
+    QueryType.INFLUENCE_METRICS,
+    project_id_param="project",
+    exclude_params=["neo4j_handler"],
+)
+def get_influence_rankings(
     project: str,
     metric: InfluenceMetric = Query(
         default=InfluenceMetric.PAGERANK,
@@ -1303,7 +1323,9 @@ async def get_influence_rankings(
     Get influence rankings for entities in the project.
 
     Calculates influence scores using PageRank or other centrality metrics.
-    Returns entities ranked by their influence in the network.
+    Returns entities ranked by their influence in the network. Scores are
+    computed from the project's graph snapshot and cached until the graph
+    changes, so repeated top-k queries are lookups.
 
     - **project**: Project safe name
     - **metric**: Influence metric to use
@@ -1314,133 +1336,32 @@ async def get_influence_rankings(
     _verify_project(neo4j_handler, project)
 
     try:
-        # Get all entities and build graph
-        entities = neo4j_handler.get_all_people(project) or []
-
-        if not entities:
-            return InfluenceRankingsResponse(
-                metric=metric.value,
-                damping_factor=damping_factor,
-                rankings=[],
-                total_entities=0,
-                convergence_iterations=0
-            )
-
-        # Build adjacency
-        entity_map = {e.get("id"): e for e in entities if e.get("id")}
-        adjacency: dict[str, set[str]] = {eid: set() for eid in entity_map}
-
-        for e in entities:
-            eid = e.get("id")
-            if not eid:
-                continue
-
-            tags = e.get("tags", []) or []
-            for tag in tags:
-                if isinstance(tag, dict):
-                    target = tag.get("target_id") or tag.get("tagged_entity_id")
-                    if target and target in entity_map:
-                        adjacency[eid].add(target)
-                        adjacency[target].add(eid)  # Undirected
-
-        n = len(entity_map)
-
-        if metric == InfluenceMetric.PAGERANK:
-            # PageRank algorithm
-            scores = {eid: 1.0 / n for eid in entity_map}
-
-            for iteration in range(iterations):
-                new_scores = {}
-                for eid in entity_map:
-                    # Sum contributions from incoming edges
-                    incoming_sum = 0.0
-                    for neighbor in adjacency[eid]:
-                        out_degree = len(adjacency[neighbor])
-                        if out_degree > 0:
-                            incoming_sum += scores[neighbor] / out_degree
-
-                    new_scores[eid] = (1 - damping_factor) / n + damping_factor * incoming_sum
+        scores = get_metric_scores(
+            neo4j_handler, project, metric.value,
+            damping_factor=damping_factor, max_iterations=iterations
+        )
 
-                # Check convergence
-                diff = sum(abs(new_scores[eid] - scores[eid]) for eid in entity_map)
-                scores = new_scores
+        top = scores.ranking(metric.value)[:limit]
+        entities = _get_entities(neo4j_handler, project, [scores.entity_ids[i] for i in top])
 
-                if diff < 1e-6:
-                    convergence = iteration + 1
-                    break
-            else:
-                convergence = iterations
-
-        elif metric == InfluenceMetric.DEGREE:
-            scores = {eid: len(neighbors) for eid, neighbors in adjacency.items()}
-            max_score = max(scores.values()) if scores else 1
-            scores = {eid: score / max_score for eid, score in scores.items()}
-            convergence = 1
-
-        elif metric == InfluenceMetric.BETWEENNESS:
-            # Simplified betweenness centrality
-            scores = {eid: 0.0 for eid in entity_map}
-
-            for source in entity_map:
-                # BFS from source
-                distances = {source: 0}
-                paths = {source: 1}
-                queue = [source]
-                order = []
-
-                while queue:
-                    current = queue.pop(0)
-                    order.append(current)
-
-                    for neighbor in adjacency[current]:
-                        if neighbor not in distances:
-                            distances[neighbor] = distances[current] + 1
-                            queue.append(neighbor)
-                            paths[neighbor] = 0
-
-                        if distances[neighbor] == distances[current] + 1:
-                            paths[neighbor] += paths[current]
-
-                # Accumulate
-                delta = {eid: 0.0 for eid in entity_map}
-                for node in reversed(order[1:]):
-                    for neighbor in adjacency[node]:
-                        if distances.get(neighbor, -1) == distances.get(node, 0) - 1:
-                            delta[neighbor] += (paths[neighbor] / max(paths[node], 1)) * (1 + delta[node])
-                    scores[node] += delta[node]
-
-            # Normalize
-            max_score = max(scores.values()) if scores else 1
-            if max_score > 0:
-                scores = {eid: score / max_score for eid, score in scores.items()}
-            convergence = 1
-
-        else:  # Closeness, Eigenvector - simplified to degree for now
-            scores = {eid: len(neighbors) / (n - 1) for eid, neighbors in adjacency.items()}
-            convergence = 1
-
-        # Build rankings
-        sorted_entities = sorted(scores.items(), key=lambda x: x[1], reverse=True)
         rankings = []
-
-        for rank, (eid, score) in enumerate(sorted_entities[:limit], 1):
-            entity = entity_map.get(eid, {})
-            label = _get_entity_label(entity)
-
+        for rank, index in enumerate(top, 1):
+            eid = scores.entity_ids[index]
+            score = scores.scores[metric.value][index]
             rankings.append(EntityInfluence(
                 entity_id=eid,
-                label=label,
+                label=_get_entity_label(entities.get(eid, {})),
                 influence_score=round(score, 6),
                 rank=rank,
-                metrics={metric.value: round(score, 6)}
+                metrics={name: round(value, 6) for name, value in scores.metrics(index).items()}
             ))
 
         return InfluenceRankingsResponse(
             metric=metric.value,
             damping_factor=damping_factor,
             rankings=rankings,
-            total_entities=n,
-            convergence_iterations=convergence
+            total_entities=len(scores.entity_ids),
+            convergence_iterations=scores.iterations[metric.value]
         )
 
     except HTTPException:
@@ -1462,7 +1383,7 @@ async def get_influence_rankings(
         404: {"description": "Project or entity not found"},
     }
 )
-async def simulate_influence_spread(
+def simulate_influence_spread(
     project: str,
     entity_id: str,
     steps: int = Query(
@@ -1586,7 +1507,12 @@ async def simulate_influence_spread(
         404: {"description": "Project not found"},
     }
 )
-async def find_key_entities(
+@cached_query(
+    QueryType.INFLUENCE_METRICS,
+    project_id_param="project",
+    exclude_params=["neo4j_handler"],
+)
+def find_key_entities(
     project: str,
     analysis_type: str = Query(
         default="structural",
@@ -1605,6 +1531,8 @@ async def find_key_entities(
 
     Identifies entities that are structurally important,
     such as hubs (highly connected) or bridges (connecting communities).
+    Structural analysis ranks by PageRank, hub analysis by degree and
+    bridge analysis by betweenness centrality.
 
     - **project**: Project safe name
     - **analysis_type**: Type of analysis (structural, bridge, hub)
@@ -1613,10 +1541,12 @@ async def find_key_entities(
     _verify_project(neo4j_handler, project)
 
     try:
-        # Get most connected entities
-        result = neo4j_handler.get_most_connected(project, limit=limit)
+        metric = KEY_ENTITY_METRICS.get(analysis_type, InfluenceMetric.PAGERANK).value
+        scores = get_metric_scores(neo4j_handler, project, metric)
+        values = scores.scores[metric]
 
-        if not result or not result.get("entities"):
+        top = [i for i in scores.ranking(metric)[:limit] if values[i] > 0]
+        if not top:
             return KeyEntitiesResponse(
                 key_entities=[],
                 total_found=0,
@@ -1624,31 +1554,27 @@ async def find_key_entities(
                 network_vulnerability=0.0
             )
 
-        # Build key entities list
-        key_entities = []
-        total_connections = sum(
-            e.get("total_connections", 0) for e in result.get("entities", [])
-        )
-
-        for entity_data in result.get("entities", []):
-            eid = entity_data.get("entity_id", "")
-            entity = entity_data.get("entity", {})
-            connections = entity_data.get("total_connections", 0)
+        entities = _get_entities(neo4j_handler, project, [scores.entity_ids[i] for i in top])
+        peak = values[top[0]]
+        total_entities = len(scores.entity_ids)
 
-            # Calculate criticality based on connections
-            criticality = connections / total_connections if total_connections > 0 else 0.0
+        key_entities = []
+        for index in top:
+            eid = scores.entity_ids[index]
+            connections = scores.degrees[index]
+            criticality = values[index] / peak
 
             # Determine role
-            if connections > result.get("total_entities_analyzed", 1) * 0.3:
+            if connections > total_entities * 0.3:
                 role = "hub"
-            elif entity_data.get("outgoing_connections", 0) > 0 and entity_data.get("incoming_connections", 0) > 0:
-                role = "broker"
+            elif metric == InfluenceMetric.BETWEENNESS.value:
+                role = "bridge"
             else:
                 role = "key"
 
             key_entities.append(KeyEntity(
                 entity_id=eid,
-                label=_get_entity_label(entity),
+                label=_get_entity_label(entities.get(eid, {})),
                 criticality_score=round(criticality, 4),
                 role=role,
                 impact_if_removed={
@@ -1658,11 +1584,8 @@ async def find_key_entities(
             ))
 
         # Calculate network vulnerability
-        if key_entities:
-            top_criticality = sum(e.criticality_score for e in key_entities[:3])
-            vulnerability = min(top_criticality / 3, 1.0)
-        else:
-            vulnerability = 0.0
+        top_criticality = sum(e.criticality_score for e in key_entities[:3])
+        vulnerability = min(top_criticality / 3, 1.0)
 
         return KeyEntitiesResponse(
             key_entities=key_entities,
@@ -1694,7 +1617,7 @@ async def find_key_entities(
         404: {"description": "Project not found"},
     }
 )
-async def detect_temporal_patterns(
+def detect_temporal_patterns(
     project: str,
     pattern_types: Optional[str] = Query(
         default=None,
@@ -15,6 +15,7 @@ from enum import Enum
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Body
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..dependencies import get_neo4j_handler
@@ -659,7 +660,7 @@ async def import_maltego(
     start_time = datetime.now()
 
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -711,7 +712,7 @@ async def import_maltego(
                     config.entity_type_mapping
                 )
 
-                result = neo4j_handler.add_person(project_safe_name, entity)
+                result = await run_in_threadpool(neo4j_handler.add_person, project_safe_name, entity)
                 if result:
                     created_ids.append(result.get('id', entity['id']))
                     imported += 1
@@ -787,7 +788,7 @@ async def import_spiderfoot(
     start_time = datetime.now()
 
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -861,7 +862,7 @@ async def import_spiderfoot(
                     }
                 }
 
-                result = neo4j_handler.add_person(project_safe_name, entity)
+                result = await run_in_threadpool(neo4j_handler.add_person, project_safe_name, entity)
                 if result:
                     created_ids.append(result.get('id', entity['id']))
                     imported += 1
@@ -922,7 +923,7 @@ async def import_theharvester(
     start_time = datetime.now()
 
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -964,7 +965,7 @@ async def import_theharvester(
                             'imported_at': datetime.now().isoformat()
                         }
                     }
-                    result = neo4j_handler.add_person(project_safe_name, entity)
+                    result = await run_in_threadpool(neo4j_handler.add_person, project_safe_name, entity)
                     if result:
                         created_ids.append(result.get('id', entity['id']))
                         imported += 1
@@ -993,7 +994,7 @@ async def import_theharvester(
                             'imported_at': datetime.now().isoformat()
                         }
                     }
-                    result = neo4j_handler.add_person(project_safe_name, entity)
+                    result = await run_in_threadpool(neo4j_handler.add_person, project_safe_name, entity)
                     if result:
                         created_ids.append(result.get('id', entity['id']))
                         imported += 1
@@ -1022,7 +1023,7 @@ async def import_theharvester(
                             'imported_at': datetime.now().isoformat()
                         }
                     }
-                    result = neo4j_handler.add_person(project_safe_name, entity)
+                    result = await run_in_threadpool(neo4j_handler.add_person, project_safe_name, entity)
                     if result:
                         created_ids.append(result.get('id', entity['id']))
                         imported += 1
@@ -1081,7 +1082,7 @@ async def import_shodan(
     start_time = datetime.now()
 
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1160,7 +1161,7 @@ async def import_shodan(
                     }
                 }
 
-                result = neo4j_handler.add_person(project_safe_name, entity)
+                result = await run_in_threadpool(neo4j_handler.add_person, project_safe_name, entity)
                 if result:
                     created_ids.append(result.get('id', entity['id']))
                     imported += 1
@@ -1220,7 +1221,7 @@ async def import_hibp(
     start_time = datetime.now()
 
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1273,7 +1274,7 @@ async def import_hibp(
                                 'imported_at': datetime.now().isoformat()
                             }
                         }
-                        result = neo4j_handler.add_person(project_safe_name, entity)
+                        result = await run_in_threadpool(neo4j_handler.add_person, project_safe_name, entity)
                         if result:
                             created_ids.append(result.get('id', entity['id']))
                             imported += 1
@@ -1300,7 +1301,7 @@ async def import_hibp(
                                 'imported_at': datetime.now().isoformat()
                             }
                         }
-                        result = neo4j_handler.add_person(project_safe_name, entity)
+                        result = await run_in_threadpool(neo4j_handler.add_person, project_safe_name, entity)
                         if result:
                             created_ids.append(result.get('id', entity['id']))
                             imported += 1
@@ -1333,7 +1334,7 @@ async def import_hibp(
                             'imported_at': datetime.now().isoformat()
                         }
                     }
-                    result = neo4j_handler.add_person(project_safe_name, entity)
+                    result = await run_in_threadpool(neo4j_handler.add_person, project_safe_name, entity)
                     if result:
                         created_ids.append(result.get('id', entity['id']))
                         imported += 1
@@ -1394,7 +1395,7 @@ async def import_csv(
     start_time = datetime.now()
 
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1460,14 +1461,19 @@ async def import_csv(
                 }
 
                 if existing_id:
-                    result = neo4j_handler.update_person(project_safe_name, existing_id, entity)
+                    result = await run_in_threadpool(
+                        neo4j_handler.update_person,
+                        project_safe_name,
+                        existing_id,
+                        entity
+                    )
                     if result:
                         updated_ids.append(existing_id)
                         imported += 1
                     else:
                         failed += 1
                 else:
-                    result = neo4j_handler.add_person(project_safe_name, entity)
+                    result = await run_in_threadpool(neo4j_handler.add_person, project_safe_name, entity)
                     if result:
                         created_ids.append(result.get('id', entity['id']))
                         imported += 1
@@ -1530,7 +1536,7 @@ async def validate_import(
     - **format**: Expected format (optional, will auto-detect)
     """
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -224,7 +224,9 @@ class WorkerStatusResponse(BaseModel):
                 "started_at": "2024-01-15T09:00:00Z",
                 "jobs_processed": 42,
                 "current_job_id": None,
-                "last_heartbeat": "2024-01-15T10:30:00Z"
+                "last_heartbeat": "2024-01-15T10:30:00Z",
+                "running_job_ids": [],
+                "max_concurrent_jobs": 5
             }
         }
     )
@@ -234,6 +236,8 @@ class WorkerStatusResponse(BaseModel):
     jobs_processed: int = Field(..., description="Total jobs processed")
     current_job_id: Optional[str] = Field(None, description="Current job ID")
     last_heartbeat: Optional[datetime] = Field(None, description="Last heartbeat")
+    running_job_ids: List[str] = Field(default_factory=list, description="IDs of all running jobs")
+    max_concurrent_jobs: int = Field(1, description="Maximum concurrently running jobs")
 
 
 class RunScheduleResponse(BaseModel):
@@ -348,7 +352,9 @@ def _worker_status_to_response(status: WorkerStatus) -> WorkerStatusResponse:
         started_at=status.started_at,
         jobs_processed=status.jobs_processed,
         current_job_id=status.current_job_id,
-        last_heartbeat=status.last_heartbeat
+        last_heartbeat=status.last_heartbeat,
+        running_job_ids=status.running_job_ids,
+        max_concurrent_jobs=status.max_concurrent_jobs
     )
 
 
@@ -425,7 +431,7 @@ def _parse_status(status_str: Optional[str]) -> Optional[JobStatus]:
         400: {"description": "Invalid request parameters"},
     }
 )
-async def enqueue_job(
+def enqueue_job(
     request: EnqueueJobRequest,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -480,7 +486,7 @@ async def enqueue_job(
         200: {"description": "Jobs retrieved successfully"},
     }
 )
-async def list_jobs(
+def list_jobs(
     status_filter: Optional[str] = Query(
         None,
         alias="status",
@@ -543,7 +549,7 @@ async def list_jobs(
         200: {"description": "Statistics retrieved successfully"},
     }
 )
-async def get_job_stats(
+def get_job_stats(
     neo4j_handler=Depends(get_neo4j_handler)
 ):
     """
@@ -572,7 +578,7 @@ async def get_job_stats(
         200: {"description": "Worker status retrieved successfully"},
     }
 )
-async def get_worker_status(
+def get_worker_status(
     neo4j_handler=Depends(get_neo4j_handler)
 ):
     """
@@ -602,7 +608,7 @@ async def get_worker_status(
         404: {"description": "Job not found"},
     }
 )
-async def get_job(
+def get_job(
     job_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -642,7 +648,7 @@ async def get_job(
         404: {"description": "Job or result not found"},
     }
 )
-async def get_job_result(
+def get_job_result(
     job_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -691,7 +697,7 @@ async def get_job_result(
         404: {"description": "Job not found"},
     }
 )
-async def cancel_job(
+def cancel_job(
     job_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -748,7 +754,7 @@ async def cancel_job(
         400: {"description": "Job cannot be retried"},
     }
 )
-async def retry_job(
+def retry_job(
     job_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -804,7 +810,7 @@ async def retry_job(
         404: {"description": "Schedule not found"},
     }
 )
-async def run_schedule_now(
+def run_schedule_now(
     schedule_id: str,
     priority: str = Query("normal", description="Job priority"),
     neo4j_handler=Depends(get_neo4j_handler)
@@ -347,7 +347,7 @@ def _verify_project_exists(neo4j_handler, project_id: str) -> dict:
         422: {"description": "Invalid orphan data"},
     }
 )
-async def create_orphan(
+def create_orphan(
     project_id: str,
     orphan: OrphanDataCreate,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -406,7 +406,7 @@ async def create_orphan(
         404: {"description": "Project not found"},
     }
 )
-async def list_orphans(
+def list_orphans(
     project_id: str,
     identifier_type: Optional[IdentifierType] = Query(
         None,
@@ -502,7 +502,7 @@ async def list_orphans(
         404: {"description": "Orphan data or project not found"},
     }
 )
-async def get_orphan(
+def get_orphan(
     project_id: str,
     orphan_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -561,7 +561,7 @@ async def get_orphan(
         422: {"description": "Invalid update data"},
     }
 )
-async def update_orphan(
+def update_orphan(
     project_id: str,
     orphan_id: str,
     orphan_update: OrphanDataUpdate,
@@ -621,7 +621,7 @@ async def update_orphan(
         404: {"description": "Orphan data or project not found"},
     }
 )
-async def delete_orphan(
+def delete_orphan(
     project_id: str,
     orphan_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -683,7 +683,7 @@ async def delete_orphan(
         404: {"description": "Orphan data or project not found"},
     }
 )
-async def get_entity_suggestions(
+def get_entity_suggestions(
     project_id: str,
     orphan_id: str,
     limit: int = Query(
@@ -764,7 +764,7 @@ async def get_entity_suggestions(
         422: {"description": "Invalid link request"},
     }
 )
-async def link_orphan_to_entity(
+def link_orphan_to_entity(
     project_id: str,
     orphan_id: str,
     link_request: OrphanLinkRequest,
@@ -849,7 +849,7 @@ async def link_orphan_to_entity(
         422: {"description": "Invalid detach request"},
     }
 )
-async def detach_from_entity(
+def detach_from_entity(
     project_id: str,
     detach_request: DetachRequest,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -912,7 +912,7 @@ async def detach_from_entity(
         422: {"description": "Invalid batch data"},
     }
 )
-async def batch_import_orphans(
+def batch_import_orphans(
     project_id: str,
     batch_request: BatchImportRequest,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -973,7 +973,7 @@ async def batch_import_orphans(
         404: {"description": "Project not found"},
     }
 )
-async def find_duplicates(
+def find_duplicates(
     project_id: str,
     identifier_type: Optional[IdentifierType] = Query(
         None,
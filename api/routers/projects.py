@@ -141,7 +141,7 @@ def slugify(value: str) -> str:
         }
     }
 )
-async def list_projects(neo4j_handler=Depends(get_neo4j_handler)):
+def list_projects(neo4j_handler=Depends(get_neo4j_handler)):
     """
     Retrieve all projects.
 
@@ -169,7 +169,7 @@ async def list_projects(neo4j_handler=Depends(get_neo4j_handler)):
         400: {"description": "Invalid project data or project already exists"},
     }
 )
-async def create_project(
+def create_project(
     project_data: ProjectCreate,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -222,7 +222,7 @@ async def create_project(
         404: {"description": "Project not found"},
     }
 )
-async def get_project(
+def get_project(
     safe_name: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -255,7 +255,7 @@ async def get_project(
         404: {"description": "Project not found"},
     }
 )
-async def update_project(
+def update_project(
     safe_name: str,
     project_update: ProjectUpdate,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -321,7 +321,7 @@ async def update_project(
         404: {"description": "Project not found"},
     }
 )
-async def delete_project(
+def delete_project(
     safe_name: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -354,7 +354,7 @@ async def delete_project(
         404: {"description": "Project not found"},
     }
 )
-async def set_current_project(
+def set_current_project(
     data: ProjectSetCurrent,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -396,7 +396,7 @@ async def set_current_project(
         404: {"description": "Project not found"},
     }
 )
-async def download_project(
+def download_project(
     safe_name: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
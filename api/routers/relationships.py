@@ -145,7 +145,7 @@ async def get_relationship_types():
         404: {"description": "Entity or project not found"},
     }
 )
-async def get_relationships(
+def get_relationships(
     project_safe_name: str,
     entity_id: str,
     include_details: bool = Query(
@@ -199,7 +199,7 @@ async def get_relationships(
         404: {"description": "Entity or project not found"},
     }
 )
-async def update_relationships(
+def update_relationships(
     project_safe_name: str,
     entity_id: str,
     data: TaggedPeopleUpdate,
@@ -283,7 +283,7 @@ async def update_relationships(
         404: {"description": "Source or target entity not found"},
     }
 )
-async def tag_entity(
+def tag_entity(
     project_safe_name: str,
     entity_id: str,
     target_entity_id: str,
@@ -403,7 +403,7 @@ async def tag_entity(
         404: {"description": "Entity or relationship not found"},
     }
 )
-async def update_entity_relationship(
+def update_entity_relationship(
     project_safe_name: str,
     entity_id: str,
     target_entity_id: str,
@@ -487,7 +487,7 @@ async def update_entity_relationship(
         404: {"description": "Relationship not found"},
     }
 )
-async def get_entity_relationship(
+def get_entity_relationship(
     project_safe_name: str,
     entity_id: str,
     target_entity_id: str,
@@ -524,7 +524,7 @@ async def get_entity_relationship(
         404: {"description": "Entity not found"},
     }
 )
-async def untag_entity(
+def untag_entity(
     project_safe_name: str,
     entity_id: str,
     target_entity_id: str,
@@ -632,7 +632,7 @@ async def get_project_relationship_types():
         404: {"description": "Project not found"},
     }
 )
-async def get_all_project_relationships(
+def get_all_project_relationships(
     project_safe_name: str,
     relationship_type: Optional[str] = Query(
         None,
@@ -712,7 +712,7 @@ async def get_all_project_relationships(
     summary="Get relationship statistics",
     description="Retrieve statistics about relationships in a project.",
 )
-async def get_relationship_stats(
+def get_relationship_stats(
     project_safe_name: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
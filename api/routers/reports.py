@@ -161,7 +161,7 @@ def validate_filename(filename: str) -> bool:
         },
     }
 )
-async def list_reports(
+def list_reports(
     project_safe_name: str,
     entity_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -205,7 +205,7 @@ async def list_reports(
         404: {"description": "Entity or project not found"},
     }
 )
-async def create_report(
+def create_report(
     project_safe_name: str,
     entity_id: str,
     report_data: ReportCreate,
@@ -281,7 +281,7 @@ async def create_report(
         404: {"description": "Entity or project not found"},
     }
 )
-async def create_report_file(
+def create_report_file(
     project_safe_name: str,
     entity_id: str,
     report_data: ReportCreateFromFile,
@@ -357,7 +357,7 @@ async def create_report_file(
         404: {"description": "Report not found"},
     }
 )
-async def get_report(
+def get_report(
     project_safe_name: str,
     entity_id: str,
     report_name: str,
@@ -407,7 +407,7 @@ async def get_report(
         404: {"description": "Report not found"},
     }
 )
-async def update_report(
+def update_report(
     project_safe_name: str,
     entity_id: str,
     report_name: str,
@@ -473,7 +473,7 @@ async def update_report(
         404: {"description": "Report not found"},
     }
 )
-async def delete_report(
+def delete_report(
     project_safe_name: str,
     entity_id: str,
     report_name: str,
@@ -536,7 +536,7 @@ async def delete_report(
         404: {"description": "Report not found"},
     }
 )
-async def rename_report(
+def rename_report(
     project_safe_name: str,
     entity_id: str,
     report_name: str,
@@ -25,6 +25,7 @@ from datetime import datetime
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, ConfigDict
 
 from ..dependencies import get_neo4j_handler, get_app_config
@@ -907,9 +908,9 @@ async def list_project_saved_searches(
 ):
     """List saved searches for a project."""
     # Verify project exists
-    project = neo4j_handler.get_project(project_id)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_id)
     if not project:
-        all_projects = neo4j_handler.get_all_projects()
+        all_projects = await run_in_threadpool(neo4j_handler.get_all_projects)
         project = next(
             (p for p in all_projects if p.get("id") == project_id),
             None
@@ -954,9 +955,9 @@ async def create_project_saved_search(
 ):
     """Create a saved search for a specific project."""
     # Verify project exists
-    project = neo4j_handler.get_project(project_id)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_id)
     if not project:
-        all_projects = neo4j_handler.get_all_projects()
+        all_projects = await run_in_threadpool(neo4j_handler.get_all_projects)
         project = next(
             (p for p in all_projects if p.get("id") == project_id),
             None
@@ -280,7 +280,7 @@ project_router = APIRouter(
     summary="Create schedule",
     description="Create a new scheduled report for a project.",
 )
-async def create_schedule(
+def create_schedule(
     project_id: str,
     request: CreateScheduleRequest,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -331,7 +331,7 @@ async def create_schedule(
     summary="List project schedules",
     description="List all schedules for a project.",
 )
-async def list_project_schedules(
+def list_project_schedules(
     project_id: str,
     enabled_only: bool = Query(False, description="Only return enabled schedules"),
     neo4j_handler=Depends(get_neo4j_handler)
@@ -380,7 +380,7 @@ admin_router = APIRouter(
     summary="List all schedules",
     description="List all schedules across all projects (admin).",
 )
-async def list_all_schedules(
+def list_all_schedules(
     enabled_only: bool = Query(False, description="Only return enabled schedules"),
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -413,7 +413,7 @@ async def list_all_schedules(
     summary="Get due schedules",
     description="Get all schedules that are past their next_run time.",
 )
-async def get_due_schedules(
+def get_due_schedules(
     project_id: Optional[str] = Query(None, description="Filter by project ID"),
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -448,7 +448,7 @@ async def get_due_schedules(
     summary="Get schedule details",
     description="Get details of a specific schedule.",
 )
-async def get_schedule(
+def get_schedule(
     schedule_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -484,7 +484,7 @@ async def get_schedule(
     summary="Update schedule",
     description="Update a schedule's settings.",
 )
-async def update_schedule(
+def update_schedule(
     schedule_id: str,
     request: UpdateScheduleRequest,
     neo4j_handler=Depends(get_neo4j_handler)
@@ -558,7 +558,7 @@ async def update_schedule(
     summary="Delete schedule",
     description="Delete a schedule.",
 )
-async def delete_schedule(
+def delete_schedule(
     schedule_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -594,7 +594,7 @@ async def delete_schedule(
     summary="Run schedule now",
     description="Trigger immediate execution of a scheduled report.",
 )
-async def run_schedule_now(
+def run_schedule_now(
     schedule_id: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
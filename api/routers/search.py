@@ -15,6 +15,7 @@ Endpoints:
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, ConfigDict
 
 from ..dependencies import get_neo4j_handler, get_app_config
@@ -531,10 +532,10 @@ async def project_search(
     - Other parameters same as global search
     """
     # Verify project exists
-    project = neo4j_handler.get_project(project_id)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_id)
     if not project:
         # Try to find by ID
-        all_projects = neo4j_handler.get_all_projects()
+        all_projects = await run_in_threadpool(neo4j_handler.get_all_projects)
         project = next(
             (p for p in all_projects if p.get("id") == project_id),
             None
@@ -647,9 +648,9 @@ async def advanced_project_search(
     - **highlight**: Generate highlighted snippets (default true)
     """
     # Verify project exists
-    project = neo4j_handler.get_project(project_id)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_id)
     if not project:
-        all_projects = neo4j_handler.get_all_projects()
+        all_projects = await run_in_threadpool(neo4j_handler.get_all_projects)
         project = next(
             (p for p in all_projects if p.get("id") == project_id),
             None
@@ -739,9 +740,9 @@ async def reindex_project(
     - **project_id**: Project ID or safe_name to reindex
     """
     # Verify project exists
-    project = neo4j_handler.get_project(project_id)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_id)
     if not project:
-        all_projects = neo4j_handler.get_all_projects()
+        all_projects = await run_in_threadpool(neo4j_handler.get_all_projects)
         project = next(
             (p for p in all_projects if p.get("id") == project_id),
             None
@@ -797,9 +798,9 @@ async def search_in_entity(
     - **q**: Search query text
     """
     # Verify project exists
-    project = neo4j_handler.get_project(project_id)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_id)
     if not project:
-        all_projects = neo4j_handler.get_all_projects()
+        all_projects = await run_in_threadpool(neo4j_handler.get_all_projects)
         project = next(
             (p for p in all_projects if p.get("id") == project_id),
             None
@@ -814,7 +815,7 @@ async def search_in_entity(
     project_safe_name = project.get("safe_name", project_id)
 
     # Verify entity exists
-    entity = neo4j_handler.get_person(project_safe_name, entity_id)
+    entity = await run_in_threadpool(neo4j_handler.get_person, project_safe_name, entity_id)
     if not entity:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
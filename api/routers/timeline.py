@@ -226,7 +226,7 @@ def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
         404: {"description": "Project not found"},
     }
 )
-async def get_project_timeline(
+def get_project_timeline(
     project_id: str,
     start_date: Optional[str] = Query(
         None,
@@ -295,7 +295,7 @@ async def get_project_timeline(
         404: {"description": "Project or entity not found"},
     }
 )
-async def get_entity_timeline(
+def get_entity_timeline(
     project_id: str,
     entity_id: str,
     start_date: Optional[str] = Query(
@@ -380,7 +380,7 @@ async def get_entity_timeline(
         404: {"description": "Project or entity not found"},
     }
 )
-async def get_relationship_history(
+def get_relationship_history(
     project_id: str,
     entity1_id: str,
     entity2_id: str,
@@ -452,7 +452,7 @@ async def get_relationship_history(
         404: {"description": "Project or entity not found"},
     }
 )
-async def get_entity_activity(
+def get_entity_activity(
     project_id: str,
     entity_id: str,
     days: int = Query(
@@ -528,7 +528,7 @@ async def get_entity_activity(
         404: {"description": "Project or entity not found"},
     }
 )
-async def record_timeline_event(
+def record_timeline_event(
     project_id: str,
     entity_id: str,
     event_data: RecordEventRequest,
@@ -18,6 +18,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..dependencies import get_neo4j_handler
@@ -427,7 +428,7 @@ async def get_entity_timeline(
     - **event_types**: Optional comma-separated event type filter
     """
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -435,7 +436,7 @@ async def get_entity_timeline(
         )
 
     # Verify entity exists
-    entity = neo4j_handler.get_person(project_safe_name, entity_id)
+    entity = await run_in_threadpool(neo4j_handler.get_person, project_safe_name, entity_id)
     if not entity:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -503,7 +504,7 @@ async def get_relationship_timeline(
     - **entity2_id**: Second entity identifier
     """
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -511,14 +512,14 @@ async def get_relationship_timeline(
         )
 
     # Verify entities exist
-    entity1 = neo4j_handler.get_person(project_safe_name, entity1_id)
+    entity1 = await run_in_threadpool(neo4j_handler.get_person, project_safe_name, entity1_id)
     if not entity1:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Entity '{entity1_id}' not found in project '{project_safe_name}'"
         )
 
-    entity2 = neo4j_handler.get_person(project_safe_name, entity2_id)
+    entity2 = await run_in_threadpool(neo4j_handler.get_person, project_safe_name, entity2_id)
     if not entity2:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -590,7 +591,7 @@ async def get_project_activity_timeline(
     - **granularity**: Time bucket size (hour, day, week, month)
     """
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -681,7 +682,7 @@ async def get_temporal_graph_snapshot(
     - **timestamp**: Point in time for the snapshot (ISO 8601)
     """
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -747,7 +748,7 @@ async def get_entity_evolution(
     - **entity_id**: Entity identifier
     """
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -755,7 +756,7 @@ async def get_entity_evolution(
         )
 
     # Verify entity exists
-    entity = neo4j_handler.get_person(project_safe_name, entity_id)
+    entity = await run_in_threadpool(neo4j_handler.get_person, project_safe_name, entity_id)
     if not entity:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -826,7 +827,7 @@ async def compare_time_periods(
     - **period2**: Second period (start_date, end_date in ISO 8601)
     """
     # Verify project exists
-    project = neo4j_handler.get_project(project_safe_name)
+    project = await run_in_threadpool(neo4j_handler.get_project, project_safe_name)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -14,6 +14,7 @@ from fastapi.responses import Response
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..dependencies import get_neo4j_handler
+from ..services.query_cache import QueryType, cached_query
 
 
 class LayoutType(str, Enum):
@@ -688,7 +689,12 @@ def _export_to_dot(
         404: {"description": "Project not found"},
     }
 )
-async def get_project_graph(
+@cached_query(
+    QueryType.GRAPH_STRUCTURE,
+    project_id_param="project_safe_name",
+    exclude_params=["neo4j_handler"],
+)
+def get_project_graph(
     project_safe_name: str,
     include_properties: bool = Query(
         True,
@@ -788,7 +794,13 @@ async def get_project_graph(
         404: {"description": "Project or entity not found"},
     }
 )
-async def get_entity_neighborhood(
+@cached_query(
+    QueryType.ENTITY_NEIGHBORHOOD,
+    project_id_param="project_safe_name",
+    entity_id_params=["entity_id"],
+    exclude_params=["neo4j_handler"],
+)
+def get_entity_neighborhood(
     project_safe_name: str,
     entity_id: str,
     depth: int = Query(
@@ -898,7 +910,12 @@ async def get_entity_neighborhood(
         404: {"description": "Project not found"},
     }
 )
-async def apply_layout(
+@cached_query(
+    QueryType.GRAPH_STRUCTURE,
+    project_id_param="project_safe_name",
+    exclude_params=["neo4j_handler"],
+)
+def apply_layout(
     project_safe_name: str,
     layout_type: LayoutType,
     entity_ids: Optional[str] = Query(
@@ -1012,7 +1029,7 @@ async def apply_layout(
         404: {"description": "Project not found"},
     }
 )
-async def export_graph(
+def export_graph(
     project_safe_name: str,
     format: ExportFormat,
     request: ExportRequest = None,
@@ -1168,7 +1185,12 @@ async def export_graph(
         404: {"description": "Project not found"},
     }
 )
-async def get_graph_stats(
+@cached_query(
+    QueryType.GRAPH_STRUCTURE,
+    project_id_param="project_safe_name",
+    exclude_params=["neo4j_handler"],
+)
+def get_graph_stats(
     project_safe_name: str,
     neo4j_handler=Depends(get_neo4j_handler)
 ):
@@ -1241,7 +1263,12 @@ async def get_graph_stats(
         404: {"description": "Project not found"},
     }
 )
-async def get_clusters_visualization(
+@cached_query(
+    QueryType.COMMUNITY_DETECTION,
+    project_id_param="project_safe_name",
+    exclude_params=["neo4j_handler"],
+)
+def get_clusters_visualization(
     project_safe_name: str,
     include_isolated: bool = Query(
         False,
@@ -1268,7 +1295,7 @@ async def get_clusters_visualization(
 
     try:
         # Use the existing cluster detection
-        cluster_result = neo4j_handler.find_clusters(project_safe_name)
+        cluster_result = neo4j_handler.find_clusters(project_safe_name, include_entities=False)
 
         if not cluster_result:
             return ClustersVisualizationResponse(
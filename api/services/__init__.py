@@ -48,6 +48,9 @@ from .graph_visualization import (
     VisualizationNode,
     VisualizationEdge,
     NodePriority,
+    NodeSizeMetric,
+    GraphMetrics,
+    BetweennessResult,
     get_graph_visualization_service,
     set_graph_visualization_service,
 )
@@ -121,6 +124,26 @@ from .similarity_service import (
     reset_similarity_service,
 )
 
+# Community Detection Engine (Graph Analytics)
+from .community_engine import (
+    CommunityGraph,
+    Community,
+    CommunityPartition,
+    detect_communities,
+    get_project_communities,
+)
+
+# Influence Metrics Engine (Graph Analytics)
+from .influence_engine import (
+    InfluenceScores,
+    compute_influence,
+    compute_betweenness,
+    compute_closeness,
+    get_project_influence,
+    get_project_betweenness,
+    get_project_closeness,
+)
+
 # Temporal Patterns Service (Graph Analytics) - ARCHIVED: See comment above
 
 # Query Cache Service (Phase 20: Performance Optimization)
@@ -133,6 +156,7 @@ from .query_cache import (
     cached_query,
     get_query_cache_service,
     initialize_query_cache,
+    initialize_shared_query_cache,
     reset_query_cache_service,
 )
 
@@ -232,6 +256,7 @@ from .deduplication import (
     MergePreview,
     MergeResult,
     DeduplicationReport,
+    BlockingStats,
     MatchType as DeduplicationMatchType,
     FieldConflictResolution,
     MatchResult,
@@ -309,6 +334,9 @@ __all__ = [
     "VisualizationNode",
     "VisualizationEdge",
     "NodePriority",
+    "NodeSizeMetric",
+    "GraphMetrics",
+    "BetweennessResult",
     "get_graph_visualization_service",
     "set_graph_visualization_service",
     # Data import exports (Phase 16)
@@ -358,6 +386,20 @@ __all__ = [
     "get_similarity_service",
     "set_similarity_service",
     "reset_similarity_service",
+    # Community Detection Engine exports (Graph Analytics)
+    "CommunityGraph",
+    "Community",
+    "CommunityPartition",
+    "detect_communities",
+    "get_project_communities",
+    # Influence Metrics Engine exports (Graph Analytics)
+    "InfluenceScores",
+    "compute_influence",
+    "compute_betweenness",
+    "compute_closeness",
+    "get_project_influence",
+    "get_project_betweenness",
+    "get_project_closeness",
     # Temporal Patterns Service exports (Graph Analytics) - ARCHIVED
     # Query Cache Service exports (Phase 20)
     "QueryCacheService",
@@ -368,6 +410,7 @@ __all__ = [
     "cached_query",
     "get_query_cache_service",
     "initialize_query_cache",
+    "initialize_shared_query_cache",
     "reset_query_cache_service",
     # Import Mapping Service exports
     "ImportMappingService",
@@ -446,6 +489,7 @@ __all__ = [
     "MergePreview",
     "MergeResult",
     "DeduplicationReport",
+    "BlockingStats",
     "DeduplicationMatchType",
     "FieldConflictResolution",
     "MatchResult",
@@ -21,7 +21,9 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from config_loader import load_config
+from config_loader import (
+    load_config, get_identifier_paths, normalize_identifier_value, extract_identifier_values
+)
 
 # Import fuzzy matcher
 try:
@@ -87,6 +89,147 @@ class FuzzyMatchConfig:
     fuzzy_fields: List[str] = field(default_factory=lambda: ["core.name", "core.alias"])
 
 
+class IdentifierIndex:
+    """
+    Inverted index from normalized identifier values to entity IDs.
+
+    Keys are (identifier path, normalized value) pairs. Only entities that
+    share at least one key are ever compared, which replaces the all-pairs
+    scan with work proportional to the number of actual collisions.
+    """
+
+    def __init__(self, paths_signature: Tuple[str, ...] = ()):
+        """
+        Initialize an empty index.
+
+        Args:
+            paths_signature: Identifier paths the index was built with, used
+                to detect when the configuration changed underneath it
+        """
+        self.paths_signature = paths_signature
+        self.built_at = datetime.now()
+        self._postings: Dict[Tuple[str, str], Set[str]] = {}
+        self._entity_identifiers: Dict[str, Dict[str, List[str]]] = {}
+        self._display_names: Dict[str, str] = {}
+        # Insertion order, used to orient pairs deterministically
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._entity_identifiers)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._entity_identifiers
+
+    @property
+    def key_count(self) -> int:
+        """Number of distinct (path, value) keys in the index."""
+        return len(self._postings)
+
+    def add_entity(
+        self,
+        entity_id: str,
+        identifiers: Dict[str, List[str]],
+        display_name: Optional[str] = None
+    ) -> None:
+        """
+        Add or replace an entity's identifiers in the index.
+
+        Args:
+            entity_id: The entity ID
+            identifiers: Mapping of identifier path to normalized values
+            display_name: Human-readable name for suggestions
+        """
+        self.remove_entity(entity_id)
+        if not identifiers:
+            return
+
+        self._entity_identifiers[entity_id] = identifiers
+        if display_name is not None:
+            self._display_names[entity_id] = display_name
+        if entity_id not in self._order:
+            self._order[entity_id] = self._next_order
+            self._next_order += 1
+
+        for path, values in identifiers.items():
+            for value in set(values):
+                self._postings.setdefault((path, value), set()).add(entity_id)
+
+    def remove_entity(self, entity_id: str) -> None:
+        """
+        Remove an entity and all of its keys from the index.
+
+        Args:
+            entity_id: The entity ID
+        """
+        identifiers = self._entity_identifiers.pop(entity_id, None)
+        self._display_names.pop(entity_id, None)
+        if not identifiers:
+            return
+
+        for path, values in identifiers.items():
+            for value in set(values):
+                key = (path, value)
+                posting = self._postings.get(key)
+                if posting is None:
+                    continue
+                posting.discard(entity_id)
+                if not posting:
+                    del self._postings[key]
+
+    def get_identifiers(self, entity_id: str) -> Dict[str, List[str]]:
+        """Get the indexed identifiers for an entity."""
+        return self._entity_identifiers.get(entity_id, {})
+
+    def get_display_name(self, entity_id: str) -> Optional[str]:
+        """Get the cached display name for an entity."""
+        return self._display_names.get(entity_id)
+
+    def find_candidates(
+        self,
+        identifiers: Dict[str, List[str]],
+        exclude_id: Optional[str] = None
+    ) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Find entities sharing at least one identifier key.
+
+        Args:
+            identifiers: Mapping of identifier path to normalized values
+            exclude_id: Entity ID to leave out of the result (usually the source)
+
+        Returns:
+            Dictionary mapping candidate entity ID to the shared (path, value) keys
+        """
+        candidates: Dict[str, List[Tuple[str, str]]] = {}
+        for path, values in identifiers.items():
+            for value in set(values):
+                for other_id in self._postings.get((path, value), ()):
+                    if other_id == exclude_id:
+                        continue
+                    candidates.setdefault(other_id, []).append((path, value))
+        return candidates
+
+    def candidate_pairs(self) -> Dict[Tuple[str, str], List[Tuple[str, str]]]:
+        """
+        Enumerate all entity pairs sharing at least one identifier key.
+
+        Pairs are oriented so the entity indexed first is the source.
+
+        Returns:
+            Dictionary mapping (source_id, target_id) to the shared (path, value) keys
+        """
+        pairs: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        order = self._order
+        for key, posting in self._postings.items():
+            if len(posting) < 2:
+                continue
+            members = sorted(posting, key=order.__getitem__)
+            for i, source_id in enumerate(members):
+                for target_id in members[i + 1:]:
+                    pairs.setdefault((source_id, target_id), []).append(key)
+        return pairs
+
+
 class AutoLinker:
     """
     Automatic entity linking service.
@@ -131,6 +274,11 @@ class AutoLinker:
     DUPLICATE_THRESHOLD = 5.0  # Score above this suggests same person
     LINK_THRESHOLD = 2.0  # Score above this suggests relationship
 
+    # Cached identifier indexes older than this are rebuilt on next use. Writes
+    # through this process's handler update the index right away; the age
+    # limit only bounds how long writes from other processes go unseen.
+    INDEX_MAX_AGE_SECONDS = 300
+
     def __init__(
         self,
         neo4j_handler=None,
@@ -152,6 +300,10 @@ class AutoLinker:
         self.fuzzy_config = fuzzy_config or FuzzyMatchConfig()
         self._fuzzy_matcher: Optional[FuzzyMatcher] = None
 
+        # Per-project identifier indexes, kept current through change events
+        self._identifier_indexes: Dict[str, IdentifierIndex] = {}
+        self._subscribe_to_changes(neo4j_handler)
+
     @property
     def fuzzy_matcher(self) -> Optional[FuzzyMatcher]:
         """Get or create the FuzzyMatcher instance."""
@@ -180,41 +332,7 @@ class AutoLinker:
             self.config = {"sections": []}
             return
 
-        self.identifier_paths = []
-
-        for section in self.config.get("sections", []):
-            section_id = section.get("id")
-
-            for field_def in section.get("fields", []):
-                field_id = field_def.get("id")
-                field_type = field_def.get("type")
-
-                # Check if field itself is an identifier
-                if field_def.get("identifier", False):
-                    path = f"{section_id}.{field_id}"
-                    self.identifier_paths.append({
-                        "path": path,
-                        "section_id": section_id,
-                        "field_id": field_id,
-                        "component_id": None,
-                        "field_type": field_type,
-                        "multiple": field_def.get("multiple", False)
-                    })
-
-                # Check components for identifiers
-                if field_type == "component" and "components" in field_def:
-                    for component in field_def.get("components", []):
-                        if component.get("identifier", False):
-                            comp_id = component.get("id")
-                            path = f"{section_id}.{field_id}.{comp_id}"
-                            self.identifier_paths.append({
-                                "path": path,
-                                "section_id": section_id,
-                                "field_id": field_id,
-                                "component_id": comp_id,
-                                "field_type": component.get("type"),
-                                "multiple": field_def.get("multiple", False)
-                            })
+        self.identifier_paths = get_identifier_paths(self.config)
 
     def _normalize_value(self, value: Any, field_type: str = "string") -> Optional[str]:
         """
@@ -227,29 +345,7 @@ class AutoLinker:
         Returns:
             Normalized string value or None if invalid
         """
-        if value is None:
-            return None
-
-        if isinstance(value, (dict, list)):
-            return None  # Complex values not directly comparable
-
-        value_str = str(value).strip().lower()
-
-        if not value_str:
-            return None
-
-        # Type-specific normalization
-        if field_type == "email":
-            # Normalize email: lowercase
-            return value_str
-
-        if field_type in ("phone", "string") and "phone" in field_type.lower():
-            # Normalize phone: remove all non-digits except leading +
-            if value_str.startswith("+"):
-                return "+" + re.sub(r"[^\d]", "", value_str[1:])
-            return re.sub(r"[^\d]", "", value_str)
-
-        return value_str
+        return normalize_identifier_value(value, field_type)
 
     def _extract_identifiers(self, entity: Dict[str, Any]) -> Dict[str, List[str]]:
         """
@@ -281,39 +377,7 @@ class AutoLinker:
             if field_data is None:
                 continue
 
-            # Handle the field data
-            values = []
-
-            if isinstance(field_data, list):
-                # Multiple values
-                for item in field_data:
-                    if component_id and isinstance(item, dict):
-                        # Extract component value
-                        comp_value = item.get(component_id)
-                        if comp_value:
-                            normalized = self._normalize_value(comp_value, field_type)
-                            if normalized:
-                                values.append(normalized)
-                    elif not component_id:
-                        normalized = self._normalize_value(item, field_type)
-                        if normalized:
-                            values.append(normalized)
-
-            elif isinstance(field_data, dict):
-                if component_id:
-                    # Single component value
-                    comp_value = field_data.get(component_id)
-                    if comp_value:
-                        normalized = self._normalize_value(comp_value, field_type)
-                        if normalized:
-                            values.append(normalized)
-
-            else:
-                # Simple value
-                normalized = self._normalize_value(field_data, field_type)
-                if normalized:
-                    values.append(normalized)
-
+            values = extract_identifier_values(field_data, component_id, field_type)
             if values:
                 identifiers[path] = values
 
@@ -349,6 +413,18 @@ class AutoLinker:
 
         return self.IDENTIFIER_WEIGHTS["default"]
 
+    def _projection_fields(self) -> List[str]:
+        """
+        Get the profile fields needed for identifier matching.
+
+        Returns:
+            Sorted "section.field" keys covering identifier fields and the
+            core name/alias fields used for display names
+        """
+        fields = {f"{path['section_id']}.{path['field_id']}" for path in self.identifier_paths}
+        fields.update(("core.name", "core.alias"))
+        return sorted(fields)
+
     def _get_entity_display_name(self, entity: Dict[str, Any]) -> str:
         """
         Get a display name for an entity.
@@ -390,6 +466,206 @@ class AutoLinker:
         # Fall back to entity ID
         return f"Entity {entity.get('id', 'unknown')[:8]}"
 
+    def build_identifier_index(
+        self,
+        project_safe_name: str,
+        entities: Optional[List[Dict[str, Any]]] = None
+    ) -> IdentifierIndex:
+        """
+        Build (and cache) the identifier index for a project.
+
+        Args:
+            project_safe_name: The project safe name
+            entities: Pre-fetched entities; fetched from Neo4j when omitted
+
+        Returns:
+            The freshly built IdentifierIndex
+        """
+        if entities is None:
+            entities = self.neo4j_handler.get_all_people(
+                project_safe_name, fields=self._projection_fields()
+            ) if self.neo4j_handler else []
+
+        index = IdentifierIndex(self._identifier_paths_signature())
+        for entity in entities:
+            entity_id = entity.get("id")
+            if not entity_id:
+                continue
+            identifiers = self._extract_identifiers(entity)
+            if identifiers:
+                index.add_entity(entity_id, identifiers, self._get_entity_display_name(entity))
+
+        self._identifier_indexes[project_safe_name] = index
+        return index
+
+    def get_identifier_index(self, project_safe_name: str) -> IdentifierIndex:
+        """
+        Get the cached identifier index for a project, rebuilding it if stale.
+
+        Args:
+            project_safe_name: The project safe name
+
+        Returns:
+            IdentifierIndex for the project
+        """
+        index = self._identifier_indexes.get(project_safe_name)
+        if index is not None:
+            age = (datetime.now() - index.built_at).total_seconds()
+            if (
+                age <= self.INDEX_MAX_AGE_SECONDS
+                and index.paths_signature == self._identifier_paths_signature()
+            ):
+                return index
+        return self.build_identifier_index(project_safe_name)
+
+    def invalidate_identifier_index(self, project_safe_name: Optional[str] = None) -> None:
+        """
+        Drop cached identifier indexes.
+
+        Args:
+            project_safe_name: Project to invalidate, or None for all projects
+        """
+        if project_safe_name is None:
+            self._identifier_indexes.clear()
+        else:
+            self._identifier_indexes.pop(project_safe_name, None)
+
+    def _subscribe_to_changes(self, neo4j_handler) -> bool:
+        """
+        Keep the cached identifier indexes up to date with entity changes.
+
+        Subscribes to the change events of the Neo4j handler.
+
+        Args:
+            neo4j_handler: Neo4jHandler whose writes should update the indexes
+
+        Returns:
+            True if the handler supports change events
+        """
+        add_listener = getattr(neo4j_handler, "add_change_listener", None)
+        if not callable(add_listener):
+            return False
+        add_listener(self._handle_entity_change)
+        return True
+
+    def _unsubscribe_from_changes(self, neo4j_handler) -> None:
+        """Stop receiving change events from a Neo4j handler."""
+        remove_listener = getattr(neo4j_handler, "remove_change_listener", None)
+        if callable(remove_listener):
+            remove_listener(self._handle_entity_change)
+
+    def _handle_entity_change(
+        self,
+        event: str,
+        project_safe_name: str,
+        entity_ids: List[str]
+    ) -> None:
+        """
+        Apply an entity change event to the cached identifier index.
+
+        Created and updated entities are re-read with the identifier
+        projection in one batch so the index reflects their stored state.
+
+        Args:
+            event: Change event name
+            project_safe_name: Project of the changed entities
+            entity_ids: IDs of the changed entities
+        """
+        if event == "project_deleted":
+            self.invalidate_identifier_index(project_safe_name)
+            return
+
+        index = self._identifier_indexes.get(project_safe_name)
+        if index is None or not entity_ids:
+            return
+
+        if event == "people_deleted":
+            for entity_id in entity_ids:
+                index.remove_entity(entity_id)
+            return
+
+        try:
+            entities = self.neo4j_handler.get_people_batch(
+                project_safe_name, entity_ids, fields=self._projection_fields()
+            )
+        except Exception:
+            # Rebuild from scratch on next use rather than serve a stale index
+            self.invalidate_identifier_index(project_safe_name)
+            return
+
+        for entity_id in entity_ids:
+            entity = entities.get(entity_id)
+            if entity:
+                self._refresh_indexed_entity(project_safe_name, entity)
+            else:
+                index.remove_entity(entity_id)
+
+    def _identifier_paths_signature(self) -> Tuple[str, ...]:
+        """Get a hashable signature of the configured identifier paths."""
+        return tuple(id_path["path"] for id_path in self.identifier_paths)
+
+    def _refresh_indexed_entity(self, project_safe_name: str, entity: Dict[str, Any]) -> None:
+        """Update a single entity in the cached index, if one exists."""
+        index = self._identifier_indexes.get(project_safe_name)
+        if index is not None and entity and entity.get("id"):
+            index.add_entity(
+                entity["id"],
+                self._extract_identifiers(entity),
+                self._get_entity_display_name(entity)
+            )
+
+    def _build_suggestion(
+        self,
+        source_id: str,
+        target_id: str,
+        target_name: str,
+        shared_keys: List[Tuple[str, str]],
+        min_confidence: float
+    ) -> Optional[LinkSuggestion]:
+        """
+        Score shared identifier keys and build a suggestion.
+
+        Args:
+            source_id: Source entity ID
+            target_id: Target entity ID
+            target_name: Display name of the target entity
+            shared_keys: (path, value) keys the two entities have in common
+            min_confidence: Minimum confidence score to return a suggestion
+
+        Returns:
+            LinkSuggestion, or None if the score is below min_confidence
+        """
+        matches = []
+        for path, value in shared_keys:
+            matches.append(IdentifierMatch(
+                identifier_type=path.split(".")[-1] if "." in path else path,
+                path=path,
+                value=value,
+                weight=self._get_identifier_weight(path)
+            ))
+
+        if not matches:
+            return None
+
+        confidence = sum(m.weight for m in matches)
+        if confidence < min_confidence:
+            return None
+
+        # Determine relationship type based on confidence
+        if confidence >= self.DUPLICATE_THRESHOLD:
+            rel_type = "POTENTIAL_DUPLICATE"
+        else:
+            rel_type = "SHARED_IDENTIFIER"
+
+        return LinkSuggestion(
+            source_entity_id=source_id,
+            target_entity_id=target_id,
+            target_entity_name=target_name,
+            matching_identifiers=matches,
+            confidence_score=confidence,
+            suggested_relationship_type=rel_type
+        )
+
     def find_matching_entities(
         self,
         project_safe_name: str,
@@ -399,6 +675,10 @@ class AutoLinker:
         """
         Find entities that have matching identifiers with the given entity.
 
+        Candidates come from the IdentifierKey layer in Neo4j when the project
+        has one, otherwise from the in-memory identifier index. Either way only
+        entities sharing at least one identifier value are scored.
+
         Args:
             project_safe_name: The project safe name
             entity_id: The entity ID to find matches for
@@ -413,6 +693,11 @@ class AutoLinker:
         if not self.neo4j_handler:
             return []
 
+        # Single indexed lookup when the project maintains identifier keys
+        key_matches = self.neo4j_handler.find_identifier_matches(project_safe_name, entity_id)
+        if key_matches is not None:
+            return self._suggestions_from_key_matches(entity_id, key_matches, min_confidence)
+
         # Get the source entity
         source_entity = self.neo4j_handler.get_person(project_safe_name, entity_id)
         if not source_entity:
@@ -423,62 +708,58 @@ class AutoLinker:
         if not source_identifiers:
             return []
 
-        # Get all entities in the project
-        all_entities = self.neo4j_handler.get_all_people(project_safe_name)
+        index = self.get_identifier_index(project_safe_name)
+        # The source was just read, so make sure the index reflects it
+        index.add_entity(entity_id, source_identifiers, self._get_entity_display_name(source_entity))
 
         suggestions = []
+        candidates = index.find_candidates(source_identifiers, exclude_id=entity_id)
 
-        for target_entity in all_entities:
-            target_id = target_entity.get("id")
+        for target_id, shared_keys in candidates.items():
+            target_name = index.get_display_name(target_id) or f"Entity {target_id[:8]}"
+            suggestion = self._build_suggestion(
+                entity_id, target_id, target_name, shared_keys, min_confidence
+            )
+            if suggestion:
+                suggestions.append(suggestion)
 
-            # Skip self
-            if target_id == entity_id:
-                continue
+        # Sort by confidence score (highest first)
+        suggestions.sort(key=lambda s: s.confidence_score, reverse=True)
 
-            # Extract target identifiers
-            target_identifiers = self._extract_identifiers(target_entity)
-            if not target_identifiers:
-                continue
+        return suggestions
 
-            # Find matches
-            matches = []
-            for path, source_values in source_identifiers.items():
-                target_values = target_identifiers.get(path, [])
-
-                # Find common values
-                common = set(source_values) & set(target_values)
-                for value in common:
-                    weight = self._get_identifier_weight(path)
-                    matches.append(IdentifierMatch(
-                        identifier_type=path.split(".")[-1] if "." in path else path,
-                        path=path,
-                        value=value,
-                        weight=weight
-                    ))
-
-            if matches:
-                # Calculate confidence score
-                confidence = sum(m.weight for m in matches)
-
-                if confidence >= min_confidence:
-                    # Determine relationship type based on confidence
-                    if confidence >= self.DUPLICATE_THRESHOLD:
-                        rel_type = "POTENTIAL_DUPLICATE"
-                    else:
-                        rel_type = "SHARED_IDENTIFIER"
-
-                    suggestions.append(LinkSuggestion(
-                        source_entity_id=entity_id,
-                        target_entity_id=target_id,
-                        target_entity_name=self._get_entity_display_name(target_entity),
-                        matching_identifiers=matches,
-                        confidence_score=confidence,
-                        suggested_relationship_type=rel_type
-                    ))
+    def _suggestions_from_key_matches(
+        self,
+        entity_id: str,
+        key_matches: List[Dict[str, Any]],
+        min_confidence: float
+    ) -> List[LinkSuggestion]:
+        """
+        Build suggestions from Neo4jHandler.find_identifier_matches rows.
 
-        # Sort by confidence score (highest first)
-        suggestions.sort(key=lambda s: s.confidence_score, reverse=True)
+        Args:
+            entity_id: The source entity ID
+            key_matches: Rows with entity_id, shared keys and a minimal profile
+            min_confidence: Minimum confidence score
 
+        Returns:
+            List of LinkSuggestion objects sorted by confidence
+        """
+        suggestions = []
+        for row in key_matches:
+            target_id = row["entity_id"]
+            shared_keys = [(key["path"], key["value"]) for key in row.get("keys", [])]
+            suggestion = self._build_suggestion(
+                entity_id,
+                target_id,
+                self._get_entity_display_name({"id": target_id, "profile": row.get("profile", {})}),
+                shared_keys,
+                min_confidence
+            )
+            if suggestion:
+                suggestions.append(suggestion)
+
+        suggestions.sort(key=lambda s: s.confidence_score, reverse=True)
         return suggestions
 
     def suggest_links(
@@ -532,68 +813,24 @@ class AutoLinker:
         if not self.neo4j_handler:
             return {"error": "Database not connected"}
 
-        all_entities = self.neo4j_handler.get_all_people(project_safe_name)
+        all_entities = self.neo4j_handler.get_all_people(
+            project_safe_name, fields=self._projection_fields()
+        )
 
-        # Build index of all identifiers
-        entity_identifiers = {}
-        for entity in all_entities:
-            entity_id = entity.get("id")
-            identifiers = self._extract_identifiers(entity)
-            if identifiers:
-                entity_identifiers[entity_id] = {
-                    "entity": entity,
-                    "identifiers": identifiers
-                }
+        # Build the inverted index; only entities sharing a key are compared
+        index = self.build_identifier_index(project_safe_name, all_entities)
 
-        # Find all matches
         all_suggestions = []
-        processed_pairs = set()
-
-        for entity_id, entity_data in entity_identifiers.items():
-            source_identifiers = entity_data["identifiers"]
-
-            for other_id, other_data in entity_identifiers.items():
-                if other_id == entity_id:
-                    continue
-
-                # Skip if already processed (avoid duplicates)
-                pair_key = tuple(sorted([entity_id, other_id]))
-                if pair_key in processed_pairs:
-                    continue
-                processed_pairs.add(pair_key)
-
-                target_identifiers = other_data["identifiers"]
-
-                # Find matches
-                matches = []
-                for path, source_values in source_identifiers.items():
-                    target_values = target_identifiers.get(path, [])
-                    common = set(source_values) & set(target_values)
-
-                    for value in common:
-                        weight = self._get_identifier_weight(path)
-                        matches.append(IdentifierMatch(
-                            identifier_type=path.split(".")[-1] if "." in path else path,
-                            path=path,
-                            value=value,
-                            weight=weight
-                        ))
-
-                if matches:
-                    confidence = sum(m.weight for m in matches)
-
-                    if confidence >= self.LINK_THRESHOLD:
-                        rel_type = "POTENTIAL_DUPLICATE" if confidence >= self.DUPLICATE_THRESHOLD else "SHARED_IDENTIFIER"
-
-                        suggestion = LinkSuggestion(
-                            source_entity_id=entity_id,
-                            target_entity_id=other_id,
-                            target_entity_name=self._get_entity_display_name(other_data["entity"]),
-                            matching_identifiers=matches,
-                            confidence_score=confidence,
-                            suggested_relationship_type=rel_type
-                        )
-                        all_suggestions.append(suggestion)
+        for (source_id, target_id), shared_keys in index.candidate_pairs().items():
+            suggestion = self._build_suggestion(
+                source_id,
+                target_id,
+                index.get_display_name(target_id) or f"Entity {target_id[:8]}",
+                shared_keys,
+                self.LINK_THRESHOLD
+            )
+            if suggestion:
+                all_suggestions.append(suggestion)
 
         # Sort by confidence
         all_suggestions.sort(key=lambda s: s.confidence_score, reverse=True)
@@ -621,7 +858,7 @@ class AutoLinker:
         return {
             "project": project_safe_name,
             "entities_scanned": len(all_entities),
-            "entities_with_identifiers": len(entity_identifiers),
+            "entities_with_identifiers": len(index),
             "potential_duplicates": duplicates,
             "suggested_links": links,
             "total_suggestions": len(all_suggestions),
@@ -737,10 +974,15 @@ class AutoLinker:
         if not updated:
             return {"error": "Failed to update primary entity"}
 
+        self._refresh_indexed_entity(project_safe_name, updated)
+
         # Optionally delete secondary
         deleted = False
         if delete_secondary:
             deleted = self.neo4j_handler.delete_person(project_safe_name, secondary_entity_id)
+            index = self._identifier_indexes.get(project_safe_name)
+            if deleted and index is not None:
+                index.remove_entity(secondary_entity_id)
 
         return {
             "success": True,
@@ -1139,7 +1381,11 @@ def get_auto_linker(neo4j_handler=None) -> AutoLinker:
 
     if _auto_linker_instance is None:
         _auto_linker_instance = AutoLinker(neo4j_handler)
-    elif neo4j_handler is not None:
+    elif neo4j_handler is not None and neo4j_handler is not _auto_linker_instance.neo4j_handler:
+        _auto_linker_instance._unsubscribe_from_changes(_auto_linker_instance.neo4j_handler)
         _auto_linker_instance.neo4j_handler = neo4j_handler
+        _auto_linker_instance._subscribe_to_changes(neo4j_handler)
+        # Indexes built from another database connection are not trustworthy
+        _auto_linker_instance.invalidate_identifier_index()
 
     return _auto_linker_instance
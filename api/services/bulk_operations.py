@@ -13,6 +13,7 @@ Phase 12 Enhancements:
 import csv
 import json
 import io
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Generator, Iterator, List, Optional, Set, Tuple, Union
@@ -32,6 +33,7 @@ class BulkImportResult:
     failed: int = 0
     errors: List[dict] = field(default_factory=list)
     created_ids: List[str] = field(default_factory=list)
+    batches: List[dict] = field(default_factory=list)
 
     def add_success(self, entity_id: str) -> None:
         """Record a successful import."""
@@ -46,6 +48,24 @@ class BulkImportResult:
             "error": message
         })
 
+    def add_batch(
+        self,
+        batch_number: int,
+        size: int,
+        successful: int,
+        failed: int,
+        duration_ms: float
+    ) -> None:
+        """Record the outcome and timing of one import batch."""
+        self.batches.append({
+            "batch": batch_number,
+            "size": size,
+            "successful": successful,
+            "failed": failed,
+            "duration_ms": round(duration_ms, 3),
+            "entities_per_second": round(size / (duration_ms / 1000), 1) if duration_ms > 0 else None
+        })
+
     def to_dict(self) -> dict:
         """Convert to dictionary representation."""
         return {
@@ -53,7 +73,8 @@ class BulkImportResult:
             "successful": self.successful,
             "failed": self.failed,
             "errors": self.errors,
-            "created_ids": self.created_ids
+            "created_ids": self.created_ids,
+            "batches": self.batches
         }
 
 
@@ -136,13 +157,15 @@ class BulkOperationsService:
         """
         Batch import entities into a project.
 
-        Uses batch creation for new entities to improve performance.
+        Each batch costs one existence check for the incoming IDs and one
+        set-based upsert, however creates and updates are mixed. Per-batch
+        timings are recorded in the result.
 
         Args:
             project_id: The project safe name to import into.
             entities: List of entity dictionaries to import.
             update_existing: If True, update existing entities; otherwise skip them.
-            batch_size: Number of entities to create in each batch (default 100).
+            batch_size: Number of entities to import in each batch (default 100).
 
         Returns:
             BulkImportResult with import statistics and any errors.
@@ -155,71 +178,86 @@ class BulkOperationsService:
             result.add_error(-1, f"Project '{project_id}' not found")
             return result
 
-        # Separate entities into updates and creates
-        entities_to_create: List[Tuple[int, dict]] = []  # (index, entity_data)
         now = datetime.now().isoformat()
+        seen_ids: Set[str] = set()
 
-        for index, entity_data in enumerate(entities):
-            try:
-                entity_id = entity_data.get("id")
-
-                if entity_id:
-                    existing = self.neo4j_handler.get_person(project_id, entity_id)
-                    if existing:
-                        if update_existing:
-                            # Update existing entity individually
-                            updated = self.neo4j_handler.update_person(
-                                project_id,
-                                entity_id,
-                                entity_data
-                            )
-                            if updated:
-                                result.add_success(entity_id)
-                            else:
-                                result.add_error(index, f"Failed to update entity '{entity_id}'")
-                        else:
-                            result.add_error(index, f"Entity '{entity_id}' already exists")
-                        continue
+        for batch_number, start in enumerate(range(0, len(entities), batch_size)):
+            started = time.perf_counter()
+            successful_before, failed_before = result.successful, result.failed
+            batch = list(enumerate(entities[start:start + batch_size], start))
+            size = len(batch)
 
-                # Prepare new entity for batch creation
-                if "profile" not in entity_data:
-                    entity_data["profile"] = {}
+            # One query tells which incoming IDs exist, and in which project
+            try:
+                incoming_ids = [
+                    entity_data["id"] for _, entity_data in batch
+                    if isinstance(entity_data, dict) and entity_data.get("id")
+                ]
+                owners = self.neo4j_handler.get_person_projects(incoming_ids) if incoming_ids else {}
+            except Exception as e:
+                for index, _ in batch:
+                    result.add_error(index, f"Existence check failed: {str(e)}")
+                owners, batch = {}, []
 
-                if not entity_id:
-                    entity_data["id"] = str(uuid4())
+            entities_to_upsert: List[Tuple[int, dict]] = []  # (index, entity_data)
+            for index, entity_data in batch:
+                try:
+                    entity_id = entity_data.get("id")
 
-                if "created_at" not in entity_data:
-                    entity_data["created_at"] = now
+                    if entity_id and entity_id in seen_ids:
+                        result.add_error(index, f"Duplicate entity id '{entity_id}' in import")
+                        continue
 
-                entities_to_create.append((index, entity_data))
+                    owner = owners.get(entity_id) if entity_id else None
+                    if owner is not None:
+                        if owner != project_id:
+                            result.add_error(index, f"Entity '{entity_id}' belongs to another project")
+                            continue
+                        if not update_existing:
+                            result.add_error(index, f"Entity '{entity_id}' already exists")
+                            continue
+                    else:
+                        # Prepare new entity
+                        if "profile" not in entity_data:
+                            entity_data["profile"] = {}
 
-            except Exception as e:
-                result.add_error(index, str(e))
+                        if not entity_id:
+                            entity_data["id"] = str(uuid4())
 
-        # Batch create new entities
-        for i in range(0, len(entities_to_create), batch_size):
-            batch = entities_to_create[i:i + batch_size]
-            batch_data = [entity_data for _, entity_data in batch]
-            batch_indices = {entity_data["id"]: idx for idx, entity_data in batch}
+                        if "created_at" not in entity_data:
+                            entity_data["created_at"] = now
 
-            try:
-                created_ids = self.neo4j_handler.create_people_batch(project_id, batch_data)
+                    seen_ids.add(entity_data["id"])
+                    entities_to_upsert.append((index, entity_data))
 
-                # Track successful creates
-                for created_id in created_ids:
-                    result.add_success(created_id)
+                except Exception as e:
+                    result.add_error(index, str(e))
 
-                # Track failures (entities not in created_ids)
-                created_set = set(created_ids)
-                for entity_data in batch_data:
-                    if entity_data["id"] not in created_set:
-                        original_index = batch_indices.get(entity_data["id"], -1)
-                        result.add_error(original_index, "Failed to create entity in batch")
+            if entities_to_upsert:
+                try:
+                    outcome = self.neo4j_handler.upsert_people_batch(
+                        project_id, [entity_data for _, entity_data in entities_to_upsert]
+                    )
+                    applied = set(outcome["created"]) | set(outcome["updated"])
 
-            except Exception as e:
-                # If batch fails, record errors for all entities in batch
-                for idx, entity_data in batch:
-                    result.add_error(idx, f"Batch creation failed: {str(e)}")
+                    for index, entity_data in entities_to_upsert:
+                        if entity_data["id"] in applied:
+                            result.add_success(entity_data["id"])
+                        else:
+                            result.add_error(index, f"Failed to import entity '{entity_data['id']}' in batch")
+
+                except Exception as e:
+                    # If batch fails, record errors for all entities in batch
+                    for index, _ in entities_to_upsert:
+                        result.add_error(index, f"Batch import failed: {str(e)}")
+
+            result.add_batch(
+                batch_number,
+                size=size,
+                successful=result.successful - successful_before,
+                failed=result.failed - failed_before,
+                duration_ms=(time.perf_counter() - started) * 1000
+            )
 
         return result
 
@@ -610,8 +648,10 @@ class BulkOperationsService:
         if not project:
             raise ValueError(f"Project '{project_id}' not found")
 
-        # Get all entities
-        entities = self.neo4j_handler.get_all_people(project_id) or []
+        # Stream entities, loading only the profile sections/fields requested
+        entities = self.neo4j_handler.iter_people(
+            project_id, fields=self._profile_fields_for_paths(fields)
+        )
 
         # Build CSV
         output = io.StringIO()
@@ -633,6 +673,27 @@ class BulkOperationsService:
 
     # ----- Private Helper Methods -----
 
+    def _profile_fields_for_paths(self, field_paths: List[str]) -> Optional[List[str]]:
+        """
+        Map export field paths to the profile fields that must be loaded.
+
+        Args:
+            field_paths: Export paths such as "id" or "profile.core.name".
+
+        Returns:
+            Section IDs / "section.field" keys for iter_people, or None
+            if the whole profile is requested.
+        """
+        profile_fields = []
+        for path in field_paths:
+            parts = path.split(".")
+            if parts[0] != "profile":
+                continue
+            if len(parts) == 1:
+                return None
+            profile_fields.append(".".join(parts[1:3]))
+        return profile_fields
+
     def _get_entity_iterator(
         self,
         project_id: str,
@@ -641,7 +702,8 @@ class BulkOperationsService:
         """
         Get an iterator over entities for streaming export.
 
-        Uses database-level pagination to avoid loading all entities into memory.
+        Uses database-level cursor pagination to avoid loading all entities
+        into memory.
 
         Args:
             project_id: The project safe name.
@@ -665,22 +727,11 @@ class BulkOperationsService:
                             yield entities_map[eid]
             return entity_id_iterator()
         else:
-            # Use database-level pagination for memory efficiency
-            def paginated_iterator() -> Iterator[dict]:
-                page_size = options.batch_size
-                offset = 0
-                while True:
-                    batch = self.neo4j_handler.get_all_people_paginated(
-                        project_id, offset=offset, limit=page_size
-                    )
-                    if not batch:
-                        break
-                    for entity in batch:
-                        yield entity
-                    if len(batch) < page_size:
-                        break
-                    offset += page_size
-            return paginated_iterator()
+            # Keyset pagination: every page seeks past the previous one, so
+            # deep pages of large projects cost the same as the first
+            return self.neo4j_handler.iter_people_pages(
+                project_id, page_size=options.batch_size
+            )
 
     def _get_entity_count(
         self,
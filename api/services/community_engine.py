@@ -0,0 +1,648 @@
+"""
+Community Detection Engine for Basset Hound OSINT Platform.
+
+This module detects communities in a project's relationship graph in
+process, on the integer-indexed adjacency of the cached GraphSnapshot:
+- Louvain modularity optimization with a resolution parameter
+- Asynchronous label propagation
+- Connected components
+
+The graph is treated as undirected and unweighted (one edge per tagged
+pair). It is held in CSR arrays; aggregation between Louvain levels is
+vectorized with NumPy when it is installed and falls back to plain dicts
+otherwise. Runs are seeded, so the same graph version always yields the
+same partition and community IDs.
+
+Partitions are cached on the snapshot they were computed from, so they
+are reused until the project's graph changes.
+"""
+
+import logging
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# NumPy is optional but speeds up building and aggregating the graph
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+LOUVAIN = "louvain"
+LABEL_PROPAGATION = "label_propagation"
+CONNECTED_COMPONENTS = "connected_components"
+
+SUPPORTED_ALGORITHMS = (LOUVAIN, LABEL_PROPAGATION, CONNECTED_COMPONENTS)
+
+# Number of hub entities reported per community
+DEFAULT_HUB_COUNT = 3
+
+# Minimum modularity gain for a Louvain move (guards against float noise)
+MIN_GAIN = 1e-12
+
+
+# =============================================================================
+# GRAPH
+# =============================================================================
+
+class CommunityGraph:
+    """
+    Undirected weighted graph in CSR form.
+
+    Every edge is stored in both directions, so the row sum of a node is
+    its weighted degree. Self-loops only occur in aggregated graphs; they
+    are stored once with the weight of both edge ends, which keeps row
+    sums equal to the summed degrees of the aggregated nodes.
+    """
+
+    def __init__(self, node_count: int, offsets: List[int], targets: List[int],
+                 weights: List[float]):
+        """
+        Initialize a graph from prebuilt CSR lists (see from_edges).
+
+        Args:
+            node_count: Number of nodes
+            offsets: node_count + 1 row offsets
+            targets: Neighbor index per entry
+            weights: Edge weight per entry
+        """
+        self.node_count = node_count
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.degrees = [
+            sum(weights[offsets[i]:offsets[i + 1]]) for i in range(node_count)
+        ]
+        self.total_weight = sum(self.degrees)
+
+    @classmethod
+    def from_edges(cls, node_count: int, sources: Sequence[int], targets: Sequence[int],
+                   weights: Optional[Sequence[float]] = None) -> "CommunityGraph":
+        """
+        Build a graph from directed CSR entries.
+
+        Both directions of every undirected edge must be listed (self-loops
+        once); use from_pairs for plain undirected pairs.
+
+        Args:
+            node_count: Number of nodes
+            sources: Source index per entry
+            targets: Target index per entry
+            weights: Weight per entry (1.0 if omitted)
+
+        Returns:
+            CommunityGraph
+        """
+        if weights is None:
+            weights = [1.0] * len(sources)
+
+        if NUMPY_AVAILABLE:
+            src = np.asarray(sources, dtype=np.int64)
+            order = np.argsort(src, kind="stable")
+            counts = np.bincount(src, minlength=node_count)
+            offsets = np.zeros(node_count + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+            return cls(
+                node_count,
+                offsets.tolist(),
+                np.asarray(targets, dtype=np.int64)[order].tolist(),
+                np.asarray(weights, dtype=np.float64)[order].tolist(),
+            )
+
+        rows: List[List[Tuple[int, float]]] = [[] for _ in range(node_count)]
+        for source, target, weight in zip(sources, targets, weights):
+            rows[source].append((target, weight))
+        offsets = [0]
+        flat_targets: List[int] = []
+        flat_weights: List[float] = []
+        for row in rows:
+            for target, weight in row:
+                flat_targets.append(target)
+                flat_weights.append(weight)
+            offsets.append(len(flat_targets))
+        return cls(node_count, offsets, flat_targets, flat_weights)
+
+    @classmethod
+    def from_pairs(cls, node_count: int, pairs) -> "CommunityGraph":
+        """
+        Build an unweighted graph from undirected pairs.
+
+        Args:
+            node_count: Number of nodes
+            pairs: Iterable of (a, b) index tuples without self-loops
+
+        Returns:
+            CommunityGraph
+        """
+        pairs = list(pairs)
+        firsts = [a for a, _ in pairs]
+        seconds = [b for _, b in pairs]
+        return cls.from_edges(node_count, firsts + seconds, seconds + firsts)
+
+    def aggregate(self, labels: List[int], community_count: int) -> "CommunityGraph":
+        """
+        Collapse every community into a single node.
+
+        Args:
+            labels: Community index (0..community_count - 1) per node
+            community_count: Number of communities
+
+        Returns:
+            CommunityGraph with one node per community
+        """
+        sources = [
+            labels[i]
+            for i in range(self.node_count)
+            for _ in range(self.offsets[i + 1] - self.offsets[i])
+        ]
+
+        if NUMPY_AVAILABLE:
+            src = np.asarray(sources, dtype=np.int64)
+            dst = np.asarray(labels, dtype=np.int64)[np.asarray(self.targets, dtype=np.int64)]
+            keys, inverse = np.unique(src * community_count + dst, return_inverse=True)
+            weights = np.bincount(inverse, weights=np.asarray(self.weights, dtype=np.float64))
+            return CommunityGraph.from_edges(
+                community_count,
+                (keys // community_count).tolist(),
+                (keys % community_count).tolist(),
+                weights.tolist(),
+            )
+
+        merged: Dict[Tuple[int, int], float] = {}
+        for source, target, weight in zip(sources, self.targets, self.weights):
+            key = (source, labels[target])
+            merged[key] = merged.get(key, 0.0) + weight
+        return CommunityGraph.from_edges(
+            community_count,
+            [source for source, _ in merged],
+            [target for _, target in merged],
+            list(merged.values()),
+        )
+
+
+def _renumber(labels: List[int]) -> Tuple[List[int], int]:
+    """Map labels to 0..k-1 in order of first appearance."""
+    mapping: Dict[int, int] = {}
+    renumbered = [mapping.setdefault(label, len(mapping)) for label in labels]
+    return renumbered, len(mapping)
+
+
+# =============================================================================
+# ALGORITHMS
+# =============================================================================
+
+def _local_moving(graph: CommunityGraph, resolution: float, rng: random.Random) -> Tuple[List[int], bool]:
+    """
+    Run the Louvain local moving phase on one level.
+
+    Args:
+        graph: Graph of the current level
+        resolution: Resolution parameter (gamma)
+        rng: Random generator for the node order
+
+    Returns:
+        Tuple of (labels, whether any node moved)
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    degrees = graph.degrees
+    scale = resolution / graph.total_weight
+
+    labels = list(range(graph.node_count))
+    community_totals = list(degrees)
+    order = list(range(graph.node_count))
+    rng.shuffle(order)
+
+    moved = False
+    improved = True
+    while improved:
+        improved = False
+        for node in order:
+            current = labels[node]
+            degree = degrees[node]
+
+            links: Dict[int, float] = {}
+            for e in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[e]
+                if neighbor != node:
+                    label = labels[neighbor]
+                    links[label] = links.get(label, 0.0) + weights[e]
+
+            community_totals[current] -= degree
+            best = current
+            best_gain = links.get(current, 0.0) - scale * community_totals[current] * degree
+            for label, weight in links.items():
+                gain = weight - scale * community_totals[label] * degree
+                if gain > best_gain + MIN_GAIN:
+                    best, best_gain = label, gain
+            community_totals[best] += degree
+
+            if best != current:
+                labels[node] = best
+                improved = True
+                moved = True
+
+    return labels, moved
+
+
+def louvain(graph: CommunityGraph, resolution: float = 1.0, seed: int = 0,
+            max_levels: int = 32) -> List[int]:
+    """
+    Detect communities with the Louvain method.
+
+    Alternates local moving and aggregation until no node changes its
+    community. Higher resolutions favour more, smaller communities.
+
+    Args:
+        graph: Graph to partition
+        resolution: Resolution parameter (gamma)
+        seed: Seed for the node visiting order
+        max_levels: Maximum number of aggregation levels
+
+    Returns:
+        Community index per node (0..k-1)
+    """
+    membership = list(range(graph.node_count))
+    if graph.total_weight == 0:
+        return membership
+
+    rng = random.Random(seed)
+    level = graph
+    for _ in range(max_levels):
+        labels, moved = _local_moving(level, resolution, rng)
+        if not moved:
+            break
+        labels, community_count = _renumber(labels)
+        membership = [labels[m] for m in membership]
+        level = level.aggregate(labels, community_count)
+
+    return _renumber(membership)[0]
+
+
+def label_propagation(graph: CommunityGraph, seed: int = 0,
+                      max_iterations: int = 100) -> List[int]:
+    """
+    Detect communities with asynchronous label propagation.
+
+    Every node repeatedly adopts the label with the highest edge weight
+    among its neighbors; ties keep the current label if it is among the
+    best, otherwise the smallest label wins.
+
+    Args:
+        graph: Graph to partition
+        seed: Seed for the node visiting order
+        max_iterations: Maximum number of sweeps over all nodes
+
+    Returns:
+        Community index per node (0..k-1)
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    labels = list(range(graph.node_count))
+    order = [i for i in range(graph.node_count) if offsets[i + 1] > offsets[i]]
+    rng = random.Random(seed)
+
+    for _ in range(max_iterations):
+        rng.shuffle(order)
+        changed = False
+        for node in order:
+            counts: Dict[int, float] = {}
+            for e in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[e]
+                if neighbor != node:
+                    label = labels[neighbor]
+                    counts[label] = counts.get(label, 0.0) + weights[e]
+            if not counts:
+                continue
+
+            best_weight = max(counts.values())
+            current = labels[node]
+            if counts.get(current) == best_weight:
+                continue
+            labels[node] = min(label for label, weight in counts.items() if weight == best_weight)
+            changed = True
+        if not changed:
+            break
+
+    return _renumber(labels)[0]
+
+
+def connected_components(graph: CommunityGraph) -> List[int]:
+    """
+    Label the connected components of a graph.
+
+    Args:
+        graph: Graph to partition
+
+    Returns:
+        Component index per node (0..k-1)
+    """
+    offsets, targets = graph.offsets, graph.targets
+    labels = [-1] * graph.node_count
+    component = 0
+    for start in range(graph.node_count):
+        if labels[start] >= 0:
+            continue
+        labels[start] = component
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                if labels[neighbor] < 0:
+                    labels[neighbor] = component
+                    stack.append(neighbor)
+        component += 1
+    return labels
+
+
+def modularity(graph: CommunityGraph, labels: Sequence[int], resolution: float = 1.0) -> float:
+    """
+    Compute the modularity of a partition.
+
+    Q = sum over communities of L_c / m - gamma * (d_c / 2m)^2, where L_c
+    is the edge weight inside community c and d_c its total degree.
+
+    Args:
+        graph: Partitioned graph
+        labels: Community index per node
+        resolution: Resolution parameter (gamma)
+
+    Returns:
+        Modularity (0.0 for graphs without edges)
+    """
+    total = graph.total_weight
+    if total == 0:
+        return 0.0
+
+    internal: Dict[int, float] = {}
+    degrees: Dict[int, float] = {}
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    for node in range(graph.node_count):
+        label = labels[node]
+        degrees[label] = degrees.get(label, 0.0) + graph.degrees[node]
+        for e in range(offsets[node], offsets[node + 1]):
+            if labels[targets[e]] == label:
+                internal[label] = internal.get(label, 0.0) + weights[e]
+
+    return sum(
+        internal.get(label, 0.0) / total - resolution * (degree / total) ** 2
+        for label, degree in degrees.items()
+    )
+
+
+# =============================================================================
+# PARTITIONS
+# =============================================================================
+
+@dataclass
+class Community:
+    """A detected community and its edge statistics."""
+    community_id: str
+    member_ids: List[str]
+    internal_edges: int = 0
+    external_edges: int = 0
+    hub_entities: List[str] = field(default_factory=list)
+    bridge_entities: List[str] = field(default_factory=list)
+    connected_communities: List[str] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        """Number of members."""
+        return len(self.member_ids)
+
+    @property
+    def density(self) -> float:
+        """Fraction of possible member pairs that are connected."""
+        possible = self.size * (self.size - 1) / 2
+        return self.internal_edges / possible if possible else 0.0
+
+    @property
+    def cohesion(self) -> float:
+        """Fraction of the members' edges that stay inside the community."""
+        edges = self.internal_edges + self.external_edges
+        return self.internal_edges / edges if edges else 0.0
+
+    @property
+    def is_isolated(self) -> bool:
+        """Whether the community is a single entity without edges."""
+        return self.size == 1 and self.external_edges == 0
+
+
+@dataclass
+class CommunityPartition:
+    """
+    Result of a community detection run on a project graph.
+
+    Communities are ordered by size (largest first) and numbered
+    community_0, community_1, ... in that order.
+    """
+    algorithm: str
+    resolution: float
+    modularity: float
+    communities: List[Community]
+    total_entities: int
+    version: int = 0
+    membership: Dict[str, int] = field(default_factory=dict)
+    internal_degrees: Dict[str, int] = field(default_factory=dict)
+    external_links: Dict[str, Dict[int, int]] = field(default_factory=dict)
+
+    def get_community(self, community_id: str) -> Optional[Community]:
+        """Get a community by ID."""
+        for community in self.communities:
+            if community.community_id == community_id:
+                return community
+        return None
+
+    def community_of(self, entity_id: str) -> Optional[Community]:
+        """Get the community an entity belongs to."""
+        index = self.membership.get(entity_id)
+        return self.communities[index] if index is not None else None
+
+    def entity_membership(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Describe an entity's place in the partition.
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            Dict with community_id, role (hub, bridge, member or isolated),
+            membership_score (share of the entity's edges inside its
+            community) and overlapping_communities, or None if the entity
+            is not part of the graph
+        """
+        community = self.community_of(entity_id)
+        if community is None:
+            return None
+
+        internal = self.internal_degrees.get(entity_id, 0)
+        links = self.external_links.get(entity_id, {})
+        degree = internal + sum(links.values())
+
+        if degree == 0:
+            role = "isolated"
+        elif entity_id in community.hub_entities:
+            role = "hub"
+        elif links:
+            role = "bridge"
+        else:
+            role = "member"
+
+        overlapping = [
+            {
+                "community_id": self.communities[index].community_id,
+                "edge_count": count,
+                "membership_score": round(count / degree, 4),
+            }
+            for index, count in sorted(links.items(), key=lambda item: (-item[1], item[0]))
+        ]
+
+        return {
+            "community_id": community.community_id,
+            "role": role,
+            "membership_score": round(internal / degree, 4) if degree else 1.0,
+            "overlapping_communities": overlapping,
+        }
+
+
+def detect_communities(snapshot, algorithm: str = LOUVAIN, resolution: float = 1.0,
+                       seed: int = 0, hub_count: int = DEFAULT_HUB_COUNT) -> CommunityPartition:
+    """
+    Detect communities in a graph snapshot.
+
+    Args:
+        snapshot: GraphSnapshot of the project
+        algorithm: One of SUPPORTED_ALGORITHMS
+        resolution: Louvain resolution (also used for the modularity score)
+        seed: Seed for the randomized algorithms
+        hub_count: Maximum number of hub entities per community
+
+    Returns:
+        CommunityPartition
+
+    Raises:
+        ValueError: If the algorithm is not supported
+    """
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        raise ValueError(f"Unsupported community detection algorithm: {algorithm}")
+
+    entity_ids = snapshot.entity_ids
+    pairs = snapshot.undirected_pairs()
+    graph = CommunityGraph.from_pairs(len(entity_ids), pairs)
+
+    if algorithm == LOUVAIN:
+        labels = louvain(graph, resolution=resolution, seed=seed)
+    elif algorithm == LABEL_PROPAGATION:
+        labels = label_propagation(graph, seed=seed)
+    else:
+        labels = connected_components(graph)
+
+    score = modularity(graph, labels, resolution)
+    return _build_partition(entity_ids, pairs, labels, algorithm, resolution, score,
+                            getattr(snapshot, "version", 0), hub_count)
+
+
+def _build_partition(entity_ids: List[str], pairs, labels: List[int], algorithm: str,
+                     resolution: float, score: float, version: int,
+                     hub_count: int) -> CommunityPartition:
+    """Collect members and edge statistics per community."""
+    node_count = len(entity_ids)
+    community_count = max(labels, default=-1) + 1
+
+    internal_degrees = [0] * node_count
+    external_links: Dict[int, Dict[int, int]] = {}
+    internal_edges = [0] * community_count
+    external_edges = [0] * community_count
+    neighbors: List[Dict[int, int]] = [{} for _ in range(community_count)]
+
+    for a, b in pairs:
+        label_a, label_b = labels[a], labels[b]
+        if label_a == label_b:
+            internal_edges[label_a] += 1
+            internal_degrees[a] += 1
+            internal_degrees[b] += 1
+            continue
+        external_edges[label_a] += 1
+        external_edges[label_b] += 1
+        for node, own, other in ((a, label_a, label_b), (b, label_b, label_a)):
+            links = external_links.setdefault(node, {})
+            links[other] = links.get(other, 0) + 1
+            neighbors[own][other] = neighbors[own].get(other, 0) + 1
+
+    members: List[List[int]] = [[] for _ in range(community_count)]
+    for node, label in enumerate(labels):
+        members[label].append(node)
+
+    # Largest communities first; ties by their first entity in snapshot order
+    order = sorted(range(community_count), key=lambda label: (-len(members[label]), members[label][0]))
+    rank = {label: position for position, label in enumerate(order)}
+
+    communities = []
+    for label in order:
+        # Hubs first: most edges inside the community, then most edges overall
+        nodes = sorted(members[label], key=lambda node: (
+            -internal_degrees[node],
+            -sum(external_links.get(node, {}).values()),
+            node,
+        ))
+        bridges = sorted(
+            (node for node in nodes if node in external_links),
+            key=lambda node: (-sum(external_links[node].values()), node),
+        )
+        connected = sorted(neighbors[label].items(), key=lambda item: (-item[1], rank[item[0]]))
+        communities.append(Community(
+            community_id=f"community_{rank[label]}",
+            member_ids=[entity_ids[node] for node in nodes],
+            internal_edges=internal_edges[label],
+            external_edges=external_edges[label],
+            hub_entities=[entity_ids[node] for node in nodes[:hub_count] if internal_degrees[node] > 0],
+            bridge_entities=[entity_ids[node] for node in bridges],
+            connected_communities=[f"community_{rank[other]}" for other, _ in connected],
+        ))
+
+    return CommunityPartition(
+        algorithm=algorithm,
+        resolution=resolution,
+        modularity=score,
+        communities=communities,
+        total_entities=node_count,
+        version=version,
+        membership={entity_ids[node]: rank[label] for node, label in enumerate(labels)},
+        internal_degrees={entity_ids[node]: internal_degrees[node] for node in range(node_count)},
+        external_links={
+            entity_ids[node]: {rank[other]: count for other, count in links.items()}
+            for node, links in external_links.items()
+        },
+    )
+
+
+def get_project_communities(neo4j_handler, project_safe_name: str, algorithm: str = LOUVAIN,
+                            resolution: float = 1.0) -> CommunityPartition:
+    """
+    Get the community partition of a project.
+
+    The partition is computed from the handler's cached graph snapshot
+    and cached on that snapshot, so it is reused until the project graph
+    changes.
+
+    Args:
+        neo4j_handler: Neo4jHandler instance
+        project_safe_name: Safe name of the project
+        algorithm: One of SUPPORTED_ALGORITHMS
+        resolution: Louvain resolution
+
+    Returns:
+        CommunityPartition
+    """
+    snapshot = neo4j_handler.get_graph_snapshot(project_safe_name)
+    return snapshot.derive(
+        ("communities", algorithm, resolution),
+        lambda: detect_communities(snapshot, algorithm=algorithm, resolution=resolution),
+    )
@@ -16,10 +16,12 @@ from uuid import uuid4
 import sys
 from pathlib import Path
 
+from fastapi.concurrency import run_in_threadpool
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from config_loader import load_config
+from config_loader import extract_identifier_values, load_config
 
 
 @dataclass
@@ -78,6 +80,9 @@ class CrossProjectLinker:
     Provides functionality to link entities across different projects,
     find potential matches based on shared identifiers, and manage
     cross-project relationships stored in Neo4j.
+
+    The handler is the synchronous Neo4jHandler; every call to it runs in
+    the worker thread pool so the event loop is never blocked.
     """
 
     # Valid link types
@@ -98,7 +103,7 @@ class CrossProjectLinker:
         Initialize the CrossProjectLinker service.
 
         Args:
-            neo4j_handler: Neo4j database handler instance (async)
+            neo4j_handler: Neo4jHandler instance
         """
         self.neo4j_handler = neo4j_handler
         self.config = None
@@ -149,40 +154,6 @@ class CrossProjectLinker:
                                 "multiple": field_def.get("multiple", False)
                             })
 
-    def _normalize_value(self, value: Any, field_type: str = "string") -> Optional[str]:
-        """
-        Normalize an identifier value for comparison.
-
-        Args:
-            value: The value to normalize
-            field_type: The type of field (email, phone, etc.)
-
-        Returns:
-            Normalized string value or None if invalid
-        """
-        if value is None:
-            return None
-
-        if isinstance(value, (dict, list)):
-            return None  # Complex values not directly comparable
-
-        value_str = str(value).strip().lower()
-
-        if not value_str:
-            return None
-
-        # Type-specific normalization
-        if field_type == "email":
-            return value_str
-
-        if field_type in ("phone", "string") and "phone" in field_type.lower():
-            import re
-            if value_str.startswith("+"):
-                return "+" + re.sub(r"[^\d]", "", value_str[1:])
-            return re.sub(r"[^\d]", "", value_str)
-
-        return value_str
-
     def _extract_identifiers(self, entity: Dict[str, Any]) -> Dict[str, List[str]]:
         """
         Extract all identifier values from an entity's profile.
@@ -213,35 +184,8 @@ class CrossProjectLinker:
             if field_data is None:
                 continue
 
-            # Handle the field data
-            values = []
-
-            if isinstance(field_data, list):
-                for item in field_data:
-                    if component_id and isinstance(item, dict):
-                        comp_value = item.get(component_id)
-                        if comp_value:
-                            normalized = self._normalize_value(comp_value, field_type)
-                            if normalized:
-                                values.append(normalized)
-                    elif not component_id:
-                        normalized = self._normalize_value(item, field_type)
-                        if normalized:
-                            values.append(normalized)
-
-            elif isinstance(field_data, dict):
-                if component_id:
-                    comp_value = field_data.get(component_id)
-                    if comp_value:
-                        normalized = self._normalize_value(comp_value, field_type)
-                        if normalized:
-                            values.append(normalized)
-
-            else:
-                normalized = self._normalize_value(field_data, field_type)
-                if normalized:
-                    values.append(normalized)
-
+            # Same normalization as the identifier key layer
+            values = extract_identifier_values(field_data, component_id, field_type)
             if values:
                 identifiers[path] = values
 
@@ -286,12 +230,12 @@ class CrossProjectLinker:
             raise ValueError("Neo4j handler not configured")
 
         # Verify source entity exists
-        source = await self.neo4j_handler.get_person(source_project, source_entity)
+        source = await run_in_threadpool(self.neo4j_handler.get_person, source_project, source_entity)
         if not source:
             raise ValueError(f"Source entity '{source_entity}' not found in project '{source_project}'")
 
         # Verify target entity exists
-        target = await self.neo4j_handler.get_person(target_project, target_entity)
+        target = await run_in_threadpool(self.neo4j_handler.get_person, target_project, target_entity)
         if not target:
             raise ValueError(f"Target entity '{target_entity}' not found in project '{target_project}'")
 
@@ -321,9 +265,13 @@ class CrossProjectLinker:
         if not self.neo4j_handler:
             return
 
-        async with self.neo4j_handler.session() as session:
+        await run_in_threadpool(self._write_link, link)
+
+    def _write_link(self, link: CrossProjectLink) -> None:
+        """Create or update the relationship of a link (blocking)."""
+        with self.neo4j_handler.driver.session() as session:
             # Create or update the cross-project link relationship
-            await session.run("""
+            session.run("""
                 MATCH (source:Person {id: $source_entity_id})
                 MATCH (target:Person {id: $target_entity_id})
                 MERGE (source)-[r:CROSS_PROJECT_LINK {
@@ -367,8 +315,20 @@ class CrossProjectLinker:
         if not self.neo4j_handler:
             return False
 
-        async with self.neo4j_handler.session() as session:
-            result = await session.run("""
+        return await run_in_threadpool(
+            self._delete_link, source_project, source_entity, target_project, target_entity
+        )
+
+    def _delete_link(
+        self,
+        source_project: str,
+        source_entity: str,
+        target_project: str,
+        target_entity: str
+    ) -> bool:
+        """Delete the relationship of a link (blocking)."""
+        with self.neo4j_handler.driver.session() as session:
+            result = session.run("""
                 MATCH (source:Person {id: $source_entity_id})
                       -[r:CROSS_PROJECT_LINK {
                           source_project_id: $source_project_id,
@@ -384,7 +344,7 @@ class CrossProjectLinker:
                 target_project_id=target_project
             )
 
-            record = await result.single()
+            record = result.single()
             return record is not None and record["deleted_count"] > 0
 
     async def get_cross_project_links(
@@ -406,10 +366,22 @@ class CrossProjectLinker:
             return []
 
         links = []
+        outgoing_records, incoming_records = await run_in_threadpool(
+            self._read_links, project_id, entity_id
+        )
+
+        for record in outgoing_records + incoming_records:
+            link = self._record_to_link(record)
+            if link:
+                links.append(link)
+
+        return links
 
-        async with self.neo4j_handler.session() as session:
+    def _read_links(self, project_id: str, entity_id: str):
+        """Read the outgoing and incoming link records of an entity (blocking)."""
+        with self.neo4j_handler.driver.session() as session:
             # Get outgoing links (this entity as source)
-            outgoing_result = await session.run("""
+            outgoing_result = session.run("""
                 MATCH (source:Person {id: $entity_id})
                       -[r:CROSS_PROJECT_LINK {source_project_id: $project_id}]->
                       (target:Person)
@@ -423,14 +395,10 @@ class CrossProjectLinker:
                        r.metadata as metadata
             """, entity_id=entity_id, project_id=project_id)
 
-            outgoing_records = await outgoing_result.data()
-            for record in outgoing_records:
-                link = self._record_to_link(record)
-                if link:
-                    links.append(link)
+            outgoing_records = outgoing_result.data()
 
             # Get incoming links (this entity as target)
-            incoming_result = await session.run("""
+            incoming_result = session.run("""
                 MATCH (source:Person)
                       -[r:CROSS_PROJECT_LINK {target_project_id: $project_id}]->
                       (target:Person {id: $entity_id})
@@ -444,13 +412,9 @@ class CrossProjectLinker:
                        r.metadata as metadata
             """, entity_id=entity_id, project_id=project_id)
 
-            incoming_records = await incoming_result.data()
-            for record in incoming_records:
-                link = self._record_to_link(record)
-                if link:
-                    links.append(link)
+            incoming_records = incoming_result.data()
 
-        return links
+        return outgoing_records, incoming_records
 
     def _record_to_link(self, record: Dict[str, Any]) -> Optional[CrossProjectLink]:
         """Convert a Neo4j record to a CrossProjectLink object."""
@@ -508,17 +472,25 @@ class CrossProjectLinker:
             return []
 
         # Get the source entity
-        source_entity = await self.neo4j_handler.get_person(project_id, entity_id)
+        source_entity = await run_in_threadpool(self.neo4j_handler.get_person, project_id, entity_id)
         if not source_entity:
             return []
 
+        # Single indexed lookup; None until the identifier key layer is built
+        key_matches = await run_in_threadpool(
+            self.neo4j_handler.find_cross_project_identifier_matches,
+            project_id, entity_id, target_projects
+        )
+        if key_matches is not None:
+            return self._matches_from_key_matches(project_id, entity_id, key_matches)
+
         # Extract identifiers from source entity
         source_identifiers = self._extract_identifiers(source_entity)
         if not source_identifiers:
             return []
 
         # Get all projects to search
-        all_projects = await self.neo4j_handler.get_all_projects()
+        all_projects = await run_in_threadpool(self.neo4j_handler.get_all_projects)
         projects_to_search = []
 
         for project in all_projects:
@@ -534,7 +506,7 @@ class CrossProjectLinker:
 
         for target_project in projects_to_search:
             # Get all entities in target project
-            target_entities = await self.neo4j_handler.get_all_people(target_project)
+            target_entities = await run_in_threadpool(self.neo4j_handler.get_all_people, target_project)
 
             for target_entity in target_entities:
                 target_id = target_entity.get("id")
@@ -556,37 +528,88 @@ class CrossProjectLinker:
                         })
 
                 if matching_paths:
-                    # Calculate confidence based on number of matching identifiers
-                    confidence = min(1.0, len(matching_paths) * 0.3)
-
-                    # Determine link type based on confidence
-                    if confidence >= 0.8:
-                        link_type = "SAME_PERSON"
-                    elif confidence >= 0.5:
-                        link_type = "RELATED"
-                    else:
-                        link_type = "RELATED"
-
-                    match = CrossProjectLink(
-                        source_project_id=project_id,
-                        source_entity_id=entity_id,
-                        target_project_id=target_project,
-                        target_entity_id=target_id,
-                        link_type=link_type,
-                        confidence=confidence,
-                        created_at=datetime.now(),
-                        metadata={
-                            "matching_identifiers": matching_paths,
-                            "is_potential": True
-                        }
-                    )
-                    potential_matches.append(match)
+                    potential_matches.append(self._potential_match(
+                        project_id, entity_id, target_project, target_id, matching_paths
+                    ))
 
         # Sort by confidence (highest first)
         potential_matches.sort(key=lambda m: m.confidence, reverse=True)
 
         return potential_matches
 
+    def _matches_from_key_matches(
+        self,
+        project_id: str,
+        entity_id: str,
+        key_matches: List[Dict[str, Any]]
+    ) -> List[CrossProjectLink]:
+        """
+        Build potential matches from Neo4jHandler.find_cross_project_identifier_matches rows.
+
+        Args:
+            project_id: Source project safe_name
+            entity_id: Source entity ID
+            key_matches: Rows with project_safe_name, entity_id and shared keys
+
+        Returns:
+            List of CrossProjectLink objects sorted by confidence
+        """
+        potential_matches = []
+
+        for key_match in key_matches:
+            values_by_path: Dict[str, List[str]] = {}
+            for key in key_match.get("keys", []):
+                values_by_path.setdefault(key["path"], []).append(key["value"])
+
+            matching_paths = [
+                {"path": path, "matching_values": values}
+                for path, values in values_by_path.items()
+            ]
+            if matching_paths:
+                potential_matches.append(self._potential_match(
+                    project_id, entity_id,
+                    key_match["project_safe_name"], key_match["entity_id"],
+                    matching_paths
+                ))
+
+        potential_matches.sort(key=lambda m: m.confidence, reverse=True)
+
+        return potential_matches
+
+    def _potential_match(
+        self,
+        project_id: str,
+        entity_id: str,
+        target_project: str,
+        target_id: str,
+        matching_paths: List[Dict[str, Any]]
+    ) -> CrossProjectLink:
+        """Create a potential match link scored by its matching identifier paths."""
+        # Calculate confidence based on number of matching identifiers
+        confidence = min(1.0, len(matching_paths) * 0.3)
+
+        # Determine link type based on confidence
+        if confidence >= 0.8:
+            link_type = "SAME_PERSON"
+        elif confidence >= 0.5:
+            link_type = "RELATED"
+        else:
+            link_type = "RELATED"
+
+        return CrossProjectLink(
+            source_project_id=project_id,
+            source_entity_id=entity_id,
+            target_project_id=target_project,
+            target_entity_id=target_id,
+            link_type=link_type,
+            confidence=confidence,
+            created_at=datetime.now(),
+            metadata={
+                "matching_identifiers": matching_paths,
+                "is_potential": True
+            }
+        )
+
     async def get_all_linked_entities(
         self,
         project_id: str,
@@ -631,7 +654,7 @@ class CrossProjectLinker:
             visited.add((other_project, other_entity))
 
             # Get entity details
-            entity_data = await self.neo4j_handler.get_person(other_project, other_entity)
+            entity_data = await run_in_threadpool(self.neo4j_handler.get_person, other_project, other_entity)
             if entity_data:
                 linked_entities.append({
                     "project_id": other_project,
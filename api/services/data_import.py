@@ -18,6 +18,8 @@ Features:
 - Dry-run mode for validation without importing
 - Automatic type detection and normalization
 - Entity and orphan data creation support
+- Streaming pipeline: parsing runs ahead in a thread feeding a bounded
+  queue while records are written in typed batches
 
 Usage:
     from api.services.data_import import (
@@ -49,7 +51,9 @@ import csv
 import io
 import json
 import logging
+import queue
 import re
+import threading
 import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -61,6 +65,7 @@ from uuid import uuid4
 from api.models.orphan import IdentifierType, OrphanDataCreate
 from api.models.entity_types import EntityType
 from api.services.normalizer import get_normalizer, DataNormalizer, NormalizedResult
+from api.services.websocket_service import ImportProgressUpdate
 
 
 logger = logging.getLogger("basset_hound.data_import")
@@ -230,6 +235,19 @@ class ImportResult:
 # BASE IMPORT CONNECTOR
 # =============================================================================
 
+# Records written per create_people_batch / bulk orphan import call
+DEFAULT_IMPORT_BATCH_SIZE = 500
+
+# Sentinel marking the end of the parsed record stream
+_PARSE_DONE = object()
+
+
+@dataclass
+class _ParseFailure:
+    """Error raised by a connector's parser, passed through the record queue."""
+    error: Exception
+
+
 class ImportConnector(ABC):
     """
     Abstract base class for OSINT tool import connectors.
@@ -293,17 +311,33 @@ class ImportConnector(ABC):
         content: Union[str, bytes],
         dry_run: bool = False,
         create_entities: bool = True,
-        create_orphans: bool = True
+        create_orphans: bool = True,
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+        progress_callback: Optional[Callable[[ImportProgressUpdate], None]] = None,
+        job_id: Optional[str] = None
     ) -> ImportResult:
         """
         Import data from the tool export.
 
+        The parser runs in a background thread and feeds a bounded queue, so
+        parsing overlaps with database writes without holding the whole
+        export in memory. Records are grouped into typed batches: entities
+        are written with create_people_batch and orphans with the orphan
+        service's bulk import. Relationships are written with
+        create_relationships_batch once all entities exist, so they may
+        point at entities parsed later. A batch that fails as a whole is
+        retried one record at a time to attribute errors.
+
         Args:
             project_id: Target project ID or safe_name
             content: Raw content from the tool export
             dry_run: If True, validate without actually importing
             create_entities: Whether to create entity records
             create_orphans: Whether to create orphan data records
+            batch_size: Number of records written per batch
+            progress_callback: Optional callable receiving an
+                ImportProgressUpdate after every batch
+            job_id: Import job ID reported in progress updates
 
         Returns:
             ImportResult with statistics and details
@@ -312,6 +346,8 @@ class ImportConnector(ABC):
             dry_run=dry_run,
             source_tool=self.get_tool_name()
         )
+        job_id = job_id or str(uuid4())
+        batch_size = max(1, batch_size)
 
         # Verify project exists
         project = self._get_project(project_id)
@@ -321,45 +357,64 @@ class ImportConnector(ABC):
 
         project_safe_name = project.get("safe_name", project_id)
 
-        # Parse and process records
+        entities: List[Tuple[int, Dict[str, Any], List[Dict[str, Any]]]] = []
+        orphans: List[Tuple[int, Dict[str, Any]]] = []
+        relationships: List[Dict[str, Any]] = []
+
+        def report(phase: str, percent: float = 0.0) -> None:
+            if progress_callback is None:
+                return
+            try:
+                progress_callback(ImportProgressUpdate(
+                    job_id=job_id,
+                    progress_percent=percent,
+                    records_processed=result.total_records,
+                    current_phase=phase,
+                    total_records=result.total_records if phase == "complete" else None,
+                    errors_count=len(result.errors),
+                ))
+            except Exception as e:
+                logger.warning(f"Import progress callback failed: {e}")
+
+        stop = threading.Event()
+        records = self._start_parser(content, batch_size * 4, stop)
+
         try:
-            for index, record in enumerate(self.parse(content)):
+            while True:
+                item = records.get()
+                if item is _PARSE_DONE:
+                    break
+                if isinstance(item, _ParseFailure):
+                    result.add_error(-1, f"Parse error: {str(item.error)}")
+                    logger.error(f"Import parse error for {self.get_tool_name()}: {item.error}")
+                    break
+
+                index, record = item
                 result.total_records += 1
 
                 try:
                     record_type = record.get("type", "orphan")
                     record_data = record.get("data", {})
-                    relationships = record.get("relationships", [])
 
                     if record_type == "entity" and create_entities:
-                        if not dry_run:
-                            entity_id = self._create_entity(project_safe_name, record_data)
-                            if entity_id:
-                                result.add_entity(entity_id)
-
-                                # Create relationships if any
-                                for rel in relationships:
-                                    if self._create_relationship(
-                                        project_safe_name,
-                                        entity_id,
-                                        rel
-                                    ):
-                                        result.add_relationship()
-                            else:
-                                result.add_error(index, "Failed to create entity", record_data)
-                        else:
-                            # Dry run - just count
+                        if dry_run:
                             result.entities_created += 1
+                        else:
+                            entities.append((index, record_data, record.get("relationships", [])))
+                            if len(entities) >= batch_size:
+                                self._write_entity_batch(project_safe_name, entities, result, relationships)
+                                entities = []
+                                report("importing")
 
                     elif record_type == "orphan" and create_orphans:
-                        if not dry_run:
-                            orphan_id = self._create_orphan(project_id, record_data)
-                            if orphan_id:
-                                result.add_orphan(orphan_id)
-                            else:
-                                result.add_error(index, "Failed to create orphan", record_data)
-                        else:
+                        if dry_run:
                             result.orphans_created += 1
+                        else:
+                            orphans.append((index, record_data))
+                            if len(orphans) >= batch_size:
+                                self._write_orphan_batch(project_id, orphans, result)
+                                orphans = []
+                                report("importing")
 
                     else:
                         result.skip_record()
@@ -367,9 +422,21 @@ class ImportConnector(ABC):
                 except Exception as e:
                     result.add_error(index, f"Processing error: {str(e)}", record.get("data"))
 
-        except Exception as e:
-            result.add_error(-1, f"Parse error: {str(e)}")
-            logger.error(f"Import parse error for {self.get_tool_name()}: {e}")
+            if entities:
+                self._write_entity_batch(project_safe_name, entities, result, relationships)
+            if orphans:
+                self._write_orphan_batch(project_id, orphans, result)
+            if relationships:
+                report("linking")
+                for start in range(0, len(relationships), batch_size):
+                    self._write_relationship_batch(
+                        project_safe_name, relationships[start:start + batch_size], result
+                    )
+        finally:
+            # Unblock the parser thread if writing stopped early
+            stop.set()
+
+        report("complete", 100.0)
 
         logger.info(
             f"Import from {self.get_tool_name()} complete: "
@@ -414,31 +481,187 @@ class ImportConnector(ABC):
         except Exception:
             return None
 
+    def _start_parser(
+        self,
+        content: Union[str, bytes],
+        max_pending: int,
+        stop: threading.Event
+    ) -> "queue.Queue":
+        """
+        Run parse() in a daemon thread feeding a bounded queue.
+
+        The queue receives (index, record) tuples, then a _ParseFailure if
+        parsing raised, then _PARSE_DONE. The thread gives up once stop is set.
+        """
+        records: "queue.Queue" = queue.Queue(maxsize=max_pending)
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    records.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for item in enumerate(self.parse(content)):
+                    if not put(item):
+                        return
+            except Exception as e:
+                put(_ParseFailure(e))
+            put(_PARSE_DONE)
+
+        threading.Thread(
+            target=produce,
+            name=f"{self.get_tool_name()}-import-parser",
+            daemon=True
+        ).start()
+        return records
+
+    def _entity_payload(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the person data written for a parsed entity record."""
+        return {
+            "id": data.get("id") or str(uuid4()),
+            "profile": data.get("profile", {}),
+            "entity_type": data.get("entity_type", EntityType.PERSON.value),
+            "created_at": datetime.now().isoformat(),
+        }
+
+    def _write_entity_batch(
+        self,
+        project_safe_name: str,
+        batch: List[Tuple[int, Dict[str, Any], List[Dict[str, Any]]]],
+        result: ImportResult,
+        relationships: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Create a batch of entities and queue their relationships.
+
+        Records missing from the batch result are retried one at a time with
+        the same payload, so a retried record keeps its ID.
+        """
+        payloads = [self._entity_payload(data) for _, data, _ in batch]
+
+        try:
+            created_ids = set(self.neo4j.create_people_batch(project_safe_name, payloads) or [])
+        except Exception as e:
+            logger.warning(f"Entity batch failed, retrying records one at a time: {e}")
+            created_ids = set()
+
+        for payload, (index, data, record_relationships) in zip(payloads, batch):
+            if payload["id"] in created_ids:
+                entity_id = payload["id"]
+            else:
+                entity_id = self._create_entity(project_safe_name, payload)
+
+            if not entity_id:
+                result.add_error(index, "Failed to create entity", data)
+                continue
+
+            result.add_entity(entity_id)
+            for rel in record_relationships:
+                if rel.get("target_id"):
+                    relationships.append({
+                        "source_id": entity_id,
+                        "target_id": rel["target_id"],
+                        "relationship_type": rel.get("type", "RELATED_TO"),
+                        "properties": rel.get("properties", {}),
+                    })
+
+    def _write_orphan_batch(
+        self,
+        project_id: str,
+        batch: List[Tuple[int, Dict[str, Any]]],
+        result: ImportResult
+    ) -> None:
+        """Create a batch of orphan data records."""
+        if not self.orphan_service:
+            logger.warning("OrphanService not available for orphan creation")
+            for index, data in batch:
+                result.add_error(index, "Failed to create orphan", data)
+            return
+
+        valid = []
+        for index, data in batch:
+            try:
+                valid.append((index, data, self._orphan_create(data)))
+            except Exception as e:
+                logger.error(f"Failed to create orphan: {e}")
+                result.add_error(index, "Failed to create orphan", data)
+        if not valid:
+            return
+
+        outcome = self.orphan_service.import_orphans_bulk(project_id, [create for _, _, create in valid])
+        orphan_ids = outcome.get("orphan_ids", [])
+
+        if len(orphan_ids) == len(valid):
+            for orphan_id in orphan_ids:
+                result.add_orphan(orphan_id)
+            return
+
+        logger.warning(
+            f"Orphan batch failed ({outcome.get('errors')}), retrying records one at a time"
+        )
+        for index, data, _ in valid:
+            orphan_id = self._create_orphan(project_id, data)
+            if orphan_id:
+                result.add_orphan(orphan_id)
+            else:
+                result.add_error(index, "Failed to create orphan", data)
+
+    def _write_relationship_batch(
+        self,
+        project_safe_name: str,
+        batch: List[Dict[str, Any]],
+        result: ImportResult
+    ) -> None:
+        """Create a batch of relationships between imported entities."""
+        try:
+            created = self.neo4j.create_relationships_batch(project_safe_name, batch)
+        except Exception as e:
+            logger.warning(f"Relationship batch failed, retrying one at a time: {e}")
+            created = [
+                rel for rel in batch
+                if self._create_relationship(project_safe_name, rel["source_id"], {
+                    "target_id": rel["target_id"],
+                    "type": rel["relationship_type"],
+                    "properties": rel["properties"],
+                })
+            ]
+
+        for _ in created:
+            result.add_relationship()
+
     def _create_entity(
         self,
         project_safe_name: str,
-        data: Dict[str, Any]
+        payload: Dict[str, Any]
     ) -> Optional[str]:
-        """Create an entity from parsed data."""
+        """Create an entity from a payload built by _entity_payload."""
         try:
-            entity_id = data.get("id") or str(uuid4())
-            profile = data.get("profile", {})
-            entity_type = data.get("entity_type", EntityType.PERSON.value)
-
-            entity_data = {
-                "id": entity_id,
-                "profile": profile,
-                "entity_type": entity_type,
-                "created_at": datetime.now().isoformat(),
-            }
-
-            created = self.neo4j.create_person(project_safe_name, entity_data)
+            created = self.neo4j.create_person(project_safe_name, dict(payload))
             return created.get("id") if created else None
 
         except Exception as e:
             logger.error(f"Failed to create entity: {e}")
             return None
 
+    def _orphan_create(self, data: Dict[str, Any]) -> OrphanDataCreate:
+        """Build the OrphanDataCreate model for a parsed orphan record."""
+        return OrphanDataCreate(
+            id=data.get("id") or f"orphan-{uuid4()}",
+            identifier_type=IdentifierType(data.get("identifier_type", "other")),
+            identifier_value=data.get("identifier_value", ""),
+            source=data.get("source", self.get_tool_name()),
+            notes=data.get("notes"),
+            tags=data.get("tags", []),
+            confidence_score=data.get("confidence_score"),
+            metadata=data.get("metadata", {}),
+            discovered_date=data.get("discovered_date"),
+        )
+
     def _create_orphan(
         self,
         project_id: str,
@@ -450,17 +673,7 @@ class ImportConnector(ABC):
             return None
 
         try:
-            orphan_create = OrphanDataCreate(
-                id=data.get("id") or f"orphan-{uuid4()}",
-                identifier_type=IdentifierType(data.get("identifier_type", "other")),
-                identifier_value=data.get("identifier_value", ""),
-                source=data.get("source", self.get_tool_name()),
-                notes=data.get("notes"),
-                tags=data.get("tags", []),
-                confidence_score=data.get("confidence_score"),
-                metadata=data.get("metadata", {}),
-                discovered_date=data.get("discovered_date"),
-            )
+            orphan_create = self._orphan_create(data)
 
             created = self.orphan_service.create_orphan(project_id, orphan_create)
             return created.id if created else None
@@ -2004,12 +2217,12 @@ class GenericCSVConnector(ImportConnector):
             if section not in target:
                 target[section] = {}
 
-            for field, values in fields.items():
-                if field not in target[section]:
-                    target[section][field] = []
+            for field_id, values in fields.items():
+                if field_id not in target[section]:
+                    target[section][field_id] = []
 
                 # Add new values
-                existing = target[section][field]
+                existing = target[section][field_id]
                 for val in values:
                     if val not in existing:
                         existing.append(val)
@@ -2093,7 +2306,8 @@ class DataImportService:
         self,
         project_id: str,
         content: Union[str, bytes],
-        dry_run: bool = False
+        dry_run: bool = False,
+        progress_callback: Optional[Callable[[ImportProgressUpdate], None]] = None
     ) -> ImportResult:
         """
         Import data from Maltego CSV export.
@@ -2102,18 +2316,22 @@ class DataImportService:
             project_id: Target project ID
             content: Maltego CSV content
             dry_run: If True, validate without importing
+            progress_callback: Optional callable receiving progress updates
 
         Returns:
             ImportResult with statistics
         """
         connector = MaltegoConnector(self.neo4j, self.orphan_service)
-        return connector.import_data(project_id, content, dry_run)
+        return connector.import_data(
+            project_id, content, dry_run, progress_callback=progress_callback
+        )
 
     def import_spiderfoot(
         self,
         project_id: str,
         content: Union[str, bytes],
-        dry_run: bool = False
+        dry_run: bool = False,
+        progress_callback: Optional[Callable[[ImportProgressUpdate], None]] = None
     ) -> ImportResult:
         """
         Import data from SpiderFoot JSON scan results.
@@ -2122,18 +2340,22 @@ class DataImportService:
             project_id: Target project ID
             content: SpiderFoot JSON content
             dry_run: If True, validate without importing
+            progress_callback: Optional callable receiving progress updates
 
         Returns:
             ImportResult with statistics
         """
         connector = SpiderFootConnector(self.neo4j, self.orphan_service)
-        return connector.import_data(project_id, content, dry_run)
+        return connector.import_data(
+            project_id, content, dry_run, progress_callback=progress_callback
+        )
 
     def import_theharvester(
         self,
         project_id: str,
         content: Union[str, bytes],
-        dry_run: bool = False
+        dry_run: bool = False,
+        progress_callback: Optional[Callable[[ImportProgressUpdate], None]] = None
     ) -> ImportResult:
         """
         Import data from TheHarvester JSON/XML output.
@@ -2142,19 +2364,23 @@ class DataImportService:
             project_id: Target project ID
             content: TheHarvester JSON or XML content
             dry_run: If True, validate without importing
+            progress_callback: Optional callable receiving progress updates
 
         Returns:
             ImportResult with statistics
         """
         connector = TheHarvesterConnector(self.neo4j, self.orphan_service)
-        return connector.import_data(project_id, content, dry_run)
+        return connector.import_data(
+            project_id, content, dry_run, progress_callback=progress_callback
+        )
 
     def import_shodan(
         self,
         project_id: str,
         content: Union[str, bytes],
         dry_run: bool = False,
-        create_device_entities: bool = False
+        create_device_entities: bool = False,
+        progress_callback: Optional[Callable[[ImportProgressUpdate], None]] = None
     ) -> ImportResult:
         """
         Import data from Shodan JSON host export.
@@ -2164,6 +2390,7 @@ class DataImportService:
             content: Shodan JSON content
             dry_run: If True, validate without importing
             create_device_entities: If True, create Device entities for hosts
+            progress_callback: Optional callable receiving progress updates
 
         Returns:
             ImportResult with statistics
@@ -2173,13 +2400,16 @@ class DataImportService:
             self.orphan_service,
             create_device_entities=create_device_entities
         )
-        return connector.import_data(project_id, content, dry_run)
+        return connector.import_data(
+            project_id, content, dry_run, progress_callback=progress_callback
+        )
 
     def import_hibp(
         self,
         project_id: str,
         content: Union[str, bytes],
-        dry_run: bool = False
+        dry_run: bool = False,
+        progress_callback: Optional[Callable[[ImportProgressUpdate], None]] = None
     ) -> ImportResult:
         """
         Import data from Have I Been Pwned breach export.
@@ -2188,12 +2418,15 @@ class DataImportService:
             project_id: Target project ID
             content: HIBP JSON content
             dry_run: If True, validate without importing
+            progress_callback: Optional callable receiving progress updates
 
         Returns:
             ImportResult with statistics
         """
         connector = HIBPConnector(self.neo4j, self.orphan_service)
-        return connector.import_data(project_id, content, dry_run)
+        return connector.import_data(
+            project_id, content, dry_run, progress_callback=progress_callback
+        )
 
     def import_csv(
         self,
@@ -2202,7 +2435,8 @@ class DataImportService:
         mapping: Dict[str, str],
         entity_type: EntityType = EntityType.PERSON,
         create_entities: bool = True,
-        dry_run: bool = False
+        dry_run: bool = False,
+        progress_callback: Optional[Callable[[ImportProgressUpdate], None]] = None
     ) -> ImportResult:
         """
         Import data from generic CSV with custom mapping.
@@ -2214,6 +2448,7 @@ class DataImportService:
             entity_type: Entity type for created entities
             create_entities: Whether to create entities
             dry_run: If True, validate without importing
+            progress_callback: Optional callable receiving progress updates
 
         Returns:
             ImportResult with statistics
@@ -2226,7 +2461,8 @@ class DataImportService:
             project_id,
             content,
             dry_run,
-            create_entities=create_entities
+            create_entities=create_entities,
+            progress_callback=progress_callback
         )
 
     def auto_detect_format(self, content: Union[str, bytes]) -> Optional[str]:
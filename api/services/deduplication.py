@@ -34,9 +34,12 @@ Usage:
     )
 """
 
+import asyncio
 import hashlib
+import os
 import threading
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -44,6 +47,13 @@ from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import re
 import uuid
 
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import Hamming, Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 
 class MatchType(str, Enum):
     """Types of matching strategies."""
@@ -232,6 +242,16 @@ class DeduplicationConfig:
         "crypto_address", "ip_address", "domain",
     ])
 
+    # Candidate blocking for find_all_duplicates
+    blocking_enabled: bool = True
+    sorted_neighborhood_window: int = 5   # Neighbors compared per sorted field value
+    max_block_size: int = 1000            # Larger key blocks are skipped as uninformative
+
+    # Parallel scoring of candidate pairs
+    scoring_workers: int = 0              # 0 = os.cpu_count()
+    scoring_chunk_size: int = 500         # Candidate pairs per worker task
+    parallel_min_pairs: int = 5000        # Score inline below this many pairs
+
 
 @dataclass
 class DeduplicationReport:
@@ -245,6 +265,8 @@ class DeduplicationReport:
     low_confidence_matches: int  # 0.50 - 0.70
     top_duplicate_fields: Dict[str, int]  # field -> count of matches
     estimated_reduction: float  # Percentage of entities that could be merged
+    pairs_considered: int = 0  # Candidate pairs scored after blocking
+    pairs_pruned: int = 0  # Pairs skipped by blocking
     generated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def to_dict(self) -> Dict[str, Any]:
@@ -259,10 +281,74 @@ class DeduplicationReport:
             "low_confidence_matches": self.low_confidence_matches,
             "top_duplicate_fields": self.top_duplicate_fields,
             "estimated_reduction": round(self.estimated_reduction, 2),
+            "pairs_considered": self.pairs_considered,
+            "pairs_pruned": self.pairs_pruned,
             "generated_at": self.generated_at.isoformat(),
         }
 
 
+@dataclass
+class BlockingStats:
+    """Counters from the candidate blocking stage of find_all_duplicates."""
+    total_pairs: int = 0  # n * (n - 1) / 2
+    pairs_considered: int = 0  # Candidate pairs emitted by blocking
+    blocks: int = 0  # Key blocks with at least two entities
+    oversized_blocks_skipped: int = 0  # Blocks larger than max_block_size
+
+    @property
+    def pairs_pruned(self) -> int:
+        """Pairs never scored because they shared no blocking key."""
+        return self.total_pairs - self.pairs_considered
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "total_pairs": self.total_pairs,
+            "pairs_considered": self.pairs_considered,
+            "pairs_pruned": self.pairs_pruned,
+            "blocks": self.blocks,
+            "oversized_blocks_skipped": self.oversized_blocks_skipped,
+        }
+
+
+def _score_candidate_chunk(
+    config: "DeduplicationConfig",
+    match_types: List["MatchType"],
+    chunk: List[Tuple[int, int, Dict[str, Any], Dict[str, Any]]],
+) -> List[Tuple[int, int, Dict[str, Any]]]:
+    """
+    Score a chunk of candidate pairs.
+
+    Module-level so it can run in a ProcessPoolExecutor worker.
+
+    Returns:
+        (left index, right index, comparison result) for pairs above the
+        ignore threshold
+    """
+    service = DeduplicationService(config)
+    scored = []
+
+    # Pairs arrive sorted by left index, so each left entity is scored
+    # against all of its right-hand candidates in one batch
+    start = 0
+    while start < len(chunk):
+        left, _, left_fields, _ = chunk[start]
+        end = start
+        while end < len(chunk) and chunk[end][0] == left:
+            end += 1
+
+        group = chunk[start:end]
+        results = service.score_candidates_batch(
+            left_fields, [right_fields for _, _, _, right_fields in group], match_types
+        )
+        for (_, right, _, _), result in zip(group, results):
+            if result["confidence"] >= config.ignore_threshold:
+                scored.append((left, right, result))
+        start = end
+
+    return scored
+
+
 class DeduplicationService:
     """
     Service for detecting and resolving duplicate entities.
@@ -321,26 +407,20 @@ class DeduplicationService:
 
         candidates: List[DuplicateCandidate] = []
 
-        for candidate in candidate_entities:
-            candidate_id = candidate.get("id", "")
-            if candidate_id == entity_id:
-                continue
+        others = [c for c in candidate_entities if c.get("id", "") != entity_id]
 
-            # Compare entities
-            result = await self._compare_entities(
-                entity_data,
-                candidate.get("profile", candidate),
-                match_types,
-            )
+        # Score all candidates column-wise in one pass
+        results = self.score_candidates_batch(
+            entity_data,
+            [candidate.get("profile", candidate) for candidate in others],
+            match_types,
+        )
+
+        for candidate, result in zip(others, results):
+            candidate_id = candidate.get("id", "")
 
             if result["confidence"] >= self._config.ignore_threshold:
-                # Determine suggested action
-                if result["confidence"] >= self._config.auto_merge_threshold:
-                    suggested_action = "merge"
-                elif result["confidence"] >= self._config.review_threshold:
-                    suggested_action = "review"
-                else:
-                    suggested_action = "ignore"
+                suggested_action = self._suggest_action(result["confidence"])
 
                 candidates.append(DuplicateCandidate(
                     entity_id=candidate_id,
@@ -359,11 +439,7 @@ class DeduplicationService:
         candidates.sort(key=lambda x: x.confidence, reverse=True)
 
         # Cache results
-        cache_key = f"{project_id}:{entity_id}"
-        with self._lock:
-            while len(self._candidate_cache) >= self._max_cache_entries:
-                self._candidate_cache.popitem(last=False)
-            self._candidate_cache[cache_key] = candidates
+        self._cache_candidates(f"{project_id}:{entity_id}", candidates)
 
         return candidates
 
@@ -384,25 +460,243 @@ class DeduplicationService:
         Returns:
             Dictionary mapping entity_id to its duplicate candidates
         """
-        all_duplicates: Dict[str, List[DuplicateCandidate]] = {}
+        all_duplicates, _ = await self.find_all_duplicates_with_stats(
+            project_id, entities, match_types
+        )
+        return all_duplicates
+
+    async def find_all_duplicates_with_stats(
+        self,
+        project_id: str,
+        entities: List[Dict[str, Any]],
+        match_types: Optional[List[MatchType]] = None,
+    ) -> Tuple[Dict[str, List[DuplicateCandidate]], BlockingStats]:
+        """
+        Find all duplicates using candidate blocking and parallel scoring.
+
+        A blocking stage emits only pairs sharing a normalized value, a
+        phonetic key or a sorted-neighborhood window on some identifier
+        field; those pairs are then scored, in a process pool for large sets.
+
+        Args:
+            project_id: Project ID
+            entities: All entities to check
+            match_types: Matching strategies to use
+
+        Returns:
+            Tuple of (entity_id -> duplicate candidates, blocking counters)
+        """
+        if match_types is None:
+            match_types = [
+                MatchType.EXACT,
+                MatchType.CASE_INSENSITIVE,
+                MatchType.FUZZY,
+                MatchType.PHONETIC,
+            ]
 
+        # Only identifier field values are needed for scoring
+        field_values = [
+            self._extract_identifier_values(entity.get("profile", entity))
+            for entity in entities
+        ]
+
+        stats = BlockingStats(total_pairs=len(entities) * (len(entities) - 1) // 2)
+        if self._config.blocking_enabled:
+            pairs = self._block_candidate_pairs(field_values, match_types, stats)
+        else:
+            pairs = [(i, j) for i in range(len(entities)) for j in range(i + 1, len(entities))]
+        stats.pairs_considered = len(pairs)
+
+        scored = await self._score_candidate_pairs(pairs, field_values, match_types)
+
+        compared_at = datetime.now(timezone.utc).isoformat()
+        by_entity: Dict[int, List[DuplicateCandidate]] = {}
+        for left, right, result in scored:
+            candidate = entities[right]
+            by_entity.setdefault(left, []).append(DuplicateCandidate(
+                entity_id=candidate.get("id", ""),
+                entity_name=candidate.get("name", candidate.get("profile", {}).get("name", "Unknown")),
+                confidence=result["confidence"],
+                match_reasons=result["reasons"],
+                field_matches=result["matches"],
+                suggested_action=self._suggest_action(result["confidence"]),
+                metadata={
+                    "project_id": project_id,
+                    "compared_at": compared_at,
+                },
+            ))
+
+        all_duplicates: Dict[str, List[DuplicateCandidate]] = {}
         for i, entity in enumerate(entities):
             entity_id = entity.get("id", str(i))
-            # Compare against remaining entities to avoid duplicate comparisons
-            remaining = entities[i+1:]
-
-            candidates = await self.find_duplicates(
-                project_id=project_id,
-                entity_id=entity_id,
-                entity_data=entity.get("profile", entity),
-                candidate_entities=remaining,
-                match_types=match_types,
-            )
-
+            candidates = by_entity.get(i, [])
+            candidates.sort(key=lambda x: x.confidence, reverse=True)
+            self._cache_candidates(f"{project_id}:{entity_id}", candidates)
             if candidates:
                 all_duplicates[entity_id] = candidates
 
-        return all_duplicates
+        return all_duplicates, stats
+
+    def _extract_identifier_values(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the non-empty identifier field values of a profile."""
+        values = {}
+        for field_id in self._config.identifier_fields:
+            value = self._get_field_value(profile, field_id)
+            if value is None or value == "":
+                continue
+            values[field_id] = value
+        return values
+
+    def _block_candidate_pairs(
+        self,
+        field_values: List[Dict[str, Any]],
+        match_types: List[MatchType],
+        stats: BlockingStats,
+    ) -> List[Tuple[int, int]]:
+        """
+        Emit candidate pairs that share at least one blocking key.
+
+        Keys per identifier field are the normalized value (covers exact and
+        case-insensitive matches), the phonetic code when phonetic matching
+        is enabled, and the tokens of multi-word values and email local
+        parts with their three-letter prefixes and phonetic codes (so
+        "Jane Dough" meets "Janet Dough"). A sorted-neighborhood
+        window then pairs every entity with those whose normalized value is
+        among the next window - 1 distinct values, catching near matches
+        that differ in a few characters even when values repeat.
+
+        Returns:
+            Sorted list of (left index, right index) pairs with left < right
+        """
+        blocks: Dict[Tuple[str, str, str], List[int]] = {}
+        use_phonetic = MatchType.PHONETIC in match_types
+
+        for index, values in enumerate(field_values):
+            for field_id, value in values.items():
+                value = str(value)
+                normalized = self._normalize_string(value) or value.lower()
+                blocks.setdefault(("value", field_id, normalized), []).append(index)
+                if use_phonetic:
+                    code = self._phonetic_code(value)
+                    if code:
+                        blocks.setdefault(("phonetic", field_id, code), []).append(index)
+                for token in self._blocking_tokens(value):
+                    if token != normalized:
+                        blocks.setdefault(("token", field_id, token), []).append(index)
+                    blocks.setdefault(("prefix", field_id, token[:3]), []).append(index)
+                    if use_phonetic:
+                        code = self._phonetic_code(token)
+                        if code:
+                            blocks.setdefault(("phonetic", field_id, code), []).append(index)
+
+        pairs: Set[Tuple[int, int]] = set()
+
+        def add_pairs(left_members: List[int], right_members: List[int]) -> None:
+            for left in left_members:
+                for right in right_members:
+                    if left != right:
+                        pairs.add((left, right) if left < right else (right, left))
+
+        for members in blocks.values():
+            # An entity can repeat a token within one value
+            members = sorted(set(members))
+            if len(members) < 2:
+                continue
+            if len(members) > self._config.max_block_size:
+                stats.oversized_blocks_skipped += 1
+                continue
+            stats.blocks += 1
+            for i, left in enumerate(members):
+                for right in members[i + 1:]:
+                    pairs.add((left, right))
+
+        window = self._config.sorted_neighborhood_window
+        if window > 1:
+            # Slide over distinct values so repeated values cannot fill the window
+            by_field: Dict[str, List[Tuple[str, List[int]]]] = {}
+            for (kind, field_id, key), members in blocks.items():
+                if kind == "value" and len(members) <= self._config.max_block_size:
+                    by_field.setdefault(field_id, []).append((key, members))
+            for keyed in by_field.values():
+                keyed.sort()
+                for i, (_, members) in enumerate(keyed):
+                    for _, neighbors in keyed[i + 1:i + window]:
+                        add_pairs(members, neighbors)
+
+        return sorted(pairs)
+
+    @staticmethod
+    def _blocking_tokens(value: str) -> List[str]:
+        """
+        Get the token blocking keys of a value.
+
+        Emails contribute their local part and its tokens; other values
+        contribute their words when they have more than one. Tokens shorter
+        than two characters are dropped.
+        """
+        text = value.lower()
+        if "@" in text:
+            local = text.split("@", 1)[0]
+            parts = [local] + re.split(r"[^a-z0-9]+", local)
+        else:
+            parts = text.split()
+            if len(parts) < 2:
+                return []
+        tokens = []
+        for part in parts:
+            token = re.sub(r"[^a-z0-9]", "", part)
+            if len(token) >= 2 and token not in tokens:
+                tokens.append(token)
+        return tokens
+
+    async def _score_candidate_pairs(
+        self,
+        pairs: List[Tuple[int, int]],
+        field_values: List[Dict[str, Any]],
+        match_types: List[MatchType],
+    ) -> List[Tuple[int, int, Dict[str, Any]]]:
+        """
+        Score candidate pairs, fanning out to a process pool for large sets.
+
+        Returns:
+            (left index, right index, comparison result) above the ignore threshold
+        """
+        chunk_size = max(1, self._config.scoring_chunk_size)
+        chunks = [
+            [(left, right, field_values[left], field_values[right]) for left, right in pairs[start:start + chunk_size]]
+            for start in range(0, len(pairs), chunk_size)
+        ]
+
+        if len(pairs) < self._config.parallel_min_pairs or len(chunks) < 2:
+            scored = []
+            for chunk in chunks:
+                scored.extend(_score_candidate_chunk(self._config, match_types, chunk))
+            return scored
+
+        workers = self._config.scoring_workers or os.cpu_count() or 1
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            results = await asyncio.gather(*[
+                loop.run_in_executor(executor, _score_candidate_chunk, self._config, match_types, chunk)
+                for chunk in chunks
+            ])
+
+        return [item for chunk_result in results for item in chunk_result]
+
+    def _suggest_action(self, confidence: float) -> str:
+        """Map a confidence score to a suggested action."""
+        if confidence >= self._config.auto_merge_threshold:
+            return "merge"
+        elif confidence >= self._config.review_threshold:
+            return "review"
+        return "ignore"
+
+    def _cache_candidates(self, cache_key: str, candidates: List[DuplicateCandidate]) -> None:
+        """Store candidates in the bounded candidate cache."""
+        with self._lock:
+            while len(self._candidate_cache) >= self._max_cache_entries:
+                self._candidate_cache.popitem(last=False)
+            self._candidate_cache[cache_key] = candidates
 
     async def preview_merge(
         self,
@@ -629,7 +923,9 @@ class DeduplicationService:
             Deduplication analysis report
         """
         # Find all duplicates
-        all_duplicates = await self.find_all_duplicates(project_id, entities)
+        all_duplicates, blocking_stats = await self.find_all_duplicates_with_stats(
+            project_id, entities
+        )
 
         # Count statistics
         total_entities = len(entities)
@@ -678,6 +974,8 @@ class DeduplicationService:
             low_confidence_matches=low_conf,
             top_duplicate_fields=top_fields,
             estimated_reduction=estimated_reduction,
+            pairs_considered=blocking_stats.pairs_considered,
+            pairs_pruned=blocking_stats.pairs_pruned,
         )
 
     async def _compare_entities(
@@ -692,6 +990,15 @@ class DeduplicationService:
         Returns:
             Dict with confidence, reasons, and field matches
         """
+        return self._compare_entities_sync(entity1, entity2, match_types)
+
+    def _compare_entities_sync(
+        self,
+        entity1: Dict[str, Any],
+        entity2: Dict[str, Any],
+        match_types: List[MatchType],
+    ) -> Dict[str, Any]:
+        """Synchronous body of _compare_entities, usable from worker processes."""
         matches: List[MatchResult] = []
         reasons: List[str] = []
         total_weight = 0.0
@@ -761,6 +1068,147 @@ class DeduplicationService:
             "matches": matches,
         }
 
+    def score_candidates_batch(
+        self,
+        entity_data: Dict[str, Any],
+        candidate_profiles: List[Dict[str, Any]],
+        match_types: Optional[List[MatchType]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Score one profile against many candidate profiles at once.
+
+        Each identifier field is scored as a whole column: fuzzy and phonetic
+        similarities go through rapidfuzz.process.extract when rapidfuzz is
+        installed, otherwise the pure-Python per-pair path is used. Results
+        are identical to calling _compare_entities for every candidate.
+
+        Args:
+            entity_data: Query entity profile
+            candidate_profiles: Candidate profiles to score against
+            match_types: Matching strategies to use
+
+        Returns:
+            List of comparison results (confidence, reasons, matches),
+            aligned with candidate_profiles
+        """
+        if match_types is None:
+            match_types = [
+                MatchType.EXACT,
+                MatchType.CASE_INSENSITIVE,
+                MatchType.FUZZY,
+                MatchType.PHONETIC,
+            ]
+
+        count = len(candidate_profiles)
+        matches: List[List[MatchResult]] = [[] for _ in range(count)]
+        reasons: List[List[str]] = [[] for _ in range(count)]
+        total_weight = [0.0] * count
+        weighted_similarity = [0.0] * count
+
+        for field_id in self._config.identifier_fields:
+            query = self._get_field_value(entity_data, field_id)
+            if query is None or query == "":
+                continue
+
+            raw_column = [self._get_field_value(profile, field_id) for profile in candidate_profiles]
+            column = [
+                None if value is None or value == "" else str(value)
+                for value in raw_column
+            ]
+            if not any(value is not None for value in column):
+                continue
+
+            weight = self._config.field_weights.get(field_id, 1.0)
+
+            # Best similarity per candidate across match types
+            best_similarity = [0.0] * count
+            best_match_type = [MatchType.EXACT] * count
+            for match_type in match_types:
+                similarities = self._similarity_column(str(query), column, match_type)
+                for i, similarity in enumerate(similarities):
+                    if similarity > best_similarity[i]:
+                        best_similarity[i] = similarity
+                        best_match_type[i] = match_type
+
+            for i, value in enumerate(column):
+                if value is None:
+                    continue
+
+                is_match = False
+                if best_match_type[i] == MatchType.EXACT and best_similarity[i] == 1.0:
+                    is_match = True
+                    reasons[i].append(f"Exact match on {field_id}")
+                elif best_similarity[i] >= self._config.fuzzy_match_threshold:
+                    is_match = True
+                    reasons[i].append(f"Similar {field_id} ({best_similarity[i]:.0%})")
+
+                matches[i].append(MatchResult(
+                    field_id=field_id,
+                    field_name=field_id,
+                    match_type=best_match_type[i],
+                    similarity=best_similarity[i],
+                    primary_value=query,
+                    duplicate_value=raw_column[i],
+                    is_match=is_match,
+                ))
+
+                if is_match:
+                    total_weight[i] += weight
+                    weighted_similarity[i] += weight * best_similarity[i]
+
+        return [
+            {
+                "confidence": weighted_similarity[i] / total_weight[i] if total_weight[i] > 0 else 0.0,
+                "reasons": reasons[i],
+                "matches": matches[i],
+            }
+            for i in range(count)
+        ]
+
+    def _similarity_column(
+        self,
+        query: str,
+        column: List[Optional[str]],
+        match_type: MatchType,
+    ) -> List[float]:
+        """Similarity of query against every value in a column (None scores 0.0)."""
+        if RAPIDFUZZ_AVAILABLE and match_type == MatchType.FUZZY:
+            return self._extract_scores(
+                query.lower(),
+                [value.lower() if value is not None else None for value in column],
+                Levenshtein.normalized_similarity,
+            )
+
+        if RAPIDFUZZ_AVAILABLE and match_type == MatchType.PHONETIC:
+            # Codes are fixed-width, so positional agreement is Hamming similarity
+            return self._extract_scores(
+                self._phonetic_code(query),
+                [self._phonetic_code(value) if value is not None else None for value in column],
+                Hamming.normalized_similarity,
+            )
+
+        return [
+            self._calculate_similarity(query, value, match_type) if value is not None else 0.0
+            for value in column
+        ]
+
+    def _extract_scores(
+        self,
+        query: str,
+        choices: List[Optional[str]],
+        scorer: Callable[..., float],
+    ) -> List[float]:
+        """Score a query against all choices with rapidfuzz in a single call."""
+        scores = [0.0] * len(choices)
+        if not query:
+            return scores
+        for _, score, index in process.extract(
+            query, choices, scorer=scorer, processor=None, limit=None
+        ):
+            if choices[index]:
+                scores[index] = score
+        return scores
+
     def _get_field_value(self, entity: Dict[str, Any], field_id: str) -> Any:
         """Get field value from entity, handling nested paths."""
         # Handle list fields (e.g., emails, phones)
@@ -828,6 +1276,9 @@ class DeduplicationService:
         if not s1 or not s2:
             return 0.0
 
+        if RAPIDFUZZ_AVAILABLE:
+            return Levenshtein.normalized_similarity(s1, s2)
+
         len1, len2 = len(s1), len(s2)
         if len1 == 0:
             return 0.0 if len2 > 0 else 1.0
@@ -855,36 +1306,36 @@ class DeduplicationService:
         max_len = max(len1, len2)
         return 1.0 - (distance / max_len)
 
+    def _phonetic_code(self, s: str) -> str:
+        """Simple Soundex-like phonetic encoding."""
+        if not s:
+            return ""
+        s = s.upper()
+        # Keep first letter
+        code = s[0]
+        # Map consonants
+        mapping = {
+            "B": "1", "F": "1", "P": "1", "V": "1",
+            "C": "2", "G": "2", "J": "2", "K": "2", "Q": "2", "S": "2", "X": "2", "Z": "2",
+            "D": "3", "T": "3",
+            "L": "4",
+            "M": "5", "N": "5",
+            "R": "6",
+        }
+        prev = ""
+        for c in s[1:]:
+            if c in mapping:
+                if mapping[c] != prev:
+                    code += mapping[c]
+                    prev = mapping[c]
+            else:
+                prev = ""
+        return code[:4].ljust(4, "0")
+
     def _phonetic_similarity(self, s1: str, s2: str) -> float:
         """Calculate phonetic similarity using simple Soundex-like approach."""
-        def simple_phonetic(s: str) -> str:
-            """Simple phonetic encoding."""
-            if not s:
-                return ""
-            s = s.upper()
-            # Keep first letter
-            code = s[0]
-            # Map consonants
-            mapping = {
-                "B": "1", "F": "1", "P": "1", "V": "1",
-                "C": "2", "G": "2", "J": "2", "K": "2", "Q": "2", "S": "2", "X": "2", "Z": "2",
-                "D": "3", "T": "3",
-                "L": "4",
-                "M": "5", "N": "5",
-                "R": "6",
-            }
-            prev = ""
-            for c in s[1:]:
-                if c in mapping:
-                    if mapping[c] != prev:
-                        code += mapping[c]
-                        prev = mapping[c]
-                else:
-                    prev = ""
-            return code[:4].ljust(4, "0")
-
-        code1 = simple_phonetic(s1)
-        code2 = simple_phonetic(s2)
+        code1 = self._phonetic_code(s1)
+        code2 = self._phonetic_code(s2)
 
         if code1 == code2:
             return 1.0
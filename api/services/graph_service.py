@@ -31,6 +31,9 @@ class GraphService:
         """
         Get the complete graph for a project.
 
+        Edges come from the handler's cached graph snapshot; only node
+        payloads are read from the database.
+
         Args:
             project_safe_name: The project's safe name
             include_orphans: Whether to include entities with no relationships
@@ -38,14 +41,42 @@ class GraphService:
         Returns:
             Dict with 'nodes' and 'edges' lists containing raw graph data
         """
+        snapshot = self.neo4j.get_graph_snapshot(project_safe_name)
+        edges = snapshot.edge_dicts()
+
+        if include_orphans:
+            entity_ids = snapshot.entity_ids
+        else:
+            connected_ids = snapshot.connected_ids()
+            entity_ids = [i for i in snapshot.entity_ids if i in connected_ids]
+
+        return {
+            "nodes": self._fetch_nodes(project_safe_name, entity_ids),
+            "edges": edges
+        }
+
+    def _fetch_nodes(self, project_safe_name: str, entity_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch node payloads for a set of entities.
+
+        Args:
+            project_safe_name: The project's safe name
+            entity_ids: IDs of the entities to fetch, in output order
+
+        Returns:
+            List of node dicts with profile data
+        """
         import json
 
+        if not entity_ids:
+            return []
+
         with self.neo4j.driver.session() as session:
-            # Get all entities in the project with their field values
             # Profile data is stored in FieldValue nodes, not on the Person node
             entities_query = """
                 MATCH (project:Project {safe_name: $project_safe_name})
                       -[:HAS_PERSON]->(person:Person)
+                WHERE person.id IN $entity_ids
                 OPTIONAL MATCH (person)-[:HAS_FIELD_VALUE]->(fv:FieldValue)
                 WITH person,
                      COLLECT({
@@ -57,19 +88,17 @@ class GraphService:
                        person.created_at AS created_at,
                        person.entity_type AS entity_type,
                        field_values
-                ORDER BY person.created_at DESC
             """
             entities_result = session.run(
                 entities_query,
-                project_safe_name=project_safe_name
+                project_safe_name=project_safe_name,
+                entity_ids=list(entity_ids)
             )
 
-            nodes = []
-            entity_ids = set()
+            nodes_by_id = {}
 
             for record in entities_result:
                 entity_id = record["id"]
-                entity_ids.add(entity_id)
 
                 # Reconstruct profile from field values
                 profile = {}
@@ -97,7 +126,7 @@ class GraphService:
 
                 entity_type = record.get("entity_type") or "person"
 
-                nodes.append({
+                nodes_by_id[entity_id] = {
                     "id": entity_id,
                     "label": display_name,
                     "type": entity_type.capitalize(),
@@ -106,49 +135,9 @@ class GraphService:
                         "created_at": record["created_at"],
                         "entity_type": entity_type
                     }
-                })
-
-            # Get all relationships between entities
-            edges = []
-
-            for node in nodes:
-                entity_id = node["id"]
-                profile = node["properties"]["profile"]
-                tagged_section = profile.get("Tagged People", {})
-
-                tagged_ids = tagged_section.get("tagged_people", []) or []
-                if not isinstance(tagged_ids, list):
-                    tagged_ids = [tagged_ids] if tagged_ids else []
-
-                relationship_types = tagged_section.get("relationship_types", {}) or {}
-                relationship_properties = tagged_section.get("relationship_properties", {}) or {}
-
-                for target_id in tagged_ids:
-                    # Only include if target exists in this project
-                    if target_id in entity_ids:
-                        rel_type = relationship_types.get(target_id, "RELATED_TO")
-                        rel_props = relationship_properties.get(target_id, {})
-
-                        edges.append({
-                            "source": entity_id,
-                            "target": target_id,
-                            "type": rel_type,
-                            "properties": rel_props
-                        })
-
-            # Filter orphans if needed
-            if not include_orphans:
-                connected_ids = set()
-                for edge in edges:
-                    connected_ids.add(edge["source"])
-                    connected_ids.add(edge["target"])
-
-                nodes = [n for n in nodes if n["id"] in connected_ids]
-
-            return {
-                "nodes": nodes,
-                "edges": edges
-            }
+                }
+
+        return [nodes_by_id[i] for i in entity_ids if i in nodes_by_id]
 
     def get_entity_subgraph(
         self,
@@ -174,22 +163,9 @@ class GraphService:
         if not entity:
             raise ValueError(f"Entity {entity_id} not found in project {project_safe_name}")
 
-        # Get full project graph first
-        full_graph = self.get_project_graph(project_safe_name, include_orphans=True)
-
-        # Build adjacency list for traversal
-        adjacency = {}
-        for edge in full_graph["edges"]:
-            source = edge["source"]
-            target = edge["target"]
-
-            if source not in adjacency:
-                adjacency[source] = []
-            if target not in adjacency:
-                adjacency[target] = []
-
-            adjacency[source].append(target)
-            adjacency[target].append(source)
+        # Traverse the cached graph snapshot in both directions
+        snapshot = self.neo4j.get_graph_snapshot(project_safe_name)
+        adjacency = snapshot.adjacency(bidirectional=True)
 
         # BFS to find entities within depth
         visited = {entity_id}
@@ -207,21 +183,20 @@ class GraphService:
             if not current_level:
                 break
 
-        # Filter nodes and edges to subgraph
-        nodes = [n for n in full_graph["nodes"] if n["id"] in visited]
-        edges = [
-            e for e in full_graph["edges"]
-            if e["source"] in visited and e["target"] in visited
-        ]
+        # Restrict edges to the subgraph and fetch only its nodes
+        edges = snapshot.edge_dicts(visited)
 
-        # Filter orphans if needed
+        node_ids = visited
         if not include_orphans:
-            connected_ids = set()
+            node_ids = set()
             for edge in edges:
-                connected_ids.add(edge["source"])
-                connected_ids.add(edge["target"])
+                node_ids.add(edge["source"])
+                node_ids.add(edge["target"])
 
-            nodes = [n for n in nodes if n["id"] in connected_ids]
+        nodes = self._fetch_nodes(
+            project_safe_name,
+            [i for i in snapshot.entity_ids if i in node_ids]
+        )
 
         return {
             "nodes": nodes,
@@ -260,15 +235,13 @@ class GraphService:
 
         cluster_entity_ids = set(target_cluster["entity_ids"])
 
-        # Get full project graph
-        full_graph = self.get_project_graph(project_safe_name, include_orphans=True)
-
-        # Filter to cluster entities
-        nodes = [n for n in full_graph["nodes"] if n["id"] in cluster_entity_ids]
-        edges = [
-            e for e in full_graph["edges"]
-            if e["source"] in cluster_entity_ids and e["target"] in cluster_entity_ids
-        ]
+        # Restrict the cached graph snapshot to cluster entities
+        snapshot = self.neo4j.get_graph_snapshot(project_safe_name)
+        edges = snapshot.edge_dicts(cluster_entity_ids)
+        nodes = self._fetch_nodes(
+            project_safe_name,
+            [i for i in snapshot.entity_ids if i in cluster_entity_ids]
+        )
 
         return {
             "nodes": nodes,
@@ -14,15 +14,28 @@ that can be rendered by any frontend library.
 import json
 import logging
 import math
+import os
 import random
 import xml.etree.ElementTree as ET
-from collections import defaultdict
+from array import array
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 
+# NumPy is optional but vectorizes force-directed layouts
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 from api.models.entity_types import EntityType
 from api.models.relationship import (
     RelationshipType,
@@ -54,6 +67,12 @@ class ExportFormat(str, Enum):
     DOT = "dot"
 
 
+class NodeSizeMetric(str, Enum):
+    """Centrality metrics that can drive node sizes."""
+    DEGREE = "degree"
+    BETWEENNESS = "betweenness"
+
+
 class NodePriority(str, Enum):
     """Node prioritization strategies for limiting graph size."""
     CENTRALITY = "centrality"
@@ -228,6 +247,35 @@ class LayoutOptions(BaseModel):
         lt=1,
         description="Velocity damping factor"
     )
+    barnes_hut_threshold: int = Field(
+        default=500,
+        ge=0,
+        description="Node count above which repulsion is approximated with a Barnes-Hut grid"
+    )
+    convergence_threshold: float = Field(
+        default=0.1,
+        ge=0,
+        description="Stop early once the mean node movement per iteration falls below this many pixels"
+    )
+    seed: int = Field(
+        default=42,
+        description="Random seed for initial positions"
+    )
+    # Node sizing
+    node_size_metric: NodeSizeMetric = Field(
+        default=NodeSizeMetric.DEGREE,
+        description="Centrality metric that determines node sizes"
+    )
+    betweenness_samples: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of sampled source nodes for approximate betweenness (None = exact)"
+    )
+    betweenness_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Worker processes for betweenness on large graphs"
+    )
     # Hierarchical specific
     level_separation: float = Field(
         default=100.0,
@@ -304,12 +352,17 @@ class ExportOptions(BaseModel):
 # LAYOUT ALGORITHMS
 # =============================================================================
 
+# Rows of the pairwise distance matrix computed at once for exact repulsion
+EXACT_REPULSION_BLOCK = 512
+
+# Average nodes per occupied cell of the finest Barnes-Hut grid, and how
+# many levels the grid may be refined beyond the depth implied by node count
+BARNES_HUT_LEAF_SIZE = 4
+BARNES_HUT_MAX_REFINEMENT = 2
+
 class LayoutEngine:
     """Engine for computing graph layouts."""
 
-    def __init__(self):
-        self._random = random.Random(42)  # Deterministic for testing
-
     def _to_dict(self, obj: Any) -> Dict[str, Any]:
         """Convert object to dict if it's a Pydantic model, otherwise return as-is."""
         if hasattr(obj, "model_dump"):
@@ -378,15 +431,15 @@ class LayoutEngine:
         for node in nodes:
             node_id = self._get_id(node)
             pos = positions.get(node_id, Position(x=0, y=0))
-            if hasattr(node, "model_copy"):
+            if isinstance(node, dict):
+                node["position"] = pos
+                updated = node
+            elif hasattr(node, "model_copy"):
                 # Pydantic v2
                 updated = node.model_copy(update={"position": pos})
             elif hasattr(node, "copy"):
                 # Pydantic v1
                 updated = node.copy(update={"position": pos})
-            elif isinstance(node, dict):
-                node["position"] = pos
-                updated = node
             else:
                 # Fallback - try to set attribute
                 node.position = pos
@@ -405,118 +458,353 @@ class LayoutEngine:
 
         This algorithm treats edges as springs that pull connected nodes together
         and applies repulsive forces between all nodes to prevent overlap.
+        Initial positions are seeded from options.seed, and the simulation
+        stops early once the mean node movement drops below
+        options.convergence_threshold. With NumPy available the forces are
+        vectorized, and graphs larger than options.barnes_hut_threshold
+        approximate repulsion with a Barnes-Hut grid.
 
         Returns dict mapping node IDs to Position objects.
         """
         if not nodes:
             return {}
 
-        # Initialize random positions
-        positions: Dict[str, Tuple[float, float]] = {}
-        velocities: Dict[str, Tuple[float, float]] = {}
-
         width = options.width - 2 * options.padding
         height = options.height - 2 * options.padding
         center_x = options.width / 2
         center_y = options.height / 2
 
-        for node in nodes:
-            node_id = node["id"]
-            # Random initial position in the center area
-            x = center_x + (self._random.random() - 0.5) * width * 0.8
-            y = center_y + (self._random.random() - 0.5) * height * 0.8
-            positions[node_id] = (x, y)
-            velocities[node_id] = (0.0, 0.0)
-
-        # Build adjacency for quick lookup
-        adjacency: Dict[str, Set[str]] = defaultdict(set)
+        # Initialize random positions in the center area
+        rng = random.Random(options.seed)
+        node_ids = [node["id"] for node in nodes]
+        xs = []
+        ys = []
+        for _ in node_ids:
+            xs.append(center_x + (rng.random() - 0.5) * width * 0.8)
+            ys.append(center_y + (rng.random() - 0.5) * height * 0.8)
+
+        # Edges as pairs of node indices
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        sources = []
+        targets = []
         for edge in edges:
-            source = edge["source"]
-            target = edge["target"]
-            adjacency[source].add(target)
-            adjacency[target].add(source)
+            source = index.get(edge["source"])
+            target = index.get(edge["target"])
+            if source is None or target is None or source == target:
+                continue
+            sources.append(source)
+            targets.append(target)
 
         # Optimal distance (Fruchterman-Reingold)
-        area = width * height
-        k = math.sqrt(area / max(len(nodes), 1))
+        k = math.sqrt(width * height / max(len(nodes), 1))
 
-        # Iterative optimization
-        temperature = width / 10
-        cooling_rate = temperature / options.iterations
+        if NUMPY_AVAILABLE:
+            xs, ys = self._force_directed_numpy(xs, ys, sources, targets, k, options)
+        else:
+            xs, ys = self._force_directed_python(xs, ys, sources, targets, k, options)
+
+        return {
+            node_id: Position(x=float(x), y=float(y))
+            for node_id, x, y in zip(node_ids, xs, ys)
+        }
+
+    def _force_directed_python(
+        self,
+        xs: List[float],
+        ys: List[float],
+        sources: List[int],
+        targets: List[int],
+        k: float,
+        options: LayoutOptions
+    ) -> Tuple[List[float], List[float]]:
+        """
+        Run the force-directed simulation in pure Python.
+
+        Repulsion is computed exactly between all node pairs, so this is
+        only used when NumPy is not installed.
 
-        for iteration in range(options.iterations):
-            # Calculate repulsive forces between all node pairs
-            forces: Dict[str, Tuple[float, float]] = {n["id"]: (0.0, 0.0) for n in nodes}
+        Returns:
+            Tuple of final (x, y) coordinate lists
+        """
+        n = len(xs)
+        vxs = [0.0] * n
+        vys = [0.0] * n
+        strength = options.repulsion_strength * k * k
+        min_x, max_x = options.padding, options.width - options.padding
+        min_y, max_y = options.padding, options.height - options.padding
+
+        temperature = (options.width - 2 * options.padding) / 10
+        cooling_rate = temperature / options.iterations
 
-            for i, node1 in enumerate(nodes):
-                for node2 in nodes[i + 1:]:
-                    id1, id2 = node1["id"], node2["id"]
-                    x1, y1 = positions[id1]
-                    x2, y2 = positions[id2]
+        for _ in range(options.iterations):
+            fxs = [0.0] * n
+            fys = [0.0] * n
 
-                    dx = x1 - x2
-                    dy = y1 - y2
+            # Repulsive forces between all node pairs (Coulomb's law style)
+            for i in range(n):
+                x1, y1 = xs[i], ys[i]
+                for j in range(i + 1, n):
+                    dx = x1 - xs[j]
+                    dy = y1 - ys[j]
                     dist = math.sqrt(dx * dx + dy * dy) + 0.01
+                    repulsion = strength / (dist * dist)
+                    fxs[i] += dx * repulsion
+                    fys[i] += dy * repulsion
+                    fxs[j] -= dx * repulsion
+                    fys[j] -= dy * repulsion
+
+            # Attractive forces along edges (Hooke's law style)
+            for source, target in zip(sources, targets):
+                dx = xs[target] - xs[source]
+                dy = ys[target] - ys[source]
+                dist = math.sqrt(dx * dx + dy * dy) + 0.01
+                attraction = options.attraction_strength * dist / k
+                fxs[source] += dx * attraction
+                fys[source] += dy * attraction
+                fxs[target] -= dx * attraction
+                fys[target] -= dy * attraction
+
+            # Update positions with velocity damping, limited by temperature
+            movement = 0.0
+            for i in range(n):
+                vx = (vxs[i] + fxs[i]) * options.damping
+                vy = (vys[i] + fys[i]) * options.damping
+                speed = math.sqrt(vx * vx + vy * vy)
+                if speed > temperature:
+                    vx = (vx / speed) * temperature
+                    vy = (vy / speed) * temperature
+                vxs[i] = vx
+                vys[i] = vy
 
-                    # Repulsive force (Coulomb's law style)
-                    repulsion = (options.repulsion_strength * k * k) / dist
+                x = max(min_x, min(max_x, xs[i] + vx))
+                y = max(min_y, min(max_y, ys[i] + vy))
+                movement += math.sqrt((x - xs[i]) ** 2 + (y - ys[i]) ** 2)
+                xs[i] = x
+                ys[i] = y
 
-                    fx = (dx / dist) * repulsion
-                    fy = (dy / dist) * repulsion
+            # Cool down
+            temperature = max(temperature - cooling_rate, 1.0)
 
-                    forces[id1] = (forces[id1][0] + fx, forces[id1][1] + fy)
-                    forces[id2] = (forces[id2][0] - fx, forces[id2][1] - fy)
+            if movement / n < options.convergence_threshold:
+                break
 
-            # Calculate attractive forces along edges
-            for edge in edges:
-                source, target = edge["source"], edge["target"]
-                if source not in positions or target not in positions:
-                    continue
+        return xs, ys
 
-                x1, y1 = positions[source]
-                x2, y2 = positions[target]
+    def _force_directed_numpy(
+        self,
+        xs: List[float],
+        ys: List[float],
+        sources: List[int],
+        targets: List[int],
+        k: float,
+        options: LayoutOptions
+    ) -> Tuple[Any, Any]:
+        """
+        Run the force-directed simulation with NumPy arrays.
 
-                dx = x2 - x1
-                dy = y2 - y1
-                dist = math.sqrt(dx * dx + dy * dy) + 0.01
+        Returns:
+            Tuple of final (x, y) coordinate arrays
+        """
+        n = len(xs)
+        x = np.array(xs, dtype=float)
+        y = np.array(ys, dtype=float)
+        vx = np.zeros(n)
+        vy = np.zeros(n)
+        source = np.array(sources, dtype=np.intp)
+        target = np.array(targets, dtype=np.intp)
+        strength = options.repulsion_strength * k * k
+        approximate = n > options.barnes_hut_threshold
+
+        temperature = (options.width - 2 * options.padding) / 10
+        cooling_rate = temperature / options.iterations
+
+        for _ in range(options.iterations):
+            if approximate:
+                fx, fy = self._grid_repulsion(x, y, strength)
+            else:
+                fx, fy = self._exact_repulsion(x, y, strength)
+
+            # Attractive forces along edges (Hooke's law style)
+            if len(source):
+                dx = x[target] - x[source]
+                dy = y[target] - y[source]
+                attraction = options.attraction_strength * (np.sqrt(dx * dx + dy * dy) + 0.01) / k
+                dx *= attraction
+                dy *= attraction
+                fx += np.bincount(source, weights=dx, minlength=n) - np.bincount(target, weights=dx, minlength=n)
+                fy += np.bincount(source, weights=dy, minlength=n) - np.bincount(target, weights=dy, minlength=n)
+
+            # Update positions with velocity damping, limited by temperature
+            vx = (vx + fx) * options.damping
+            vy = (vy + fy) * options.damping
+            speed = np.sqrt(vx * vx + vy * vy)
+            limit = np.minimum(1.0, temperature / np.maximum(speed, 1e-12))
+            vx *= limit
+            vy *= limit
+
+            new_x = np.clip(x + vx, options.padding, options.width - options.padding)
+            new_y = np.clip(y + vy, options.padding, options.height - options.padding)
+            movement = float(np.mean(np.sqrt((new_x - x) ** 2 + (new_y - y) ** 2)))
+            x, y = new_x, new_y
+
+            # Cool down
+            temperature = max(temperature - cooling_rate, 1.0)
 
-                # Attractive force (Hooke's law style)
-                attraction = options.attraction_strength * dist * dist / k
+            if movement < options.convergence_threshold:
+                break
 
-                fx = (dx / dist) * attraction
-                fy = (dy / dist) * attraction
+        return x, y
 
-                forces[source] = (forces[source][0] + fx, forces[source][1] + fy)
-                forces[target] = (forces[target][0] - fx, forces[target][1] - fy)
+    def _exact_repulsion(self, x: Any, y: Any, strength: float) -> Tuple[Any, Any]:
+        """
+        Compute the repulsive force on every node from all other nodes.
 
-            # Update positions with velocity damping
-            for node in nodes:
-                node_id = node["id"]
-                fx, fy = forces[node_id]
-                vx, vy = velocities[node_id]
+        Rows are processed in blocks to bound the size of the pairwise
+        distance matrices.
 
-                # Update velocity with force and damping
-                vx = (vx + fx) * options.damping
-                vy = (vy + fy) * options.damping
+        Returns:
+            Tuple of (fx, fy) force arrays
+        """
+        n = len(x)
+        fx = np.empty(n)
+        fy = np.empty(n)
+        for start in range(0, n, EXACT_REPULSION_BLOCK):
+            stop = min(start + EXACT_REPULSION_BLOCK, n)
+            dx = x[start:stop, None] - x[None, :]
+            dy = y[start:stop, None] - y[None, :]
+            dist = np.sqrt(dx * dx + dy * dy) + 0.01
+            repulsion = strength / (dist * dist)
+            fx[start:stop] = (dx * repulsion).sum(axis=1)
+            fy[start:stop] = (dy * repulsion).sum(axis=1)
+        return fx, fy
+
+    def _grid_repulsion(self, x: Any, y: Any, strength: float) -> Tuple[Any, Any]:
+        """
+        Approximate the repulsive forces with a Barnes-Hut grid.
 
-                # Limit velocity by temperature
-                speed = math.sqrt(vx * vx + vy * vy)
-                if speed > temperature:
-                    vx = (vx / speed) * temperature
-                    vy = (vy / speed) * temperature
+        Nodes are binned into a quadtree of regular grids, one per level.
+        Nodes in the same or adjacent cells of the finest grid repel each
+        other exactly. Farther nodes are grouped by the coarsest cell that
+        is not adjacent to the node's own cell and act through that cell's
+        center of mass, so every node pair is counted exactly once.
 
-                velocities[node_id] = (vx, vy)
+        Nodes sharing a position (e.g. piled up in a corner of the canvas)
+        are merged into one weighted point first; they exert no force on
+        each other, so this keeps dense piles from making the near field
+        quadratic.
 
-                # Update position
-                x, y = positions[node_id]
-                x = max(options.padding, min(options.width - options.padding, x + vx))
-                y = max(options.padding, min(options.height - options.padding, y + vy))
-                positions[node_id] = (x, y)
+        Returns:
+            Tuple of (fx, fy) force arrays
+        """
+        points, inverse, weight = np.unique(x + 1j * y, return_inverse=True, return_counts=True)
+        x = points.real
+        y = points.imag
+        weight = weight.astype(float)
+        n = len(x)
+        fx = np.zeros(n)
+        fy = np.zeros(n)
+
+        # Refine the finest grid until occupied cells hold few points on
+        # average, since layouts tend to crowd along the canvas edges
+        min_x = x.min()
+        min_y = y.min()
+        span = max(x.max() - min_x, y.max() - min_y, 1e-9)
+        depth = max(2, math.ceil(math.log(max(n / BARNES_HUT_LEAF_SIZE, 1), 4)))
+        max_depth = depth + BARNES_HUT_MAX_REFINEMENT
+        while True:
+            size = 1 << depth
+            cell_x = np.minimum((x - min_x) * (size / span), size - 1).astype(np.intp)
+            cell_y = np.minimum((y - min_y) * (size / span), size - 1).astype(np.intp)
+            cells = cell_x * size + cell_y
+            counts = np.bincount(cells, minlength=size * size)
+            if depth >= max_depth or n <= BARNES_HUT_LEAF_SIZE * np.count_nonzero(counts):
+                break
+            depth += 1
+
+        # Near field: exact forces from the 3x3 neighbourhood of finest cells
+        order = np.argsort(cells, kind="stable")
+        starts = np.cumsum(counts) - counts
+
+        for offset_x in (-1, 0, 1):
+            for offset_y in (-1, 0, 1):
+                neighbour_x = cell_x + offset_x
+                neighbour_y = cell_y + offset_y
+                nodes = np.nonzero(
+                    (neighbour_x >= 0) & (neighbour_x < size)
+                    & (neighbour_y >= 0) & (neighbour_y < size)
+                )[0]
+                neighbours = neighbour_x[nodes] * size + neighbour_y[nodes]
+                neighbour_counts = counts[neighbours]
+                total = int(neighbour_counts.sum())
+                if not total:
+                    continue
 
-            # Cool down
-            temperature = max(temperature - cooling_rate, 1.0)
+                # Expand to one (node, other) pair per node in the neighbour cell
+                first = np.cumsum(neighbour_counts) - neighbour_counts
+                within = np.arange(total) - np.repeat(first, neighbour_counts)
+                i = np.repeat(nodes, neighbour_counts)
+                j = order[np.repeat(starts[neighbours], neighbour_counts) + within]
+
+                dx = x[i] - x[j]
+                dy = y[i] - y[j]
+                dist = np.sqrt(dx * dx + dy * dy) + 0.01
+                repulsion = strength * weight[j] / (dist * dist)
+                fx += np.bincount(i, weights=dx * repulsion, minlength=n)
+                fy += np.bincount(i, weights=dy * repulsion, minlength=n)
+
+        # Far field: cells that are children of the parent's neighbours but
+        # not neighbours themselves act through their center of mass. Which
+        # offsets qualify depends only on the parity of the node's cell.
+        interaction_offsets = {}
+        for parity_x in (0, 1):
+            for parity_y in (0, 1):
+                offsets = [
+                    (offset_x, offset_y)
+                    for offset_x in range(-2 - parity_x, 4 - parity_x)
+                    for offset_y in range(-2 - parity_y, 4 - parity_y)
+                    if abs(offset_x) > 1 or abs(offset_y) > 1
+                ]
+                interaction_offsets[parity_x, parity_y] = np.array(offsets, dtype=np.intp).T
+
+        for level in range(2, depth + 1):
+            shift = depth - level
+            level_size = 1 << level
+            level_x = cell_x >> shift
+            level_y = cell_y >> shift
+            level_cells = level_x * level_size + level_y
+
+            mass = np.bincount(level_cells, weights=weight, minlength=level_size * level_size)
+            occupied = np.maximum(mass, 1.0)
+            center_x = np.bincount(level_cells, weights=x * weight, minlength=level_size * level_size) / occupied
+            center_y = np.bincount(level_cells, weights=y * weight, minlength=level_size * level_size) / occupied
+
+            for (parity_x, parity_y), (offsets_x, offsets_y) in interaction_offsets.items():
+                group = np.nonzero(((level_x & 1) == parity_x) & ((level_y & 1) == parity_y))[0]
+                if not len(group):
+                    continue
 
-        return {node_id: Position(x=x, y=y) for node_id, (x, y) in positions.items()}
+                other_x = level_x[group, None] + offsets_x
+                other_y = level_y[group, None] + offsets_y
+                valid = (
+                    (other_x >= 0) & (other_x < level_size)
+                    & (other_y >= 0) & (other_y < level_size)
+                )
+                nodes = np.broadcast_to(group[:, None], valid.shape)[valid]
+                others = other_x[valid] * level_size + other_y[valid]
+
+                # Empty cells exert no force
+                nonempty = mass[others] > 0
+                nodes = nodes[nonempty]
+                others = others[nonempty]
+
+                dx = x[nodes] - center_x[others]
+                dy = y[nodes] - center_y[others]
+                dist = np.sqrt(dx * dx + dy * dy) + 0.01
+                repulsion = strength * mass[others] / (dist * dist)
+                fx += np.bincount(nodes, weights=dx * repulsion, minlength=n)
+                fy += np.bincount(nodes, weights=dy * repulsion, minlength=n)
+
+        return fx[inverse], fy[inverse]
 
     def _hierarchical_layout(
         self,
@@ -777,6 +1065,85 @@ class LayoutEngine:
 # GRAPH METRICS AND ANALYSIS
 # =============================================================================
 
+# Source count below which betweenness never fans out to worker processes
+BETWEENNESS_PARALLEL_MIN_SOURCES = 256
+
+# Source batches per worker, so uneven BFS costs even out across workers
+BETWEENNESS_BATCHES_PER_WORKER = 4
+
+
+def _brandes_batch(offsets: array, targets: array, sources: List[int]) -> List[float]:
+    """
+    Accumulate Brandes dependencies for a batch of BFS sources.
+
+    Module-level so it can run in a ProcessPoolExecutor worker. The work
+    arrays are allocated once per batch and only the entries a search
+    visited are reset afterwards.
+
+    Args:
+        offsets: CSR row offsets of the undirected graph
+        targets: CSR neighbor indexes
+        sources: Source node indexes
+
+    Returns:
+        Summed dependency per node (each pair counted from both ends)
+    """
+    node_count = len(offsets) - 1
+    betweenness = [0.0] * node_count
+    distances = [-1] * node_count
+    paths = [0] * node_count
+    dependency = [0.0] * node_count
+
+    for source in sources:
+        distances[source] = 0
+        paths[source] = 1
+        order = []
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            next_distance = distances[node] + 1
+            node_paths = paths[node]
+            for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                if distances[neighbor] < 0:
+                    distances[neighbor] = next_distance
+                    queue.append(neighbor)
+                if distances[neighbor] == next_distance:
+                    paths[neighbor] += node_paths
+
+        for node in reversed(order):
+            previous_distance = distances[node] - 1
+            share = (1.0 + dependency[node]) / paths[node]
+            for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                if distances[neighbor] == previous_distance:
+                    dependency[neighbor] += paths[neighbor] * share
+            if node != source:
+                betweenness[node] += dependency[node]
+
+        for node in order:
+            distances[node] = -1
+            paths[node] = 0
+            dependency[node] = 0.0
+
+    return betweenness
+
+
+@dataclass
+class BetweennessResult:
+    """
+    Betweenness centrality scores with their accuracy.
+
+    Scores are the share of shortest paths between other node pairs that
+    pass through each node (0-1). Sampled scores are within error_bound of
+    the exact scores for all nodes at once, with the given confidence.
+    """
+    scores: Dict[str, float]
+    sources_used: int
+    exact: bool = True
+    error_bound: float = 0.0
+    confidence: float = 1.0
+
+
 class GraphMetrics:
     """Compute graph metrics for visualization enhancement."""
 
@@ -812,71 +1179,130 @@ class GraphMetrics:
             for node_id, degree in degrees.items()
         }
 
+    @staticmethod
+    def betweenness_error_bound(node_count: int, samples: int, confidence: float = 0.95) -> float:
+        """
+        Bound the error of betweenness estimated from sampled sources.
+
+        Each sampled source contributes at most n / (n - 1) to a node's
+        scaled score, so Hoeffding's inequality with a union bound over
+        all nodes gives the maximum absolute error that holds for every
+        node at once with the given confidence.
+
+        Args:
+            node_count: Number of nodes
+            samples: Number of sampled sources
+            confidence: Probability that the bound holds
+
+        Returns:
+            Maximum absolute error of the pair-normalized scores
+        """
+        if node_count < 3 or samples >= node_count:
+            return 0.0
+        spread = node_count / (node_count - 1)
+        return spread * math.sqrt(math.log(2 * node_count / (1 - confidence)) / (2 * samples))
+
+    @staticmethod
+    def compute_betweenness(
+        nodes: List[Dict[str, Any]],
+        edges: List[Dict[str, Any]],
+        samples: Optional[int] = None,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        confidence: float = 0.95
+    ) -> BetweennessResult:
+        """
+        Compute betweenness centrality with Brandes' algorithm.
+
+        Edges are treated as undirected. With samples set, only that many
+        randomly chosen sources are searched and the dependencies are
+        scaled up, which trades accuracy (see betweenness_error_bound) for
+        a proportional speedup. With workers above 1, large source sets
+        are split into batches searched in a process pool.
+
+        Args:
+            nodes: Node dicts with "id"
+            edges: Edge dicts with "source" and "target"
+            samples: Number of sampled sources (None = all nodes)
+            seed: Random seed for source sampling
+            workers: Maximum number of worker processes
+            confidence: Confidence of the reported error bound
+
+        Returns:
+            BetweennessResult
+        """
+        node_ids = [n["id"] for n in nodes]
+        node_count = len(node_ids)
+        if node_count < 3:
+            return BetweennessResult(scores={node_id: 0.0 for node_id in node_ids}, sources_used=0)
+
+        # Unique undirected pairs in CSR form
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        neighbors: List[Set[int]] = [set() for _ in range(node_count)]
+        for edge in edges:
+            source, target = index.get(edge["source"]), index.get(edge["target"])
+            if source is not None and target is not None and source != target:
+                neighbors[source].add(target)
+                neighbors[target].add(source)
+
+        offsets = array("i", [0])
+        targets = array("i")
+        for row in neighbors:
+            targets.extend(sorted(row))
+            offsets.append(len(targets))
+
+        sources = list(range(node_count))
+        exact = samples is None or samples >= node_count
+        if not exact:
+            sources = sorted(random.Random(seed).sample(sources, samples))
+
+        workers = min(workers, os.cpu_count() or 1)
+        if workers > 1 and len(sources) >= BETWEENNESS_PARALLEL_MIN_SOURCES:
+            batch_count = min(len(sources), workers * BETWEENNESS_BATCHES_PER_WORKER)
+            batches = [sources[i::batch_count] for i in range(batch_count)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                partials = list(executor.map(_brandes_batch, repeat(offsets), repeat(targets), batches))
+            betweenness = [sum(values) for values in zip(*partials)]
+        else:
+            betweenness = _brandes_batch(offsets, targets, sources)
+
+        # Scale sampled sources up to all sources, then to the share of
+        # ordered pairs of other nodes (each pair is counted from both ends)
+        scale = (node_count / len(sources)) / ((node_count - 1) * (node_count - 2))
+        return BetweennessResult(
+            scores={node_id: betweenness[i] * scale for i, node_id in enumerate(node_ids)},
+            sources_used=len(sources),
+            exact=exact,
+            error_bound=0.0 if exact else GraphMetrics.betweenness_error_bound(node_count, len(sources), confidence),
+            confidence=1.0 if exact else confidence,
+        )
+
     @staticmethod
     def compute_betweenness_centrality(
         nodes: List[Dict[str, Any]],
-        edges: List[Dict[str, Any]]
+        edges: List[Dict[str, Any]],
+        samples: Optional[int] = None,
+        seed: Optional[int] = None,
+        workers: int = 1
     ) -> Dict[str, float]:
         """
-        Compute approximate betweenness centrality.
+        Compute betweenness centrality scaled to the most central node.
 
         Betweenness centrality measures how often a node lies on shortest paths
-        between other nodes.
-        """
-        if len(nodes) < 3:
-            return {n["id"]: 0.0 for n in nodes}
+        between other nodes. See compute_betweenness for the parameters.
 
-        node_ids = {n["id"] for n in nodes}
-
-        # Build adjacency list
-        adjacency: Dict[str, Set[str]] = defaultdict(set)
-        for edge in edges:
-            source, target = edge["source"], edge["target"]
-            if source in node_ids and target in node_ids:
-                adjacency[source].add(target)
-                adjacency[target].add(source)
+        Returns:
+            Dict mapping node ID to betweenness relative to the maximum (0-1)
+        """
+        scores = GraphMetrics.compute_betweenness(nodes, edges, samples, seed, workers).scores
 
-        betweenness: Dict[str, float] = {n["id"]: 0.0 for n in nodes}
-
-        # For each node, do BFS and count paths
-        for source_node in nodes:
-            source = source_node["id"]
-
-            # BFS from source
-            distances: Dict[str, int] = {source: 0}
-            paths: Dict[str, int] = {source: 1}
-            queue = [source]
-            order = []
-
-            while queue:
-                current = queue.pop(0)
-                order.append(current)
-
-                for neighbor in adjacency[current]:
-                    if neighbor not in distances:
-                        distances[neighbor] = distances[current] + 1
-                        queue.append(neighbor)
-                        paths[neighbor] = 0
-
-                    if distances[neighbor] == distances[current] + 1:
-                        paths[neighbor] += paths[current]
-
-            # Accumulate betweenness
-            delta: Dict[str, float] = {n["id"]: 0.0 for n in nodes}
-            for node in reversed(order[1:]):  # Skip source
-                for neighbor in adjacency[node]:
-                    if distances.get(neighbor, -1) == distances.get(node, 0) - 1:
-                        delta[neighbor] += (paths[neighbor] / max(paths[node], 1)) * (1 + delta[node])
-                betweenness[node] += delta[node]
-
-        # Normalize
-        max_betweenness = max(betweenness.values()) if betweenness else 1
+        max_betweenness = max(scores.values()) if scores else 1
         if max_betweenness == 0:
             max_betweenness = 1
 
         return {
             node_id: value / max_betweenness
-            for node_id, value in betweenness.items()
+            for node_id, value in scores.items()
         }
 
     @staticmethod
@@ -1247,6 +1673,10 @@ class GraphExporter:
 # MAIN SERVICE CLASS
 # =============================================================================
 
+# Profile sections loaded for graph nodes; node labels are built from these
+GRAPH_LABEL_SECTIONS = ("profile", "core")
+
+
 class GraphVisualizationService:
     """
     Graph Visualization Service for Basset Hound OSINT Platform.
@@ -1421,6 +1851,12 @@ class GraphVisualizationService:
         if not self.neo4j_handler:
             return {"nodes": [], "edges": []}
 
+        # Prefer the handler's cached graph snapshot over parsing every profile
+        if callable(getattr(self.neo4j_handler, "get_graph_snapshot", None)):
+            return await run_in_threadpool(
+                self._fetch_snapshot_graph, project_safe_name, include_orphans
+            )
+
         async with self.neo4j_handler.session() as session:
             # Get all entities
             entities_result = await session.run("""
@@ -1497,6 +1933,46 @@ class GraphVisualizationService:
 
             return {"nodes": nodes, "edges": edges}
 
+    def _fetch_snapshot_graph(
+        self,
+        project_safe_name: str,
+        include_orphans: bool
+    ) -> Dict[str, Any]:
+        """
+        Build project graph data from the handler's graph snapshot.
+
+        Blocking; only the profile sections node labels are built from
+        (GRAPH_LABEL_SECTIONS) are loaded.
+        """
+        snapshot = self.neo4j_handler.get_graph_snapshot(project_safe_name)
+        edges = snapshot.edge_dicts()
+
+        entity_ids = snapshot.entity_ids
+        if not include_orphans:
+            connected_ids = snapshot.connected_ids()
+            entity_ids = [i for i in entity_ids if i in connected_ids]
+
+        people = self.neo4j_handler.get_people_batch(
+            project_safe_name, entity_ids, sections=list(GRAPH_LABEL_SECTIONS)
+        )
+        nodes = []
+        for entity_id in entity_ids:
+            person = people.get(entity_id)
+            if person is None:
+                continue
+            profile = person.get("profile") or {}
+            nodes.append({
+                "id": entity_id,
+                "label": self._extract_display_name(profile, entity_id),
+                "type": "Person",
+                "properties": {
+                    "profile": profile,
+                    "created_at": person.get("created_at")
+                }
+            })
+
+        return {"nodes": nodes, "edges": edges}
+
     async def _extract_subgraph(
         self,
         project_safe_name: str,
@@ -1638,14 +2114,32 @@ class GraphVisualizationService:
             return VisualizationGraph()
 
         # Compute layout positions
-        positions = self.layout_engine.compute_layout(
+        laid_out = self.layout_engine.compute_layout(
             raw_nodes,
             raw_edges,
             layout_options
         )
+        positions = {node["id"]: node["position"] for node in laid_out}
 
         # Compute metrics
-        centralities = self.metrics.compute_degree_centrality(raw_nodes, raw_edges)
+        metadata: Dict[str, Any] = {"node_size_metric": layout_options.node_size_metric.value}
+        if layout_options.node_size_metric == NodeSizeMetric.BETWEENNESS:
+            betweenness = self.metrics.compute_betweenness(
+                raw_nodes,
+                raw_edges,
+                samples=layout_options.betweenness_samples,
+                seed=layout_options.seed,
+                workers=layout_options.betweenness_workers
+            )
+            max_betweenness = max(betweenness.scores.values(), default=0.0) or 1.0
+            centralities = {
+                node_id: value / max_betweenness
+                for node_id, value in betweenness.scores.items()
+            }
+            metadata["betweenness_sources"] = betweenness.sources_used
+            metadata["betweenness_error_bound"] = round(betweenness.error_bound, 6)
+        else:
+            centralities = self.metrics.compute_degree_centrality(raw_nodes, raw_edges)
         degrees = self.metrics.compute_node_degrees(raw_nodes, raw_edges)
 
         # Build visualization nodes
@@ -1746,7 +2240,8 @@ class GraphVisualizationService:
                 "node_count": len(vis_nodes),
                 "edge_count": len(vis_edges),
                 "layout_algorithm": layout_options.algorithm.value,
-                "layout_iterations": layout_options.iterations
+                "layout_iterations": layout_options.iterations,
+                **metadata
             }
         )
 
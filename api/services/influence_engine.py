@@ -0,0 +1,486 @@
+"""
+Influence Metrics Engine for Basset Hound OSINT Platform.
+
+This module scores entity influence on the integer-indexed adjacency of a
+project's cached GraphSnapshot:
+- PageRank and eigenvector centrality by power iteration, run together
+  over the same edge arrays and stopped early on an L1 delta
+- Degree centrality
+- Betweenness centrality from GraphMetrics.compute_betweenness, the
+  sampled Brandes implementation shared with graph visualization
+- Closeness centrality from one breadth-first search per entity
+
+The graph is treated as undirected (one edge per tagged pair). With NumPy
+installed every iteration is a sparse matrix-vector product done with
+np.bincount over the edge arrays; without it the same products run as
+plain loops.
+
+Scores are cached on the snapshot they were computed from, together with
+their ranking order, so top-k queries are lookups until the project's
+graph changes.
+"""
+
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from api.services.graph_visualization import GraphMetrics
+
+# NumPy is optional but vectorizes the power iterations
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+PAGERANK = "pagerank"
+EIGENVECTOR = "eigenvector"
+DEGREE = "degree"
+BETWEENNESS = "betweenness"
+CLOSENESS = "closeness"
+
+SPECTRAL_METRICS = (PAGERANK, EIGENVECTOR, DEGREE)
+PATH_METRICS = (BETWEENNESS, CLOSENESS)
+
+DEFAULT_DAMPING_FACTOR = 0.85
+DEFAULT_MAX_ITERATIONS = 100
+
+# Power iterations stop once the L1 change of the score vector drops below
+# this value (scaled by the entity count for eigenvector centrality, whose
+# vector has unit L2 norm rather than unit sum)
+DEFAULT_TOLERANCE = 1e-6
+
+# Betweenness is searched from at most this many sampled entities; smaller
+# projects are scored exactly. The fixed seed keeps rankings stable across
+# recomputations of the same graph.
+DEFAULT_BETWEENNESS_SAMPLES = 256
+BETWEENNESS_SEED = 0
+
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+@dataclass
+class InfluenceScores:
+    """
+    Influence scores of every entity in a project graph.
+
+    Scores are stored per metric as lists aligned with entity_ids. Rankings
+    are sorted once per metric and reused by later top-k queries.
+    """
+    entity_ids: List[str]
+    scores: Dict[str, List[float]]
+    degrees: List[int]
+    iterations: Dict[str, int] = field(default_factory=dict)
+    converged: Dict[str, bool] = field(default_factory=dict)
+    damping_factor: float = DEFAULT_DAMPING_FACTOR
+    version: int = 0
+    _rankings: Dict[str, List[int]] = field(default_factory=dict, repr=False)
+
+    def ranking(self, metric: str) -> List[int]:
+        """
+        Get entity indexes ordered by a metric, highest first.
+
+        Ties are broken by snapshot order.
+
+        Args:
+            metric: Metric name
+
+        Returns:
+            List of entity indexes
+        """
+        order = self._rankings.get(metric)
+        if order is None:
+            values = self.scores[metric]
+            order = sorted(range(len(values)), key=lambda i: (-values[i], i))
+            self._rankings[metric] = order
+        return order
+
+    def top(self, metric: str, limit: int) -> List[Tuple[str, float]]:
+        """
+        Get the highest scoring entities for a metric.
+
+        Args:
+            metric: Metric name
+            limit: Maximum number of entities
+
+        Returns:
+            List of (entity_id, score) tuples, highest first
+        """
+        values = self.scores[metric]
+        return [(self.entity_ids[i], values[i]) for i in self.ranking(metric)[:limit]]
+
+    def metrics(self, index: int) -> Dict[str, float]:
+        """Get every metric score of the entity at an index."""
+        return {metric: values[index] for metric, values in self.scores.items()}
+
+
+# =============================================================================
+# GRAPH ARRAYS
+# =============================================================================
+
+def _edge_arrays(snapshot) -> Tuple[int, List[int], List[int]]:
+    """Get both directions of every undirected edge as parallel lists."""
+    pairs = snapshot.undirected_pairs()
+    firsts = [a for a, _ in pairs]
+    seconds = [b for _, b in pairs]
+    return len(snapshot.entity_ids), firsts + seconds, seconds + firsts
+
+
+def _csr(node_count: int, sources: List[int], targets: List[int]) -> Tuple[List[int], List[int]]:
+    """Group edge targets by source into CSR offsets and targets."""
+    rows: List[List[int]] = [[] for _ in range(node_count)]
+    for source, target in zip(sources, targets):
+        rows[source].append(target)
+    offsets = [0]
+    flat: List[int] = []
+    for row in rows:
+        flat.extend(sorted(row))
+        offsets.append(len(flat))
+    return offsets, flat
+
+
+# =============================================================================
+# ALGORITHMS
+# =============================================================================
+
+def _spectral_numpy(node_count, sources, targets, damping_factor, max_iterations, tolerance):
+    """Run PageRank and eigenvector power iterations with NumPy."""
+    src = np.asarray(sources, dtype=np.int64)
+    dst = np.asarray(targets, dtype=np.int64)
+    degrees = np.bincount(src, minlength=node_count).astype(np.float64)
+    dangling = degrees == 0
+    share = 1.0 / np.where(dangling, 1.0, degrees)
+
+    pagerank = np.full(node_count, 1.0 / node_count)
+    eigenvector = np.full(node_count, 1.0 / np.sqrt(node_count))
+    iterations = {PAGERANK: max_iterations, EIGENVECTOR: max_iterations}
+    converged = {PAGERANK: False, EIGENVECTOR: False}
+
+    for iteration in range(1, max_iterations + 1):
+        if not converged[PAGERANK]:
+            spread = np.bincount(dst, weights=(pagerank * share)[src], minlength=node_count)
+            updated = damping_factor * (spread + pagerank[dangling].sum() / node_count)
+            updated += (1.0 - damping_factor) / node_count
+            delta = np.abs(updated - pagerank).sum()
+            pagerank = updated
+            if delta < tolerance:
+                converged[PAGERANK] = True
+                iterations[PAGERANK] = iteration
+
+        if not converged[EIGENVECTOR]:
+            # Iterate on A + I so bipartite graphs do not oscillate
+            updated = eigenvector + np.bincount(dst, weights=eigenvector[src], minlength=node_count)
+            updated /= np.linalg.norm(updated)
+            delta = np.abs(updated - eigenvector).sum()
+            eigenvector = updated
+            if delta < tolerance * node_count:
+                converged[EIGENVECTOR] = True
+                iterations[EIGENVECTOR] = iteration
+
+        if all(converged.values()):
+            break
+
+    return pagerank.tolist(), eigenvector.tolist(), degrees.astype(np.int64).tolist(), iterations, converged
+
+
+def _spectral_python(node_count, sources, targets, damping_factor, max_iterations, tolerance):
+    """Run PageRank and eigenvector power iterations with plain loops."""
+    degrees = [0] * node_count
+    for source in sources:
+        degrees[source] += 1
+
+    pagerank = [1.0 / node_count] * node_count
+    eigenvector = [1.0 / node_count ** 0.5] * node_count
+    iterations = {PAGERANK: max_iterations, EIGENVECTOR: max_iterations}
+    converged = {PAGERANK: False, EIGENVECTOR: False}
+
+    for iteration in range(1, max_iterations + 1):
+        if not converged[PAGERANK]:
+            spread = [0.0] * node_count
+            for source, target in zip(sources, targets):
+                spread[target] += pagerank[source] / degrees[source]
+            dangling = sum(pagerank[i] for i in range(node_count) if degrees[i] == 0) / node_count
+            base = (1.0 - damping_factor) / node_count
+            updated = [base + damping_factor * (value + dangling) for value in spread]
+            delta = sum(abs(a - b) for a, b in zip(updated, pagerank))
+            pagerank = updated
+            if delta < tolerance:
+                converged[PAGERANK] = True
+                iterations[PAGERANK] = iteration
+
+        if not converged[EIGENVECTOR]:
+            updated = list(eigenvector)
+            for source, target in zip(sources, targets):
+                updated[target] += eigenvector[source]
+            norm = sum(value * value for value in updated) ** 0.5
+            updated = [value / norm for value in updated]
+            delta = sum(abs(a - b) for a, b in zip(updated, eigenvector))
+            eigenvector = updated
+            if delta < tolerance * node_count:
+                converged[EIGENVECTOR] = True
+                iterations[EIGENVECTOR] = iteration
+
+        if all(converged.values()):
+            break
+
+    return pagerank, eigenvector, degrees, iterations, converged
+
+
+def compute_influence(snapshot, damping_factor: float = DEFAULT_DAMPING_FACTOR,
+                      max_iterations: int = DEFAULT_MAX_ITERATIONS,
+                      tolerance: float = DEFAULT_TOLERANCE) -> InfluenceScores:
+    """
+    Compute PageRank, eigenvector and degree centrality together.
+
+    PageRank spreads the rank of entities without edges evenly over all
+    entities, so scores always sum to 1. Eigenvector centrality is scaled
+    so the most central entity scores 1.0, and degree centrality is the
+    share of other entities an entity is connected to.
+
+    Args:
+        snapshot: GraphSnapshot of the project
+        damping_factor: PageRank damping factor
+        max_iterations: Maximum power iterations per metric
+        tolerance: L1 convergence threshold
+
+    Returns:
+        InfluenceScores with the pagerank, eigenvector and degree metrics
+    """
+    node_count, sources, targets = _edge_arrays(snapshot)
+    version = getattr(snapshot, "version", 0)
+    if node_count == 0:
+        return InfluenceScores(
+            entity_ids=[],
+            scores={metric: [] for metric in SPECTRAL_METRICS},
+            degrees=[],
+            iterations={PAGERANK: 0, EIGENVECTOR: 0, DEGREE: 0},
+            converged={PAGERANK: True, EIGENVECTOR: True, DEGREE: True},
+            damping_factor=damping_factor,
+            version=version,
+        )
+
+    spectral = _spectral_numpy if NUMPY_AVAILABLE else _spectral_python
+    pagerank, eigenvector, degrees, iterations, converged = spectral(
+        node_count, sources, targets, damping_factor, max_iterations, tolerance
+    )
+
+    peak = max(eigenvector)
+    if peak > 0:
+        eigenvector = [value / peak for value in eigenvector]
+    scale = 1.0 / (node_count - 1) if node_count > 1 else 0.0
+
+    for metric in (PAGERANK, EIGENVECTOR):
+        if not converged[metric]:
+            logger.debug(
+                f"{metric} for project {snapshot.project_safe_name} did not converge "
+                f"in {max_iterations} iterations"
+            )
+
+    return InfluenceScores(
+        entity_ids=list(snapshot.entity_ids),
+        scores={
+            PAGERANK: pagerank,
+            EIGENVECTOR: eigenvector,
+            DEGREE: [degree * scale for degree in degrees],
+        },
+        degrees=degrees,
+        iterations={**iterations, DEGREE: 1},
+        converged={**converged, DEGREE: True},
+        damping_factor=damping_factor,
+        version=version,
+    )
+
+
+def compute_betweenness(snapshot, samples: Optional[int] = DEFAULT_BETWEENNESS_SAMPLES,
+                        seed: int = BETWEENNESS_SEED) -> InfluenceScores:
+    """
+    Compute betweenness centrality.
+
+    Betweenness is the share of shortest paths between other entity pairs
+    that pass through an entity. Scores come from
+    GraphMetrics.compute_betweenness, which searches from a random sample of
+    entities on large graphs.
+
+    Args:
+        snapshot: GraphSnapshot of the project
+        samples: Number of sampled source entities (None = all)
+        seed: Random seed for source sampling
+
+    Returns:
+        InfluenceScores with the betweenness metric; its iteration count is
+        the number of source entities searched
+    """
+    entity_ids = list(snapshot.entity_ids)
+    pairs = snapshot.undirected_pairs()
+    result = GraphMetrics.compute_betweenness(
+        [{"id": entity_id} for entity_id in entity_ids],
+        [{"source": entity_ids[a], "target": entity_ids[b]} for a, b in pairs],
+        samples=samples,
+        seed=seed,
+    )
+
+    degrees = [0] * len(entity_ids)
+    for a, b in pairs:
+        degrees[a] += 1
+        degrees[b] += 1
+
+    return InfluenceScores(
+        entity_ids=entity_ids,
+        scores={BETWEENNESS: [result.scores[entity_id] for entity_id in entity_ids]},
+        degrees=degrees,
+        iterations={BETWEENNESS: result.sources_used},
+        converged={BETWEENNESS: True},
+        version=getattr(snapshot, "version", 0),
+    )
+
+
+def compute_closeness(snapshot) -> InfluenceScores:
+    """
+    Compute closeness centrality.
+
+    Runs one breadth-first search per entity, so the cost grows with
+    entities times edges; results are meant to be cached. Closeness is
+    scaled by the share of entities reachable from an entity
+    (Wasserman-Faust).
+
+    Args:
+        snapshot: GraphSnapshot of the project
+
+    Returns:
+        InfluenceScores with the closeness metric
+    """
+    node_count, sources, targets = _edge_arrays(snapshot)
+    offsets, neighbors = _csr(node_count, sources, targets)
+
+    closeness = [0.0] * node_count
+    distances = [-1] * node_count
+
+    for source in range(node_count):
+        distances[source] = 0
+        order = []
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            next_distance = distances[node] + 1
+            for neighbor in neighbors[offsets[node]:offsets[node + 1]]:
+                if distances[neighbor] < 0:
+                    distances[neighbor] = next_distance
+                    queue.append(neighbor)
+
+        reached = len(order) - 1
+        if reached > 0:
+            total_distance = sum(distances[node] for node in order)
+            closeness[source] = (reached / total_distance) * (reached / (node_count - 1))
+
+        for node in order:
+            distances[node] = -1
+
+    degrees = [offsets[i + 1] - offsets[i] for i in range(node_count)]
+    return InfluenceScores(
+        entity_ids=list(snapshot.entity_ids),
+        scores={CLOSENESS: closeness},
+        degrees=degrees,
+        iterations={CLOSENESS: 1},
+        converged={CLOSENESS: True},
+        version=getattr(snapshot, "version", 0),
+    )
+
+
+def get_project_influence(neo4j_handler, project_safe_name: str,
+                          damping_factor: float = DEFAULT_DAMPING_FACTOR,
+                          max_iterations: int = DEFAULT_MAX_ITERATIONS) -> InfluenceScores:
+    """
+    Get PageRank, eigenvector and degree centrality of a project.
+
+    Scores are cached on the handler's graph snapshot and reused until the
+    project graph changes.
+
+    Args:
+        neo4j_handler: Neo4jHandler instance
+        project_safe_name: Safe name of the project
+        damping_factor: PageRank damping factor
+        max_iterations: Maximum power iterations
+
+    Returns:
+        InfluenceScores
+    """
+    snapshot = neo4j_handler.get_graph_snapshot(project_safe_name)
+    return snapshot.derive(
+        ("influence", damping_factor, max_iterations),
+        lambda: compute_influence(snapshot, damping_factor=damping_factor, max_iterations=max_iterations),
+    )
+
+
+def get_project_betweenness(neo4j_handler, project_safe_name: str,
+                            samples: Optional[int] = DEFAULT_BETWEENNESS_SAMPLES) -> InfluenceScores:
+    """
+    Get betweenness centrality of a project.
+
+    Scores are cached on the handler's graph snapshot and reused until the
+    project graph changes.
+
+    Args:
+        neo4j_handler: Neo4jHandler instance
+        project_safe_name: Safe name of the project
+        samples: Number of sampled source entities (None = all)
+
+    Returns:
+        InfluenceScores
+    """
+    snapshot = neo4j_handler.get_graph_snapshot(project_safe_name)
+    return snapshot.derive(("betweenness", samples), lambda: compute_betweenness(snapshot, samples))
+
+
+def get_project_closeness(neo4j_handler, project_safe_name: str) -> InfluenceScores:
+    """
+    Get closeness centrality of a project.
+
+    Scores are cached on the handler's graph snapshot and reused until the
+    project graph changes.
+
+    Args:
+        neo4j_handler: Neo4jHandler instance
+        project_safe_name: Safe name of the project
+
+    Returns:
+        InfluenceScores
+    """
+    snapshot = neo4j_handler.get_graph_snapshot(project_safe_name)
+    return snapshot.derive(("closeness",), lambda: compute_closeness(snapshot))
+
+
+def get_metric_scores(neo4j_handler, project_safe_name: str, metric: str,
+                      damping_factor: float = DEFAULT_DAMPING_FACTOR,
+                      max_iterations: int = DEFAULT_MAX_ITERATIONS) -> Optional[InfluenceScores]:
+    """
+    Get the cached scores that contain a metric.
+
+    Args:
+        neo4j_handler: Neo4jHandler instance
+        project_safe_name: Safe name of the project
+        metric: One of SPECTRAL_METRICS or PATH_METRICS
+        damping_factor: PageRank damping factor
+        max_iterations: Maximum power iterations
+
+    Returns:
+        InfluenceScores, or None for unknown metrics
+    """
+    if metric in SPECTRAL_METRICS:
+        return get_project_influence(neo4j_handler, project_safe_name, damping_factor, max_iterations)
+    if metric == BETWEENNESS:
+        return get_project_betweenness(neo4j_handler, project_safe_name)
+    if metric == CLOSENESS:
+        return get_project_closeness(neo4j_handler, project_safe_name)
+    return None
@@ -0,0 +1,741 @@
+"""
+Job Queue Backends for Basset Hound
+
+This module provides the storage and queue used by JobRunner. The default
+in-memory queue keeps jobs in the current process; the Redis queue shares
+jobs between all API workers and keeps them across restarts.
+
+Features:
+- Priority ordering by (priority, scheduled time, enqueue order)
+- Delayed jobs held until their scheduled time
+- Leases with visibility timeouts: a claimed job returns to the queue if
+  its worker stops renewing the lease (e.g. because the process died)
+- Acknowledgement of finished jobs
+- Bounded storage: the oldest finished jobs and oldest results are
+  dropped once max_jobs or max_results is exceeded
+"""
+
+import heapq
+import itertools
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from api.services.job_runner import Job, JobResult
+
+logger = logging.getLogger(__name__)
+
+
+class DelayedJobWheel:
+    """
+    Hashed timing wheel holding jobs until their scheduled time.
+
+    Time is divided into ticks of tick_seconds; a job due at tick t sits
+    in slot t % slot_count, so adding a job and collecting the due ones
+    cost O(1) per job instead of keeping every delayed job sorted. Jobs
+    due more than one revolution ahead share slots with nearer ones and
+    stay put until their tick comes around. Not thread-safe; MemoryJobQueue
+    guards it with its lock.
+    """
+
+    def __init__(self, tick_seconds: float = 0.1, slot_count: int = 600, now: Optional[float] = None):
+        """
+        Initialize the wheel.
+
+        Args:
+            tick_seconds: Resolution of scheduled times
+            slot_count: Number of slots (ticks per revolution)
+            now: Current time as a UNIX timestamp (defaults to time.time())
+        """
+        self._tick_seconds = tick_seconds
+        self._slots: List[List[tuple]] = [[] for _ in range(slot_count)]
+        self._current_tick = self._tick_of(time.time() if now is None else now)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of delayed jobs."""
+        return self._count
+
+    def _tick_of(self, timestamp: float) -> int:
+        """Get the tick a timestamp falls in."""
+        return math.floor(timestamp / self._tick_seconds)
+
+    def add(self, due: float, job_id: str) -> None:
+        """
+        Hold a job until a time.
+
+        Args:
+            due: Scheduled time as a UNIX timestamp
+            job_id: Job ID
+        """
+        # Round up so a job is never released before its time
+        tick = max(math.ceil(due / self._tick_seconds), self._current_tick + 1)
+        self._slots[tick % len(self._slots)].append((tick, job_id))
+        self._count += 1
+
+    def advance(self, now: float) -> List[str]:
+        """
+        Move the wheel to a time and collect the jobs that became due.
+
+        Args:
+            now: Current time as a UNIX timestamp
+
+        Returns:
+            IDs of due jobs, in tick order
+        """
+        now_tick = self._tick_of(now)
+        if now_tick <= self._current_tick:
+            return []
+
+        slot_count = len(self._slots)
+        due: List[tuple] = []
+        # A gap longer than a revolution visits every slot once
+        for tick in range(self._current_tick + 1, min(now_tick, self._current_tick + slot_count) + 1):
+            slot = self._slots[tick % slot_count]
+            if not slot:
+                continue
+            keep = []
+            for entry in slot:
+                (due if entry[0] <= now_tick else keep).append(entry)
+            slot[:] = keep
+
+        self._current_tick = now_tick
+        self._count -= len(due)
+        due.sort(key=lambda entry: entry[0])
+        return [job_id for _, job_id in due]
+
+    def next_deadline(self) -> Optional[float]:
+        """
+        Get the time the wheel next needs to advance.
+
+        Returns:
+            The start of the nearest tick holding a job due within one
+            revolution, the end of the revolution if all jobs are further
+            away, or None if the wheel is empty
+        """
+        if not self._count:
+            return None
+
+        slot_count = len(self._slots)
+        horizon = self._current_tick + slot_count
+        for tick in range(self._current_tick + 1, horizon + 1):
+            if any(entry[0] == tick for entry in self._slots[tick % slot_count]):
+                return tick * self._tick_seconds
+        return horizon * self._tick_seconds
+
+    def clear(self) -> None:
+        """Remove all delayed jobs."""
+        for slot in self._slots:
+            slot.clear()
+        self._count = 0
+
+class JobQueueBackend(ABC):
+    """
+    Abstract storage and queue for JobRunner.
+
+    Jobs and results are stored by ID. Pending jobs are pushed onto the
+    queue with a priority rank (lower runs first) and a due timestamp;
+    workers claim the highest priority due job, which leases it for
+    lease_seconds, and acknowledge it once it has been executed.
+    """
+
+    # Whether other processes see the same jobs
+    shared: bool = False
+
+    # Seconds between queue checks for jobs pushed by other processes
+    # (None if every push wakes the worker directly)
+    poll_interval: Optional[float] = None
+
+    # Maximum number of stored jobs and results (0 if unbounded)
+    max_jobs: int = 0
+    max_results: int = 0
+
+    @abstractmethod
+    def save_job(self, job: "Job") -> None:
+        """Store a job, replacing any earlier version."""
+        pass
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Optional["Job"]:
+        """Get a job by ID."""
+        pass
+
+    @abstractmethod
+    def list_jobs(self, status: Optional[str] = None) -> List["Job"]:
+        """Get all stored jobs, or only those with a status."""
+        pass
+
+    @abstractmethod
+    def count_jobs_by_status(self) -> Dict[str, int]:
+        """Get the number of stored jobs per status value."""
+        pass
+
+    @abstractmethod
+    def delete_jobs(self, job_ids: Iterable[str]) -> int:
+        """Delete jobs with their results and queue entries; return the number deleted."""
+        pass
+
+    @abstractmethod
+    def count_jobs(self) -> int:
+        """Get the number of stored jobs."""
+        pass
+
+    @abstractmethod
+    def save_result(self, result: "JobResult") -> None:
+        """Store the result of a job."""
+        pass
+
+    @abstractmethod
+    def get_result(self, job_id: str) -> Optional["JobResult"]:
+        """Get the result of a job."""
+        pass
+
+    @abstractmethod
+    def list_results(self) -> List["JobResult"]:
+        """Get all stored results."""
+        pass
+
+    @abstractmethod
+    def count_results(self) -> int:
+        """Get the number of stored results."""
+        pass
+
+    @abstractmethod
+    def push(self, job_id: str, rank: int, due: float) -> None:
+        """Queue a job, replacing any earlier queue entry of it."""
+        pass
+
+    @abstractmethod
+    def remove(self, job_id: str) -> None:
+        """Remove a job from the queue."""
+        pass
+
+    @abstractmethod
+    def claim(self, lease_seconds: float) -> Optional[str]:
+        """Take the highest priority due job off the queue and lease it."""
+        pass
+
+    @abstractmethod
+    def ack(self, job_id: str) -> None:
+        """Release the lease of an executed job."""
+        pass
+
+    @abstractmethod
+    def extend_leases(self, job_ids: Iterable[str], lease_seconds: float) -> None:
+        """Renew the leases of running jobs."""
+        pass
+
+    @abstractmethod
+    def next_due(self) -> Optional[float]:
+        """Get the time the next delayed job may become due (None if there is none)."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> int:
+        """Remove all jobs, results and queue entries; return the number of jobs removed."""
+        pass
+
+
+class MemoryJobQueue(JobQueueBackend):
+    """
+    In-process job queue.
+
+    Jobs live in this process only and are lost on restart. Due jobs are
+    kept on a heap and delayed jobs in a DelayedJobWheel; queue entries of
+    cancelled or re-queued jobs are skipped lazily when they reach the
+    top of the heap. Stored jobs and results are bounded with LRU
+    eviction. Leases are not needed since claimed jobs cannot outlive
+    the process, so ack and extend_leases do nothing.
+    """
+
+    def __init__(self, max_jobs: int = 1000, max_results: int = 1000):
+        """
+        Initialize the queue.
+
+        Args:
+            max_jobs: Maximum number of jobs to store (LRU eviction)
+            max_results: Maximum number of job results to store (LRU eviction)
+        """
+        self.max_jobs = max_jobs
+        self.max_results = max_results
+        self._lock = threading.RLock()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._results: "OrderedDict[str, JobResult]" = OrderedDict()
+
+        self._ready_heap: List[tuple] = []
+        self._delayed = DelayedJobWheel()
+        self._entries: Dict[str, Tuple[int, int, float]] = {}
+        self._sequence = itertools.count()
+
+    def _enforce_jobs_limit(self) -> None:
+        """Evict oldest finished jobs when limit is exceeded (LRU eviction)."""
+        from api.services.job_runner import JobStatus
+
+        while len(self._jobs) > self.max_jobs:
+            # Get the oldest job (first in OrderedDict)
+            oldest_key = next(iter(self._jobs))
+            oldest_job = self._jobs[oldest_key]
+            # Only evict completed/failed/cancelled jobs
+            if oldest_job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+                del self._jobs[oldest_key]
+                logger.debug(f"LRU evicted job: {oldest_key}")
+            else:
+                # Move to end to avoid infinite loop with active jobs
+                self._jobs.move_to_end(oldest_key)
+                # If we've cycled through all and none can be evicted, break
+                if next(iter(self._jobs)) == oldest_key:
+                    break
+
+    def _enforce_results_limit(self) -> None:
+        """Evict oldest job results when limit is exceeded (LRU eviction)."""
+        while len(self._results) > self.max_results:
+            oldest_key = next(iter(self._results))
+            del self._results[oldest_key]
+            logger.debug(f"LRU evicted job result: {oldest_key}")
+
+    def save_job(self, job: "Job") -> None:
+        """Store a job, replacing any earlier version."""
+        with self._lock:
+            self._jobs[job.id] = job
+            self._jobs.move_to_end(job.id)  # Mark as most recently used
+            self._enforce_jobs_limit()
+
+    def get_job(self, job_id: str) -> Optional["Job"]:
+        """Get a job by ID."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._jobs.move_to_end(job_id)  # Mark as most recently used
+            return job
+
+    def list_jobs(self, status: Optional[str] = None) -> List["Job"]:
+        """Get all stored jobs, or only those with a status."""
+        with self._lock:
+            if status is None:
+                return list(self._jobs.values())
+            return [job for job in self._jobs.values() if job.status == status]
+
+    def count_jobs_by_status(self) -> Dict[str, int]:
+        """Get the number of stored jobs per status value."""
+        with self._lock:
+            return dict(Counter(job.status.value for job in self._jobs.values()))
+
+    def delete_jobs(self, job_ids: Iterable[str]) -> int:
+        """Delete jobs with their results and queue entries; return the number deleted."""
+        deleted = 0
+        with self._lock:
+            for job_id in job_ids:
+                if self._jobs.pop(job_id, None) is not None:
+                    deleted += 1
+                self._results.pop(job_id, None)
+                self._entries.pop(job_id, None)
+        return deleted
+
+    def count_jobs(self) -> int:
+        """Get the number of stored jobs."""
+        with self._lock:
+            return len(self._jobs)
+
+    def save_result(self, result: "JobResult") -> None:
+        """Store the result of a job."""
+        with self._lock:
+            self._results[result.job_id] = result
+            self._results.move_to_end(result.job_id)
+            self._enforce_results_limit()
+
+    def get_result(self, job_id: str) -> Optional["JobResult"]:
+        """Get the result of a job."""
+        with self._lock:
+            result = self._results.get(job_id)
+            if result is not None:
+                self._results.move_to_end(job_id)  # Mark as most recently used
+            return result
+
+    def list_results(self) -> List["JobResult"]:
+        """Get all stored results."""
+        with self._lock:
+            return list(self._results.values())
+
+    def count_results(self) -> int:
+        """Get the number of stored results."""
+        with self._lock:
+            return len(self._results)
+
+    def push(self, job_id: str, rank: int, due: float) -> None:
+        """Queue a job, replacing any earlier queue entry of it."""
+        with self._lock:
+            sequence = next(self._sequence)
+            self._entries[job_id] = (sequence, rank, due)
+            if due > time.time():
+                self._delayed.add(due, job_id)
+            else:
+                heapq.heappush(self._ready_heap, (rank, due, sequence, job_id))
+
+    def remove(self, job_id: str) -> None:
+        """Remove a job from the queue."""
+        with self._lock:
+            self._entries.pop(job_id, None)
+
+    def claim(self, lease_seconds: float) -> Optional[str]:
+        """Take the highest priority due job off the queue and lease it."""
+        with self._lock:
+            # Move jobs whose scheduled time has come onto the heap
+            for job_id in self._delayed.advance(time.time()):
+                entry = self._entries.get(job_id)
+                if entry is not None:
+                    sequence, rank, due = entry
+                    heapq.heappush(self._ready_heap, (rank, due, sequence, job_id))
+
+            while self._ready_heap:
+                _, _, sequence, job_id = heapq.heappop(self._ready_heap)
+                entry = self._entries.get(job_id)
+                if entry is not None and entry[0] == sequence:
+                    del self._entries[job_id]
+                    return job_id
+            return None
+
+    def ack(self, job_id: str) -> None:
+        """Release the lease of an executed job."""
+        pass
+
+    def extend_leases(self, job_ids: Iterable[str], lease_seconds: float) -> None:
+        """Renew the leases of running jobs."""
+        pass
+
+    def next_due(self) -> Optional[float]:
+        """Get the time the next delayed job may become due (None if there is none)."""
+        with self._lock:
+            return self._delayed.next_deadline()
+
+    def clear(self) -> int:
+        """Remove all jobs, results and queue entries; return the number of jobs removed."""
+        with self._lock:
+            count = len(self._jobs)
+            self._jobs.clear()
+            self._results.clear()
+            self._ready_heap.clear()
+            self._delayed.clear()
+            self._entries.clear()
+        return count
+
+
+# Moves due delayed jobs and jobs with expired leases to the ready set,
+# then pops the best ready job and leases it.
+# KEYS: ready, delayed, leases, ranks; ARGV: now, lease_seconds, batch size
+_CLAIM_SCRIPT = """
+local now = tonumber(ARGV[1])
+local batch = tonumber(ARGV[3])
+for _, source in ipairs({KEYS[2], KEYS[3]}) do
+    local ids = redis.call('ZRANGEBYSCORE', source, '-inf', now, 'LIMIT', 0, batch)
+    for _, id in ipairs(ids) do
+        redis.call('ZREM', source, id)
+        redis.call('ZADD', KEYS[1], redis.call('HGET', KEYS[4], id) or '0', id)
+    end
+end
+local popped = redis.call('ZPOPMIN', KEYS[1])
+if #popped == 0 then
+    return false
+end
+redis.call('ZADD', KEYS[3], now + tonumber(ARGV[2]), popped[1])
+return popped[1]
+"""
+
+# Drops the oldest entries of a hash once it holds more than a limit.
+# Only IDs in the order set are candidates; they are also removed from the
+# order set and from any further sets.
+# KEYS: hash, order, sets...; ARGV: limit
+_TRIM_SCRIPT = """
+local excess = redis.call('HLEN', KEYS[1]) - tonumber(ARGV[1])
+if excess <= 0 then
+    return 0
+end
+local ids = redis.call('ZRANGE', KEYS[2], 0, excess - 1)
+if #ids == 0 then
+    return 0
+end
+redis.call('HDEL', KEYS[1], unpack(ids))
+redis.call('ZREM', KEYS[2], unpack(ids))
+for i = 3, #KEYS do
+    redis.call('SREM', KEYS[i], unpack(ids))
+end
+return #ids
+"""
+
+# Status values of jobs that are done and may be dropped from storage
+_FINISHED_STATUSES = ("completed", "failed", "cancelled")
+_STATUSES = ("pending", "running") + _FINISHED_STATUSES
+
+
+class RedisJobQueue(JobQueueBackend):
+    """
+    Redis-backed job queue shared by all processes using the same prefix.
+
+    Layout (all keys under the prefix):
+    - jobs, results: hashes of JSON-serialized jobs and results by ID
+    - ready: sorted set of due jobs scored by rank * 10^13 + due time in ms
+    - delayed: sorted set of future jobs scored by due time
+    - leases: sorted set of claimed jobs scored by lease expiry
+    - ranks: hash of the ready score of each queued or claimed job
+    - status:<status>: set of the IDs of stored jobs with that status
+    - finished: sorted set of finished jobs scored by when they finished
+    - result_order: sorted set of stored results scored by when they were saved
+
+    Claiming runs as one Lua script, so a job is handed to one worker only.
+    A job whose lease expires without an ack, e.g. because its worker was
+    killed, is moved back to the ready set and claimed again. Like the
+    in-memory queue, storage is bounded: once there are more than max_jobs
+    jobs the oldest finished ones are dropped, and once there are more than
+    max_results results the oldest are dropped.
+
+    The client is synchronous; JobRunner calls the queue from worker
+    threads so Redis round trips never block its event loop.
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "basset:jobs:",
+        poll_interval: float = 1.0,
+        socket_timeout: float = 5.0,
+        client=None,
+        max_jobs: int = 1000,
+        max_results: int = 1000,
+    ):
+        """
+        Initialize the Redis job queue.
+
+        Args:
+            url: Redis connection URL
+            prefix: Key prefix for all queue keys
+            poll_interval: Seconds between checks for jobs pushed by other processes
+            socket_timeout: Socket timeout in seconds
+            client: Existing Redis client (used instead of connecting to url)
+            max_jobs: Maximum number of jobs to store (oldest finished dropped first)
+            max_results: Maximum number of job results to store (oldest dropped first)
+        """
+        self._url = url
+        self._prefix = prefix
+        self._socket_timeout = socket_timeout
+        self.poll_interval = poll_interval
+        self.max_jobs = max_jobs
+        self.max_results = max_results
+        self._client = None
+        self._claim_script = None
+        self._trim_script = None
+        if client is not None:
+            self._use_client(client)
+
+    def _use_client(self, client) -> None:
+        """Use a connected client."""
+        self._client = client
+        self._claim_script = client.register_script(_CLAIM_SCRIPT)
+        self._trim_script = client.register_script(_TRIM_SCRIPT)
+
+    def _key(self, name: str) -> str:
+        """Add prefix to key."""
+        return f"{self._prefix}{name}"
+
+    def _status_keys(self) -> List[str]:
+        """Get the keys of the per-status job ID sets."""
+        return [self._key(f"status:{status}") for status in _STATUSES]
+
+    def _all_keys(self) -> List[str]:
+        """Get every key of the queue."""
+        names = ("jobs", "results", "ready", "delayed", "leases", "ranks", "finished", "result_order")
+        return [self._key(name) for name in names] + self._status_keys()
+
+    def _load_jobs(self, raws: Iterable[Optional[str]]) -> List["Job"]:
+        """Deserialize stored jobs, skipping missing entries."""
+        from api.services.job_runner import Job
+
+        return [Job.model_validate_json(raw) for raw in raws if raw]
+
+    def connect(self) -> bool:
+        """
+        Connect to Redis.
+
+        Returns:
+            True if connected successfully, False otherwise.
+        """
+        try:
+            import redis
+
+            client = redis.Redis.from_url(
+                self._url,
+                socket_timeout=self._socket_timeout,
+                socket_connect_timeout=self._socket_timeout,
+                decode_responses=True,
+            )
+            client.ping()
+            self._use_client(client)
+            logger.info(f"Job queue connected to Redis at {self._url}")
+            return True
+
+        except ImportError:
+            logger.warning("redis-py not installed. Install with: pip install redis")
+            return False
+        except Exception as e:
+            logger.warning(f"Failed to connect job queue to Redis: {e}")
+            return False
+
+    def disconnect(self) -> None:
+        """Disconnect from Redis."""
+        if self._client:
+            self._client.close()
+            self._client = None
+            self._claim_script = None
+            self._trim_script = None
+
+    @staticmethod
+    def _ready_score(rank: int, due: float) -> int:
+        """Score ordering ready jobs by rank, then due time."""
+        return rank * 10 ** 13 + int(due * 1000)
+
+    def save_job(self, job: "Job") -> None:
+        """Store a job, replacing any earlier version."""
+        status = job.status.value
+        pipe = self._client.pipeline()
+        pipe.hset(self._key("jobs"), job.id, job.model_dump_json())
+        for key in self._status_keys():
+            pipe.srem(key, job.id)
+        pipe.sadd(self._key(f"status:{status}"), job.id)
+        if status in _FINISHED_STATUSES:
+            pipe.zadd(self._key("finished"), {job.id: time.time()})
+        else:
+            pipe.zrem(self._key("finished"), job.id)
+        pipe.execute()
+
+        if status in _FINISHED_STATUSES and self.max_jobs > 0:
+            self._trim_script(
+                keys=[self._key("jobs"), self._key("finished")] + self._status_keys(),
+                args=[self.max_jobs],
+            )
+
+    def get_job(self, job_id: str) -> Optional["Job"]:
+        """Get a job by ID."""
+        from api.services.job_runner import Job
+
+        raw = self._client.hget(self._key("jobs"), job_id)
+        return Job.model_validate_json(raw) if raw else None
+
+    def list_jobs(self, status: Optional[str] = None) -> List["Job"]:
+        """Get all stored jobs, or only those with a status."""
+        if status is None:
+            return self._load_jobs(self._client.hvals(self._key("jobs")))
+
+        job_ids = list(self._client.smembers(self._key(f"status:{status}")))
+        if not job_ids:
+            return []
+        jobs = self._load_jobs(self._client.hmget(self._key("jobs"), job_ids))
+        # A job may have changed status between the two reads
+        return [job for job in jobs if job.status == status]
+
+    def count_jobs_by_status(self) -> Dict[str, int]:
+        """Get the number of stored jobs per status value."""
+        pipe = self._client.pipeline()
+        for key in self._status_keys():
+            pipe.scard(key)
+        return {status: count for status, count in zip(_STATUSES, pipe.execute()) if count}
+
+    def delete_jobs(self, job_ids: Iterable[str]) -> int:
+        """Delete jobs with their results and queue entries; return the number deleted."""
+        job_ids = list(job_ids)
+        if not job_ids:
+            return 0
+        pipe = self._client.pipeline()
+        pipe.hdel(self._key("jobs"), *job_ids)
+        pipe.hdel(self._key("results"), *job_ids)
+        pipe.hdel(self._key("ranks"), *job_ids)
+        for name in ("ready", "delayed", "leases", "finished", "result_order"):
+            pipe.zrem(self._key(name), *job_ids)
+        for key in self._status_keys():
+            pipe.srem(key, *job_ids)
+        return pipe.execute()[0]
+
+    def count_jobs(self) -> int:
+        """Get the number of stored jobs."""
+        return self._client.hlen(self._key("jobs"))
+
+    def save_result(self, result: "JobResult") -> None:
+        """Store the result of a job."""
+        pipe = self._client.pipeline()
+        pipe.hset(self._key("results"), result.job_id, result.model_dump_json())
+        pipe.zadd(self._key("result_order"), {result.job_id: time.time()})
+        pipe.execute()
+
+        if self.max_results > 0:
+            self._trim_script(
+                keys=[self._key("results"), self._key("result_order")],
+                args=[self.max_results],
+            )
+
+    def get_result(self, job_id: str) -> Optional["JobResult"]:
+        """Get the result of a job."""
+        from api.services.job_runner import JobResult
+
+        raw = self._client.hget(self._key("results"), job_id)
+        return JobResult.model_validate_json(raw) if raw else None
+
+    def list_results(self) -> List["JobResult"]:
+        """Get all stored results."""
+        from api.services.job_runner import JobResult
+
+        return [JobResult.model_validate_json(raw) for raw in self._client.hvals(self._key("results"))]
+
+    def count_results(self) -> int:
+        """Get the number of stored results."""
+        return self._client.hlen(self._key("results"))
+
+    def push(self, job_id: str, rank: int, due: float) -> None:
+        """Queue a job, replacing any earlier queue entry of it."""
+        pipe = self._client.pipeline()
+        pipe.hset(self._key("ranks"), job_id, self._ready_score(rank, due))
+        pipe.zrem(self._key("ready"), job_id)
+        pipe.zrem(self._key("delayed"), job_id)
+        if due > time.time():
+            pipe.zadd(self._key("delayed"), {job_id: due})
+        else:
+            pipe.zadd(self._key("ready"), {job_id: self._ready_score(rank, due)})
+        pipe.execute()
+
+    def remove(self, job_id: str) -> None:
+        """Remove a job from the queue."""
+        pipe = self._client.pipeline()
+        pipe.zrem(self._key("ready"), job_id)
+        pipe.zrem(self._key("delayed"), job_id)
+        pipe.execute()
+
+    def claim(self, lease_seconds: float) -> Optional[str]:
+        """Take the highest priority due job off the queue and lease it."""
+        keys = [self._key(name) for name in ("ready", "delayed", "leases", "ranks")]
+        return self._claim_script(keys=keys, args=[time.time(), lease_seconds, 100]) or None
+
+    def ack(self, job_id: str) -> None:
+        """Release the lease of an executed job."""
+        self._client.zrem(self._key("leases"), job_id)
+
+    def extend_leases(self, job_ids: Iterable[str], lease_seconds: float) -> None:
+        """Renew the leases of running jobs."""
+        job_ids = list(job_ids)
+        if job_ids:
+            expiry = time.time() + lease_seconds
+            # XX: never lease a job that was acked in the meantime
+            self._client.zadd(self._key("leases"), {job_id: expiry for job_id in job_ids}, xx=True)
+
+    def next_due(self) -> Optional[float]:
+        """Get the time the next delayed job may become due (None if there is none)."""
+        first = self._client.zrange(self._key("delayed"), 0, 0, withscores=True)
+        return first[0][1] if first else None
+
+    def clear(self) -> int:
+        """Remove all jobs, results and queue entries; return the number of jobs removed."""
+        count = self.count_jobs()
+        self._client.delete(*self._all_keys())
+        return count
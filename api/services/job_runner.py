@@ -11,21 +11,29 @@ Features:
 - Job status tracking (PENDING, RUNNING, COMPLETED, FAILED, CANCELLED)
 - Configurable retry logic with exponential backoff
 - Timeout handling for long-running jobs
-- In-memory job history (ready for Redis migration)
+- In-memory job history, or a Redis queue shared by all workers
 - Integration with report scheduler
+
+Jobs are stored and queued by a JobQueueBackend (see job_queue). The worker
+claims due jobs in priority order, sleeps on an event that enqueueing sets
+so new jobs are picked up immediately, and runs up to max_concurrent_jobs
+jobs at once. Calls to a shared backend do network I/O, so the worker makes
+them from a thread instead of on the event loop.
 """
 
 import asyncio
 import logging
 import threading
-from collections import OrderedDict
+import time
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from .job_queue import JobQueueBackend, MemoryJobQueue
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +62,15 @@ class JobPriority(str, Enum):
     CRITICAL = "critical"
 
 
+# Heap rank of each priority (lower runs first)
+PRIORITY_RANKS: Dict[JobPriority, int] = {
+    JobPriority.CRITICAL: 0,
+    JobPriority.HIGH: 1,
+    JobPriority.NORMAL: 2,
+    JobPriority.LOW: 3,
+}
+
+
 class JobResult(BaseModel):
     """
     Result of a job execution.
@@ -185,8 +202,10 @@ class WorkerStatus(BaseModel):
         is_running: Whether the worker is running
         started_at: When the worker started
         jobs_processed: Total jobs processed
-        current_job_id: ID of currently running job
+        current_job_id: ID of the most recently started running job
         last_heartbeat: Last heartbeat timestamp
+        running_job_ids: IDs of all running jobs
+        max_concurrent_jobs: Maximum concurrently running jobs
     """
     model_config = ConfigDict(extra="forbid")
 
@@ -195,6 +214,8 @@ class WorkerStatus(BaseModel):
     jobs_processed: int = Field(default=0, description="Jobs processed count")
     current_job_id: Optional[str] = Field(default=None, description="Current job ID")
     last_heartbeat: Optional[datetime] = Field(default=None, description="Last heartbeat")
+    running_job_ids: List[str] = Field(default_factory=list, description="IDs of all running jobs")
+    max_concurrent_jobs: int = Field(default=1, description="Maximum concurrently running jobs")
 
 
 class JobRunner:
@@ -203,7 +224,13 @@ class JobRunner:
 
     Provides methods for enqueueing jobs, tracking status, handling retries,
     and executing various job types including reports, exports, and bulk imports.
-    Uses in-memory storage with interfaces designed for Redis/ARQ migration.
+
+    Jobs and results are kept by a JobQueueBackend: in memory by default, or
+    in Redis so jobs are shared by all API workers and survive restarts.
+    Pending jobs are claimed in order of (priority, scheduled time, enqueue
+    order). With a shared backend, claimed jobs are leased for
+    lease_seconds and the worker renews the leases of its running jobs;
+    jobs of a worker that dies are claimed again once their lease expires.
     """
 
     def __init__(
@@ -215,6 +242,8 @@ class JobRunner:
         max_concurrent_jobs: int = 5,
         max_jobs: int = 1000,
         max_job_results: int = 1000,
+        queue_backend: Optional[JobQueueBackend] = None,
+        lease_seconds: float = 60.0,
     ):
         """
         Initialize the job runner.
@@ -227,26 +256,33 @@ class JobRunner:
             max_concurrent_jobs: Maximum number of concurrent jobs
             max_jobs: Maximum number of jobs to store in memory (LRU eviction)
             max_job_results: Maximum number of job results to store in memory (LRU eviction)
+            queue_backend: Job storage and queue (defaults to an in-memory
+                queue bounded by max_jobs and max_job_results; a given
+                backend applies its own limits)
+            lease_seconds: Visibility timeout of claimed jobs in a shared queue
         """
         self._handler = neo4j_handler
         self._report_scheduler = report_scheduler
         self._report_export_service = report_export_service
         self._bulk_operations_service = bulk_operations_service
         self._max_concurrent_jobs = max_concurrent_jobs
-        self._max_jobs = max_jobs
-        self._max_job_results = max_job_results
+        self._lease_seconds = lease_seconds
 
-        # In-memory storage with thread safety and LRU ordering
+        # Job storage and queue; the lock guards changes to job objects
         self._lock = threading.RLock()
-        self._jobs: OrderedDict[str, Job] = OrderedDict()
-        self._job_results: OrderedDict[str, JobResult] = OrderedDict()
+        self._queue = queue_backend or MemoryJobQueue(max_jobs, max_job_results)
 
         # Worker state
         self._worker_running = False
         self._worker_started_at: Optional[datetime] = None
         self._jobs_processed = 0
-        self._current_job_id: Optional[str] = None
+        self._active_job_ids: Dict[str, None] = {}
         self._worker_task: Optional[asyncio.Task] = None
+        self._lease_task: Optional[asyncio.Task] = None
+        self._worker_loop_ref: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._execution_slots: Optional[asyncio.Semaphore] = None
+        self._running_tasks: Dict[str, asyncio.Task] = {}
         self._last_heartbeat: Optional[datetime] = None
 
         # Registered job handlers
@@ -258,59 +294,104 @@ class JobRunner:
 
     # ==================== Memory Management ====================
 
-    def _enforce_jobs_limit(self) -> None:
-        """Evict oldest jobs when limit is exceeded (LRU eviction)."""
-        while len(self._jobs) > self._max_jobs:
-            # Get the oldest job (first in OrderedDict)
-            oldest_key = next(iter(self._jobs))
-            oldest_job = self._jobs[oldest_key]
-            # Only evict completed/failed/cancelled jobs
-            if oldest_job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
-                del self._jobs[oldest_key]
-                logger.debug(f"LRU evicted job: {oldest_key}")
-            else:
-                # Move to end to avoid infinite loop with active jobs
-                self._jobs.move_to_end(oldest_key)
-                # If we've cycled through all and none can be evicted, break
-                if next(iter(self._jobs)) == oldest_key:
-                    break
-
-    def _enforce_results_limit(self) -> None:
-        """Evict oldest job results when limit is exceeded (LRU eviction)."""
-        while len(self._job_results) > self._max_job_results:
-            oldest_key = next(iter(self._job_results))
-            del self._job_results[oldest_key]
-            logger.debug(f"LRU evicted job result: {oldest_key}")
-
     def get_jobs_size(self) -> int:
         """Get current number of jobs in storage."""
-        with self._lock:
-            return len(self._jobs)
+        return self._queue.count_jobs()
 
     def get_jobs_capacity(self) -> int:
-        """Get maximum job storage capacity."""
-        return self._max_jobs
+        """Get maximum job storage capacity (0 if unbounded)."""
+        return self._queue.max_jobs
 
     def get_results_size(self) -> int:
         """Get current number of job results in storage."""
-        with self._lock:
-            return len(self._job_results)
+        return self._queue.count_results()
 
     def get_results_capacity(self) -> int:
-        """Get maximum job results storage capacity."""
-        return self._max_job_results
+        """Get maximum job results storage capacity (0 if unbounded)."""
+        return self._queue.max_results
 
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory usage statistics for this service."""
-        with self._lock:
-            return {
-                "jobs_count": len(self._jobs),
-                "jobs_capacity": self._max_jobs,
-                "jobs_usage_percent": (len(self._jobs) / self._max_jobs * 100) if self._max_jobs > 0 else 0,
-                "results_count": len(self._job_results),
-                "results_capacity": self._max_job_results,
-                "results_usage_percent": (len(self._job_results) / self._max_job_results * 100) if self._max_job_results > 0 else 0,
-            }
+        jobs_count = self._queue.count_jobs()
+        results_count = self._queue.count_results()
+        max_jobs = self._queue.max_jobs
+        max_results = self._queue.max_results
+        return {
+            "jobs_count": jobs_count,
+            "jobs_capacity": max_jobs,
+            "jobs_usage_percent": (jobs_count / max_jobs * 100) if max_jobs > 0 else 0,
+            "results_count": results_count,
+            "results_capacity": max_results,
+            "results_usage_percent": (results_count / max_results * 100) if max_results > 0 else 0,
+        }
+
+    # ==================== Scheduling ====================
+
+    async def _call_queue(self, func: Callable, *args) -> Any:
+        """
+        Call a queue backend method from the event loop.
+
+        Shared backends do network I/O and are called from a worker thread;
+        the in-memory queue is called directly.
+        """
+        if self._queue.shared:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    def _queue_job(self, job: Job) -> None:
+        """Queue a pending job and wake the worker."""
+        due = (job.scheduled_for or job.created_at).timestamp()
+        self._queue.push(job.id, PRIORITY_RANKS.get(job.priority, 2), due)
+        self._wake_worker()
+
+    def _claim_job(self) -> Optional[str]:
+        """
+        Claim the highest priority due job.
+
+        Returns:
+            Job ID, or None if no job is due
+        """
+        while True:
+            job_id = self._queue.claim(self._lease_seconds)
+            if job_id is None:
+                return None
+
+            job = self._queue.get_job(job_id)
+            if job is not None and job.status == JobStatus.RUNNING:
+                # Only a job whose worker stopped renewing its lease is queued while running
+                logger.warning(f"Recovering job {job_id} after its lease expired")
+                return job_id
+            if job is not None and job.status == JobStatus.PENDING:
+                return job_id
+            self._queue.ack(job_id)
+
+    def _next_wakeup_delay(self) -> Optional[float]:
+        """Seconds until the queue should be checked again (None to wait for a wake-up)."""
+        delays = []
+        due = self._queue.next_due()
+        if due is not None:
+            delays.append(due - time.time())
+        if self._queue.poll_interval is not None:
+            delays.append(self._queue.poll_interval)
+        return max(0.0, min(delays)) if delays else None
+
+    def _wake_worker(self) -> None:
+        """Wake the worker; safe to call from any thread."""
+        loop, wakeup = self._worker_loop_ref, self._wakeup
+        if loop is None or wakeup is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            wakeup.set()
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            # Loop already closed; the worker is gone
+            pass
 
     # ==================== Queue Management ====================
 
@@ -365,10 +446,8 @@ class JobRunner:
             created_by=created_by
         )
 
-        with self._lock:
-            self._jobs[job_id] = job
-            self._jobs.move_to_end(job_id)  # Mark as most recently used
-            self._enforce_jobs_limit()
+        self._queue.save_job(job)
+        self._queue_job(job)
         logger.info(f"Enqueued job {job_id} of type {job_type.value}")
 
         return job
@@ -383,11 +462,7 @@ class JobRunner:
         Returns:
             Job if found, None otherwise
         """
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if job is not None:
-                self._jobs.move_to_end(job_id)  # Mark as most recently used
-            return job
+        return self._queue.get_job(job_id)
 
     def get_job_status(self, job_id: str) -> Optional[JobStatus]:
         """
@@ -399,9 +474,8 @@ class JobRunner:
         Returns:
             JobStatus if job found, None otherwise
         """
-        with self._lock:
-            job = self._jobs.get(job_id)
-            return job.status if job else None
+        job = self._queue.get_job(job_id)
+        return job.status if job else None
 
     def get_job_result(self, job_id: str) -> Optional[JobResult]:
         """
@@ -413,11 +487,7 @@ class JobRunner:
         Returns:
             JobResult if available, None otherwise
         """
-        with self._lock:
-            result = self._job_results.get(job_id)
-            if result is not None:
-                self._job_results.move_to_end(job_id)  # Mark as most recently used
-            return result
+        return self._queue.get_result(job_id)
 
     def cancel_job(self, job_id: str) -> bool:
         """
@@ -430,7 +500,7 @@ class JobRunner:
             True if job was cancelled, False otherwise
         """
         with self._lock:
-            job = self._jobs.get(job_id)
+            job = self._queue.get_job(job_id)
             if job is None:
                 return False
 
@@ -441,22 +511,41 @@ class JobRunner:
             job.status = JobStatus.CANCELLED
             job.completed_at = datetime.now(timezone.utc)
             job.error = "Job cancelled by user"
+            self._queue.remove(job_id)
+            self._queue.save_job(job)
 
             # Create result record
-            self._job_results[job_id] = JobResult(
+            self._queue.save_result(JobResult(
                 job_id=job_id,
                 status=JobStatus.CANCELLED,
                 error="Job cancelled by user",
                 completed_at=job.completed_at,
                 retry_count=job.retry_count,
                 metadata={"cancelled_from_status": job.status.value}
-            )
-            self._job_results.move_to_end(job_id)
-            self._enforce_results_limit()
+            ))
+            task = self._running_tasks.get(job_id)
+
+        if task is not None:
+            self._cancel_task(task)
 
         logger.info(f"Cancelled job {job_id}")
         return True
 
+    def _cancel_task(self, task: asyncio.Task) -> None:
+        """Cancel a running job task; safe to call from any thread."""
+        loop = self._worker_loop_ref
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if loop is None or running_loop is loop:
+            task.cancel()
+            return
+        try:
+            loop.call_soon_threadsafe(task.cancel)
+        except RuntimeError:
+            pass
+
     def list_jobs(
         self,
         status: Optional[JobStatus] = None,
@@ -476,23 +565,15 @@ class JobRunner:
         Returns:
             List of matching Job objects
         """
-        with self._lock:
-            jobs = list(self._jobs.values())
+        # The backend filters by status, so a shared queue reads only those jobs
+        jobs = self._queue.list_jobs(JobStatus(status).value if status is not None else None)
 
         # Apply filters
-        if status is not None:
-            jobs = [j for j in jobs if j.status == status]
         if job_type is not None:
             jobs = [j for j in jobs if j.job_type == job_type]
 
         # Sort by priority (descending) and created_at (ascending)
-        priority_order = {
-            JobPriority.CRITICAL: 0,
-            JobPriority.HIGH: 1,
-            JobPriority.NORMAL: 2,
-            JobPriority.LOW: 3
-        }
-        jobs.sort(key=lambda j: (priority_order.get(j.priority, 2), j.created_at))
+        jobs.sort(key=lambda j: (PRIORITY_RANKS.get(j.priority, 2), j.created_at))
 
         # Apply pagination
         return jobs[offset:offset + limit]
@@ -522,20 +603,19 @@ class JobRunner:
         Returns:
             JobStats with aggregated metrics
         """
-        with self._lock:
-            jobs = list(self._jobs.values())
-            job_results = list(self._job_results.values())
-
-        total = len(jobs)
+        counts = self._queue.count_jobs_by_status()
+        total = sum(counts.values())
 
         if total == 0:
             return JobStats()
 
-        pending = sum(1 for j in jobs if j.status == JobStatus.PENDING)
-        running = sum(1 for j in jobs if j.status == JobStatus.RUNNING)
-        completed = sum(1 for j in jobs if j.status == JobStatus.COMPLETED)
-        failed = sum(1 for j in jobs if j.status == JobStatus.FAILED)
-        cancelled = sum(1 for j in jobs if j.status == JobStatus.CANCELLED)
+        pending = counts.get(JobStatus.PENDING.value, 0)
+        running = counts.get(JobStatus.RUNNING.value, 0)
+        completed = counts.get(JobStatus.COMPLETED.value, 0)
+        failed = counts.get(JobStatus.FAILED.value, 0)
+        cancelled = counts.get(JobStatus.CANCELLED.value, 0)
+
+        job_results = self._queue.list_results()
 
         # Calculate average duration for completed jobs
         completed_results = [
@@ -577,23 +657,8 @@ class JobRunner:
         Raises:
             ValueError: If job not found or already executed
         """
-        # Get job with lock, but release before long-running execution
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if job is None:
-                raise ValueError(f"Job not found: {job_id}")
-
-            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
-                raise ValueError(f"Job already in terminal state: {job.status.value}")
-
-            # Mark job as running
-            job.status = JobStatus.RUNNING
-            job.started_at = datetime.now(timezone.utc)
-            self._current_job_id = job_id
-
-            # Get handler while holding lock
-            handler = self._job_handlers.get(job.job_type)
-            timeout_seconds = job.timeout_seconds
+        job, handler = await self._call_queue(self._start_job, job_id)
+        timeout_seconds = job.timeout_seconds
 
         result = None
         error = None
@@ -646,11 +711,13 @@ class JobRunner:
         finally:
             with self._lock:
                 job.completed_at = datetime.now(timezone.utc)
-                self._current_job_id = None
+                self._active_job_ids.pop(job_id, None)
 
                 if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
                     self._jobs_processed += 1
 
+            await self._call_queue(self._finish_job, job)
+
         # Calculate duration
         duration_ms = None
         if job.started_at and job.completed_at:
@@ -670,12 +737,46 @@ class JobRunner:
             metadata={"job_type": job.job_type.value, "priority": job.priority.value}
         )
 
-        with self._lock:
-            self._job_results[job_id] = job_result
-            self._job_results.move_to_end(job_id)
-            self._enforce_results_limit()
+        await self._call_queue(self._queue.save_result, job_result)
         return job_result
 
+    def _start_job(self, job_id: str) -> Tuple[Job, Optional[Callable]]:
+        """
+        Mark a job as running.
+
+        Returns:
+            The job and the handler of its type
+
+        Raises:
+            ValueError: If job not found or already executed
+        """
+        # Get job with lock, but release before long-running execution
+        with self._lock:
+            job = self._queue.get_job(job_id)
+            if job is None:
+                raise ValueError(f"Job not found: {job_id}")
+
+            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+                raise ValueError(f"Job already in terminal state: {job.status.value}")
+
+            # Mark job as running
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.now(timezone.utc)
+            self._queue.remove(job_id)
+            self._queue.save_job(job)
+            self._active_job_ids[job_id] = None
+
+            # Get handler while holding lock
+            return job, self._job_handlers.get(job.job_type)
+
+    def _finish_job(self, job: Job) -> None:
+        """Store an executed job and queue it again if it will be retried."""
+        # Release the lease before a retry can be claimed again
+        self._queue.ack(job.id)
+        self._queue.save_job(job)
+        if job.status == JobStatus.PENDING:
+            self._queue_job(job)
+
     async def execute_report_job(self, job: Job) -> Dict[str, Any]:
         """
         Execute a report generation job.
@@ -692,10 +793,14 @@ class JobRunner:
         if self._report_scheduler is None:
             raise ValueError("report_scheduler is not configured")
 
+        # Report generation blocks, so it runs in a worker thread to keep
+        # the loop free for other jobs and for the job timeout
         schedule_id = job.payload.get("schedule_id")
         if schedule_id:
             # Run from schedule
-            report_bytes = self._report_scheduler.run_scheduled_report(schedule_id)
+            report_bytes = await asyncio.to_thread(
+                self._report_scheduler.run_scheduled_report, schedule_id
+            )
             if report_bytes is None:
                 raise ValueError(f"Schedule not found: {schedule_id}")
 
@@ -716,7 +821,8 @@ class JobRunner:
             from .report_export_service import ReportFormat
             format_str = job.payload.get("format", "html")
             report_format = ReportFormat(format_str)
-            report_bytes = self._report_export_service.generate_project_summary(
+            report_bytes = await asyncio.to_thread(
+                self._report_export_service.generate_project_summary,
                 project_id,
                 report_format
             )
@@ -732,7 +838,7 @@ class JobRunner:
                 include_timeline=job.payload.get("include_timeline", True),
                 include_statistics=job.payload.get("include_statistics", True)
             )
-            report_bytes = self._report_export_service.generate_report(options)
+            report_bytes = await asyncio.to_thread(self._report_export_service.generate_report, options)
 
         return {
             "project_id": project_id,
@@ -773,7 +879,9 @@ class JobRunner:
             entity_ids=entity_ids
         )
 
-        export_data = self._bulk_operations_service.export_entities(project_id, options)
+        export_data = await asyncio.to_thread(
+            self._bulk_operations_service.export_entities, project_id, options
+        )
 
         return {
             "project_id": project_id,
@@ -805,7 +913,8 @@ class JobRunner:
         entities = job.payload.get("entities", [])
         update_existing = job.payload.get("update_existing", False)
 
-        result = self._bulk_operations_service.import_entities(
+        result = await asyncio.to_thread(
+            self._bulk_operations_service.import_entities,
             project_id,
             entities,
             update_existing
@@ -818,6 +927,7 @@ class JobRunner:
             "failed": result.failed,
             "created_ids": result.created_ids,
             "errors": result.errors,
+            "batches": result.batches,
             "imported_at": datetime.now(timezone.utc).isoformat()
         }
 
@@ -827,7 +937,8 @@ class JobRunner:
         """
         Start the background worker for processing jobs.
 
-        The worker continuously processes pending jobs in priority order.
+        The worker runs pending jobs in priority order, up to
+        max_concurrent_jobs at a time.
         """
         if self._worker_running:
             logger.warning("Worker is already running")
@@ -836,37 +947,30 @@ class JobRunner:
         self._worker_running = True
         self._worker_started_at = datetime.now(timezone.utc)
         self._last_heartbeat = self._worker_started_at
+        self._worker_loop_ref = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._execution_slots = asyncio.Semaphore(max(1, self._max_concurrent_jobs))
 
         logger.info("Job worker started")
 
         self._worker_task = asyncio.create_task(self._worker_loop())
+        if self._queue.shared:
+            self._lease_task = asyncio.create_task(self._lease_loop())
 
     async def _worker_loop(self) -> None:
-        """Internal worker loop that processes jobs."""
+        """Internal worker loop that dispatches jobs to concurrent executions."""
         while self._worker_running:
             try:
-                self._last_heartbeat = datetime.now(timezone.utc)
-
-                # Get next pending job
-                pending_jobs = self.get_pending_jobs()
-
-                # Filter scheduled jobs that aren't due yet
-                now = datetime.now(timezone.utc)
-                ready_jobs = [
-                    j for j in pending_jobs
-                    if j.scheduled_for is None or j.scheduled_for <= now
-                ]
-
-                if ready_jobs:
-                    # Process highest priority job
-                    job = ready_jobs[0]
-                    try:
-                        await self.execute_job(job.id)
-                    except Exception as e:
-                        logger.error(f"Error executing job {job.id}: {e}")
+                await self._execution_slots.acquire()
+                try:
+                    job_id = await self._wait_for_ready_job()
+                except BaseException:
+                    self._execution_slots.release()
+                    raise
 
-                # Small delay to prevent tight loop
-                await asyncio.sleep(0.1)
+                task = asyncio.create_task(self._run_job(job_id))
+                with self._lock:
+                    self._running_tasks[job_id] = task
 
             except asyncio.CancelledError:
                 logger.info("Worker loop cancelled")
@@ -875,11 +979,70 @@ class JobRunner:
                 logger.error(f"Worker loop error: {e}")
                 await asyncio.sleep(1)  # Back off on error
 
+    async def _wait_for_ready_job(self) -> str:
+        """Wait until a job is due and take it off the queue."""
+        while True:
+            self._last_heartbeat = datetime.now(timezone.utc)
+
+            # Clear before looking, so an enqueue after the look wakes us
+            self._wakeup.clear()
+            job_id = await self._call_queue(self._claim_job)
+            if job_id is not None:
+                return job_id
+
+            delay = await self._call_queue(self._next_wakeup_delay)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _lease_loop(self) -> None:
+        """Renew the leases of running jobs and stop jobs cancelled by other processes."""
+        while True:
+            await asyncio.sleep(self._lease_seconds / 3)
+            try:
+                with self._lock:
+                    running = dict(self._running_tasks)
+                if not running:
+                    continue
+
+                cancelled = await self._call_queue(self._renew_leases, list(running))
+                for job_id in cancelled:
+                    running[job_id].cancel()
+            except Exception as e:
+                logger.error(f"Lease renewal error: {e}")
+
+    def _renew_leases(self, job_ids: List[str]) -> List[str]:
+        """
+        Renew the leases of running jobs.
+
+        Returns:
+            IDs of the jobs that were cancelled by another process
+        """
+        self._queue.extend_leases(job_ids, self._lease_seconds)
+        cancelled = []
+        for job_id in job_ids:
+            job = self._queue.get_job(job_id)
+            if job is not None and job.status == JobStatus.CANCELLED:
+                cancelled.append(job_id)
+        return cancelled
+
+    async def _run_job(self, job_id: str) -> None:
+        """Execute one dispatched job and free its execution slot."""
+        try:
+            await self.execute_job(job_id)
+        except Exception as e:
+            logger.error(f"Error executing job {job_id}: {e}")
+        finally:
+            with self._lock:
+                self._running_tasks.pop(job_id, None)
+            self._execution_slots.release()
+
     async def stop_worker(self) -> None:
         """
         Stop the background worker gracefully.
 
-        Waits for the current job to complete before stopping.
+        Stops dispatching new jobs and waits for running jobs to complete.
         """
         if not self._worker_running:
             logger.warning("Worker is not running")
@@ -895,6 +1058,21 @@ class JobRunner:
                 pass
             self._worker_task = None
 
+        with self._lock:
+            running = list(self._running_tasks.values())
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+        if self._lease_task:
+            self._lease_task.cancel()
+            try:
+                await self._lease_task
+            except asyncio.CancelledError:
+                pass
+            self._lease_task = None
+
+        self._worker_loop_ref = None
+        self._wakeup = None
         logger.info("Job worker stopped")
 
     def get_worker_status(self) -> WorkerStatus:
@@ -904,12 +1082,16 @@ class JobRunner:
         Returns:
             WorkerStatus with worker state information
         """
+        with self._lock:
+            running_job_ids = list(self._active_job_ids)
         return WorkerStatus(
             is_running=self._worker_running,
             started_at=self._worker_started_at,
             jobs_processed=self._jobs_processed,
-            current_job_id=self._current_job_id,
-            last_heartbeat=self._last_heartbeat
+            current_job_id=running_job_ids[-1] if running_job_ids else None,
+            last_heartbeat=self._last_heartbeat,
+            running_job_ids=running_job_ids,
+            max_concurrent_jobs=self._max_concurrent_jobs
         )
 
     # ==================== Integration Hooks ====================
@@ -1014,17 +1196,13 @@ class JobRunner:
         from datetime import timedelta
         cutoff = cutoff - timedelta(hours=max_age_hours)
 
-        with self._lock:
-            jobs_to_remove = []
-            for job_id, job in self._jobs.items():
-                if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
-                    if job.completed_at and job.completed_at < cutoff:
-                        jobs_to_remove.append(job_id)
+        jobs_to_remove = []
+        for status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+            for job in self._queue.list_jobs(status.value):
+                if job.completed_at and job.completed_at < cutoff:
+                    jobs_to_remove.append(job.id)
 
-            for job_id in jobs_to_remove:
-                del self._jobs[job_id]
-                if job_id in self._job_results:
-                    del self._job_results[job_id]
+        self._queue.delete_jobs(jobs_to_remove)
 
         logger.info(f"Cleared {len(jobs_to_remove)} old jobs")
         return len(jobs_to_remove)
@@ -1036,10 +1214,7 @@ class JobRunner:
         Returns:
             Number of jobs cleared
         """
-        with self._lock:
-            count = len(self._jobs)
-            self._jobs.clear()
-            self._job_results.clear()
+        count = self._queue.clear()
         logger.info(f"Cleared {count} jobs")
         return count
 
@@ -1068,8 +1243,7 @@ class JobRunner:
         Returns:
             List of jobs with that status
         """
-        with self._lock:
-            return [j for j in self._jobs.values() if j.status == status]
+        return self._queue.list_jobs(JobStatus(status).value)
 
     def retry_failed_job(self, job_id: str) -> bool:
         """
@@ -1082,7 +1256,7 @@ class JobRunner:
             True if job was reset for retry, False otherwise
         """
         with self._lock:
-            job = self._jobs.get(job_id)
+            job = self._queue.get_job(job_id)
             if job is None:
                 return False
 
@@ -1095,7 +1269,9 @@ class JobRunner:
             job.completed_at = None
             job.error = None
             job.retry_count = 0  # Reset retry count for manual retry
+            self._queue.save_job(job)
 
+        self._queue_job(job)
         logger.info(f"Job {job_id} reset for manual retry")
         return True
 
@@ -1109,7 +1285,8 @@ def get_job_runner(
     neo4j_handler=None,
     report_scheduler=None,
     report_export_service=None,
-    bulk_operations_service=None
+    bulk_operations_service=None,
+    queue_backend: Optional[JobQueueBackend] = None
 ) -> JobRunner:
     """
     Get or create the job runner singleton.
@@ -1119,6 +1296,7 @@ def get_job_runner(
         report_scheduler: ReportScheduler instance (optional)
         report_export_service: ReportExportService instance (optional)
         bulk_operations_service: BulkOperationsService instance (optional)
+        queue_backend: Job storage and queue used when creating the runner (optional)
 
     Returns:
         JobRunner instance
@@ -1133,7 +1311,8 @@ def get_job_runner(
                     neo4j_handler,
                     report_scheduler,
                     report_export_service,
-                    bulk_operations_service
+                    bulk_operations_service,
+                    queue_backend=queue_backend
                 )
 
     return _job_runner
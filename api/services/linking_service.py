@@ -352,6 +352,8 @@ class LinkingService:
                 action_id=action_id,
             )
 
+        await self.neo4j.report_person_changes([keep_entity_id, discard_entity_id])
+
         # Create audit trail
         await self._create_audit_trail(
             action_id=action_id,
@@ -528,6 +530,8 @@ class LinkingService:
                     action_id=action_id,
                 )
 
+        await self.neo4j.report_person_changes([entity_id_1, entity_id_2])
+
         # Create audit trail
         await self._create_audit_trail(
             action_id=action_id,
@@ -643,6 +647,8 @@ class LinkingService:
                 action_id=action_id,
             )
 
+        await self.neo4j.report_person_changes([entity_id])
+
         # Create audit trail
         await self._create_audit_trail(
             action_id=action_id,
@@ -7,14 +7,17 @@ and context manager support for sessions.
 """
 
 import asyncio
+import functools
 import json
+import logging
 import os
 import re
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 from uuid import uuid4
 
+import anyio
 from dotenv import load_dotenv
 from neo4j import AsyncGraphDatabase
 from neo4j.exceptions import (
@@ -27,6 +30,32 @@ from neo4j.exceptions import (
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Callbacks told about writes made through any AsyncNeo4jService, called
+# as reporter(event, project_safe_name, entity_ids, data_version) in a
+# worker thread (see Neo4jHandler.report_change)
+_change_reporters: List[Callable[..., Any]] = []
+
+
+def add_change_reporter(reporter: Callable[..., Any]) -> None:
+    """
+    Register a callback for writes made through AsyncNeo4jService.
+
+    Args:
+        reporter: Callable taking (event, project_safe_name, entity_ids,
+            data_version), with the same events as Neo4jHandler change
+            listeners
+    """
+    if reporter not in _change_reporters:
+        _change_reporters.append(reporter)
+
+
+def remove_change_reporter(reporter: Callable[..., Any]) -> None:
+    """Unregister a callback added with add_change_reporter."""
+    if reporter in _change_reporters:
+        _change_reporters.remove(reporter)
+
 
 class Neo4jConnectionError(Exception):
     """Raised when connection to Neo4j fails."""
@@ -246,6 +275,84 @@ class AsyncNeo4jService:
         except Exception as e:
             raise Neo4jQueryError(f"Query execution failed: {e}")
 
+    # ==================== Change Reporting ====================
+
+    async def report_person_changes(
+        self,
+        person_ids: Iterable[str],
+        event: str = "people_updated"
+    ) -> None:
+        """
+        Bump the data version of the projects of changed people and report them.
+
+        Every write that changes people must end up here (Neo4jHandler
+        bumps the version in the write's own session), so caches in this
+        and other processes notice it. Failures are logged and never fail the write.
+
+        Args:
+            person_ids: IDs of the people changed.
+            event: Change event passed to the reporters.
+        """
+        person_ids = list(dict.fromkeys(person_ids))
+        if not person_ids:
+            return
+
+        try:
+            rows = await self._execute_query("""
+                UNWIND $person_ids AS person_id
+                MATCH (project:Project)-[:HAS_PERSON]->(person:Person {id: person_id})
+                WITH project, collect(DISTINCT person.id) AS entity_ids
+                SET project.data_version = coalesce(project.data_version, 0) + 1
+                RETURN project.safe_name AS safe_name,
+                       project.data_version AS version,
+                       entity_ids
+            """, {"person_ids": person_ids})
+        except Exception:
+            logger.exception(f"Failed to bump the data version for {event}")
+            return
+
+        for row in rows or []:
+            await self._call_change_reporters(
+                event, row["safe_name"], row["entity_ids"], row["version"]
+            )
+
+    async def _report_project_change(
+        self,
+        event: str,
+        project_safe_name: str,
+        entity_ids: List[str]
+    ) -> None:
+        """Bump a project's data version and report a change to its people."""
+        try:
+            record = await self._execute_query("""
+                MATCH (project:Project {safe_name: $project_safe_name})
+                SET project.data_version = coalesce(project.data_version, 0) + 1
+                RETURN project.data_version AS version
+            """, {"project_safe_name": project_safe_name}, fetch_one=True)
+        except Exception:
+            logger.exception(f"Failed to bump the data version of {project_safe_name}")
+            record = None
+
+        await self._call_change_reporters(
+            event, project_safe_name, entity_ids, record["version"] if record else None
+        )
+
+    async def _call_change_reporters(
+        self,
+        event: str,
+        project_safe_name: str,
+        entity_ids: List[str],
+        data_version: Optional[int] = None
+    ) -> None:
+        """Call the change reporters in a worker thread; a failing one is logged."""
+        for reporter in list(_change_reporters):
+            try:
+                await anyio.to_thread.run_sync(functools.partial(
+                    reporter, event, project_safe_name, list(entity_ids), data_version
+                ))
+            except Exception:
+                logger.exception(f"Change reporter failed for {event} in {project_safe_name}")
+
     # ==================== Schema Management ====================
 
     async def ensure_constraints(self) -> None:
@@ -507,7 +614,11 @@ class AsyncNeo4jService:
             """, safe_name=safe_name)
 
             record = await result.single()
-            return record is not None and record["deleted_count"] > 0
+            deleted = record is not None and record["deleted_count"] > 0
+
+        if deleted:
+            await self._call_change_reporters("project_deleted", safe_name, [])
+        return deleted
 
     # ==================== Person Management ====================
 
@@ -572,8 +683,9 @@ class AsyncNeo4jService:
 
         # Process profile data using batch operation to avoid N+1 queries
         if "profile" in person_data and person_data["profile"]:
-            await self.set_person_fields_batch(person_id, person_data["profile"])
+            await self._write_person_fields_batch(person_id, person_data["profile"])
 
+        await self.report_person_changes([person_id], "people_created")
         return await self.get_person(project_safe_name, person_id)
 
     async def get_person(
@@ -779,8 +891,10 @@ class AsyncNeo4jService:
 
         # Update profile data using batch operation to avoid N+1 queries
         if profile_data:
-            await self.set_person_fields_batch(person_id, profile_data)
+            await self._write_person_fields_batch(person_id, profile_data)
 
+        if updated_data or profile_data:
+            await self.report_person_changes([person_id])
         return await self.get_person(project_safe_name, person_id)
 
     async def set_person_field(
@@ -799,6 +913,17 @@ class AsyncNeo4jService:
             field_id: Field identifier.
             value: Value to set (can be string, dict, list, or file data).
         """
+        await self._write_person_field(person_id, section_id, field_id, value)
+        await self.report_person_changes([person_id])
+
+    async def _write_person_field(
+        self,
+        person_id: str,
+        section_id: str,
+        field_id: str,
+        value: Any
+    ) -> None:
+        """Write a field value without reporting the change (see set_person_field)."""
         async with self.session() as session:
             # First delete any existing value for this field
             await session.run("""
@@ -867,6 +992,18 @@ class AsyncNeo4jService:
         if not profile_data:
             return
 
+        await self._write_person_fields_batch(person_id, profile_data)
+        await self.report_person_changes([person_id])
+
+    async def _write_person_fields_batch(
+        self,
+        person_id: str,
+        profile_data: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Write field values without reporting the change (see set_person_fields_batch)."""
+        if not profile_data:
+            return
+
         # Separate regular field values from file uploads
         field_values = []
         file_uploads = []
@@ -1032,7 +1169,11 @@ class AsyncNeo4jService:
             """, project_safe_name=project_safe_name, person_id=person_id)
 
             record = await result.single()
-            return record is not None and record["deleted_count"] > 0
+            deleted = record is not None and record["deleted_count"] > 0
+
+        if deleted:
+            await self._report_project_change("people_deleted", project_safe_name, [person_id])
+        return deleted
 
     # ==================== File Management ====================
 
@@ -1267,8 +1408,9 @@ class AsyncNeo4jService:
         for i, person_data in enumerate(people_data):
             person_id = person_ids[i]
             if "profile" in person_data and person_data["profile"]:
-                await self.set_person_fields_batch(person_id, person_data["profile"])
+                await self._write_person_fields_batch(person_id, person_data["profile"])
 
+        await self.report_person_changes(person_ids, "people_created")
         return person_ids
 
     async def export_to_json(self, project_safe_name: str) -> Optional[Dict[str, Any]]:
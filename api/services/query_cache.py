@@ -6,6 +6,7 @@ Provides intelligent caching for expensive graph analytics queries with:
 - TTL configuration per query type
 - Project-aware cache invalidation
 - Cache statistics and monitoring
+- Optional Redis backend shared by API and Celery workers
 
 Phase 20: Query & Performance Optimization
 """
@@ -13,15 +14,21 @@ Phase 20: Query & Performance Optimization
 import asyncio
 import functools
 import hashlib
+import heapq
 import json
 import logging
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar, Union
+from uuid import uuid4
 
+import anyio
 from pydantic import BaseModel, Field
 
+from .cache_service import BaseCacheBackend, RedisCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,6 +93,7 @@ class CacheEntry(BaseModel):
     access_count: int = 0
     last_accessed: Optional[datetime] = None
     computation_time_ms: float = 0.0
+    data_version: Optional[int] = None
 
     model_config = {"extra": "allow"}
 
@@ -127,12 +135,36 @@ class QueryCacheService:
     - Project-aware invalidation
     - Entity-aware invalidation
     - Performance statistics
+    - Optional shared backend (Redis) for multiple workers
+
+    Local entries are kept in an OrderedDict in recency order, with
+    project, entity and query type indexes, so lookups, LRU eviction and
+    invalidation only touch the affected entries.
+
+    With a shared backend, entries are stored there instead, tagged by
+    project, entity and query type, so every API and Celery worker using
+    the same backend sees the same results and invalidations. Values then
+    round-trip through the backend's serialization (JSON for RedisCache),
+    eviction is left to the backend's TTLs, and statistics stay per process.
+
+    Every invalidation also bumps the version of the tags it covers. A
+    caller that reads get_versions before computing a result and passes
+    them to set never stores a result that an invalidation made stale
+    while it was being computed.
+
+    Once enable_change_invalidation is given a Neo4j handler, entries also
+    record the project's data version they were computed from, and get
+    drops entries whose project was written since by another process.
     """
 
+    # Version tag bumped by clear, covering every entry
+    _ALL_TAG = "all"
+
     def __init__(
         self,
         config: Optional[CacheConfig] = None,
         max_entries: int = 500,
+        backend: Optional[BaseCacheBackend] = None,
     ):
         """
         Initialize the query cache service.
@@ -140,12 +172,21 @@ class QueryCacheService:
         Args:
             config: Cache configuration settings
             max_entries: Maximum cache entries before LRU eviction
+            backend: Optional shared cache backend (e.g. a connected RedisCache)
         """
         self.config = config or CacheConfig()
         self.max_entries = max_entries
-        self._cache: Dict[str, CacheEntry] = {}
+        self.backend = backend
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._project_keys: Dict[str, Set[str]] = {}
+        self._entity_keys: Dict[str, Set[str]] = {}
+        self._type_keys: Dict[QueryType, Set[str]] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._stats = CacheStats(enabled=self.config.enabled)
+        self._tag_versions: Dict[str, int] = {}
         self._lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._neo4j_handler: Any = None
 
         # TTL mapping by query type
         self._ttl_map = {
@@ -182,6 +223,150 @@ class QueryCacheService:
         """Get TTL for a specific query type."""
         return self._ttl_map.get(query_type, self.config.default_ttl)
 
+    @staticmethod
+    def _project_tag(project_id: str) -> str:
+        """Shared backend tag for a project."""
+        return f"project:{project_id}"
+
+    @staticmethod
+    def _entity_tag(entity_id: str) -> str:
+        """Shared backend tag for an entity."""
+        return f"entity:{entity_id}"
+
+    @staticmethod
+    def _type_tag(query_type: QueryType) -> str:
+        """Shared backend tag for a query type."""
+        return f"type:{query_type.value}"
+
+    @staticmethod
+    def _version_key(tag: str) -> str:
+        """Shared backend key holding the version of a tag."""
+        return f"__version__:{tag}"
+
+    def _version_tags(
+        self,
+        query_type: QueryType,
+        project_id: Optional[str] = None,
+        entity_ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """Tags whose invalidation makes a result stale."""
+        tags = [self._ALL_TAG, self._type_tag(query_type)]
+        if project_id:
+            tags.append(self._project_tag(project_id))
+        tags.extend(self._entity_tag(entity_id) for entity_id in entity_ids or [])
+        return tags
+
+    async def get_versions(
+        self,
+        query_type: QueryType,
+        project_id: Optional[str] = None,
+        entity_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get the current versions of the tags a result would be stored under.
+
+        Read them before computing a result and pass them to set, which
+        drops the result if any of the tags was invalidated meanwhile.
+
+        Args:
+            query_type: Type of query
+            project_id: Project ID for scoping
+            entity_ids: Entity IDs involved
+
+        Returns:
+            Dict mapping tag to version
+        """
+        tags = self._version_tags(query_type, project_id, entity_ids)
+        if self.backend is not None:
+            return {tag: await self.backend.get(self._version_key(tag)) for tag in tags}
+        return {tag: self._tag_versions.get(tag, 0) for tag in tags}
+
+    async def _bump_version(self, tag: str) -> None:
+        """
+        Bump the version of a tag before its entries are invalidated.
+
+        Local versions are counters and must be bumped under the lock (or
+        from the loop without awaiting); shared versions are random tokens
+        kept a little longer than the longest entry TTL.
+        """
+        if self.backend is None:
+            self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+            return
+        ttl = max([self.config.default_ttl, *self._ttl_map.values()]) + 60
+        await self.backend.set(self._version_key(tag), uuid4().hex, ttl=ttl)
+
+    async def get_data_version(self, project_id: Optional[str]) -> Optional[int]:
+        """
+        Get a project's data version from the handler passed to enable_change_invalidation.
+
+        Read it before computing a result and pass it to set, so the entry
+        is dropped once the project is written in any process.
+
+        Args:
+            project_id: Project ID for scoping
+
+        Returns:
+            The data version, or None if unknown
+        """
+        get_version = getattr(self._neo4j_handler, "get_data_version", None)
+        if not project_id or not callable(get_version):
+            return None
+        try:
+            return await anyio.to_thread.run_sync(get_version, project_id)
+        except Exception as e:
+            logger.warning(f"Failed to read the data version of {project_id}: {e}")
+            return None
+
+    @staticmethod
+    def _is_current(entry_version: Optional[int], data_version: Optional[int]) -> bool:
+        """Whether an entry computed at entry_version reflects data_version; unknown counts as current."""
+        return entry_version is None or data_version is None or entry_version == data_version
+
+    def _index_entry(self, entry: CacheEntry) -> None:
+        """Add a local entry to the cache and its secondary indexes."""
+        self._cache[entry.key] = entry
+        if entry.project_id:
+            self._project_keys.setdefault(entry.project_id, set()).add(entry.key)
+        for entity_id in entry.entity_ids:
+            self._entity_keys.setdefault(entity_id, set()).add(entry.key)
+        self._type_keys.setdefault(entry.query_type, set()).add(entry.key)
+
+        heapq.heappush(self._expiry_heap, (entry.expires_at.timestamp(), entry.key))
+        if len(self._expiry_heap) > 2 * max(self.max_entries, len(self._cache)):
+            # Drop heap items of replaced or removed entries
+            self._expiry_heap = [
+                (e.expires_at.timestamp(), key) for key, e in self._cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _remove_entry(self, key: str) -> bool:
+        """Remove a local entry from the cache and its secondary indexes."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+
+        def unindex(index: Dict[Any, Set[str]], name: Any) -> None:
+            keys = index.get(name)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[name]
+
+        if entry.project_id:
+            unindex(self._project_keys, entry.project_id)
+        for entity_id in entry.entity_ids:
+            unindex(self._entity_keys, entity_id)
+        unindex(self._type_keys, entry.query_type)
+        return True
+
+    def _remove_keys(self, keys: Set[str]) -> int:
+        """Remove local entries by key, returning how many existed."""
+        count = 0
+        for key in list(keys):
+            if self._remove_entry(key):
+                count += 1
+        return count
+
     async def get(
         self,
         query_type: QueryType,
@@ -203,6 +388,21 @@ class QueryCacheService:
             return None
 
         key = self._generate_key(query_type, project_id, **params)
+        data_version = await self.get_data_version(project_id)
+
+        if self.backend is not None:
+            payload = await self.backend.get(key)
+            if isinstance(payload, dict) and not self._is_current(payload.get("data_version"), data_version):
+                # Written by another process since it was computed
+                await self.backend.delete(key)
+                payload = None
+            async with self._lock:
+                if not isinstance(payload, dict) or "value" not in payload:
+                    self._stats.misses += 1
+                    return None
+                self._stats.hits += 1
+                self._stats.total_computation_time_saved_ms += payload.get("computation_time_ms", 0.0)
+            return payload["value"]
 
         async with self._lock:
             entry = self._cache.get(key)
@@ -211,15 +411,16 @@ class QueryCacheService:
                 self._stats.misses += 1
                 return None
 
-            # Check expiration
+            # Check expiration, and writes by other processes since it was computed
             now = datetime.now(timezone.utc)
-            if entry.expires_at < now:
+            if entry.expires_at < now or not self._is_current(entry.data_version, data_version):
                 # Expired - remove and return None
-                del self._cache[key]
+                self._remove_entry(key)
                 self._stats.misses += 1
                 return None
 
             # Cache hit
+            self._cache.move_to_end(key)
             self._stats.hits += 1
             self._stats.total_computation_time_saved_ms += entry.computation_time_ms
             entry.access_count += 1
@@ -239,6 +440,8 @@ class QueryCacheService:
         entity_ids: Optional[List[str]] = None,
         computation_time_ms: float = 0.0,
         ttl_override: Optional[int] = None,
+        versions: Optional[Dict[str, Any]] = None,
+        data_version: Optional[int] = None,
         **params: Any,
     ) -> str:
         """
@@ -251,6 +454,10 @@ class QueryCacheService:
             entity_ids: Entity IDs involved (for invalidation)
             computation_time_ms: How long the query took
             ttl_override: Override default TTL
+            versions: Tag versions read with get_versions before the
+                result was computed; the result is dropped if they changed
+            data_version: Project data version read with get_data_version
+                before the result was computed (read now if omitted)
             **params: Query parameters for key generation
 
         Returns:
@@ -262,28 +469,69 @@ class QueryCacheService:
         key = self._generate_key(query_type, project_id, **params)
         ttl = ttl_override or self._get_ttl(query_type)
         now = datetime.now(timezone.utc)
-
-        entry = CacheEntry(
-            key=key,
-            value=value,
-            query_type=query_type,
-            project_id=project_id,
-            entity_ids=entity_ids or [],
-            created_at=now,
-            expires_at=datetime.fromtimestamp(
-                now.timestamp() + ttl, tz=timezone.utc
-            ),
-            computation_time_ms=computation_time_ms,
-        )
+        if data_version is None:
+            data_version = await self.get_data_version(project_id)
+
+        if self.backend is not None:
+            if versions is not None and await self.get_versions(query_type, project_id, entity_ids) != versions:
+                logger.debug(f"Dropped stale result: {query_type.value}")
+                return key
+
+            tags = {self._type_tag(query_type)}
+            if project_id:
+                tags.add(self._project_tag(project_id))
+            tags.update(self._entity_tag(entity_id) for entity_id in entity_ids or [])
+
+            stored = await self.backend.set(
+                key,
+                {
+                    "value": _to_jsonable(value),
+                    "computation_time_ms": computation_time_ms,
+                    "data_version": data_version,
+                },
+                ttl=ttl,
+                tags=tags,
+            )
+            if not stored:
+                return key
+
+            # An invalidation between the check and the write bumps first
+            if versions is not None and await self.get_versions(query_type, project_id, entity_ids) != versions:
+                await self.backend.delete(key)
+                logger.debug(f"Dropped stale result: {query_type.value}")
+                return key
+        else:
+            entry = CacheEntry(
+                key=key,
+                value=value,
+                query_type=query_type,
+                project_id=project_id,
+                entity_ids=entity_ids or [],
+                created_at=now,
+                expires_at=datetime.fromtimestamp(
+                    now.timestamp() + ttl, tz=timezone.utc
+                ),
+                computation_time_ms=computation_time_ms,
+                data_version=data_version,
+            )
 
         async with self._lock:
-            # Check if we need to evict (LRU)
-            if len(self._cache) >= self.max_entries and key not in self._cache:
-                await self._evict_lru()
+            if self.backend is None:
+                if versions is not None and {
+                    tag: self._tag_versions.get(tag, 0) for tag in versions
+                } != versions:
+                    logger.debug(f"Dropped stale result: {query_type.value}")
+                    return key
+
+                # Replace an existing entry, or make room for a new one (LRU)
+                if not self._remove_entry(key):
+                    while self._cache and len(self._cache) >= self.max_entries:
+                        self._evict_lru()
+
+                self._index_entry(entry)
+                self._stats.cache_size = len(self._cache)
 
-            self._cache[key] = entry
             self._stats.sets += 1
-            self._stats.cache_size = len(self._cache)
 
             # Update average computation time
             total_sets = self._stats.sets
@@ -299,25 +547,31 @@ class QueryCacheService:
         )
         return key
 
-    async def _evict_lru(self) -> None:
-        """Evict least recently used entries."""
+    def _evict_lru(self) -> None:
+        """Evict the least recently used local entry."""
         if not self._cache:
             return
 
-        # Find entry with oldest access time
-        oldest_key = None
-        oldest_time = None
-
-        for key, entry in self._cache.items():
-            access_time = entry.last_accessed or entry.created_at
-            if oldest_time is None or access_time < oldest_time:
-                oldest_time = access_time
-                oldest_key = key
+        oldest_key = next(iter(self._cache))
+        self._remove_entry(oldest_key)
+        self._stats.evictions += 1
+        self._stats.cache_size = len(self._cache)
+
+    async def _invalidate(self, index: Dict[Any, Set[str]], name: Any, tag: str) -> int:
+        """Invalidate the entries under one secondary index name or backend tag."""
+        if self.backend is not None:
+            await self._bump_version(tag)
+            count = await self.backend.invalidate_by_tag(tag)
+            async with self._lock:
+                self._stats.invalidations += count
+            return count
 
-        if oldest_key:
-            del self._cache[oldest_key]
-            self._stats.evictions += 1
+        async with self._lock:
+            await self._bump_version(tag)
+            count = self._remove_keys(index.get(name, set()))
+            self._stats.invalidations += count
             self._stats.cache_size = len(self._cache)
+            return count
 
     async def invalidate_project(self, project_id: str) -> int:
         """
@@ -332,20 +586,85 @@ class QueryCacheService:
         if not self.config.enabled:
             return 0
 
-        async with self._lock:
-            keys_to_remove = [
-                key for key, entry in self._cache.items()
-                if entry.project_id == project_id
-            ]
+        count = await self._invalidate(
+            self._project_keys, project_id, self._project_tag(project_id)
+        )
+        logger.info(f"Invalidated {count} entries for project {project_id}")
+        return count
 
-            for key in keys_to_remove:
-                del self._cache[key]
+    def enable_change_invalidation(self, neo4j_handler: Any) -> bool:
+        """
+        Invalidate a project's entries whenever its entities change.
+
+        Subscribes to the change events of the Neo4j handler, and checks
+        entries against the handler's project data versions so writes from
+        other processes invalidate too. Must be called from the event loop
+        serving the cached queries.
+
+        Args:
+            neo4j_handler: Neo4jHandler whose writes should invalidate
+
+        Returns:
+            True if the handler supports change events
+        """
+        add_listener = getattr(neo4j_handler, "add_change_listener", None)
+        if not callable(add_listener):
+            return False
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        self._neo4j_handler = neo4j_handler
+        add_listener(self._handle_entity_change)
+        return True
+
+    def _handle_entity_change(
+        self,
+        event: str,
+        project_safe_name: str,
+        entity_ids: List[str],
+    ) -> None:
+        """
+        Invalidate the project of an entity change event.
+
+        Any entity or relationship change can alter paths, communities and
+        scores across the whole project, so every entry of the project is
+        dropped. Writes from the event loop invalidate local entries before
+        returning; writes from worker threads wait for the loop to do so.
+
+        Args:
+            event: Change event name
+            project_safe_name: Project of the changed entities
+            entity_ids: IDs of the changed entities
+        """
+        if not self.config.enabled or not project_safe_name:
+            return
 
-            self._stats.invalidations += len(keys_to_remove)
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        loop = self._loop
+        if loop is None or loop is running_loop or loop.is_closed():
+            if self.backend is not None and running_loop is not None:
+                running_loop.create_task(self.invalidate_project(project_safe_name))
+                return
+            # No awaits: atomic with respect to the coroutines on the loop
+            tag = self._project_tag(project_safe_name)
+            self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+            count = self._remove_keys(self._project_keys.get(project_safe_name, set()))
+            self._stats.invalidations += count
             self._stats.cache_size = len(self._cache)
+            return
 
-            logger.info(f"Invalidated {len(keys_to_remove)} entries for project {project_id}")
-            return len(keys_to_remove)
+        future = asyncio.run_coroutine_threadsafe(
+            self.invalidate_project(project_safe_name), loop
+        )
+        try:
+            future.result(timeout=5)
+        except Exception as e:
+            logger.warning(f"Query cache invalidation failed for {project_safe_name}: {e}")
 
     async def invalidate_entity(self, entity_id: str) -> int:
         """
@@ -360,20 +679,11 @@ class QueryCacheService:
         if not self.config.enabled:
             return 0
 
-        async with self._lock:
-            keys_to_remove = [
-                key for key, entry in self._cache.items()
-                if entity_id in entry.entity_ids
-            ]
-
-            for key in keys_to_remove:
-                del self._cache[key]
-
-            self._stats.invalidations += len(keys_to_remove)
-            self._stats.cache_size = len(self._cache)
-
-            logger.debug(f"Invalidated {len(keys_to_remove)} entries for entity {entity_id}")
-            return len(keys_to_remove)
+        count = await self._invalidate(
+            self._entity_keys, entity_id, self._entity_tag(entity_id)
+        )
+        logger.debug(f"Invalidated {count} entries for entity {entity_id}")
+        return count
 
     async def invalidate_query_type(self, query_type: QueryType) -> int:
         """
@@ -388,52 +698,62 @@ class QueryCacheService:
         if not self.config.enabled:
             return 0
 
-        async with self._lock:
-            keys_to_remove = [
-                key for key, entry in self._cache.items()
-                if entry.query_type == query_type
-            ]
-
-            for key in keys_to_remove:
-                del self._cache[key]
-
-            self._stats.invalidations += len(keys_to_remove)
-            self._stats.cache_size = len(self._cache)
-
-            return len(keys_to_remove)
+        return await self._invalidate(
+            self._type_keys, query_type, self._type_tag(query_type)
+        )
 
     async def clear(self) -> int:
         """Clear all cached entries."""
+        if self.backend is not None:
+            count = await self.backend.clear()
+            await self._bump_version(self._ALL_TAG)
+            async with self._lock:
+                self._stats.invalidations += count
+            return count
+
         async with self._lock:
+            await self._bump_version(self._ALL_TAG)
             count = len(self._cache)
             self._cache.clear()
+            self._project_keys.clear()
+            self._entity_keys.clear()
+            self._type_keys.clear()
+            self._expiry_heap.clear()
             self._stats.invalidations += count
             self._stats.cache_size = 0
             return count
 
     async def get_stats(self) -> CacheStats:
         """Get cache statistics."""
+        if self.backend is not None:
+            keys = await self.backend.keys("*")
+            size = sum(1 for key in keys if not key.startswith(("__tags__:", "__version__:")))
+            async with self._lock:
+                self._stats.cache_size = size
+                return self._stats.model_copy()
+
         async with self._lock:
             self._stats.cache_size = len(self._cache)
             return self._stats.model_copy()
 
     async def cleanup_expired(self) -> int:
-        """Remove expired entries."""
-        if not self.config.enabled:
+        """Remove expired entries (the shared backend expires its own)."""
+        if not self.config.enabled or self.backend is not None:
             return 0
 
-        now = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc).timestamp()
         async with self._lock:
-            keys_to_remove = [
-                key for key, entry in self._cache.items()
-                if entry.expires_at < now
-            ]
-
-            for key in keys_to_remove:
-                del self._cache[key]
+            count = 0
+            while self._expiry_heap and self._expiry_heap[0][0] < now:
+                expires_at, key = heapq.heappop(self._expiry_heap)
+                entry = self._cache.get(key)
+                # Skip heap items of entries replaced since
+                if entry is not None and entry.expires_at.timestamp() == expires_at:
+                    self._remove_entry(key)
+                    count += 1
 
             self._stats.cache_size = len(self._cache)
-            return len(keys_to_remove)
+            return count
 
 
 # =============================================================================
@@ -443,35 +763,72 @@ class QueryCacheService:
 T = TypeVar("T")
 
 
+def _to_jsonable(value: Any) -> Any:
+    """Convert pydantic models in a value to plain JSON-compatible data."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, dict):
+        return {k: _to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(v) for v in value]
+    return value
+
+
 def cached_query(
     query_type: QueryType,
     project_id_param: str = "project_id",
     entity_id_params: Optional[List[str]] = None,
     ttl_override: Optional[int] = None,
+    exclude_params: Optional[List[str]] = None,
 ):
     """
-    Decorator for caching async query methods.
+    Decorator for caching query methods.
+
+    Also works on FastAPI endpoints, which are called with keyword
+    arguments; place it below the route decorator and exclude injected
+    dependencies from the key. Sync functions are run in the worker
+    thread pool on a cache miss, so blocking endpoints stay off the
+    event loop.
 
     Usage:
         @cached_query(QueryType.COMMUNITY_DETECTION, project_id_param="project_safe_name")
         async def detect_communities(self, project_safe_name: str, ...):
             ...
 
+        @router.get("/communities")
+        @cached_query(
+            QueryType.COMMUNITY_DETECTION,
+            project_id_param="project",
+            exclude_params=["neo4j_handler"],
+        )
+        def detect_communities(project: str, neo4j_handler=Depends(get_neo4j_handler)):
+            ...
+
     Args:
         query_type: Type of query for TTL and invalidation
         project_id_param: Name of the parameter containing project ID
         entity_id_params: Names of parameters containing entity IDs
         ttl_override: Optional TTL override
+        exclude_params: Names of parameters left out of the cache key
     """
     entity_params = entity_id_params or []
+    excluded = set(exclude_params or [])
+    excluded.add(project_id_param)
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        is_async = asyncio.iscoroutinefunction(func)
+
+        async def call(*args, **kwargs) -> T:
+            if is_async:
+                return await func(*args, **kwargs)
+            return await anyio.to_thread.run_sync(functools.partial(func, *args, **kwargs))
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> T:
             # Get cache service
             cache = get_query_cache_service()
             if cache is None or not cache.config.enabled:
-                return await func(*args, **kwargs)
+                return await call(*args, **kwargs)
 
             # Extract project ID from args/kwargs
             # Handle both positional and keyword arguments
@@ -495,7 +852,7 @@ def cached_query(
                         entity_ids.append(val)
 
             # Generate cache key from all kwargs
-            cache_params = {k: v for k, v in kwargs.items() if k != project_id_param}
+            cache_params = {k: v for k, v in kwargs.items() if k not in excluded}
 
             # Check cache
             cached = await cache.get(
@@ -506,9 +863,11 @@ def cached_query(
             if cached is not None:
                 return cached
 
-            # Execute query and measure time
+            # Execute query and measure time; invalidations meanwhile drop the result
+            versions = await cache.get_versions(query_type, project_id, entity_ids)
+            data_version = await cache.get_data_version(project_id)
             start_time = time.perf_counter()
-            result = await func(*args, **kwargs)
+            result = await call(*args, **kwargs)
             computation_time_ms = (time.perf_counter() - start_time) * 1000
 
             # Cache result
@@ -519,6 +878,8 @@ def cached_query(
                 entity_ids=entity_ids,
                 computation_time_ms=computation_time_ms,
                 ttl_override=ttl_override,
+                versions=versions,
+                data_version=data_version,
                 **cache_params,
             )
 
@@ -543,17 +904,47 @@ def get_query_cache_service() -> Optional[QueryCacheService]:
 def initialize_query_cache(
     config: Optional[CacheConfig] = None,
     max_entries: int = 500,
+    backend: Optional[BaseCacheBackend] = None,
 ) -> QueryCacheService:
     """Initialize the query cache service singleton."""
     global _query_cache_service
-    _query_cache_service = QueryCacheService(config=config, max_entries=max_entries)
+    _query_cache_service = QueryCacheService(
+        config=config, max_entries=max_entries, backend=backend
+    )
     logger.info(
         f"Query cache initialized (enabled={_query_cache_service.config.enabled}, "
-        f"max_entries={max_entries})"
+        f"max_entries={max_entries}, shared={backend is not None})"
     )
     return _query_cache_service
 
 
+async def initialize_shared_query_cache(
+    redis_url: str,
+    config: Optional[CacheConfig] = None,
+    max_entries: int = 500,
+    prefix: str = "basset:query:",
+) -> QueryCacheService:
+    """
+    Initialize the query cache singleton on a shared Redis backend.
+
+    Falls back to the in-process cache when Redis cannot be reached.
+
+    Args:
+        redis_url: Redis connection URL
+        config: Cache configuration settings
+        max_entries: Maximum local entries if Redis is unavailable
+        prefix: Key prefix separating query results from other cached data
+
+    Returns:
+        The initialized QueryCacheService
+    """
+    backend = RedisCache(url=redis_url, prefix=prefix)
+    if not await backend.connect():
+        logger.warning("Redis unavailable, query cache is local to this process")
+        backend = None
+    return initialize_query_cache(config=config, max_entries=max_entries, backend=backend)
+
+
 def reset_query_cache_service() -> None:
     """Reset the query cache service singleton (for testing)."""
     global _query_cache_service
@@ -15,13 +15,19 @@ Features:
 - Phrase search with quotes
 - Wildcard support (* and ?)
 - Nested query grouping with parentheses
+- In-memory inverted index with incremental updates and disk snapshots
 """
 
+import logging
+import os
 import re
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from enum import Enum
 
+from .text_index import ProjectTextIndex
+
 # Fuzzy matcher is optional but enhances search
 try:
     from .fuzzy_matcher import FuzzyMatcher, get_fuzzy_matcher, RAPIDFUZZ_AVAILABLE
@@ -31,12 +37,21 @@ except ImportError:
     get_fuzzy_matcher = None
 
 
+logger = logging.getLogger(__name__)
+
 # Default searchable field types
 DEFAULT_SEARCHABLE_TYPES = {"string", "email", "url", "comment", "ip_address"}
 
 # Index name for full-text search
 FULLTEXT_INDEX_NAME = "entity_fulltext_index"
 
+# Shortest literal fragment pushed down to the full-text index; shorter
+# fragments are barely selective and expensive as leading wildcards
+MIN_FULLTEXT_TERM_LENGTH = 3
+
+# Literal fragments that the Lucene standard analyzer never splits
+FULLTEXT_FRAGMENT_PATTERN = re.compile(r'[A-Za-z0-9]+')
+
 
 class QueryOperator(Enum):
     """Enumeration of supported query operators."""
@@ -349,6 +364,7 @@ class SearchService:
         self,
         neo4j_handler,
         config: Optional[Dict[str, Any]] = None,
+        snapshot_dir: Optional[str] = None,
     ):
         """
         Initialize the search service.
@@ -356,12 +372,17 @@ class SearchService:
         Args:
             neo4j_handler: Neo4j database handler instance
             config: Application configuration dictionary
+            snapshot_dir: Directory for text index snapshots (optional)
         """
         self.neo4j = neo4j_handler
         self.config = config or {}
+        self.snapshot_dir = snapshot_dir
         self._fuzzy_matcher: Optional[FuzzyMatcher] = None
         self._searchable_fields: Optional[List[str]] = None
         self._query_parser = AdvancedQueryParser()
+        self._text_indexes: Dict[str, ProjectTextIndex] = {}
+        self._checked_snapshots: Set[str] = set()
+        self._text_index_lock = threading.Lock()
 
     @property
     def fuzzy_matcher(self) -> Optional[FuzzyMatcher]:
@@ -475,6 +496,14 @@ class SearchService:
         """
         Execute a parsed boolean query against entities.
 
+        Projects with an in-memory text index are answered from the index
+        alone. For the others, the query is first compiled into a Lucene
+        query that every match must satisfy, which narrows the candidates
+        through the Neo4j full-text index. The full token tree is then
+        evaluated in Python on the candidates only. Queries that cannot be
+        narrowed (e.g. only negations) and databases without the full-text
+        index fall back to a full scan.
+
         Args:
             query: Search query parameters
             parsed: Parsed query tokens
@@ -493,11 +522,39 @@ class SearchService:
         else:
             projects = self.neo4j.get_all_projects()
 
+        text_indexes = {
+            project.get("safe_name"): self.get_text_index(project.get("safe_name"))
+            for project in projects
+        }
+        unindexed = [name for name, index in text_indexes.items() if index is None]
+
+        candidates = None
+        lucene_query = self._compile_fulltext_query(parsed.tokens) if unindexed else None
+        if lucene_query:
+            candidates = self.neo4j.find_fulltext_candidates(unindexed, lucene_query)
+
         for project in projects:
             project_safe_name = project.get("safe_name")
             project_id = project.get("id", project_safe_name)
 
-            entities = self.neo4j.get_all_people(project_safe_name)
+            index = text_indexes[project_safe_name]
+            if index is not None:
+                results.extend(self._search_text_index(
+                    index,
+                    project_id,
+                    lambda text_index: self._match_text_index(parsed.tokens, text_index),
+                    lambda profile: self._evaluate_query(parsed.tokens, profile, query.highlight)
+                ))
+                continue
+
+            if candidates is None:
+                entities = self.neo4j.get_all_people(project_safe_name)
+            else:
+                candidate_ids = candidates.get(project_safe_name, [])
+                if not candidate_ids:
+                    continue
+                entities_map = self.neo4j.get_people_batch(project_safe_name, candidate_ids)
+                entities = [entities_map[eid] for eid in candidate_ids if eid in entities_map]
 
             for entity in entities:
                 entity_id = entity.get("id", "")
@@ -523,6 +580,158 @@ class SearchService:
 
         return results
 
+    def _compile_fulltext_query(self, tokens: List[QueryToken]) -> Optional[str]:
+        """
+        Compile query tokens into a Lucene pre-filter for the full-text index.
+
+        The compiled query is a necessary condition: every entity matching
+        the tokens also matches it, but not necessarily the reverse. Terms
+        become substring wildcards over their literal fragments, and the
+        tokens are combined in the same order as _evaluate_query. Parts that
+        cannot be expressed (negations, short fragments) are unconstrained.
+
+        Args:
+            tokens: List of query tokens
+
+        Returns:
+            Lucene query string, or None if the query cannot narrow results
+        """
+        def combine(operator: str, left: Optional[str], right: Optional[str]) -> Optional[str]:
+            if operator == "AND":
+                if left is None or right is None:
+                    return left if right is None else right
+                return f"({left} AND {right})"
+            return None if left is None or right is None else f"({left} OR {right})"
+
+        return self._fold_query(tokens, self._compile_fulltext_term, combine)
+
+    def _match_text_index(
+        self,
+        tokens: List[QueryToken],
+        index: ProjectTextIndex
+    ) -> Optional[Set[int]]:
+        """
+        Find the indexed entities that could match query tokens.
+
+        Like _compile_fulltext_query, the result is a necessary condition
+        that is refined by _evaluate_query on the returned candidates.
+
+        Args:
+            tokens: List of query tokens
+            index: Text index of the searched project
+
+        Returns:
+            Set of document ordinals, or None if the query cannot narrow results
+        """
+        def match_term(token: QueryToken) -> Optional[Set[int]]:
+            if token.negated:
+                return None
+            return index.match_term(
+                token.value,
+                field=token.field,
+                wildcard='*' in token.value or '?' in token.value
+            )
+
+        def combine(operator: str, left: Optional[Set[int]], right: Optional[Set[int]]) -> Optional[Set[int]]:
+            if operator == "AND":
+                if left is None or right is None:
+                    return left if right is None else right
+                return left & right
+            return None if left is None or right is None else left | right
+
+        return self._fold_query(tokens, match_term, combine)
+
+    def _fold_query(
+        self,
+        tokens: List[QueryToken],
+        compile_term: Callable[[QueryToken], Any],
+        combine: Callable[[str, Any, Any], Any]
+    ) -> Any:
+        """
+        Fold query tokens into a single value in _evaluate_query order.
+
+        Groups are folded recursively and operators are applied first in,
+        first out with an implicit AND between adjacent terms.
+
+        Args:
+            tokens: List of query tokens
+            compile_term: Function converting a term token into a value
+            combine: Function merging two values for "AND" or "OR"
+
+        Returns:
+            The folded value, or None for an empty query
+        """
+        operands = []
+        operators = []
+
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+
+            if token.type == "group" and token.value == "(":
+                # Find matching closing parenthesis
+                depth = 1
+                j = i + 1
+                while j < len(tokens) and depth > 0:
+                    if tokens[j].type == "group":
+                        if tokens[j].value == "(":
+                            depth += 1
+                        elif tokens[j].value == ")":
+                            depth -= 1
+                    j += 1
+
+                operands.append(self._fold_query(tokens[i + 1:j - 1], compile_term, combine))
+                i = j
+
+            elif token.type == "operator":
+                operators.append(token.value)
+                i += 1
+
+            elif token.type in ("field", "phrase", "word"):
+                operands.append(compile_term(token))
+                i += 1
+
+            else:
+                i += 1
+
+        # Combine exactly like _evaluate_query does
+        while operators or len(operands) > 1:
+            operator = operators.pop(0) if operators else "AND"
+
+            if operator in ("AND", "OR"):
+                if len(operands) >= 2:
+                    right = operands.pop()
+                    left = operands.pop()
+                    operands.append(combine(operator, left, right))
+                elif len(operands) == 1:
+                    break
+
+        return operands[0] if operands else None
+
+    def _compile_fulltext_term(self, token: QueryToken) -> Optional[str]:
+        """
+        Compile a single search term into a Lucene clause.
+
+        Args:
+            token: Query token
+
+        Returns:
+            Lucene clause requiring each literal fragment of the term, or None
+        """
+        if token.negated:
+            return None
+
+        fragments = []
+        for fragment in FULLTEXT_FRAGMENT_PATTERN.findall(token.value.lower()):
+            if len(fragment) >= MIN_FULLTEXT_TERM_LENGTH and fragment not in fragments:
+                fragments.append(fragment)
+
+        if not fragments:
+            return None
+        if len(fragments) == 1:
+            return f"*{fragments[0]}*"
+        return "(" + " AND ".join(f"*{fragment}*" for fragment in fragments) + ")"
+
     def _evaluate_query(
         self,
         tokens: List[QueryToken],
@@ -893,47 +1102,35 @@ class SearchService:
             project_safe_name = project.get("safe_name")
             project_id = project.get("id", project_safe_name)
 
+            index = self.get_text_index(project_safe_name)
+            if index is not None:
+                results.extend(self._search_text_index(
+                    index,
+                    project_id,
+                    lambda text_index: text_index.match_term(search_text),
+                    lambda profile: self._match_profile(profile, search_lower, search_text, query)
+                ))
+                continue
+
             entities = self.neo4j.get_all_people(project_safe_name)
 
             for entity in entities:
                 entity_id = entity.get("id", "")
                 profile = entity.get("profile", {})
 
-                # Search through profile fields
-                matched_fields = []
-                highlights = {}
-                max_score = 0.0
-
-                for section_id, fields in profile.items():
-                    if not isinstance(fields, dict):
-                        continue
-
-                    for field_id, value in fields.items():
-                        # Check if we should search this field
-                        if query.fields and field_id not in query.fields:
-                            continue
-
-                        # Search in value
-                        field_path = f"{section_id}.{field_id}"
-                        match_result = self._search_in_value(
-                            value,
-                            search_lower,
-                            search_text,
-                            query.highlight
-                        )
-
-                        if match_result["matched"]:
-                            matched_fields.append(field_path)
-                            if match_result["highlights"]:
-                                highlights[field_path] = match_result["highlights"]
-                            max_score = max(max_score, match_result["score"])
+                matches, score, highlights, matched_fields = self._match_profile(
+                    profile,
+                    search_lower,
+                    search_text,
+                    query
+                )
 
-                if matched_fields:
+                if matches:
                     results.append(SearchResult(
                         entity_id=entity_id,
                         project_id=project_id,
                         entity_type="Person",
-                        score=max_score,
+                        score=score,
                         highlights=highlights,
                         matched_fields=matched_fields,
                         entity_data=self._extract_entity_summary(entity),
@@ -941,6 +1138,98 @@ class SearchService:
 
         return results, len(results)
 
+    def _match_profile(
+        self,
+        profile: Dict[str, Any],
+        search_lower: str,
+        search_text: str,
+        query: SearchQuery
+    ) -> Tuple[bool, float, Dict[str, List[str]], List[str]]:
+        """
+        Match plain search text against every searchable profile field.
+
+        Args:
+            profile: Entity profile data
+            search_lower: Lowercase search text
+            search_text: Original search text for highlighting
+            query: Search query parameters
+
+        Returns:
+            Tuple of (matches, score, highlights, matched_fields)
+        """
+        matched_fields = []
+        highlights = {}
+        max_score = 0.0
+
+        for section_id, fields in profile.items():
+            if not isinstance(fields, dict):
+                continue
+
+            for field_id, value in fields.items():
+                # Check if we should search this field
+                if query.fields and field_id not in query.fields:
+                    continue
+
+                # Search in value
+                field_path = f"{section_id}.{field_id}"
+                match_result = self._search_in_value(
+                    value,
+                    search_lower,
+                    search_text,
+                    query.highlight
+                )
+
+                if match_result["matched"]:
+                    matched_fields.append(field_path)
+                    if match_result["highlights"]:
+                        highlights[field_path] = match_result["highlights"]
+                    max_score = max(max_score, match_result["score"])
+
+        return bool(matched_fields), max_score, highlights, matched_fields
+
+    def _search_text_index(
+        self,
+        index: ProjectTextIndex,
+        project_id: str,
+        find_candidates: Callable[[ProjectTextIndex], Optional[Set[int]]],
+        evaluate: Callable[[Dict[str, Any]], Tuple[bool, float, Dict[str, List[str]], List[str]]]
+    ) -> List[SearchResult]:
+        """
+        Search a project through its text index.
+
+        Candidates are looked up in the index and then confirmed against
+        their stored profiles, so no Neo4j access is needed.
+
+        Args:
+            index: Text index of the searched project
+            project_id: Project ID reported in the results
+            find_candidates: Function returning candidate ordinals from the
+                index, or None if every entity is a candidate
+            evaluate: Function returning (matches, score, highlights, fields)
+                for a profile
+
+        Returns:
+            List of SearchResult for the matching entities
+        """
+        with index.lock:
+            documents = index.get_documents(find_candidates(index))
+
+        results = []
+        for entity_id, profile, summary in documents:
+            matches, score, highlights, matched_fields = evaluate(profile)
+            if matches:
+                results.append(SearchResult(
+                    entity_id=entity_id,
+                    project_id=project_id,
+                    entity_type="Person",
+                    score=score,
+                    highlights=highlights,
+                    matched_fields=matched_fields,
+                    entity_data=dict(summary),
+                ))
+
+        return results
+
     async def _fuzzy_search(
         self,
         query: SearchQuery,
@@ -1141,7 +1430,9 @@ class SearchService:
         """
         Rebuild the search index for a project.
 
-        Creates or updates the Neo4j full-text index for the project's entities.
+        Creates or updates the Neo4j full-text index for the project's entities
+        and rebuilds the project's in-memory text index, saving a snapshot of
+        it when a snapshot directory is configured.
 
         Args:
             project_id: Project ID or safe_name
@@ -1157,12 +1448,11 @@ class SearchService:
             return 0
 
         project_safe_name = project.get("safe_name", project_id)
-        entities = self.neo4j.get_all_people(project_safe_name)
+        entities = self._rebuild_text_index(project_safe_name)
 
         indexed_count = 0
         for entity in entities:
-            entity_id = entity.get("id", "")
-            if await self.index_entity(project_id, entity_id, entity):
+            if await self.index_entity(project_id, entity.get("id", ""), entity):
                 indexed_count += 1
 
         # Try to create/update full-text index
@@ -1170,6 +1460,248 @@ class SearchService:
 
         return indexed_count
 
+    def _rebuild_text_index(self, project_safe_name: str) -> List[Dict[str, Any]]:
+        """
+        Rebuild a project's in-memory text index from the database.
+
+        The index is stored with the project's data version and saved as a
+        snapshot when a snapshot directory is configured.
+
+        Args:
+            project_safe_name: Project safe name
+
+        Returns:
+            The project's entities the index was built from
+        """
+        # Read the version first so writes during the build leave the index stale
+        data_version = self._get_data_version(project_safe_name)
+        entities = self.neo4j.get_all_people(project_safe_name)
+
+        text_index = ProjectTextIndex(project_safe_name)
+        text_index.data_version = data_version
+        for entity in entities:
+            text_index.add_document(
+                entity.get("id", ""),
+                entity.get("profile", {}),
+                self._extract_entity_summary(entity)
+            )
+
+        with self._text_index_lock:
+            self._text_indexes[project_safe_name] = text_index
+        self.save_text_index_snapshot(project_safe_name)
+        return entities
+
+    def _get_data_version(self, project_safe_name: str) -> Optional[int]:
+        """Get a project's data version from the handler, or None if unsupported."""
+        get_version = getattr(self.neo4j, "get_data_version", None)
+        if not callable(get_version):
+            return None
+        try:
+            version = get_version(project_safe_name)
+        except Exception as e:
+            logger.warning(f"Failed to read the data version of {project_safe_name}: {e}")
+            return None
+        return version if isinstance(version, int) else None
+
+    def get_text_index(self, project_safe_name: str) -> Optional[ProjectTextIndex]:
+        """
+        Get the in-memory text index of a project.
+
+        Indexes are created by build_search_index or restored from a
+        snapshot the first time a project is searched. Each lookup compares
+        the index with the project's data version, so changes made by other
+        processes are seen: a stale index is rebuilt from the database.
+        When the handler has no data versions, a snapshot whose entity count
+        no longer matches the database is discarded.
+
+        Args:
+            project_safe_name: Project safe name
+
+        Returns:
+            ProjectTextIndex, or None if the project is not indexed
+        """
+        with self._text_index_lock:
+            text_index = self._text_indexes.get(project_safe_name)
+            if text_index is None:
+                text_index = self._load_text_index_snapshot(project_safe_name)
+        if text_index is None:
+            return None
+
+        data_version = self._get_data_version(project_safe_name)
+        if data_version is not None and data_version != text_index.data_version:
+            logger.info(f"Rebuilding stale search index for {project_safe_name}")
+            self._rebuild_text_index(project_safe_name)
+            with self._text_index_lock:
+                text_index = self._text_indexes.get(project_safe_name)
+        return text_index
+
+    def _load_text_index_snapshot(self, project_safe_name: str) -> Optional[ProjectTextIndex]:
+        """
+        Restore a project's text index from its snapshot, once per process.
+
+        Must be called with the text index lock held.
+
+        Args:
+            project_safe_name: Project safe name
+
+        Returns:
+            The restored ProjectTextIndex, or None if there is no usable snapshot
+        """
+        if not self.snapshot_dir or project_safe_name in self._checked_snapshots:
+            return None
+
+        self._checked_snapshots.add(project_safe_name)
+        path = self._snapshot_path(project_safe_name)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            text_index = ProjectTextIndex.load(path)
+            if (text_index.data_version is None
+                    and len(text_index) != self.neo4j.get_people_count(project_safe_name)):
+                logger.info(f"Discarding stale search index snapshot for {project_safe_name}")
+                return None
+        except Exception as e:
+            logger.warning(f"Failed to load search index snapshot {path}: {e}")
+            return None
+
+        self._text_indexes[project_safe_name] = text_index
+        return text_index
+
+    def drop_text_index(self, project_safe_name: str) -> None:
+        """
+        Drop the in-memory text index of a project and its snapshot.
+
+        Args:
+            project_safe_name: Project safe name
+        """
+        with self._text_index_lock:
+            self._text_indexes.pop(project_safe_name, None)
+            if self.snapshot_dir:
+                path = self._snapshot_path(project_safe_name)
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def save_text_index_snapshot(self, project_safe_name: str) -> bool:
+        """
+        Save the text index of a project to the snapshot directory.
+
+        Args:
+            project_safe_name: Project safe name
+
+        Returns:
+            True if a snapshot was written
+        """
+        text_index = self._text_indexes.get(project_safe_name)
+        if text_index is None or not self.snapshot_dir:
+            return False
+
+        try:
+            text_index.save(self._snapshot_path(project_safe_name))
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to save search index snapshot for {project_safe_name}: {e}")
+            return False
+
+    def save_text_index_snapshots(self) -> int:
+        """
+        Save the text indexes of all projects to the snapshot directory.
+
+        Returns:
+            Number of snapshots written
+        """
+        return sum(
+            1 for project_safe_name in list(self._text_indexes)
+            if self.save_text_index_snapshot(project_safe_name)
+        )
+
+    def _snapshot_path(self, project_safe_name: str) -> str:
+        """Get the snapshot file path of a project."""
+        return os.path.join(self.snapshot_dir, f"{project_safe_name}.search_index.json")
+
+    def enable_incremental_indexing(self) -> bool:
+        """
+        Keep the text indexes up to date with entity changes.
+
+        Subscribes to the change events of the Neo4j handler.
+
+        Returns:
+            True if the handler supports change events
+        """
+        add_listener = getattr(self.neo4j, "add_change_listener", None)
+        if not callable(add_listener):
+            return False
+        add_listener(self._handle_entity_change)
+        return True
+
+    def _handle_entity_change(
+        self,
+        event: str,
+        project_safe_name: str,
+        entity_ids: List[str]
+    ) -> None:
+        """
+        Apply an entity change event to the affected text index.
+
+        Created and updated entities are re-read from the database in one
+        batch so the index reflects their stored state.
+
+        Args:
+            event: Change event name
+            project_safe_name: Project of the changed entities
+            entity_ids: IDs of the changed entities
+        """
+        if event == "project_deleted":
+            self.drop_text_index(project_safe_name)
+            return
+
+        with self._text_index_lock:
+            text_index = self._text_indexes.get(project_safe_name)
+        if text_index is None:
+            return
+
+        if event == "people_deleted":
+            for entity_id in entity_ids:
+                text_index.remove_document(entity_id)
+        elif entity_ids:
+            entities = self.neo4j.get_people_batch(project_safe_name, entity_ids)
+            for entity_id in entity_ids:
+                entity = entities.get(entity_id)
+                if entity:
+                    text_index.add_document(
+                        entity_id,
+                        entity.get("profile", {}),
+                        self._extract_entity_summary(entity)
+                    )
+                else:
+                    text_index.remove_document(entity_id)
+
+        self._advance_data_version(text_index, project_safe_name)
+
+    def _advance_data_version(self, text_index: ProjectTextIndex, project_safe_name: str) -> None:
+        """
+        Record that a text index reflects the change just reported.
+
+        The index only moves to the new version when it was at the version
+        right before it; otherwise a change from another process was missed
+        and the version is cleared so the next lookup rebuilds the index.
+
+        Args:
+            text_index: Text index the change was applied to
+            project_safe_name: Project of the change
+        """
+        get_version = getattr(self.neo4j, "get_notified_data_version", None)
+        version = get_version(project_safe_name) if callable(get_version) else None
+        if not isinstance(version, int):
+            version = None
+
+        with text_index.lock:
+            if (version is not None and text_index.data_version is not None
+                    and version == text_index.data_version + 1):
+                text_index.data_version = version
+            else:
+                text_index.data_version = None
+
     async def index_entity(
         self,
         project_id: str,
@@ -1196,18 +1728,7 @@ class SearchService:
 
             # Update the entity with searchable text property
             # This allows full-text index to work on the property
-            cypher = """
-                MATCH (person:Person {id: $entity_id})
-                SET person.search_text = $search_text
-                RETURN person
-            """
-
-            result = self.neo4j.execute_query(
-                cypher,
-                {"entity_id": entity_id, "search_text": search_text}
-            )
-
-            return len(result) > 0
+            return bool(self.neo4j.set_person_search_text(entity_id, search_text))
 
         except Exception:
             return False
@@ -1625,7 +2146,8 @@ _search_service_instance: Optional[SearchService] = None
 
 def get_search_service(
     neo4j_handler=None,
-    config: Optional[Dict[str, Any]] = None
+    config: Optional[Dict[str, Any]] = None,
+    snapshot_dir: Optional[str] = None
 ) -> SearchService:
     """
     Get or create the SearchService singleton instance.
@@ -1633,6 +2155,7 @@ def get_search_service(
     Args:
         neo4j_handler: Neo4j handler (required for first call)
         config: Application config (optional)
+        snapshot_dir: Directory for text index snapshots (optional)
 
     Returns:
         SearchService instance
@@ -1642,7 +2165,7 @@ def get_search_service(
     if _search_service_instance is None:
         if neo4j_handler is None:
             raise ValueError("neo4j_handler required for first initialization")
-        _search_service_instance = SearchService(neo4j_handler, config)
+        _search_service_instance = SearchService(neo4j_handler, config, snapshot_dir)
 
     return _search_service_instance
 
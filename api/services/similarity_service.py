@@ -7,19 +7,39 @@ This module provides entity similarity analysis capabilities including:
 - Common Neighbors Analysis
 - Role Similarity (SimRank-like iterative algorithm)
 
-All computations are done in pure Python for efficiency with medium-sized graphs
-(1000-10000 entities).
+Most computations are done in pure Python for efficiency with medium-sized graphs
+(1000-10000 entities). SimRank uses sparse matrix products and Monte Carlo
+random walks when NumPy and SciPy are installed.
+
+Top-k queries avoid scoring every pair: Jaccard and common neighbor
+candidates come from shared neighbors (or MinHash LSH buckets on large
+graphs) and cosine scores from sparse dot products over the relationship
+vectors.
 """
 
+import heapq
 import logging
 import math
+import random
+import zlib
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, ConfigDict
 
+# NumPy and SciPy are optional but turn SimRank into sparse matrix products
+try:
+    import numpy as np
+    from scipy import sparse
+    SPARSE_AVAILABLE = True
+except ImportError:
+    np = None
+    sparse = None
+    SPARSE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +64,25 @@ DEFAULT_WEIGHTS = {
     SimilarityMethod.SIMRANK: 0.2,
 }
 
+# Largest graph for which SimRank is solved exactly (dense n x n scores)
+SIMRANK_EXACT_LIMIT = 2000
+
+# Random walks per entity for Monte Carlo SimRank on larger graphs
+SIMRANK_WALKS = 200
+
+# Entity pairs compared at once when estimating SimRank for selected pairs
+SIMRANK_PAIR_BLOCK = 1024
+
+# MinHash signature length and LSH banding (64 bands of 2 rows)
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 64
+
+# Smallest entity count for which top-k Jaccard candidates come from LSH
+LSH_MIN_ENTITIES = 1000
+
+# Entities scored at once in sparse top-k cosine products
+COSINE_TOP_K_BLOCK = 256
+
 
 # =============================================================================
 # PYDANTIC MODELS
@@ -119,6 +158,12 @@ class SimilarityConfig(BaseModel):
         lt=1.0,
         description="Decay factor for SimRank (typically 0.8)"
     )
+    simrank_walks: int = Field(
+        default=SIMRANK_WALKS,
+        ge=10,
+        le=10000,
+        description="Random walks per entity when SimRank is estimated on large graphs"
+    )
     # Combined method weights
     weights: Optional[Dict[str, float]] = Field(
         default=None,
@@ -247,6 +292,137 @@ class SimilarityAlgorithms:
 
         return len(common) / max_possible
 
+    @staticmethod
+    def top_k(
+        scored: List[Tuple[str, float]],
+        k: int,
+        min_score: float = 0.0
+    ) -> List[Tuple[str, float]]:
+        """
+        Select the k highest positive scores.
+
+        Args:
+            scored: (entity_id, score) pairs
+            k: Maximum number of pairs to keep
+            min_score: Minimum score to keep
+
+        Returns:
+            Up to k (entity_id, score) pairs by descending score, ties in
+            input order
+        """
+        ranked = [
+            (position, entity_id, score)
+            for position, (entity_id, score) in enumerate(scored)
+            if score > 0 and score >= min_score
+        ]
+        best = heapq.nsmallest(k, ranked, key=lambda item: (-item[2], item[0]))
+        return [(entity_id, score) for _, entity_id, score in best]
+
+
+def _top_k_indices(scores: Any, k: int, min_score: float = 0.0) -> Any:
+    """Indexes of the k highest positive scores in an array, ties by index."""
+    keep = np.flatnonzero((scores > 0) & (scores >= min_score))
+    if len(keep) > k:
+        kth = np.partition(scores[keep], len(keep) - k)[len(keep) - k]
+        keep = keep[scores[keep] >= kth]
+    order = np.lexsort((keep, -scores[keep]))
+    return keep[order[:k]]
+
+
+class MinHashLSH:
+    """
+    MinHash signatures with LSH banding for Jaccard candidate pairs.
+
+    Each set is summarized by the minimum of num_perm universal hashes of
+    its items. Signatures are split into bands; sets that agree on every
+    row of at least one band share a bucket and become candidates. With
+    64 bands of 2 rows, pairs with Jaccard 0.3 are found with probability
+    above 0.99 while dissimilar pairs are rarely compared.
+    """
+
+    _PRIME = (1 << 31) - 1
+
+    def __init__(
+        self,
+        num_perm: int = MINHASH_PERMUTATIONS,
+        bands: int = LSH_BANDS,
+        seed: int = 1
+    ):
+        """
+        Initialize the hash family.
+
+        Args:
+            num_perm: Number of hash functions per signature
+            bands: Number of LSH bands (must divide num_perm)
+            seed: Seed for the hash coefficients
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, self._PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, self._PRIME) for _ in range(num_perm)]
+
+    def signature(self, items: Set[str]) -> Optional[Tuple[int, ...]]:
+        """
+        Compute the MinHash signature of a set.
+
+        Args:
+            items: Set of string items
+
+        Returns:
+            Tuple of num_perm minimum hashes, or None for an empty set
+        """
+        if not items:
+            return None
+
+        prime = self._PRIME
+        hashes = [zlib.crc32(str(item).encode("utf-8")) % prime for item in items]
+
+        if SPARSE_AVAILABLE:
+            h = np.asarray(hashes, dtype=np.int64)
+            a = np.asarray(self._a, dtype=np.int64)[:, None]
+            b = np.asarray(self._b, dtype=np.int64)[:, None]
+            return tuple(((a * h + b) % prime).min(axis=1).tolist())
+
+        return tuple(
+            min((a * h + b) % prime for h in hashes)
+            for a, b in zip(self._a, self._b)
+        )
+
+    def candidate_pairs(self, sets: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+        """
+        Find candidate similar sets through LSH buckets.
+
+        Args:
+            sets: Dict mapping keys to their sets
+
+        Returns:
+            Dict mapping each key to the keys sharing a bucket with it
+        """
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = defaultdict(list)
+        for key, items in sets.items():
+            sig = self.signature(items)
+            if sig is None:
+                continue
+            for band in range(self.bands):
+                start = band * self.rows
+                buckets[(band, sig[start:start + self.rows])].append(key)
+
+        candidates: Dict[str, Set[str]] = defaultdict(set)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for key in members:
+                candidates[key].update(members)
+
+        for key, others in candidates.items():
+            others.discard(key)
+        return candidates
+
 
 class SimRankCalculator:
     """
@@ -255,12 +431,22 @@ class SimRankCalculator:
     SimRank is based on the idea that two entities are similar if
     their neighbors are similar. Uses iterative computation with
     configurable decay factor and iteration count.
+
+    With NumPy and SciPy installed, entities are indexed by integer and
+    graphs of up to exact_limit entities are solved exactly as
+    S = c * W^T S W with the diagonal reset to 1, where W is the sparse
+    in-neighbor matrix with normalized columns. Larger graphs are
+    estimated with coupled reverse random walks (Monte Carlo), which only
+    touch the entities being scored.
     """
 
     def __init__(
         self,
         decay: float = 0.8,
-        iterations: int = 5
+        iterations: int = 5,
+        walks: int = SIMRANK_WALKS,
+        exact_limit: int = SIMRANK_EXACT_LIMIT,
+        seed: int = 42
     ):
         """
         Initialize SimRank calculator.
@@ -268,9 +454,15 @@ class SimRankCalculator:
         Args:
             decay: Decay factor (typically 0.8)
             iterations: Number of iterations for convergence
+            walks: Random walks per entity for Monte Carlo estimates
+            exact_limit: Largest graph solved exactly with matrix products
+            seed: Random seed for Monte Carlo estimates
         """
         self.decay = decay
         self.iterations = iterations
+        self.walks = walks
+        self.exact_limit = exact_limit
+        self.seed = seed
 
     def compute_simrank(
         self,
@@ -291,6 +483,313 @@ class SimRankCalculator:
         if n < 2:
             return {}
 
+        if not SPARSE_AVAILABLE:
+            return self._compute_simrank_python(adjacency, entity_ids)
+
+        sim = self.compute_simrank_matrix(adjacency, entity_ids)
+        return {
+            (a, b): float(sim[i, j])
+            for i, a in enumerate(entity_ids)
+            for j, b in enumerate(entity_ids)
+        }
+
+    def compute_simrank_matrix(
+        self,
+        adjacency: Dict[str, Set[str]],
+        entity_ids: List[str]
+    ) -> Any:
+        """
+        Compute the exact SimRank matrix with sparse matrix products.
+
+        Requires NumPy and SciPy. Memory grows with the square of the
+        number of entities, so callers should stay within exact_limit.
+
+        Args:
+            adjacency: Adjacency dict mapping entity -> set of neighbors
+            entity_ids: List of all entity IDs
+
+        Returns:
+            Dense n x n array indexed like entity_ids
+        """
+        n = len(entity_ids)
+        _, indptr, indices = self._index_in_neighbors(adjacency, entity_ids)
+
+        # W[i, j] = 1 / |In(j)| for every in-neighbor i of j
+        degrees = np.diff(indptr)
+        columns = np.repeat(np.arange(n), degrees)
+        weights = 1.0 / degrees[columns]
+        known = indices >= 0
+        transposed = sparse.csr_matrix(
+            (weights[known], (columns[known], indices[known])),
+            shape=(n, n)
+        )
+
+        sim = np.identity(n)
+        for _ in range(self.iterations):
+            # c * W^T S W, using the symmetry of S for the right product
+            sim = transposed @ sim
+            sim = self.decay * (transposed @ sim.T)
+            np.fill_diagonal(sim, 1.0)
+
+        return sim
+
+    def compute_simrank_for_entity(
+        self,
+        entity_id: str,
+        adjacency: Dict[str, Set[str]],
+        entity_ids: List[str]
+    ) -> Dict[str, float]:
+        """
+        Compute SimRank scores for a single entity against all others.
+
+        Graphs larger than exact_limit use a single-source Monte Carlo
+        estimate, which scales linearly with the number of entities.
+
+        Args:
+            entity_id: Target entity ID
+            adjacency: Adjacency dict mapping entity -> set of neighbors
+            entity_ids: List of all entity IDs
+
+        Returns:
+            Dict mapping other entity IDs to similarity scores
+        """
+        if entity_id not in entity_ids:
+            return {}
+
+        if not SPARSE_AVAILABLE:
+            return self._compute_simrank_for_entity_python(entity_id, adjacency, entity_ids)
+
+        if len(entity_ids) <= self.exact_limit:
+            sim = self.compute_simrank_matrix(adjacency, entity_ids)
+            row = sim[entity_ids.index(entity_id)]
+        else:
+            index, indptr, indices = self._index_in_neighbors(adjacency, entity_ids)
+            positions = self._random_walks(np.arange(len(entity_ids)), indptr, indices)
+            row = self._walk_scores(positions, positions[index[entity_id]][None, :, :])
+
+        return {
+            eid: float(score)
+            for eid, score in zip(entity_ids, row)
+            if eid != entity_id
+        }
+
+    def compute_simrank_pairs(
+        self,
+        adjacency: Dict[str, Set[str]],
+        entity_ids: List[str],
+        pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], float]:
+        """
+        Compute SimRank scores for selected entity pairs.
+
+        Scores are computed over the whole graph. Graphs larger than
+        exact_limit only simulate random walks from the entities in the
+        requested pairs.
+
+        Args:
+            adjacency: Adjacency dict mapping entity -> set of neighbors
+            entity_ids: List of all entity IDs
+            pairs: (entity1, entity2) pairs to score
+
+        Returns:
+            Dict mapping each requested pair to its similarity score
+        """
+        if not SPARSE_AVAILABLE:
+            all_scores = self._compute_simrank_python(adjacency, entity_ids)
+            return {
+                (a, b): 1.0 if a == b else all_scores.get((a, b), 0.0)
+                for a, b in pairs
+            }
+
+        index, indptr, indices = self._index_in_neighbors(adjacency, entity_ids)
+        known = [(a, b) for a, b in pairs if a in index and b in index]
+        scores = {pair: 0.0 for pair in pairs}
+        if not known:
+            return scores
+
+        if len(entity_ids) <= self.exact_limit:
+            sim = self.compute_simrank_matrix(adjacency, entity_ids)
+            for a, b in known:
+                scores[(a, b)] = float(sim[index[a], index[b]])
+            return scores
+
+        # Walk only from the entities appearing in the pairs
+        sources = sorted({index[eid] for pair in known for eid in pair})
+        rows = {source: row for row, source in enumerate(sources)}
+        positions = self._random_walks(np.array(sources, dtype=np.intp), indptr, indices)
+        first = np.array([rows[index[a]] for a, _ in known], dtype=np.intp)
+        second = np.array([rows[index[b]] for _, b in known], dtype=np.intp)
+
+        for start in range(0, len(known), SIMRANK_PAIR_BLOCK):
+            stop = start + SIMRANK_PAIR_BLOCK
+            block = self._walk_scores(positions[first[start:stop]], positions[second[start:stop]])
+            for (a, b), score in zip(known[start:stop], block):
+                scores[(a, b)] = 1.0 if a == b else float(score)
+
+        return scores
+
+    def compute_simrank_top_k(
+        self,
+        adjacency: Dict[str, Set[str]],
+        entity_ids: List[str],
+        targets: List[str],
+        top_k: int,
+        min_score: float = 0.0
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        Find the most similar targets for each target entity.
+
+        Scores are computed over the whole graph. Graphs larger than
+        exact_limit simulate walks from the targets only, and each target
+        is only scored against targets whose walks meet one of its walks,
+        since all other scores are 0.
+
+        Args:
+            adjacency: Adjacency dict mapping entity -> set of neighbors
+            entity_ids: List of all entity IDs
+            targets: Entities to rank, and to rank against
+            top_k: Maximum number of similar entities per target
+            min_score: Minimum score to keep
+
+        Returns:
+            Dict mapping each target to (entity_id, score) pairs by
+            descending score
+        """
+        if not SPARSE_AVAILABLE:
+            all_scores = self._compute_simrank_python(adjacency, entity_ids)
+            return {
+                a: SimilarityAlgorithms.top_k(
+                    [(b, all_scores.get((a, b), 0.0)) for b in targets if b != a],
+                    top_k, min_score
+                )
+                for a in targets
+            }
+
+        index, indptr, indices = self._index_in_neighbors(adjacency, entity_ids)
+        targets = [eid for eid in targets if eid in index]
+        rows = np.array([index[eid] for eid in targets], dtype=np.intp)
+        result: Dict[str, List[Tuple[str, float]]] = {}
+
+        if len(entity_ids) <= self.exact_limit:
+            sim = self.compute_simrank_matrix(adjacency, entity_ids)[np.ix_(rows, rows)]
+            np.fill_diagonal(sim, 0.0)
+            for row, eid in enumerate(targets):
+                best = _top_k_indices(sim[row], top_k, min_score)
+                result[eid] = [(targets[j], float(sim[row, j])) for j in best]
+            return result
+
+        # Key every walk position by (walk, step, entity) to find meetings
+        positions = self._random_walks(rows, indptr, indices)
+        m, walks, steps = positions.shape
+        slots = np.arange(walks * steps, dtype=np.int64).reshape(walks, steps)
+        keys = np.where(positions >= 0, slots * len(entity_ids) + positions, -1).reshape(m, -1)
+        flat = keys.ravel()
+        order = np.argsort(flat, kind="stable")
+        sorted_keys = flat[order]
+        owners = order // keys.shape[1]
+
+        for row, eid in enumerate(targets):
+            own = keys[row][keys[row] >= 0]
+            starts = np.searchsorted(sorted_keys, own, side="left")
+            stops = np.searchsorted(sorted_keys, own, side="right")
+            spans = [owners[a:b] for a, b in zip(starts, stops) if b - a > 1]
+            if not spans:
+                result[eid] = []
+                continue
+            candidates = np.unique(np.concatenate(spans))
+            candidates = candidates[candidates != row]
+            scores = self._walk_scores(positions[candidates], positions[row][None, :, :])
+            best = _top_k_indices(scores, top_k, min_score)
+            result[eid] = [(targets[candidates[j]], float(scores[j])) for j in best]
+
+        return result
+
+    def _index_in_neighbors(
+        self,
+        adjacency: Dict[str, Set[str]],
+        entity_ids: List[str]
+    ) -> Tuple[Dict[str, int], Any, Any]:
+        """
+        Index entities by integer and build compressed in-neighbor lists.
+
+        In-neighbors outside entity_ids are kept as -1: they count towards
+        the in-degree but are similar to nothing, like in the pure Python
+        computation where their similarities are never initialized.
+
+        Returns:
+            Tuple of (entity index, indptr, indices) where the in-neighbors
+            of entity j are indices[indptr[j]:indptr[j + 1]]
+        """
+        index = {eid: i for i, eid in enumerate(entity_ids)}
+        in_neighbors: List[List[int]] = [[] for _ in entity_ids]
+        for entity, neighbors in adjacency.items():
+            source = index.get(entity, -1)
+            for neighbor in neighbors:
+                target = index.get(neighbor)
+                if target is not None:
+                    in_neighbors[target].append(source)
+
+        indptr = np.zeros(len(entity_ids) + 1, dtype=np.intp)
+        indptr[1:] = np.cumsum([len(sources) for sources in in_neighbors])
+        indices = np.fromiter(
+            (source for sources in in_neighbors for source in sources),
+            dtype=np.intp,
+            count=int(indptr[-1])
+        )
+        return index, indptr, indices
+
+    def _random_walks(self, sources: Any, indptr: Any, indices: Any) -> Any:
+        """
+        Simulate reverse random walks along in-neighbor edges.
+
+        Every source gets `walks` independent walks of `iterations` steps.
+        A walk reaching an entity without in-neighbors stops, marked -1.
+
+        Returns:
+            Array of shape (sources, walks, iterations) with walk positions
+        """
+        rng = np.random.default_rng(self.seed)
+        current = np.repeat(np.asarray(sources, dtype=np.intp)[:, None], self.walks, axis=1)
+        positions = np.empty(current.shape + (self.iterations,), dtype=np.intp)
+
+        for step in range(self.iterations):
+            alive = current >= 0
+            starts = indptr[np.where(alive, current, 0)]
+            degrees = np.where(alive, indptr[np.where(alive, current, 0) + 1] - starts, 0)
+            moving = degrees > 0
+            offsets = (rng.random(current.shape) * degrees).astype(np.intp)
+            current = np.where(moving, indices[np.where(moving, starts + offsets, 0)], -1)
+            positions[:, :, step] = current
+
+        return positions
+
+    def _walk_scores(self, first: Any, second: Any) -> Any:
+        """
+        Estimate SimRank from the first meeting step of paired walks.
+
+        The score is the mean of decay^t over walks, where t is the first
+        step at which both walks stand on the same entity, and 0 for walks
+        that never meet within `iterations` steps.
+
+        Args:
+            first: Walk positions of shape (pairs or 1, walks, iterations)
+            second: Walk positions broadcastable against first
+
+        Returns:
+            Array of scores, one per pair
+        """
+        meets = (first == second) & (first >= 0)
+        met = meets.any(axis=2)
+        first_meeting = meets.argmax(axis=2) + 1
+        decayed = np.where(met, self.decay ** first_meeting, 0.0)
+        return decayed.mean(axis=1)
+
+    def _compute_simrank_python(
+        self,
+        adjacency: Dict[str, Set[str]],
+        entity_ids: List[str]
+    ) -> Dict[Tuple[str, str], float]:
+        """Compute all-pairs SimRank with dictionaries, without NumPy or SciPy."""
         # Build reverse adjacency (who points to me)
         in_neighbors: Dict[str, Set[str]] = defaultdict(set)
         for entity, neighbors in adjacency.items():
@@ -343,28 +842,13 @@ class SimRankCalculator:
 
         return current_sim
 
-    def compute_simrank_for_entity(
+    def _compute_simrank_for_entity_python(
         self,
         entity_id: str,
         adjacency: Dict[str, Set[str]],
         entity_ids: List[str]
     ) -> Dict[str, float]:
-        """
-        Compute SimRank scores for a single entity against all others.
-
-        More efficient when only one entity's similarities are needed.
-
-        Args:
-            entity_id: Target entity ID
-            adjacency: Adjacency dict mapping entity -> set of neighbors
-            entity_ids: List of all entity IDs
-
-        Returns:
-            Dict mapping other entity IDs to similarity scores
-        """
-        if entity_id not in entity_ids:
-            return {}
-
+        """Compute single-entity SimRank with dictionaries, without NumPy or SciPy."""
         # Build reverse adjacency
         in_neighbors: Dict[str, Set[str]] = defaultdict(set)
         for entity, neighbors in adjacency.items():
@@ -527,8 +1011,17 @@ class RelationshipVectorEncoder:
         Returns:
             Dict mapping entity ID to its vector
         """
+        # Group edges by endpoint once instead of scanning them per entity
+        edges_by_entity: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for edge in edges:
+            source = edge.get("source")
+            target = edge.get("target")
+            edges_by_entity[source].append(edge)
+            if target != source:
+                edges_by_entity[target].append(edge)
+
         return {
-            eid: self.encode_entity(eid, edges)
+            eid: self.encode_entity(eid, edges_by_entity.get(eid, []))
             for eid in entity_ids
         }
 
@@ -572,6 +1065,13 @@ class SimilarityService:
         if not self.neo4j_handler:
             return [], [], {}
 
+        # Prefer the handler's cached graph snapshot over querying every time
+        get_graph_snapshot = getattr(self.neo4j_handler, "get_graph_snapshot", None)
+        if callable(get_graph_snapshot):
+            snapshot = await run_in_threadpool(get_graph_snapshot, project_safe_name)
+            adjacency: Dict[str, Set[str]] = defaultdict(set, snapshot.adjacency(bidirectional=True))
+            return list(snapshot.entity_ids), snapshot.edge_dicts(), adjacency
+
         async with self.neo4j_handler.session() as session:
             # Get all entities
             entities_result = await session.run("""
@@ -586,7 +1086,7 @@ class SimilarityService:
 
             # Get all relationships from profiles
             edges = []
-            adjacency: Dict[str, Set[str]] = defaultdict(set)
+            adjacency = defaultdict(set)
 
             # Fetch profile data to extract relationships
             profiles_result = await session.run("""
@@ -805,6 +1305,171 @@ class SimilarityService:
             }
         )
 
+    def _shared_neighbor_candidates(
+        self,
+        entity_id: str,
+        adjacency: Dict[str, Set[str]]
+    ) -> Set[str]:
+        """
+        Get the entities sharing at least one neighbor with an entity.
+
+        Jaccard and common neighbor scores are 0 for every other entity.
+
+        Args:
+            entity_id: Entity ID
+            adjacency: Adjacency dict
+
+        Returns:
+            Set of entity IDs two hops away
+        """
+        candidates: Set[str] = set()
+        for neighbor in adjacency.get(entity_id, ()):
+            candidates.update(adjacency.get(neighbor, ()))
+        candidates.discard(entity_id)
+        return candidates
+
+    def _top_k_cosine(
+        self,
+        sources: List[str],
+        candidates: List[str],
+        vectors: Dict[str, Dict[str, float]],
+        top_k: int,
+        min_score: float = 0.0
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        Rank candidates by cosine similarity to each source entity.
+
+        Vectors are normalized once and scored with sparse dot products,
+        so candidates sharing no dimension with a source are never visited.
+
+        Args:
+            sources: Entities to rank candidates for
+            candidates: Entities to rank (a source never ranks itself)
+            vectors: Pre-computed relationship vectors
+            top_k: Maximum number of candidates per source
+            min_score: Minimum score to keep
+
+        Returns:
+            Dict mapping each source to (entity_id, score) pairs by
+            descending score, ties in candidate order
+        """
+        position = {eid: i for i, eid in enumerate(candidates)}
+
+        def normalized(eid: str) -> Dict[str, float]:
+            vector = vectors.get(eid) or {}
+            norm = math.sqrt(sum(v * v for v in vector.values()))
+            return {dim: v / norm for dim, v in vector.items()} if norm else {}
+
+        if not SPARSE_AVAILABLE:
+            postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+            for i, eid in enumerate(candidates):
+                for dim, value in normalized(eid).items():
+                    postings[dim].append((i, value))
+
+            result = {}
+            for source in sources:
+                scores: Dict[int, float] = defaultdict(float)
+                for dim, value in normalized(source).items():
+                    for i, other in postings.get(dim, ()):
+                        scores[i] += value * other
+                scores.pop(position.get(source), None)
+                best = heapq.nsmallest(top_k, (
+                    (-score, i) for i, score in scores.items()
+                    if score > 0 and score >= min_score
+                ))
+                result[source] = [(candidates[i], -score) for score, i in best]
+            return result
+
+        dims: Dict[str, int] = {}
+
+        def build(ids: List[str], grow: bool) -> Any:
+            rows, cols, values = [], [], []
+            for row, eid in enumerate(ids):
+                for dim, value in normalized(eid).items():
+                    col = dims.get(dim)
+                    if col is None:
+                        if not grow:
+                            continue
+                        col = dims[dim] = len(dims)
+                    rows.append(row)
+                    cols.append(col)
+                    values.append(value)
+            return rows, cols, values
+
+        candidate_data = build(candidates, grow=True)
+        if not dims:
+            return {source: [] for source in sources}
+        source_data = build(sources, grow=False)
+
+        shape = len(dims)
+        matrix = sparse.csr_matrix(
+            (candidate_data[2], (candidate_data[0], candidate_data[1])),
+            shape=(len(candidates), shape)
+        )
+        queries = sparse.csr_matrix(
+            (source_data[2], (source_data[0], source_data[1])),
+            shape=(len(sources), shape)
+        )
+        transposed = matrix.T.tocsr()
+
+        result = {}
+        for start in range(0, len(sources), COSINE_TOP_K_BLOCK):
+            block = (queries[start:start + COSINE_TOP_K_BLOCK] @ transposed).tocsr()
+            block.sort_indices()
+            for offset in range(block.shape[0]):
+                source = sources[start + offset]
+                lo, hi = block.indptr[offset], block.indptr[offset + 1]
+                columns = block.indices[lo:hi]
+                scores = block.data[lo:hi]
+                own = position.get(source)
+                if own is not None:
+                    keep = columns != own
+                    columns, scores = columns[keep], scores[keep]
+                best = _top_k_indices(scores, top_k, min_score)
+                result[source] = [(candidates[columns[j]], float(scores[j])) for j in best]
+
+        return result
+
+    def _top_n_results(
+        self,
+        entity_id: str,
+        entity_ids: List[str],
+        ranked_ids: List[str],
+        make_result: Any,
+        config: SimilarityConfig
+    ) -> List[SimilarityResult]:
+        """
+        Build results for ranked entities, padded with zero-score entities.
+
+        When the threshold admits zero scores, entities left out of the
+        ranking are appended in entity order, as an exhaustive stable sort
+        would return them.
+
+        Args:
+            entity_id: Target entity ID
+            entity_ids: All entity IDs
+            ranked_ids: Entities with positive scores, best first
+            make_result: Callable building the SimilarityResult of an entity
+            config: Similarity configuration
+
+        Returns:
+            Up to top_n SimilarityResult objects
+        """
+        results = [make_result(other_id) for other_id in ranked_ids[:config.top_n]]
+
+        if len(results) < config.top_n and config.threshold <= 0:
+            ranked = set(ranked_ids)
+            for other_id in entity_ids:
+                if len(results) >= config.top_n:
+                    break
+                if other_id != entity_id and other_id not in ranked:
+                    results.append(make_result(other_id))
+
+        if not config.include_common_neighbors:
+            for result in results:
+                result.common_neighbors = []
+        return results
+
     async def find_similar_entities(
         self,
         project_safe_name: str,
@@ -814,6 +1479,11 @@ class SimilarityService:
         """
         Find entities most similar to a given entity.
 
+        Jaccard and common neighbor scores are only computed for entities
+        sharing a neighbor with the target, and cosine scores with sparse
+        dot products, so no method except SimRank and COMBINED scores every
+        entity.
+
         Args:
             project_safe_name: Project identifier
             entity_id: Target entity ID
@@ -840,48 +1510,54 @@ class SimilarityService:
         # Compute similarities based on method
         results: List[SimilarityResult] = []
 
-        if config.method == SimilarityMethod.JACCARD:
-            for other_id in entity_ids:
-                if other_id == entity_id:
-                    continue
-                result = self.compute_jaccard_similarity(
-                    entity_id, other_id, adjacency
-                )
-                if result.score >= config.threshold:
-                    if not config.include_common_neighbors:
-                        result.common_neighbors = []
-                    results.append(result)
+        if config.method in (SimilarityMethod.JACCARD, SimilarityMethod.COMMON_NEIGHBORS):
+            if config.method == SimilarityMethod.JACCARD:
+                def score_entity(other_id: str) -> SimilarityResult:
+                    return self.compute_jaccard_similarity(entity_id, other_id, adjacency)
+            else:
+                total_nodes = len(entity_ids)
+
+                def score_entity(other_id: str) -> SimilarityResult:
+                    return self.compute_common_neighbors_score(
+                        entity_id, other_id, adjacency, total_nodes
+                    )
+
+            # Only entities sharing a neighbor can score above 0
+            shared = self._shared_neighbor_candidates(entity_id, adjacency)
+            scored = {
+                other_id: score_entity(other_id)
+                for other_id in entity_ids
+                if other_id in shared
+            }
+            ranked = self.algorithms.top_k(
+                [(other_id, result.score) for other_id, result in scored.items()],
+                config.top_n,
+                config.threshold
+            )
+            results = self._top_n_results(
+                entity_id, entity_ids, [other_id for other_id, _ in ranked],
+                lambda other_id: scored.get(other_id) or score_entity(other_id),
+                config
+            )
 
         elif config.method == SimilarityMethod.COSINE:
             vectors = self.encoder.encode_all_entities(entity_ids, edges)
-            for other_id in entity_ids:
-                if other_id == entity_id:
-                    continue
-                result = self.compute_cosine_similarity(
+            ranked = self._top_k_cosine(
+                [entity_id], entity_ids, vectors, config.top_n, config.threshold
+            )[entity_id]
+            results = self._top_n_results(
+                entity_id, entity_ids, [other_id for other_id, _ in ranked],
+                lambda other_id: self.compute_cosine_similarity(
                     entity_id, other_id, vectors, adjacency
-                )
-                if result.score >= config.threshold:
-                    if not config.include_common_neighbors:
-                        result.common_neighbors = []
-                    results.append(result)
-
-        elif config.method == SimilarityMethod.COMMON_NEIGHBORS:
-            total_nodes = len(entity_ids)
-            for other_id in entity_ids:
-                if other_id == entity_id:
-                    continue
-                result = self.compute_common_neighbors_score(
-                    entity_id, other_id, adjacency, total_nodes
-                )
-                if result.score >= config.threshold:
-                    if not config.include_common_neighbors:
-                        result.common_neighbors = []
-                    results.append(result)
+                ),
+                config
+            )
 
         elif config.method == SimilarityMethod.SIMRANK:
             calculator = SimRankCalculator(
                 decay=config.simrank_decay,
-                iterations=config.simrank_iterations
+                iterations=config.simrank_iterations,
+                walks=config.simrank_walks
             )
             simrank_scores = calculator.compute_simrank_for_entity(
                 entity_id, adjacency, entity_ids
@@ -956,7 +1632,8 @@ class SimilarityService:
 
         calculator = SimRankCalculator(
             decay=config.simrank_decay,
-            iterations=config.simrank_iterations
+            iterations=config.simrank_iterations,
+            walks=config.simrank_walks
         )
         simrank_scores = calculator.compute_simrank_for_entity(
             entity_id, adjacency, entity_ids
@@ -1059,11 +1736,12 @@ class SimilarityService:
         elif config.method == SimilarityMethod.SIMRANK:
             calculator = SimRankCalculator(
                 decay=config.simrank_decay,
-                iterations=config.simrank_iterations
+                iterations=config.simrank_iterations,
+                walks=config.simrank_walks
             )
-            all_scores = calculator.compute_simrank(adjacency, entity_ids)
-            key = (entity1_id, entity2_id) if entity1_id <= entity2_id else (entity2_id, entity1_id)
-            score = all_scores.get(key, 0.0)
+            score = calculator.compute_simrank_pairs(
+                adjacency, entity_ids, [(entity1_id, entity2_id)]
+            )[(entity1_id, entity2_id)]
 
             neighbors1 = adjacency.get(entity1_id, set()) - {entity2_id}
             neighbors2 = adjacency.get(entity2_id, set()) - {entity1_id}
@@ -1109,7 +1787,8 @@ class SimilarityService:
         Find potential missing links between entities.
 
         Uses common neighbors analysis to suggest entity pairs that
-        might have a relationship but currently don't.
+        might have a relationship but currently don't. Only pairs sharing
+        a neighbor are scored, and only the best max_results are kept.
 
         Args:
             project_safe_name: Project identifier
@@ -1136,58 +1815,72 @@ class SimilarityService:
                 existing_connections.add((source, target))
                 existing_connections.add((target, source))
 
-        # Score potential links (non-connected pairs)
-        potential_links: List[PotentialLink] = []
-
-        for i, entity1 in enumerate(entity_ids):
-            for entity2 in entity_ids[i + 1:]:
-                # Skip if already connected
-                if (entity1, entity2) in existing_connections:
-                    continue
-
-                neighbors1 = adjacency.get(entity1, set())
-                neighbors2 = adjacency.get(entity2, set())
-                common = neighbors1 & neighbors2
-
-                if not common:
-                    continue
+        # Candidate pairs are the pairs of neighbors of some entity
+        position = {eid: i for i, eid in enumerate(entity_ids)}
+        candidate_pairs: Set[Tuple[int, int]] = set()
+        for neighbors in adjacency.values():
+            members = sorted(position[eid] for eid in neighbors if eid in position)
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    candidate_pairs.add((first, second))
+
+        # Score potential links (non-connected pairs), keeping the best ones
+        scored: List[Tuple[float, int, int]] = []
+        for i, j in candidate_pairs:
+            entity1, entity2 = entity_ids[i], entity_ids[j]
+            if (entity1, entity2) in existing_connections:
+                continue
 
-                # Compute score based on common neighbors
-                score = self.algorithms.common_neighbors_score(
-                    neighbors1, neighbors2, len(entity_ids)
-                )
+            score = self.algorithms.common_neighbors_score(
+                adjacency.get(entity1, set()), adjacency.get(entity2, set()), len(entity_ids)
+            )
+            if score > 0 and score >= config.threshold:
+                scored.append((-score, i, j))
 
-                if score >= config.threshold:
-                    potential_links.append(PotentialLink(
-                        entity1_id=entity1,
-                        entity2_id=entity2,
-                        score=score,
-                        common_neighbor_count=len(common),
-                        common_neighbors=list(common) if config.include_common_neighbors else [],
-                        evidence={
-                            "entity1_degree": len(neighbors1),
-                            "entity2_degree": len(neighbors2),
-                            "common_ratio": len(common) / max(min(len(neighbors1), len(neighbors2)), 1)
-                        }
-                    ))
+        potential_links: List[PotentialLink] = []
+        for negated_score, i, j in heapq.nsmallest(max_results, scored):
+            entity1, entity2 = entity_ids[i], entity_ids[j]
+            neighbors1 = adjacency.get(entity1, set())
+            neighbors2 = adjacency.get(entity2, set())
+            common = neighbors1 & neighbors2
+
+            potential_links.append(PotentialLink(
+                entity1_id=entity1,
+                entity2_id=entity2,
+                score=-negated_score,
+                common_neighbor_count=len(common),
+                common_neighbors=list(common) if config.include_common_neighbors else [],
+                evidence={
+                    "entity1_degree": len(neighbors1),
+                    "entity2_degree": len(neighbors2),
+                    "common_ratio": len(common) / max(min(len(neighbors1), len(neighbors2)), 1)
+                }
+            ))
 
-        # Sort by score and limit
-        potential_links.sort(key=lambda x: x.score, reverse=True)
-        return potential_links[:max_results]
+        return potential_links
 
     async def get_similarity_matrix(
         self,
         project_safe_name: str,
         entity_ids: Optional[List[str]] = None,
-        config: Optional[SimilarityConfig] = None
+        config: Optional[SimilarityConfig] = None,
+        top_k: Optional[int] = None,
+        min_score: float = 0.0
     ) -> Dict[str, Dict[str, float]]:
         """
         Compute full similarity matrix for a set of entities.
 
+        With top_k, each row only holds the top_k most similar other
+        entities scoring at least min_score, found without scoring every
+        pair (see _top_k_matrix). Use it for large projects; the full
+        matrix grows with the square of the number of entities.
+
         Args:
             project_safe_name: Project identifier
             entity_ids: Specific entities to include (None = all)
             config: Similarity configuration
+            top_k: Keep only the top_k entries per row (None = full matrix)
+            min_score: Minimum score kept in top-k rows
 
         Returns:
             Nested dict: matrix[entity1][entity2] = similarity score
@@ -1198,13 +1891,19 @@ class SimilarityService:
         all_entity_ids, edges, adjacency = await self._fetch_graph_data(project_safe_name)
 
         if entity_ids:
-            target_ids = [eid for eid in entity_ids if eid in all_entity_ids]
+            known_ids = set(all_entity_ids)
+            target_ids = [eid for eid in entity_ids if eid in known_ids]
         else:
             target_ids = all_entity_ids
 
         if len(target_ids) < 2:
             return {}
 
+        if top_k is not None:
+            return self._top_k_matrix(
+                target_ids, all_entity_ids, edges, adjacency, config, top_k, min_score
+            )
+
         # Initialize matrix
         matrix: Dict[str, Dict[str, float]] = {eid: {} for eid in target_ids}
 
@@ -1244,20 +1943,94 @@ class SimilarityService:
         elif config.method == SimilarityMethod.SIMRANK:
             calculator = SimRankCalculator(
                 decay=config.simrank_decay,
-                iterations=config.simrank_iterations
+                iterations=config.simrank_iterations,
+                walks=config.simrank_walks
             )
-            simrank_matrix = calculator.compute_simrank(adjacency, target_ids)
+            # Scores come from the whole project graph, not just the targets
+            pairs = [
+                (e1, e2)
+                for i, e1 in enumerate(target_ids)
+                for e2 in target_ids[i + 1:]
+            ]
+            simrank_scores = calculator.compute_simrank_pairs(adjacency, all_entity_ids, pairs)
 
             for e1 in target_ids:
-                for e2 in target_ids:
-                    if e1 == e2:
-                        matrix[e1][e2] = 1.0
-                    else:
-                        key = (e1, e2) if e1 <= e2 else (e2, e1)
-                        matrix[e1][e2] = simrank_matrix.get(key, 0.0)
+                matrix[e1][e1] = 1.0
+            for (e1, e2), score in simrank_scores.items():
+                matrix[e1][e2] = score
+                matrix[e2][e1] = score
 
         return matrix
 
+    def _top_k_matrix(
+        self,
+        target_ids: List[str],
+        all_entity_ids: List[str],
+        edges: List[Dict[str, Any]],
+        adjacency: Dict[str, Set[str]],
+        config: SimilarityConfig,
+        top_k: int,
+        min_score: float
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Compute the top-k rows of a similarity matrix.
+
+        Jaccard candidates are entities sharing a neighbor, or entities
+        sharing a MinHash LSH bucket once there are LSH_MIN_ENTITIES
+        targets; candidates are then scored exactly. Common neighbor
+        candidates always share a neighbor, cosine uses sparse dot
+        products and SimRank only compares entities whose walks meet.
+
+        Returns:
+            Nested dict with at most top_k entries per row, best first
+        """
+        ranked: Dict[str, List[Tuple[str, float]]] = {}
+
+        if config.method in (SimilarityMethod.JACCARD, SimilarityMethod.COMMON_NEIGHBORS):
+            position = {eid: i for i, eid in enumerate(target_ids)}
+            if config.method == SimilarityMethod.JACCARD and len(target_ids) >= LSH_MIN_ENTITIES:
+                candidates = MinHashLSH().candidate_pairs(
+                    {eid: adjacency.get(eid, set()) for eid in target_ids}
+                )
+            else:
+                candidates = {
+                    eid: self._shared_neighbor_candidates(eid, adjacency)
+                    for eid in target_ids
+                }
+
+            total = len(all_entity_ids)
+            for e1 in target_ids:
+                scored = []
+                others = sorted(
+                    (eid for eid in candidates.get(e1, ()) if eid in position),
+                    key=position.__getitem__
+                )
+                for e2 in others:
+                    neighbors1 = adjacency.get(e1, set()) - {e2}
+                    neighbors2 = adjacency.get(e2, set()) - {e1}
+                    if config.method == SimilarityMethod.JACCARD:
+                        score = self.algorithms.jaccard_similarity(neighbors1, neighbors2)
+                    else:
+                        score = self.algorithms.common_neighbors_score(neighbors1, neighbors2, total)
+                    scored.append((e2, score))
+                ranked[e1] = self.algorithms.top_k(scored, top_k, min_score)
+
+        elif config.method == SimilarityMethod.COSINE:
+            vectors = self.encoder.encode_all_entities(target_ids, edges)
+            ranked = self._top_k_cosine(target_ids, target_ids, vectors, top_k, min_score)
+
+        elif config.method == SimilarityMethod.SIMRANK:
+            calculator = SimRankCalculator(
+                decay=config.simrank_decay,
+                iterations=config.simrank_iterations,
+                walks=config.simrank_walks
+            )
+            ranked = calculator.compute_simrank_top_k(
+                adjacency, all_entity_ids, target_ids, top_k, min_score
+            )
+
+        return {eid: dict(ranked.get(eid, [])) for eid in target_ids}
+
 
 # =============================================================================
 # SINGLETON MANAGEMENT
@@ -0,0 +1,522 @@
+"""
+In-Memory Text Index for Basset Hound Search.
+
+This module keeps a per-project inverted index over entity profiles so the
+search service can answer substring, phrase, prefix, wildcard and
+field-scoped queries without scanning every profile in Neo4j.
+
+Each field value is split into lowercase word tokens. A token maps to a
+posting list of (document, field, position) entries held in compact
+``array`` columns, and each document keeps its token sequence per field so
+phrases can be checked by position. Lookups are conservative: they return
+every entity that could match a term, and the search service confirms the
+candidates against the stored profiles with its usual matching rules.
+
+The index is updated incrementally as entities change and can be saved to
+and restored from a JSON snapshot.
+"""
+
+import json
+import os
+import re
+import threading
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+# Word characters form tokens; everything else separates them
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# Token id placed between the values of a multi-valued field so phrases
+# never match across two values
+VALUE_SEPARATOR = 0xFFFFFFFF
+
+# Snapshot format version, bumped whenever the layout changes
+SNAPSHOT_VERSION = 1
+
+# Tombstoned documents tolerated before postings are rebuilt
+MIN_COMPACTION_DELETES = 64
+
+
+def iter_field_text(value: Any, path: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (field_path, text) pairs for every leaf value under a path.
+
+    Dicts extend the path with their keys, lists keep the path of their
+    parent, and empty strings are skipped like in the search service.
+
+    Args:
+        value: Profile value to walk
+        path: Dot-separated path of the value
+
+    Yields:
+        Tuples of (field_path, text)
+    """
+    if value is None:
+        return
+
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from iter_field_text(item, f"{path}.{key}")
+    elif isinstance(value, list):
+        for item in value:
+            yield from iter_field_text(item, path)
+    elif isinstance(value, str):
+        if value.strip():
+            yield path, value
+    else:
+        yield path, str(value)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in order of appearance
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class ProjectTextIndex:
+    """
+    Inverted text index over the entities of one project.
+
+    Documents are addressed by ordinal. Removing an entity tombstones its
+    ordinal, and the postings are rebuilt once tombstones make up half of
+    the index, which renumbers the documents. All public methods are
+    thread-safe; hold ``lock`` to keep ordinals stable across several calls.
+
+    Usage:
+        index = ProjectTextIndex("my_project")
+        index.add_document(entity_id, profile, summary)
+        with index.lock:
+            candidates = index.match_term("john doe", field="core")
+            documents = index.get_documents(candidates)
+    """
+
+    def __init__(self, project_safe_name: str):
+        """
+        Initialize an empty index.
+
+        Args:
+            project_safe_name: Safe name of the indexed project
+        """
+        self.project_safe_name = project_safe_name
+        self.built_at = datetime.now().isoformat()
+        # Project data version the index reflects, None if unknown
+        self.data_version: Optional[int] = None
+        self.lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        """Drop all documents and postings."""
+        # Vocabulary
+        self._token_ids: Dict[str, int] = {}
+        self._tokens: List[str] = []
+        self._trigrams: Dict[str, Set[int]] = {}
+
+        # Field paths
+        self._field_ids: Dict[str, int] = {}
+        self._field_paths: List[str] = []
+
+        # Postings per token id: parallel (documents, fields, positions) columns
+        self._postings: List[Tuple[array, array, array]] = []
+
+        # Documents by ordinal, None once removed
+        self._entity_ids: List[Optional[str]] = []
+        self._profiles: List[Optional[Dict[str, Any]]] = []
+        self._summaries: List[Optional[Dict[str, Any]]] = []
+        self._sequences: List[Optional[Dict[int, array]]] = []
+        self._ordinals: Dict[str, int] = {}
+        self._deleted = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed entities."""
+        return len(self._ordinals)
+
+    def __contains__(self, entity_id: str) -> bool:
+        """Return whether an entity is indexed."""
+        return entity_id in self._ordinals
+
+    # ----- Updates -----
+
+    def add_document(
+        self,
+        entity_id: str,
+        profile: Dict[str, Any],
+        summary: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Index an entity, replacing any previous version of it.
+
+        Args:
+            entity_id: Entity ID
+            profile: Entity profile data
+            summary: Entity summary returned with search results
+        """
+        with self.lock:
+            if entity_id in self._ordinals:
+                self._remove(entity_id)
+            self._add(entity_id, profile or {}, summary or {"id": entity_id})
+
+    def remove_document(self, entity_id: str) -> bool:
+        """
+        Remove an entity from the index.
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            True if the entity was indexed
+        """
+        with self.lock:
+            if entity_id not in self._ordinals:
+                return False
+            self._remove(entity_id)
+            if (self._deleted >= MIN_COMPACTION_DELETES
+                    and self._deleted * 2 >= len(self._entity_ids)):
+                self._compact()
+            return True
+
+    def _add(self, entity_id: str, profile: Dict[str, Any], summary: Dict[str, Any]) -> None:
+        """Append a document and its postings."""
+        ordinal = len(self._entity_ids)
+        sequences: Dict[int, array] = {}
+
+        for section_id, fields in profile.items():
+            for path, text in iter_field_text(fields, section_id):
+                field_id = self._field_id(path)
+                sequence = sequences.get(field_id)
+                if sequence is None:
+                    sequence = sequences[field_id] = array("I")
+                elif sequence:
+                    sequence.append(VALUE_SEPARATOR)
+
+                for token in tokenize(text):
+                    token_id = self._token_id(token)
+                    documents, field_ids, positions = self._postings[token_id]
+                    documents.append(ordinal)
+                    field_ids.append(field_id)
+                    positions.append(len(sequence))
+                    sequence.append(token_id)
+
+        self._entity_ids.append(entity_id)
+        self._profiles.append(profile)
+        self._summaries.append(summary)
+        self._sequences.append(sequences)
+        self._ordinals[entity_id] = ordinal
+
+    def _remove(self, entity_id: str) -> None:
+        """Tombstone a document; its postings are skipped until compaction."""
+        ordinal = self._ordinals.pop(entity_id)
+        self._entity_ids[ordinal] = None
+        self._profiles[ordinal] = None
+        self._summaries[ordinal] = None
+        self._sequences[ordinal] = None
+        self._deleted += 1
+
+    def _compact(self) -> None:
+        """Rebuild the postings from the live documents."""
+        live = [
+            (self._entity_ids[ordinal], self._profiles[ordinal], self._summaries[ordinal])
+            for ordinal in self.iter_documents()
+        ]
+        self._reset()
+        for entity_id, profile, summary in live:
+            self._add(entity_id, profile, summary)
+
+    def _token_id(self, token: str) -> int:
+        """Get or assign the id of a token."""
+        token_id = self._token_ids.get(token)
+        if token_id is None:
+            token_id = len(self._tokens)
+            self._token_ids[token] = token_id
+            self._tokens.append(token)
+            self._postings.append((array("I"), array("I"), array("I")))
+            for i in range(len(token) - 2):
+                self._trigrams.setdefault(token[i:i + 3], set()).add(token_id)
+        return token_id
+
+    def _field_id(self, path: str) -> int:
+        """Get or assign the id of a field path."""
+        field_id = self._field_ids.get(path)
+        if field_id is None:
+            field_id = len(self._field_paths)
+            self._field_ids[path] = field_id
+            self._field_paths.append(path)
+        return field_id
+
+    # ----- Lookups -----
+
+    def iter_documents(self) -> Iterator[int]:
+        """Yield the ordinals of all indexed entities."""
+        for ordinal, entity_id in enumerate(self._entity_ids):
+            if entity_id is not None:
+                yield ordinal
+
+    def get_documents(
+        self,
+        ordinals: Optional[Iterable[int]] = None
+    ) -> List[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        """
+        Get stored documents in ordinal order.
+
+        Args:
+            ordinals: Document ordinals to fetch, or None for all entities
+
+        Returns:
+            List of (entity_id, profile, summary) tuples
+        """
+        with self.lock:
+            if ordinals is None:
+                ordinals = self.iter_documents()
+            else:
+                ordinals = sorted(ordinals)
+            return [
+                (self._entity_ids[ordinal], self._profiles[ordinal], self._summaries[ordinal])
+                for ordinal in ordinals
+                if self._entity_ids[ordinal] is not None
+            ]
+
+    def match_term(
+        self,
+        text: str,
+        field: Optional[str] = None,
+        wildcard: bool = False
+    ) -> Optional[Set[int]]:
+        """
+        Find the entities that could contain a search term.
+
+        The result is a superset of the entities whose values contain the
+        term as a substring (or match it as a wildcard pattern). Every word
+        of the term must occur inside a token of the same field; without
+        wildcards, consecutive words must also occupy consecutive positions.
+
+        Args:
+            text: Search term, optionally with * and ? wildcards
+            field: Dot-separated field path restricting the search, or None
+            wildcard: Whether the term is a wildcard pattern
+
+        Returns:
+            Set of document ordinals, or None if the term has no words and
+            cannot narrow the search
+        """
+        runs = tokenize(text)
+        if not runs:
+            return None
+
+        with self.lock:
+            field_ids = self._scoped_field_ids(field)
+            if field_ids is not None and not field_ids:
+                return set()
+
+            if wildcard or len(runs) == 1:
+                matches: Optional[Set[int]] = None
+                for run in runs:
+                    documents = self._documents_for_tokens(self._tokens_containing(run), field_ids)
+                    matches = documents if matches is None else matches & documents
+                    if not matches:
+                        break
+                return matches
+
+            return self._match_sequence(runs, field_ids)
+
+    def _scoped_field_ids(self, field: Optional[str]) -> Optional[Set[int]]:
+        """Get the ids of the field paths at or below a path, or None for all."""
+        if not field:
+            return None
+        prefix = field + "."
+        return {
+            field_id for field_id, path in enumerate(self._field_paths)
+            if path == field or path.startswith(prefix)
+        }
+
+    def _tokens_containing(self, run: str) -> List[int]:
+        """Get the ids of all tokens containing a substring."""
+        if len(run) < 3:
+            return [token_id for token_id, token in enumerate(self._tokens) if run in token]
+
+        candidates = None
+        for i in range(len(run) - 2):
+            token_ids = self._trigrams.get(run[i:i + 3])
+            if not token_ids:
+                return []
+            candidates = token_ids if candidates is None or len(token_ids) < len(candidates) else candidates
+
+        return [token_id for token_id in candidates if run in self._tokens[token_id]]
+
+    def _documents_for_tokens(
+        self,
+        token_ids: Iterable[int],
+        field_ids: Optional[Set[int]]
+    ) -> Set[int]:
+        """Collect the live documents holding any of the tokens in scope."""
+        entity_ids = self._entity_ids
+        documents = set()
+        for token_id in token_ids:
+            posted_documents, posted_fields, _ = self._postings[token_id]
+            if field_ids is None:
+                documents.update(posted_documents)
+            else:
+                documents.update(
+                    document for document, field_id in zip(posted_documents, posted_fields)
+                    if field_id in field_ids
+                )
+        return {document for document in documents if entity_ids[document] is not None}
+
+    def _match_sequence(self, runs: List[str], field_ids: Optional[Set[int]]) -> Set[int]:
+        """
+        Find documents where the runs of a multi-word term appear in order.
+
+        The first token must end with the first run, the last token must
+        start with the last run and the tokens in between must equal their
+        runs exactly.
+        """
+        first_tokens = [
+            token_id for token_id in self._tokens_containing(runs[0])
+            if self._tokens[token_id].endswith(runs[0])
+        ]
+        last_tokens = {
+            token_id for token_id in self._tokens_containing(runs[-1])
+            if self._tokens[token_id].startswith(runs[-1])
+        }
+        middle_tokens = [self._token_ids.get(run) for run in runs[1:-1]]
+        if not first_tokens or not last_tokens or None in middle_tokens:
+            return set()
+
+        span = len(runs) - 1
+        documents = set()
+        for token_id in first_tokens:
+            posted_documents, posted_fields, posted_positions = self._postings[token_id]
+            for document, field_id, position in zip(posted_documents, posted_fields, posted_positions):
+                if document in documents or (field_ids is not None and field_id not in field_ids):
+                    continue
+                sequences = self._sequences[document]
+                if sequences is None:
+                    continue
+                sequence = sequences[field_id]
+                if position + span >= len(sequence):
+                    continue
+                if sequence[position + span] not in last_tokens:
+                    continue
+                if all(sequence[position + 1 + i] == middle for i, middle in enumerate(middle_tokens)):
+                    documents.add(document)
+
+        return documents
+
+    # ----- Snapshots -----
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the index to a JSON-compatible dictionary.
+
+        Returns:
+            Snapshot dictionary
+        """
+        with self.lock:
+            if self._deleted:
+                self._compact()
+            return {
+                "version": SNAPSHOT_VERSION,
+                "project_safe_name": self.project_safe_name,
+                "built_at": self.built_at,
+                "data_version": self.data_version,
+                "tokens": self._tokens,
+                "field_paths": self._field_paths,
+                "postings": [
+                    [documents.tolist(), field_ids.tolist(), positions.tolist()]
+                    for documents, field_ids, positions in self._postings
+                ],
+                "documents": [
+                    {
+                        "id": self._entity_ids[ordinal],
+                        "profile": self._profiles[ordinal],
+                        "summary": self._summaries[ordinal],
+                        "sequences": {
+                            str(field_id): sequence.tolist()
+                            for field_id, sequence in self._sequences[ordinal].items()
+                        },
+                    }
+                    for ordinal in range(len(self._entity_ids))
+                ],
+            }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProjectTextIndex":
+        """
+        Restore an index from a snapshot dictionary.
+
+        Args:
+            data: Dictionary produced by to_dict
+
+        Returns:
+            Restored ProjectTextIndex
+
+        Raises:
+            ValueError: If the snapshot version is not supported
+        """
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported text index snapshot version: {data.get('version')}")
+
+        index = cls(data["project_safe_name"])
+        index.built_at = data.get("built_at", index.built_at)
+        index.data_version = data.get("data_version")
+
+        for token in data["tokens"]:
+            index._token_id(token)
+        for path in data["field_paths"]:
+            index._field_id(path)
+        index._postings = [
+            (array("I", documents), array("I", field_ids), array("I", positions))
+            for documents, field_ids, positions in data["postings"]
+        ]
+
+        for ordinal, document in enumerate(data["documents"]):
+            index._entity_ids.append(document["id"])
+            index._profiles.append(document["profile"])
+            index._summaries.append(document["summary"])
+            index._sequences.append({
+                int(field_id): array("I", sequence)
+                for field_id, sequence in document["sequences"].items()
+            })
+            index._ordinals[document["id"]] = ordinal
+
+        return index
+
+    def save(self, path: str) -> None:
+        """
+        Write a snapshot of the index to disk.
+
+        The snapshot is written to a temporary file first so a crash never
+        leaves a truncated snapshot behind.
+
+        Args:
+            path: Snapshot file path
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.to_dict(), f, default=str)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ProjectTextIndex":
+        """
+        Read an index snapshot from disk.
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            Restored ProjectTextIndex
+        """
+        with open(path, "r") as f:
+            return cls.from_dict(json.load(f))
@@ -177,12 +177,7 @@ def register_analysis_tools(mcp):
         if not safe_name:
             return {"error": f"Project not found: {project_id}"}
 
-        result = handler.find_clusters(safe_name)
-
-        if not include_isolated:
-            # Filter out isolated entities
-            result["clusters"] = [c for c in result["clusters"] if not c["is_isolated"]]
-            result["cluster_count"] = len(result["clusters"])
+        result = handler.find_clusters(safe_name, include_isolated=include_isolated)
 
         return result
 
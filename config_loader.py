@@ -66,6 +66,104 @@ def get_all_field_paths(config):
     
     return paths
 
+def get_identifier_paths(config):
+    """Get all fields and components flagged as identifiers in the configuration"""
+    identifier_paths = []
+    for section in config.get('sections', []):
+        section_id = section.get('id')
+        for field in section.get('fields', []):
+            field_id = field.get('id')
+            field_type = field.get('type')
+
+            # Check if field itself is an identifier
+            if field.get('identifier', False):
+                identifier_paths.append({
+                    'path': get_field_path(section_id, field_id),
+                    'section_id': section_id,
+                    'field_id': field_id,
+                    'component_id': None,
+                    'field_type': field_type,
+                    'multiple': field.get('multiple', False)
+                })
+
+            # Check components for identifiers
+            if field_type == 'component' and 'components' in field:
+                for component in field.get('components', []):
+                    if component.get('identifier', False):
+                        component_id = component.get('id')
+                        identifier_paths.append({
+                            'path': get_component_path(section_id, field_id, component_id),
+                            'section_id': section_id,
+                            'field_id': field_id,
+                            'component_id': component_id,
+                            'field_type': component.get('type'),
+                            'multiple': field.get('multiple', False)
+                        })
+
+    return identifier_paths
+
+def normalize_identifier_value(value, field_type='string'):
+    """Normalize an identifier value for comparison, or return None if not comparable"""
+    if value is None:
+        return None
+
+    if isinstance(value, (dict, list)):
+        return None  # Complex values not directly comparable
+
+    value_str = str(value).strip().lower()
+
+    if not value_str:
+        return None
+
+    # Type-specific normalization
+    if field_type == 'email':
+        # Normalize email: lowercase
+        return value_str
+
+    if field_type in ('phone', 'string') and 'phone' in field_type.lower():
+        # Normalize phone: remove all non-digits except leading +
+        if value_str.startswith('+'):
+            return '+' + re.sub(r'[^\d]', '', value_str[1:])
+        return re.sub(r'[^\d]', '', value_str)
+
+    return value_str
+
+def extract_identifier_values(field_data, component_id=None, field_type='string'):
+    """Extract normalized identifier values from a stored field value"""
+    values = []
+
+    if isinstance(field_data, list):
+        # Multiple values
+        for item in field_data:
+            if component_id and isinstance(item, dict):
+                # Extract component value
+                comp_value = item.get(component_id)
+                if comp_value:
+                    normalized = normalize_identifier_value(comp_value, field_type)
+                    if normalized:
+                        values.append(normalized)
+            elif not component_id:
+                normalized = normalize_identifier_value(item, field_type)
+                if normalized:
+                    values.append(normalized)
+
+    elif isinstance(field_data, dict):
+        if component_id:
+            # Single component value
+            comp_value = field_data.get(component_id)
+            if comp_value:
+                normalized = normalize_identifier_value(comp_value, field_type)
+                if normalized:
+                    values.append(normalized)
+
+    elif field_data is not None:
+        # Simple value
+        normalized = normalize_identifier_value(field_data, field_type)
+        if normalized:
+            values.append(normalized)
+
+    return values
+
 def get_field_input_type(field):
     """Get the HTML input type for a field based on its type"""
     field_type = field.get('type', 'string')
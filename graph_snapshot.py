@@ -0,0 +1,364 @@
+"""
+Compact in-memory snapshots of project relationship graphs.
+
+Relationships are stored on each person as "Tagged People" field values,
+so every analytics path used to query and JSON-decode them to rebuild its
+own adjacency. A GraphSnapshot holds the tag graph of one project once, in
+compressed sparse row (CSR) form: entities are numbered in query order,
+the outgoing edges of entity i are targets[offsets[i]:offsets[i + 1]], and
+each edge carries a relationship type code and its properties.
+
+GraphSnapshotCache keeps one snapshot per project and rebuilds it lazily
+after the project is invalidated. Every invalidation bumps the project
+version, so a snapshot that was being built while the graph changed is
+returned to its caller but never cached. Values derived from a snapshot
+can be cached on it with derive and share its lifetime.
+
+Invalidation only reaches the process that made the write, so cached
+snapshots also expire after a maximum age and, when the cache is given a
+version loader, are rebuilt as soon as the project's stored data version
+moves past the one they were built from.
+"""
+
+import threading
+import time
+from array import array
+
+
+DEFAULT_RELATIONSHIP_TYPE = "RELATED_TO"
+
+# Maximum age of a cached snapshot, bounding staleness from writes the
+# cache was never told about
+DEFAULT_MAX_AGE_SECONDS = 300
+
+
+class GraphSnapshot:
+    """
+    Immutable CSR view of a project's tag graph.
+
+    Only edges between entities of the project are kept; tags pointing at
+    unknown entities are dropped, and self-tags are kept as stored.
+
+    Usage:
+        snapshot = GraphSnapshot.build("my_project", handler.get_tagged_edges("my_project"))
+        for target in snapshot.neighbors("entity-1"):
+            ...
+    """
+
+    def __init__(self, project_safe_name, version, entity_ids, offsets, targets,
+                 type_codes, type_names, edge_properties):
+        """
+        Initialize a snapshot from prebuilt arrays (see build).
+
+        Args:
+            project_safe_name: Safe name of the project
+            version: Cache version the snapshot was built for
+            entity_ids: Entity IDs by index
+            offsets: array of len(entity_ids) + 1 edge offsets
+            targets: array of target indexes, grouped by source
+            type_codes: array of relationship type codes per edge
+            type_names: Relationship type names by code
+            edge_properties: Relationship properties per edge (None if empty)
+        """
+        self.project_safe_name = project_safe_name
+        self.version = version
+        self.entity_ids = entity_ids
+        self.index = {entity_id: i for i, entity_id in enumerate(entity_ids)}
+        self.offsets = offsets
+        self.targets = targets
+        self.type_codes = type_codes
+        self.type_names = type_names
+        self.edge_properties = edge_properties
+        self._derived = {}
+
+    @classmethod
+    def build(cls, project_safe_name, rows, version=0):
+        """
+        Build a snapshot from per-person tag rows.
+
+        Args:
+            project_safe_name: Safe name of the project
+            rows: Iterable of (person_id, tagged_ids) tuples, optionally
+                followed by relationship_types and relationship_properties
+                dicts keyed by target ID
+            version: Cache version the snapshot is built for
+
+        Returns:
+            GraphSnapshot
+        """
+        entity_ids = []
+        index = {}
+        tags = []
+        for row in rows:
+            person_id, tagged_ids = row[0], row[1]
+            if person_id in index:
+                continue
+            index[person_id] = len(entity_ids)
+            entity_ids.append(person_id)
+            relationship_types = row[2] if len(row) > 2 and isinstance(row[2], dict) else {}
+            relationship_properties = row[3] if len(row) > 3 and isinstance(row[3], dict) else {}
+            tags.append((tagged_ids or [], relationship_types, relationship_properties))
+
+        offsets = array("I", [0])
+        targets = array("I")
+        type_codes = array("H")
+        type_names = []
+        type_index = {}
+        edge_properties = []
+
+        for tagged_ids, relationship_types, relationship_properties in tags:
+            for tagged_id in tagged_ids:
+                target = index.get(tagged_id)
+                if target is None:
+                    continue
+
+                type_name = relationship_types.get(tagged_id) or DEFAULT_RELATIONSHIP_TYPE
+                code = type_index.get(type_name)
+                if code is None:
+                    code = type_index[type_name] = len(type_names)
+                    type_names.append(type_name)
+
+                targets.append(target)
+                type_codes.append(code)
+                edge_properties.append(relationship_properties.get(tagged_id) or None)
+            offsets.append(len(targets))
+
+        return cls(project_safe_name, version, entity_ids, offsets, targets,
+                   type_codes, type_names, edge_properties)
+
+    def derive(self, key, compute):
+        """
+        Get a value computed from this snapshot, computing it on first use.
+
+        Derived values (community partitions, for example) live as long as
+        the snapshot, so they are dropped together with it when the
+        project graph changes. Concurrent first calls may compute twice.
+
+        Args:
+            key: Hashable key of the derived value
+            compute: Callable returning the value
+
+        Returns:
+            The cached or newly computed value
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            return self._derived.setdefault(key, compute())
+
+    def __len__(self):
+        """Return the number of entities."""
+        return len(self.entity_ids)
+
+    def __contains__(self, entity_id):
+        """Return whether an entity is part of the snapshot."""
+        return entity_id in self.index
+
+    @property
+    def edge_count(self):
+        """Number of directed edges."""
+        return len(self.targets)
+
+    def neighbors(self, entity_id):
+        """
+        Get the entities an entity has tagged.
+
+        Args:
+            entity_id: Source entity ID
+
+        Returns:
+            List of target entity IDs (empty for unknown entities)
+        """
+        i = self.index.get(entity_id)
+        if i is None:
+            return []
+        return [self.entity_ids[t] for t in self.targets[self.offsets[i]:self.offsets[i + 1]]]
+
+    def iter_edges(self):
+        """
+        Iterate over all directed edges.
+
+        Yields:
+            Tuples of (source_index, target_index, relationship_type, properties)
+        """
+        offsets = self.offsets
+        for source in range(len(self.entity_ids)):
+            for e in range(offsets[source], offsets[source + 1]):
+                yield (
+                    source,
+                    self.targets[e],
+                    self.type_names[self.type_codes[e]],
+                    self.edge_properties[e],
+                )
+
+    def edge_dicts(self, entity_ids=None):
+        """
+        Get edges as dicts in the format used by the graph services.
+
+        Args:
+            entity_ids: Optional set of entity IDs; only edges with both
+                endpoints in the set are returned
+
+        Returns:
+            List of {"source", "target", "type", "properties"} dicts
+        """
+        ids = self.entity_ids
+        edges = []
+        for source, target, rel_type, properties in self.iter_edges():
+            if entity_ids is not None and (ids[source] not in entity_ids or ids[target] not in entity_ids):
+                continue
+            edges.append({
+                "source": ids[source],
+                "target": ids[target],
+                "type": rel_type,
+                "properties": dict(properties) if properties else {},
+            })
+        return edges
+
+    def undirected_pairs(self):
+        """
+        Get the unique undirected edges between distinct entities.
+
+        Returns:
+            Set of (a, b) index tuples with a < b
+        """
+        pairs = set()
+        offsets = self.offsets
+        for source in range(len(self.entity_ids)):
+            for target in self.targets[offsets[source]:offsets[source + 1]]:
+                if target != source:
+                    pairs.add((source, target) if source < target else (target, source))
+        return pairs
+
+    def adjacency(self, bidirectional=True):
+        """
+        Build a dict-of-sets adjacency keyed by entity ID.
+
+        Args:
+            bidirectional: Whether to add the reverse of every edge
+
+        Returns:
+            Dict mapping entity ID to the set of neighbor IDs
+        """
+        ids = self.entity_ids
+        adjacency = {}
+        offsets = self.offsets
+        for source in range(len(ids)):
+            for target in self.targets[offsets[source]:offsets[source + 1]]:
+                adjacency.setdefault(ids[source], set()).add(ids[target])
+                if bidirectional:
+                    adjacency.setdefault(ids[target], set()).add(ids[source])
+        return adjacency
+
+    def connected_ids(self):
+        """
+        Get the entities that have at least one edge.
+
+        Returns:
+            Set of entity IDs
+        """
+        ids = self.entity_ids
+        connected = set()
+        offsets = self.offsets
+        for source in range(len(ids)):
+            if offsets[source + 1] > offsets[source]:
+                connected.add(ids[source])
+        connected.update(ids[target] for target in self.targets)
+        return connected
+
+
+class GraphSnapshotCache:
+    """
+    Per-project cache of GraphSnapshot objects.
+
+    Snapshots are built on first use with the loader and dropped by
+    invalidate, after max_age_seconds, or when version_loader reports a
+    data version other than the one they were built from. The cache is
+    thread-safe; concurrent misses may build the same snapshot twice, but
+    a stale one is never stored.
+    """
+
+    def __init__(self, loader, version_loader=None, max_age_seconds=DEFAULT_MAX_AGE_SECONDS):
+        """
+        Initialize the cache.
+
+        Args:
+            loader: Callable returning the tag rows of a project (see
+                GraphSnapshot.build)
+            version_loader: Optional callable returning the stored data
+                version of a project, or None when it is unknown
+            max_age_seconds: Seconds a snapshot is reused, or None to keep
+                it until invalidated
+        """
+        self._loader = loader
+        self._version_loader = version_loader
+        self._max_age_seconds = max_age_seconds
+        self._snapshots = {}
+        self._versions = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, project_safe_name):
+        """
+        Get the snapshot of a project, building it if needed.
+
+        Args:
+            project_safe_name: Safe name of the project
+
+        Returns:
+            GraphSnapshot
+        """
+        data_version = self._load_data_version(project_safe_name)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._snapshots.get(project_safe_name)
+            if entry is not None:
+                snapshot, built_version, built_at = entry
+                if self._is_current(built_version, built_at, data_version, now):
+                    return snapshot
+                del self._snapshots[project_safe_name]
+            version = self._versions.get(project_safe_name, 0)
+            generation = self._generation
+
+        snapshot = GraphSnapshot.build(project_safe_name, self._loader(project_safe_name), version)
+
+        with self._lock:
+            if (self._versions.get(project_safe_name, 0) == version
+                    and self._generation == generation):
+                self._snapshots[project_safe_name] = (snapshot, data_version, now)
+        return snapshot
+
+    def _load_data_version(self, project_safe_name):
+        """Get the stored data version of a project, or None without a version loader."""
+        if self._version_loader is None:
+            return None
+        return self._version_loader(project_safe_name)
+
+    def _is_current(self, built_version, built_at, data_version, now):
+        """Return whether a cached snapshot may still be served."""
+        if self._max_age_seconds is not None and now - built_at >= self._max_age_seconds:
+            return False
+        return data_version is None or built_version == data_version
+
+    def version(self, project_safe_name):
+        """Return the current version of a project's graph."""
+        with self._lock:
+            return self._versions.get(project_safe_name, 0)
+
+    def invalidate(self, project_safe_name=None):
+        """
+        Drop the snapshot of a project, or of every project.
+
+        Args:
+            project_safe_name: Safe name of the project, or None for all
+        """
+        with self._lock:
+            if project_safe_name is None:
+                self._generation += 1
+                names = set(self._snapshots) | set(self._versions)
+            else:
+                names = {project_safe_name}
+            for name in names:
+                self._snapshots.pop(name, None)
+                self._versions[name] = self._versions.get(name, 0) + 1
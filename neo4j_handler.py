@@ -1,28 +1,69 @@
 from neo4j import GraphDatabase
+from neo4j.exceptions import ClientError
 import os
 from datetime import datetime
 from dotenv import load_dotenv
+import base64
 import json
 from uuid import uuid4
+import logging
 import re
 import time
 
+from config_loader import load_config, get_identifier_paths, extract_identifier_values
+from graph_snapshot import GraphSnapshotCache
+
 # Load environment variables from .env
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Seconds a project's data version read from the database is trusted before
+# get_data_version reads it again
+DATA_VERSION_CHECK_INTERVAL = 0.25
+
 class Neo4jHandler:
-    def __init__(self):
-        """Initialize Neo4j connection using environment variables."""
+    def __init__(self, max_connection_pool_size=None, connection_acquisition_timeout=None,
+                 connection_timeout=None, fetch_size=None):
+        """
+        Initialize Neo4j connection using environment variables.
+
+        The handler is synchronous and thread-safe: the driver keeps a
+        connection pool shared by every thread, so async callers run it in
+        a worker thread pool sized at or below max_connection_pool_size.
+
+        Args:
+            max_connection_pool_size: Maximum number of pooled connections
+            connection_acquisition_timeout: Seconds to wait for a pooled connection
+            connection_timeout: Seconds to wait when opening a connection
+            fetch_size: Number of records fetched per batch from results
+
+        Options left as None use the driver defaults.
+        """
         self.uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
         self.user = os.getenv("NEO4J_USER", "neo4j")
         self.password = os.getenv("NEO4J_PASSWORD", "neo4jbasset")
+        self.driver_config = {
+            key: value for key, value in (
+                ("max_connection_pool_size", max_connection_pool_size),
+                ("connection_acquisition_timeout", connection_acquisition_timeout),
+                ("connection_timeout", connection_timeout),
+                ("fetch_size", fetch_size),
+            ) if value is not None
+        }
         self.driver = None
+        self._identifier_paths = None
+        self._change_listeners = []
+        self._data_versions = {}
+        self._graph_snapshots = self._new_graph_snapshot_cache()
 
         # Wait for Neo4j to be available
         wait_start = time.time()
         while True:
             try:
-                self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
+                self.driver = GraphDatabase.driver(
+                    self.uri, auth=(self.user, self.password), **self.driver_config
+                )
                 # Try a simple query to test connection
                 with self.driver.session() as session:
                     session.run("RETURN 1")
@@ -39,7 +80,205 @@ class Neo4jHandler:
         """Close the Neo4j driver."""
         if self.driver:
             self.driver.close()
+
+    def add_change_listener(self, listener):
+        """
+        Register a callback for entity changes.
+
+        The listener is called as listener(event, project_safe_name, entity_ids)
+        after people are created, updated or deleted through this handler, with
+        event one of "people_created", "people_updated", "people_deleted" or
+        "project_deleted". Writes through set_person_field and
+        set_person_fields_batch are reported as "people_updated".
+
+        Listeners only see writes made through this handler instance or
+        reported to it with report_change. Every
+        write also bumps the project's data version in the database (see
+        get_data_version), so caches can detect writes from other processes.
+
+        Args:
+            listener: Callable taking (event, project_safe_name, entity_ids)
+        """
+        if not hasattr(self, "_change_listeners"):
+            self._change_listeners = []
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener):
+        """Unregister a callback added with add_change_listener."""
+        listeners = getattr(self, "_change_listeners", [])
+        if listener in listeners:
+            listeners.remove(listener)
+
+    def _notify_change(self, event, project_safe_name, entity_ids=(), data_version=None):
+        """Report a change whose write bumped the project's data version to data_version."""
+        self.report_change(event, project_safe_name, entity_ids, data_version)
+
+    def report_change(self, event, project_safe_name, entity_ids=(), data_version=None):
+        """
+        Report a change made outside this handler to its caches and listeners.
+
+        Writers that bypass the handler (the async service, for example)
+        call this after bumping the project's data version themselves. The
+        graph snapshot is dropped and the change listeners are called as
+        for writes made through the handler; a failing listener never
+        fails the write.
+
+        Args:
+            event: One of the events passed to change listeners
+            project_safe_name: The project's safe name
+            entity_ids: IDs of the people changed
+            data_version: Data version produced by the write, if known
+        """
+        versions = self._notified_data_versions()
+        checked_versions = self._checked_data_versions()
+        if event == "project_deleted":
+            versions.pop(project_safe_name, None)
+            checked_versions.pop(project_safe_name, None)
+        else:
+            versions[project_safe_name] = data_version
+            if data_version is None:
+                checked_versions.pop(project_safe_name, None)
+            else:
+                checked_versions[project_safe_name] = (data_version, time.monotonic())
+
+        self.invalidate_graph_snapshot(project_safe_name)
+        for listener in list(getattr(self, "_change_listeners", [])):
+            try:
+                listener(event, project_safe_name, list(entity_ids))
+            except Exception:
+                logger.exception(f"Change listener failed for {event} in {project_safe_name}")
+
+    def _notified_data_versions(self):
+        """Get the data versions of the latest reported changes, creating them on first use."""
+        if getattr(self, "_data_versions", None) is None:
+            self._data_versions = {}
+        return self._data_versions
+
+    def _checked_data_versions(self):
+        """Get the data versions last read or written per project, creating them on first use."""
+        if getattr(self, "_data_version_checks", None) is None:
+            self._data_version_checks = {}
+        return self._data_version_checks
+
+    @staticmethod
+    def _bump_data_version(session, project_safe_name):
+        """
+        Increment a project's data version as part of a write.
+
+        Args:
+            session: Open Neo4j session or transaction of the write
+            project_safe_name: The project's safe name
+
+        Returns:
+            The new data version, or None if the project does not exist
+        """
+        record = session.run("""
+            MATCH (project:Project {safe_name: $project_safe_name})
+            SET project.data_version = coalesce(project.data_version, 0) + 1
+            RETURN project.data_version AS version
+        """, project_safe_name=project_safe_name).single()
+        return record.get("version") if record else None
+
+    def get_data_version(self, project_safe_name):
+        """
+        Get a project's data version.
+
+        The version is a counter stored on the Project node and incremented
+        by every change reported through any handler, in any process. A
+        cache that records the version it was built from is stale once the
+        version moves on without its listener seeing the change.
+
+        The database is read at most once every DATA_VERSION_CHECK_INTERVAL
+        seconds per project; changes reported to this handler update the
+        version at once.
+
+        Args:
+            project_safe_name: The project's safe name
+
+        Returns:
+            The data version, or None if the project does not exist
+        """
+        checked_versions = self._checked_data_versions()
+        checked = checked_versions.get(project_safe_name)
+        now = time.monotonic()
+        if checked is not None and now - checked[1] < DATA_VERSION_CHECK_INTERVAL:
+            return checked[0]
+
+        with self.driver.session() as session:
+            record = session.run("""
+                MATCH (project:Project {safe_name: $project_safe_name})
+                RETURN coalesce(project.data_version, 0) AS version
+            """, project_safe_name=project_safe_name).single()
+        version = record["version"] if record else None
+        if version is None:
+            checked_versions.pop(project_safe_name, None)
+        else:
+            checked_versions[project_safe_name] = (version, now)
+        return version
+
+    def get_notified_data_version(self, project_safe_name):
+        """
+        Get the data version produced by the latest change reported here.
+
+        Change listeners use it to advance the version their cache reflects
+        without another database round trip.
+
+        Args:
+            project_safe_name: The project's safe name
+
+        Returns:
+            The data version, or None if unknown
+        """
+        return self._notified_data_versions().get(project_safe_name)
     
+    def _graph_snapshot_cache(self):
+        """Get the graph snapshot cache, creating it on first use."""
+        if getattr(self, "_graph_snapshots", None) is None:
+            self._graph_snapshots = self._new_graph_snapshot_cache()
+        return self._graph_snapshots
+
+    def _new_graph_snapshot_cache(self):
+        """Create a graph snapshot cache checked against the stored data version."""
+        return GraphSnapshotCache(self._load_graph_snapshot_rows, self._load_snapshot_data_version)
+
+    def _load_snapshot_data_version(self, project_safe_name):
+        """Get a project's data version for the snapshot cache (None on failure)."""
+        try:
+            return self.get_data_version(project_safe_name)
+        except Exception:
+            logger.exception(f"Failed to read the data version of {project_safe_name}")
+            return None
+
+    def _load_graph_snapshot_rows(self, project_safe_name):
+        """Load the tag rows a GraphSnapshot is built from."""
+        return self.get_tagged_edges(project_safe_name, include_types=True)
+
+    def get_graph_snapshot(self, project_safe_name):
+        """
+        Get the cached CSR snapshot of a project's relationship graph.
+
+        The snapshot is built from get_tagged_edges on first use and reused
+        by the analytics paths until a change is reported to this handler,
+        the project's data version moves on, or it reaches its maximum age.
+
+        Args:
+            project_safe_name: The project's safe name
+
+        Returns:
+            GraphSnapshot
+        """
+        return self._graph_snapshot_cache().get(project_safe_name)
+
+    def invalidate_graph_snapshot(self, project_safe_name=None):
+        """
+        Drop the cached graph snapshot of a project, or of every project.
+
+        Args:
+            project_safe_name: The project's safe name, or None for all
+        """
+        self._graph_snapshot_cache().invalidate(project_safe_name)
+
     def ensure_constraints(self):
         """Set up constraints to ensure uniqueness and indexing."""
         with self.driver.session() as session:
@@ -53,6 +292,8 @@ class Neo4jHandler:
                 # Basic single-property indexes
                 "CREATE INDEX IF NOT EXISTS FOR (p:Project) ON (p.name)",
                 "CREATE INDEX IF NOT EXISTS FOR (p:Person) ON (p.created_at)",
+                # Seek index for keyset pagination in (created_at, id) order
+                "CREATE INDEX IF NOT EXISTS FOR (p:Person) ON (p.created_at, p.id)",
                 "CREATE INDEX IF NOT EXISTS FOR (s:Section) ON (s.id)",
                 "CREATE INDEX IF NOT EXISTS FOR (f:Field) ON (f.id)",
 
@@ -75,6 +316,14 @@ class Neo4jHandler:
                 # Relationship property indexes
                 "CREATE INDEX IF NOT EXISTS FOR ()-[r:HAS_FILE]-() ON (r.section_id, r.field_id)",
                 "CREATE INDEX IF NOT EXISTS FOR ()-[r:TAGGED]-() ON (r.relationship_type)",
+
+                # Identifier key layer for indexed link suggestions
+                "CREATE CONSTRAINT IF NOT EXISTS FOR (k:IdentifierKey) REQUIRE (k.path, k.value) IS UNIQUE",
+                "CREATE INDEX IF NOT EXISTS FOR (k:IdentifierKey) ON (k.value)",
+
+                # Full-text index over the denormalized search text of each person
+                "CREATE FULLTEXT INDEX entity_fulltext_index IF NOT EXISTS "
+                "FOR (p:Person) ON EACH [p.search_text]",
             ]
 
             for constraint in constraints:
@@ -181,7 +430,8 @@ class Neo4jHandler:
                     name: $name,
                     safe_name: $safe_name,
                     start_date: datetime(),
-                    created_at: datetime()
+                    created_at: datetime(),
+                    identifier_keys_ready: true
                 })
                 RETURN p
             """, id=project_id, name=project_name, safe_name=safe_name)
@@ -256,6 +506,16 @@ class Neo4jHandler:
     def delete_project(self, safe_name):
         """Delete a project and all its associated data."""
         with self.driver.session() as session:
+            # Release the project's identifier keys and drop those left orphaned
+            session.run("""
+                MATCH (project:Project {safe_name: $safe_name})
+                      -[:HAS_PERSON]->(:Person)-[r:HAS_IDENTIFIER_KEY]->(key:IdentifierKey)
+                DELETE r
+                WITH DISTINCT key
+                WHERE NOT (key)<-[:HAS_IDENTIFIER_KEY]-()
+                DELETE key
+            """, safe_name=safe_name)
+
             # Delete all related data first
             session.run("""
                 MATCH (project:Project {safe_name: $safe_name})-[:HAS_PERSON]->(person:Person)
@@ -271,7 +531,11 @@ class Neo4jHandler:
             """, safe_name=safe_name)
             
             record = result.single()
-            return record and record["deleted_count"] > 0
+
+        deleted = record and record["deleted_count"] > 0
+        if deleted:
+            self._notify_change("project_deleted", safe_name)
+        return deleted
     
     def create_person(self, project_safe_name, person_data=None):
         """Create a new person in a project."""
@@ -324,16 +588,21 @@ class Neo4jHandler:
                         if isinstance(value, (dict, list)):
                             # Convert complex objects to JSON strings
                             value = json.dumps(value)
-                        self.set_person_field(person_id, section_id, field_id, value)
-            
-            return self.get_person(project_safe_name, person_id)
+                        self._write_person_field(person_id, section_id, field_id, value, session)
+
+            data_version = self._bump_data_version(session, project_safe_name)
+
+        self._notify_change("people_created", project_safe_name, [person_id], data_version)
+        return self.get_person(project_safe_name, person_id)
 
     def create_people_batch(self, project_safe_name, people_data):
         """
         Create multiple people in a batch operation.
 
         This method uses UNWIND to create multiple person nodes in a single query,
-        then processes their profile data in batches.
+        then writes all their profile data with a fixed number of queries. The
+        whole batch runs in one write transaction, so it is created completely
+        or not at all.
 
         Args:
             project_safe_name: The project's safe name.
@@ -359,37 +628,173 @@ class Neo4jHandler:
                 "created_at": created_at
             })
 
+        profiles = {
+            person_ids[i]: person_data["profile"]
+            for i, person_data in enumerate(people_data)
+            if person_data.get("profile")
+        }
+
         with self.driver.session() as session:
-            # Verify project exists
-            project = session.run("""
-                MATCH (p:Project {safe_name: $project_safe_name})
-                RETURN p
-            """, project_safe_name=project_safe_name)
+            written = session.execute_write(
+                self._create_people_batch_tx, project_safe_name, prepared_people, profiles
+            )
 
-            if not project.single():
-                return []
+        if written is None:
+            return []
 
-            # Batch create all person nodes and link to project
-            session.run("""
+        file_uploads, data_version = written
+        for person_id, uploads in file_uploads.items():
+            self.handle_file_uploads_batch(person_id, uploads)
+
+        self._notify_change("people_created", project_safe_name, person_ids, data_version)
+        return person_ids
+
+    def _create_people_batch_tx(self, tx, project_safe_name, people, profiles):
+        """
+        Create people and write their profiles inside one transaction.
+
+        Args:
+            tx: Open Neo4j write transaction
+            project_safe_name: The project's safe name
+            people: List of {"id", "created_at"} dicts for the new nodes
+            profiles: Dict mapping person ID to profile data
+
+        Returns:
+            Tuple of (dict mapping person ID to file uploads, the project's
+            new data version), or None if the project does not exist
+        """
+        # Verify project exists
+        project = tx.run("""
+            MATCH (p:Project {safe_name: $project_safe_name})
+            RETURN p
+        """, project_safe_name=project_safe_name)
+
+        if not project.single():
+            return None
+
+        # Batch create all person nodes and link to project
+        tx.run("""
+            MATCH (project:Project {safe_name: $project_safe_name})
+            UNWIND $people AS p
+            CREATE (person:Person {
+                id: p.id,
+                created_at: p.created_at
+            })
+            CREATE (project)-[:HAS_PERSON]->(person)
+        """, project_safe_name=project_safe_name, people=people)
+
+        # Write every profile with a fixed number of queries
+        file_uploads = self._write_profiles_batch(tx, profiles)
+        return file_uploads, self._bump_data_version(tx, project_safe_name)
+
+    def get_person_projects(self, person_ids):
+        """
+        Look up which project each of the given people belongs to.
+
+        Args:
+            person_ids: List of person IDs
+
+        Returns:
+            Dict mapping each existing person ID to its project's safe name
+        """
+        if not person_ids:
+            return {}
+
+        with self.driver.session() as session:
+            result = session.run("""
+                UNWIND $person_ids AS pid
+                MATCH (project:Project)-[:HAS_PERSON]->(person:Person {id: pid})
+                RETURN person.id AS id, project.safe_name AS project_safe_name
+            """, person_ids=list(person_ids))
+
+            return {record["id"]: record["project_safe_name"] for record in result}
+
+    def upsert_people_batch(self, project_safe_name, people_data):
+        """
+        Create or update multiple people with a fixed number of queries.
+
+        People are MERGEd on their ID. New people get their created_at, and
+        existing people of this project get their other top-level properties
+        updated. Every field in a person's profile replaces that field's
+        stored value, as in update_person. People whose ID belongs to
+        another project are left untouched and not returned.
+
+        Args:
+            project_safe_name: The project's safe name.
+            people_data: List of person data dictionaries, each with an "id".
+
+        Returns:
+            Dict with "created" and "updated" lists of person IDs.
+        """
+        outcome = {"created": [], "updated": []}
+        if not people_data:
+            return outcome
+
+        now = datetime.now().isoformat()
+        rows = []
+        for person_data in people_data:
+            properties = {
+                key: value for key, value in person_data.items()
+                if key not in ("id", "profile", "created_at")
+            }
+            rows.append({
+                "id": person_data["id"],
+                "created_at": person_data.get("created_at") or now,
+                "properties": self.clean_data(properties),
+            })
+
+        with self.driver.session() as session:
+            result = session.run("""
                 MATCH (project:Project {safe_name: $project_safe_name})
                 UNWIND $people AS p
-                CREATE (person:Person {
-                    id: p.id,
-                    created_at: p.created_at
-                })
-                CREATE (project)-[:HAS_PERSON]->(person)
-            """, project_safe_name=project_safe_name, people=prepared_people)
+                OPTIONAL MATCH (existing:Person {id: p.id})
+                WITH project, p, existing
+                WHERE existing IS NULL OR (project)-[:HAS_PERSON]->(existing)
+                MERGE (person:Person {id: p.id})
+                ON CREATE SET person.created_at = p.created_at
+                MERGE (project)-[:HAS_PERSON]->(person)
+                SET person += p.properties
+                RETURN p.id AS id, existing IS NULL AS created
+            """, project_safe_name=project_safe_name, people=rows)
 
-        # Process profile data for each person using batch operations
-        for i, person_data in enumerate(people_data):
-            person_id = person_ids[i]
-            if "profile" in person_data and person_data["profile"]:
-                self.set_person_fields_batch(person_id, person_data["profile"])
+            for record in result:
+                outcome["created" if record["created"] else "updated"].append(record["id"])
 
-        return person_ids
+            applied = set(outcome["created"]) | set(outcome["updated"])
+            profiles = {
+                person_data["id"]: person_data["profile"]
+                for person_data in people_data
+                if person_data["id"] in applied and person_data.get("profile")
+            }
+            # New people have no stored values to replace
+            file_uploads = self._write_profiles_batch(session, profiles, replace_ids=outcome["updated"])
+
+            # One version per reported event, so listeners see consecutive versions
+            changes = [
+                (event, person_ids, self._bump_data_version(session, project_safe_name))
+                for event, person_ids in (("people_created", outcome["created"]),
+                                          ("people_updated", outcome["updated"]))
+                if person_ids
+            ]
+
+        for person_id, uploads in file_uploads.items():
+            self.handle_file_uploads_batch(person_id, uploads)
 
-    def get_person(self, project_safe_name, person_id):
-        """Retrieve a person by ID within a project."""
+        for event, person_ids, data_version in changes:
+            self._notify_change(event, project_safe_name, person_ids, data_version)
+        return outcome
+
+    def get_person(self, project_safe_name, person_id, fields=None, sections=None):
+        """
+        Retrieve a person by ID within a project.
+
+        Args:
+            project_safe_name: The project's safe name
+            person_id: The person's ID
+            fields: Optional section-qualified field IDs ("core.name") to load
+            sections: Optional section IDs ("core") to load in full
+        """
+        field_filter = self._field_filter_params(fields, sections)
         with self.driver.session() as session:
             # Get basic person info
             result = session.run("""
@@ -407,8 +812,10 @@ class Neo4jHandler:
             # Get all profile data
             profile_result = session.run("""
                 MATCH (person:Person {id: $person_id})-[:HAS_FIELD_VALUE]->(fv:FieldValue)
+                WHERE $all_fields OR fv.section_id IN $sections
+                      OR fv.section_id + '.' + fv.field_id IN $field_keys
                 RETURN fv.section_id as section_id, fv.field_id as field_id, fv.value as value
-            """, person_id=person_id)
+            """, person_id=person_id, **field_filter)
             
             for field_record in profile_result:
                 section_id = field_record["section_id"]
@@ -430,8 +837,10 @@ class Neo4jHandler:
             # Get all file references with relationship properties
             files_result = session.run("""
                 MATCH (person:Person {id: $person_id})-[r:HAS_FILE]->(file:File)
+                WHERE $all_fields OR r.section_id IN $sections
+                      OR r.section_id + '.' + r.field_id IN $field_keys
                 RETURN file, r.section_id as section_id, r.field_id as field_id
-            """, person_id=person_id)
+            """, person_id=person_id, **field_filter)
             
             for file_record in files_result:
                 file_data = dict(file_record["file"])
@@ -451,187 +860,224 @@ class Neo4jHandler:
             
             return person_data
 
-    def get_all_people(self, project_safe_name):
+    @staticmethod
+    def _field_filter_params(fields=None, sections=None):
         """
-        Retrieve all people in a project with all their data in a single query.
+        Build Cypher parameters restricting which field values are loaded.
 
-        This method uses COLLECT to aggregate all related data (field values and files)
-        in a single query, avoiding N+1 query patterns.
-        """
-        with self.driver.session() as session:
-            # Single optimized query that fetches all people with their field values and files
-            result = session.run("""
-                MATCH (project:Project {safe_name: $project_safe_name})
-                      -[:HAS_PERSON]->(person:Person)
-                OPTIONAL MATCH (person)-[:HAS_FIELD_VALUE]->(fv:FieldValue)
-                OPTIONAL MATCH (person)-[file_rel:HAS_FILE]->(file:File)
-                WITH person,
-                     COLLECT(DISTINCT {
-                         section_id: fv.section_id,
-                         field_id: fv.field_id,
-                         value: fv.value
-                     }) AS field_values,
-                     COLLECT(DISTINCT {
-                         file: file,
-                         section_id: file_rel.section_id,
-                         field_id: file_rel.field_id
-                     }) AS files
-                RETURN person, field_values, files
-                ORDER BY person.created_at DESC
-            """, project_safe_name=project_safe_name)
+        Args:
+            fields: Iterable of section-qualified field IDs ("core.name");
+                bare section IDs are treated as whole sections
+            sections: Iterable of section IDs ("core") to load in full
 
-            people = []
-            for record in result:
-                person_data = dict(record["person"])
-                person_data["profile"] = {}
+        Returns:
+            dict with all_fields, sections and field_keys query parameters.
+            When both fields and sections are None every field is loaded.
+        """
+        if fields is None and sections is None:
+            return {"all_fields": True, "sections": [], "field_keys": []}
 
-                # Process field values
-                for fv in record["field_values"]:
-                    # Skip empty field values (from OPTIONAL MATCH with no results)
-                    if fv["section_id"] is None:
-                        continue
+        section_ids = list(sections or [])
+        field_keys = []
+        for field in fields or []:
+            if "." in field:
+                field_keys.append(field)
+            else:
+                section_ids.append(field)
+        return {"all_fields": False, "sections": section_ids, "field_keys": field_keys}
 
-                    section_id = fv["section_id"]
-                    field_id = fv["field_id"]
-                    value = fv["value"]
+    @staticmethod
+    def _person_from_record(record):
+        """Hydrate a person dict from a (person, field_values, files) record."""
+        person_data = dict(record["person"])
+        person_data["profile"] = {}
+
+        # Process field values
+        for fv in record["field_values"]:
+            # Skip empty field values (from OPTIONAL MATCH with no results)
+            if fv["section_id"] is None:
+                continue
 
-                    if section_id not in person_data["profile"]:
-                        person_data["profile"][section_id] = {}
+            section_id = fv["section_id"]
+            field_id = fv["field_id"]
+            value = fv["value"]
 
-                    # Try to parse JSON strings
-                    if isinstance(value, str):
-                        try:
-                            value = json.loads(value)
-                        except json.JSONDecodeError:
-                            pass
+            if section_id not in person_data["profile"]:
+                person_data["profile"][section_id] = {}
 
-                    person_data["profile"][section_id][field_id] = value
+            # Try to parse JSON strings
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError:
+                    pass
 
-                # Process files
-                for file_data in record["files"]:
-                    # Skip empty file entries (from OPTIONAL MATCH with no results)
-                    if file_data["file"] is None:
-                        continue
+            person_data["profile"][section_id][field_id] = value
 
-                    file_info = dict(file_data["file"])
-                    section_id = file_data["section_id"]
-                    field_id = file_data["field_id"]
+        # Process files
+        for file_data in record["files"]:
+            # Skip empty file entries (from OPTIONAL MATCH with no results)
+            if file_data["file"] is None:
+                continue
 
-                    if section_id not in person_data["profile"]:
-                        person_data["profile"][section_id] = {}
+            file_info = dict(file_data["file"])
+            section_id = file_data["section_id"]
+            field_id = file_data["field_id"]
 
-                    if field_id not in person_data["profile"][section_id]:
-                        person_data["profile"][section_id][field_id] = []
+            if section_id not in person_data["profile"]:
+                person_data["profile"][section_id] = {}
 
-                    if isinstance(person_data["profile"][section_id][field_id], list):
-                        person_data["profile"][section_id][field_id].append(file_info)
-                    else:
-                        person_data["profile"][section_id][field_id] = file_info
+            if field_id not in person_data["profile"][section_id]:
+                person_data["profile"][section_id][field_id] = []
 
-                people.append(person_data)
+            if isinstance(person_data["profile"][section_id][field_id], list):
+                person_data["profile"][section_id][field_id].append(file_info)
+            else:
+                person_data["profile"][section_id][field_id] = file_info
 
-            return people
+        return person_data
 
-    def get_people_batch(self, project_safe_name, entity_ids):
+    def iter_people(self, project_safe_name, batch_size=500, fields=None, sections=None):
         """
-        Retrieve multiple people by their IDs in a single query.
+        Stream people in a project from the driver's result cursor.
 
-        This method uses UNWIND to fetch multiple entities efficiently,
-        avoiding N+1 query patterns when retrieving multiple people.
+        Records are pulled from the server batch_size at a time and yielded
+        as they arrive, so only one batch is held in memory. The session stays
+        open until the generator is exhausted or closed.
 
         Args:
             project_safe_name: The project's safe name
-            entity_ids: List of entity IDs to retrieve
+            batch_size: Number of records fetched per round trip
+            fields: Optional section-qualified field IDs ("core.name") to load;
+                files are restricted the same way
+            sections: Optional section IDs ("core") to load in full
 
-        Returns:
-            Dict mapping entity_id to person data
+        Yields:
+            Person data dictionaries, newest first
         """
-        if not entity_ids:
-            return {}
-
-        with self.driver.session() as session:
-            # Single optimized query that fetches all requested people with their data
+        with self.driver.session(fetch_size=batch_size) as session:
+            # Field values and files are collected in separate steps so the
+            # two OPTIONAL MATCHes do not multiply into a cross product
             result = session.run("""
                 MATCH (project:Project {safe_name: $project_safe_name})
-                UNWIND $entity_ids AS eid
-                MATCH (project)-[:HAS_PERSON]->(person:Person {id: eid})
+                      -[:HAS_PERSON]->(person:Person)
                 OPTIONAL MATCH (person)-[:HAS_FIELD_VALUE]->(fv:FieldValue)
-                OPTIONAL MATCH (person)-[file_rel:HAS_FILE]->(file:File)
+                WHERE $all_fields OR fv.section_id IN $sections
+                      OR fv.section_id + '.' + fv.field_id IN $field_keys
                 WITH person,
                      COLLECT(DISTINCT {
                          section_id: fv.section_id,
                          field_id: fv.field_id,
                          value: fv.value
-                     }) AS field_values,
+                     }) AS field_values
+                OPTIONAL MATCH (person)-[file_rel:HAS_FILE]->(file:File)
+                WHERE $all_fields OR file_rel.section_id IN $sections
+                      OR file_rel.section_id + '.' + file_rel.field_id IN $field_keys
+                WITH person, field_values,
                      COLLECT(DISTINCT {
                          file: file,
                          section_id: file_rel.section_id,
                          field_id: file_rel.field_id
                      }) AS files
                 RETURN person, field_values, files
-            """, project_safe_name=project_safe_name, entity_ids=list(entity_ids))
+                ORDER BY person.created_at DESC
+            """, project_safe_name=project_safe_name, **self._field_filter_params(fields, sections))
 
-            people_map = {}
             for record in result:
-                person_data = dict(record["person"])
-                person_data["profile"] = {}
-
-                # Process field values
-                for fv in record["field_values"]:
-                    if fv["section_id"] is None:
-                        continue
+                yield self._person_from_record(record)
 
-                    section_id = fv["section_id"]
-                    field_id = fv["field_id"]
-                    value = fv["value"]
-
-                    if section_id not in person_data["profile"]:
-                        person_data["profile"][section_id] = {}
-
-                    # Try to parse JSON strings
-                    if isinstance(value, str):
-                        try:
-                            value = json.loads(value)
-                        except json.JSONDecodeError:
-                            pass
-
-                    person_data["profile"][section_id][field_id] = value
-
-                # Process files
-                for file_data in record["files"]:
-                    if file_data["file"] is None:
-                        continue
+    def get_all_people(self, project_safe_name, fields=None, sections=None):
+        """
+        Retrieve all people in a project with all their data in a single query.
 
-                    file_info = dict(file_data["file"])
-                    section_id = file_data["section_id"]
-                    field_id = file_data["field_id"]
+        This method uses COLLECT to aggregate all related data (field values and files)
+        in a single query, avoiding N+1 query patterns. Use iter_people to stream
+        large projects instead of building the full list.
 
-                    if section_id not in person_data["profile"]:
-                        person_data["profile"][section_id] = {}
+        Args:
+            project_safe_name: The project's safe name
+            fields: Optional section-qualified field IDs ("core.name") to load
+            sections: Optional section IDs ("core") to load in full
+        """
+        return list(self.iter_people(project_safe_name, fields=fields, sections=sections))
 
-                    if field_id not in person_data["profile"][section_id]:
-                        person_data["profile"][section_id][field_id] = []
+    def get_people_batch(self, project_safe_name, entity_ids, fields=None, sections=None):
+        """
+        Retrieve multiple people by their IDs in a single query.
 
-                    if isinstance(person_data["profile"][section_id][field_id], list):
-                        person_data["profile"][section_id][field_id].append(file_info)
-                    else:
-                        person_data["profile"][section_id][field_id] = file_info
+        This method uses UNWIND to fetch multiple entities efficiently,
+        avoiding N+1 query patterns when retrieving multiple people.
 
-                people_map[person_data["id"]] = person_data
+        Args:
+            project_safe_name: The project's safe name
+            entity_ids: List of entity IDs to retrieve
+            fields: Optional section-qualified field IDs ("core.name") to load
+            sections: Optional section IDs ("core") to load in full
 
-            return people_map
+        Returns:
+            Dict mapping entity_id to person data
+        """
+        if not entity_ids:
+            return {}
 
-    def get_all_people_paginated(self, project_safe_name, offset=0, limit=100):
+        with self.driver.session() as session:
+            return self._read_people_batch(session, project_safe_name, entity_ids, fields, sections)
+
+    def _read_people_batch(self, session, project_safe_name, entity_ids, fields=None, sections=None):
+        """
+        Read people by ID within an open session or transaction.
+
+        See get_people_batch for the arguments and return value.
+        """
+        # Single optimized query that fetches all requested people with their data
+        result = session.run("""
+            MATCH (project:Project {safe_name: $project_safe_name})
+            UNWIND $entity_ids AS eid
+            MATCH (project)-[:HAS_PERSON]->(person:Person {id: eid})
+            OPTIONAL MATCH (person)-[:HAS_FIELD_VALUE]->(fv:FieldValue)
+            WHERE $all_fields OR fv.section_id IN $sections
+                  OR fv.section_id + '.' + fv.field_id IN $field_keys
+            WITH person,
+                 COLLECT(DISTINCT {
+                     section_id: fv.section_id,
+                     field_id: fv.field_id,
+                     value: fv.value
+                 }) AS field_values
+            OPTIONAL MATCH (person)-[file_rel:HAS_FILE]->(file:File)
+            WHERE $all_fields OR file_rel.section_id IN $sections
+                  OR file_rel.section_id + '.' + file_rel.field_id IN $field_keys
+            WITH person, field_values,
+                 COLLECT(DISTINCT {
+                     file: file,
+                     section_id: file_rel.section_id,
+                     field_id: file_rel.field_id
+                 }) AS files
+            RETURN person, field_values, files
+        """, project_safe_name=project_safe_name, entity_ids=list(entity_ids),
+            **self._field_filter_params(fields, sections))
+
+        people_map = {}
+        for record in result:
+            person_data = self._person_from_record(record)
+            people_map[person_data["id"]] = person_data
+
+        return people_map
+
+    def get_all_people_paginated(self, project_safe_name, offset=0, limit=100,
+                                 fields=None, sections=None):
         """
         Retrieve people in a project with database-level pagination.
 
         This method uses SKIP and LIMIT in the Cypher query for efficient
-        pagination without loading all data into memory.
+        pagination without loading all data into memory. The cost of SKIP
+        grows with the offset; use get_people_page to walk deep pages.
 
         Args:
             project_safe_name: The project's safe name
             offset: Number of records to skip (default 0)
             limit: Maximum number of records to return (default 100)
+            fields: Optional section-qualified field IDs ("core.name") to load
+            sections: Optional section IDs ("core") to load in full
 
         Returns:
             List of person data dictionaries
@@ -645,69 +1091,222 @@ class Neo4jHandler:
                 SKIP $offset
                 LIMIT $limit
                 OPTIONAL MATCH (person)-[:HAS_FIELD_VALUE]->(fv:FieldValue)
-                OPTIONAL MATCH (person)-[file_rel:HAS_FILE]->(file:File)
+                WHERE $all_fields OR fv.section_id IN $sections
+                      OR fv.section_id + '.' + fv.field_id IN $field_keys
                 WITH person,
                      COLLECT(DISTINCT {
                          section_id: fv.section_id,
                          field_id: fv.field_id,
                          value: fv.value
-                     }) AS field_values,
+                     }) AS field_values
+                OPTIONAL MATCH (person)-[file_rel:HAS_FILE]->(file:File)
+                WHERE $all_fields OR file_rel.section_id IN $sections
+                      OR file_rel.section_id + '.' + file_rel.field_id IN $field_keys
+                WITH person, field_values,
                      COLLECT(DISTINCT {
                          file: file,
                          section_id: file_rel.section_id,
                          field_id: file_rel.field_id
                      }) AS files
                 RETURN person, field_values, files
-            """, project_safe_name=project_safe_name, offset=offset, limit=limit)
+                ORDER BY person.created_at DESC
+            """, project_safe_name=project_safe_name, offset=offset, limit=limit,
+                **self._field_filter_params(fields, sections))
 
-            people = []
-            for record in result:
-                person_data = dict(record["person"])
-                person_data["profile"] = {}
+            return [self._person_from_record(record) for record in result]
 
-                # Process field values
-                for fv in record["field_values"]:
-                    if fv["section_id"] is None:
-                        continue
+    @staticmethod
+    def _encode_people_cursor(person):
+        """Encode the (created_at, id) sort key of a person as an opaque cursor."""
+        created_at = person.get("created_at")
+        if created_at is not None and not isinstance(created_at, (str, int, float)):
+            created_at = str(created_at)
+        key = json.dumps([created_at, person["id"]], separators=(",", ":"))
+        return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
 
-                    section_id = fv["section_id"]
-                    field_id = fv["field_id"]
-                    value = fv["value"]
+    @staticmethod
+    def _decode_people_cursor(cursor):
+        """Decode a cursor from _encode_people_cursor into (created_at, id)."""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            created_at, person_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cursor: {cursor!r}") from e
+        if not isinstance(person_id, str):
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        return created_at, person_id
+
+    def get_people_page(self, project_safe_name, cursor=None, limit=100,
+                        fields=None, sections=None):
+        """
+        Retrieve a page of people using keyset (cursor) pagination.
+
+        People are ordered newest first by (created_at, id), and each page
+        seeks past the last person of the previous one instead of skipping
+        rows, so deep pages cost the same as the first. Pages stay
+        consistent while people are added or deleted.
+
+        The first page has no predicate. Later pages use a plain range on
+        created_at, which the (created_at, id) index can seek, with the id
+        only breaking ties. People without created_at sort first and are
+        paged with a filter instead; only legacy data lacks it.
 
-                    if section_id not in person_data["profile"]:
-                        person_data["profile"][section_id] = {}
+        Args:
+            project_safe_name: The project's safe name
+            cursor: Opaque cursor from a previous page, or None for the first
+            limit: Maximum number of people to return (default 100)
+            fields: Optional section-qualified field IDs ("core.name") to load
+            sections: Optional section IDs ("core") to load in full
 
-                    if isinstance(value, str):
-                        try:
-                            value = json.loads(value)
-                        except json.JSONDecodeError:
-                            pass
+        Returns:
+            Tuple of (people, next_cursor); next_cursor is None on the last page
 
-                    person_data["profile"][section_id][field_id] = value
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after_created_at, after_id = (None, None)
+        if not cursor:
+            seek_clause = ""
+        else:
+            after_created_at, after_id = self._decode_people_cursor(cursor)
+            if after_created_at is None:
+                # Null created_at values sort first in descending order
+                seek_clause = "WHERE person.created_at IS NOT NULL OR person.id < $after_id"
+            else:
+                seek_clause = """WHERE person.created_at <= $after_created_at
+                      AND (person.created_at < $after_created_at OR person.id < $after_id)"""
 
-                # Process files
-                for file_data in record["files"]:
-                    if file_data["file"] is None:
-                        continue
+        with self.driver.session() as session:
+            result = session.run(f"""
+                MATCH (project:Project {{safe_name: $project_safe_name}})
+                      -[:HAS_PERSON]->(person:Person)
+                {seek_clause}
+                WITH person
+                ORDER BY person.created_at DESC, person.id DESC
+                LIMIT $fetch_limit
+                OPTIONAL MATCH (person)-[:HAS_FIELD_VALUE]->(fv:FieldValue)
+                WHERE $all_fields OR fv.section_id IN $sections
+                      OR fv.section_id + '.' + fv.field_id IN $field_keys
+                WITH person,
+                     COLLECT(DISTINCT {{
+                         section_id: fv.section_id,
+                         field_id: fv.field_id,
+                         value: fv.value
+                     }}) AS field_values
+                OPTIONAL MATCH (person)-[file_rel:HAS_FILE]->(file:File)
+                WHERE $all_fields OR file_rel.section_id IN $sections
+                      OR file_rel.section_id + '.' + file_rel.field_id IN $field_keys
+                WITH person, field_values,
+                     COLLECT(DISTINCT {{
+                         file: file,
+                         section_id: file_rel.section_id,
+                         field_id: file_rel.field_id
+                     }}) AS files
+                RETURN person, field_values, files
+                ORDER BY person.created_at DESC, person.id DESC
+            """, project_safe_name=project_safe_name,
+                after_created_at=after_created_at, after_id=after_id,
+                fetch_limit=limit + 1,
+                **self._field_filter_params(fields, sections))
 
-                    file_info = dict(file_data["file"])
-                    section_id = file_data["section_id"]
-                    field_id = file_data["field_id"]
+            people = [self._person_from_record(record) for record in result]
 
-                    if section_id not in person_data["profile"]:
-                        person_data["profile"][section_id] = {}
+        # One extra row tells whether another page exists
+        if len(people) <= limit:
+            return people, None
+        people = people[:limit]
+        return people, self._encode_people_cursor(people[-1])
 
-                    if field_id not in person_data["profile"][section_id]:
-                        person_data["profile"][section_id][field_id] = []
+    def iter_people_pages(self, project_safe_name, page_size=500, fields=None, sections=None):
+        """
+        Iterate over all people of a project page by page with get_people_page.
 
-                    if isinstance(person_data["profile"][section_id][field_id], list):
-                        person_data["profile"][section_id][field_id].append(file_info)
-                    else:
-                        person_data["profile"][section_id][field_id] = file_info
+        Unlike iter_people, no session is held open between pages.
 
-                people.append(person_data)
+        Args:
+            project_safe_name: The project's safe name
+            page_size: Number of people fetched per query
+            fields: Optional section-qualified field IDs ("core.name") to load
+            sections: Optional section IDs ("core") to load in full
+
+        Yields:
+            Person data dictionaries, newest first
+        """
+        cursor = None
+        while True:
+            people, cursor = self.get_people_page(
+                project_safe_name, cursor=cursor, limit=page_size,
+                fields=fields, sections=sections
+            )
+            yield from people
+            if cursor is None:
+                break
+
+    def set_person_search_text(self, person_id, search_text):
+        """
+        Store the denormalized full-text search text for a person.
 
-            return people
+        Any later field or file write removes it again, so a person without
+        search_text is always treated as a search candidate.
+
+        Args:
+            person_id: The person's ID
+            search_text: Concatenated searchable text of the profile
+
+        Returns:
+            True if the person exists and was updated
+        """
+        with self.driver.session() as session:
+            result = session.run("""
+                MATCH (person:Person {id: $person_id})
+                SET person.search_text = $search_text
+                RETURN count(person) AS updated
+            """, person_id=person_id, search_text=search_text)
+
+            record = result.single()
+            return bool(record and record["updated"] > 0)
+
+    def find_fulltext_candidates(self, project_safe_names, lucene_query):
+        """
+        Narrow people to full-text search candidates across projects.
+
+        Returns people whose search_text matches the Lucene query, plus
+        people with no (or stale, hence removed) search_text, which cannot
+        be ruled out by the index.
+
+        Args:
+            project_safe_names: Safe names of the projects to search
+            lucene_query: Lucene query against entity_fulltext_index
+
+        Returns:
+            Dict mapping project safe name to candidate person IDs (newest
+            first), or None if the full-text index is unavailable
+        """
+        try:
+            with self.driver.session() as session:
+                result = session.run("""
+                    CALL {
+                        CALL db.index.fulltext.queryNodes('entity_fulltext_index', $lucene_query)
+                        YIELD node
+                        RETURN node
+                        UNION
+                        MATCH (project:Project)-[:HAS_PERSON]->(node:Person)
+                        WHERE project.safe_name IN $project_safe_names
+                          AND node.search_text IS NULL
+                        RETURN node
+                    }
+                    MATCH (project:Project)-[:HAS_PERSON]->(node)
+                    WHERE project.safe_name IN $project_safe_names
+                    RETURN project.safe_name AS project_safe_name, node.id AS person_id
+                    ORDER BY node.created_at DESC
+                """, project_safe_names=list(project_safe_names), lucene_query=lucene_query)
+
+                candidates = {}
+                for record in result:
+                    candidates.setdefault(record["project_safe_name"], []).append(record["person_id"])
+                return candidates
+        except ClientError:
+            return None
 
     def get_people_count(self, project_safe_name):
         """
@@ -751,75 +1350,130 @@ class Neo4jHandler:
             # Update profile data
             for section_id, fields in profile_data.items():
                 for field_id, value in fields.items():
-                    self.set_person_field(person_id, section_id, field_id, value)
-            
-            return self.get_person(project_safe_name, person_id)
+                    self._write_person_field(person_id, section_id, field_id, value, session)
+
+            data_version = self._bump_data_version(session, project_safe_name)
+
+        self._notify_change("people_updated", project_safe_name, [person_id], data_version)
+        return self.get_person(project_safe_name, person_id)
     
+    @staticmethod
+    def _delete_field_values(session, person_id, field_keys):
+        """
+        Delete a person's stored values for the given fields.
+
+        Args:
+            session: Open Neo4j session
+            person_id: Person's unique identifier
+            field_keys: List of {"section_id", "field_id"} dicts
+
+        Returns:
+            Safe name of the person's project, or None if it is not found
+        """
+        record = session.run("""
+            MATCH (person:Person {id: $person_id})
+            OPTIONAL MATCH (project:Project)-[:HAS_PERSON]->(person)
+            OPTIONAL MATCH (person)-[r:HAS_FIELD_VALUE]->(fv:FieldValue)
+            WHERE any(fk IN $field_keys
+                      WHERE fv.section_id = fk.section_id AND fv.field_id = fk.field_id)
+            DELETE r, fv
+            RETURN DISTINCT project.safe_name AS safe_name
+        """, person_id=person_id, field_keys=field_keys).single()
+        return record["safe_name"] if record else None
+
     def set_person_field(self, person_id, section_id, field_id, value):
-        """Set a specific field value for a person."""
+        """Set a specific field value for a person and report the change."""
         with self.driver.session() as session:
-            # First delete any existing value for this field
-            session.run("""
-                MATCH (person:Person {id: $person_id})-[r:HAS_FIELD_VALUE]->(fv:FieldValue)
-                WHERE fv.section_id = $section_id AND fv.field_id = $field_id
-                DELETE r, fv
-            """, person_id=person_id, section_id=section_id, field_id=field_id)
-            
-            # Handle file fields differently
-            if isinstance(value, dict) and "path" in value:
-                return self.handle_file_upload(
+            project_safe_name = self._write_person_field(person_id, section_id, field_id, value, session)
+            data_version = self._bump_data_version(session, project_safe_name) if project_safe_name else None
+        self._notify_person_updated(
+            person_id, project_safe_name, section_id == "Tagged People", data_version
+        )
+
+    def _notify_person_updated(self, person_id, project_safe_name, tagged_people_changed=False,
+                               data_version=None):
+        """Report a field setter write, dropping all snapshots for tag writes outside a project."""
+        if project_safe_name:
+            self._notify_change("people_updated", project_safe_name, [person_id], data_version)
+        elif tagged_people_changed:
+            self.invalidate_graph_snapshot()
+
+    def _write_person_field(self, person_id, section_id, field_id, value, session):
+        """
+        Set a specific field value for a person without reporting the change.
+
+        Args:
+            person_id: Person's unique identifier
+            section_id: Section of the field
+            field_id: Field to set
+            value: New value; file values are stored as File nodes
+            session: Open Neo4j session of the write
+
+        Returns:
+            Safe name of the person's project, or None if it is not found
+        """
+        # First delete any existing value for this field
+        project_safe_name = self._delete_field_values(
+            session, person_id, [{"section_id": section_id, "field_id": field_id}]
+        )
+
+        # Handle file fields differently
+        if isinstance(value, dict) and "path" in value:
+            self.handle_file_upload(
+                person_id=person_id,
+                section_id=section_id,
+                field_id=field_id,
+                file_id=value.get("id", str(uuid4())),
+                filename=value.get("name", ""),
+                file_path=value.get("path", ""),
+                metadata=value
+            )
+            return project_safe_name
+        elif isinstance(value, list) and value and isinstance(value[0], dict) and "path" in value[0]:
+            for file_data in value:
+                self.handle_file_upload(
                     person_id=person_id,
                     section_id=section_id,
                     field_id=field_id,
-                    file_id=value.get("id", str(uuid4())),
-                    filename=value.get("name", ""),
-                    file_path=value.get("path", ""),
-                    metadata=value
+                    file_id=file_data.get("id", str(uuid4())),
+                    filename=file_data.get("name", ""),
+                    file_path=file_data.get("path", ""),
+                    metadata=file_data
                 )
-            elif isinstance(value, list) and value and isinstance(value[0], dict) and "path" in value[0]:
-                for file_data in value:
-                    self.handle_file_upload(
-                        person_id=person_id,
-                        section_id=section_id,
-                        field_id=field_id,
-                        file_id=file_data.get("id", str(uuid4())),
-                        filename=file_data.get("name", ""),
-                        file_path=file_data.get("path", ""),
-                        metadata=file_data
-                    )
-                return
-            
-            # Convert complex objects to JSON strings
-            if isinstance(value, (dict, list)):
-                value = json.dumps(value)
-            
-            # Create new field value node
-            session.run("""
-                MATCH (person:Person {id: $person_id})
-                CREATE (fv:FieldValue {
-                    section_id: $section_id,
-                    field_id: $field_id,
-                    value: $value
-                })
-                CREATE (person)-[:HAS_FIELD_VALUE]->(fv)
-            """, person_id=person_id, section_id=section_id,
-                field_id=field_id, value=value)
-
-    def set_person_fields_batch(self, person_id, profile_data):
-        """
-        Set multiple field values for a person in a batch operation.
+            return project_safe_name
+
+        # Convert complex objects to JSON strings
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value)
+
+        # Create new field value node; the cached search text is now stale
+        session.run("""
+            MATCH (person:Person {id: $person_id})
+            REMOVE person.search_text
+            CREATE (fv:FieldValue {
+                section_id: $section_id,
+                field_id: $field_id,
+                value: $value
+            })
+            CREATE (person)-[:HAS_FIELD_VALUE]->(fv)
+        """, person_id=person_id, section_id=section_id,
+            field_id=field_id, value=value)
 
-        This method uses UNWIND to create multiple field values in a single query,
-        avoiding N+1 query patterns when setting multiple fields.
+        self._sync_identifier_keys(session, person_id, {section_id: {field_id: value}})
+        return project_safe_name
+
+    @staticmethod
+    def _split_profile_values(profile_data):
+        """
+        Split profile data into stored field values and file uploads.
 
         Args:
-            person_id: Person's unique identifier.
             profile_data: Dictionary of section_id -> {field_id -> value} mappings.
-        """
-        if not profile_data:
-            return
 
-        # Separate regular field values from file uploads
+        Returns:
+            Tuple of (field value dicts with JSON-encoded complex values,
+            file upload dicts for handle_file_uploads_batch)
+        """
         field_values = []
         file_uploads = []
 
@@ -855,20 +1509,94 @@ class Neo4jHandler:
                         "value": value
                     })
 
+        return field_values, file_uploads
+
+    def _write_profiles_batch(self, session, profiles, replace_ids=()):
+        """
+        Write the profile fields of several people with a fixed number of queries.
+
+        Args:
+            session: Open Neo4j session or transaction
+            profiles: Dict mapping person ID to profile data
+            replace_ids: IDs of people whose stored values of the written
+                fields are deleted first (new people have none)
+
+        Returns:
+            Dict mapping person ID to file uploads for handle_file_uploads_batch
+        """
+        replace_ids = set(replace_ids)
+        field_values = []
+        updated_fields = {}
+        file_uploads = {}
+        for person_id, profile_data in profiles.items():
+            values, uploads = self._split_profile_values(profile_data)
+            for fv in values:
+                field_values.append(dict(fv, person_id=person_id))
+                updated_fields.setdefault(person_id, {}).setdefault(
+                    fv["section_id"], {}
+                )[fv["field_id"]] = fv["value"]
+            if uploads:
+                file_uploads[person_id] = uploads
+
+        if not field_values:
+            return file_uploads
+
+        field_keys = [
+            {"person_id": fv["person_id"], "section_id": fv["section_id"], "field_id": fv["field_id"]}
+            for fv in field_values
+            if fv["person_id"] in replace_ids
+        ]
+        if field_keys:
+            session.run("""
+                UNWIND $field_keys AS fk
+                MATCH (person:Person {id: fk.person_id})-[r:HAS_FIELD_VALUE]->(fv:FieldValue)
+                WHERE fv.section_id = fk.section_id AND fv.field_id = fk.field_id
+                DELETE r, fv
+            """, field_keys=field_keys)
+
+        # The cached search text of every written person is now stale
+        session.run("""
+            UNWIND $field_values AS fv
+            MATCH (person:Person {id: fv.person_id})
+            REMOVE person.search_text
+            CREATE (field_value:FieldValue {
+                section_id: fv.section_id,
+                field_id: fv.field_id,
+                value: fv.value
+            })
+            CREATE (person)-[:HAS_FIELD_VALUE]->(field_value)
+        """, field_values=field_values)
+
+        self._sync_identifier_keys_batch(session, updated_fields)
+        return file_uploads
+
+    def set_person_fields_batch(self, person_id, profile_data):
+        """
+        Set multiple field values for a person in a batch operation.
+
+        This method uses UNWIND to create multiple field values in a single query,
+        avoiding N+1 query patterns when setting multiple fields.
+
+        Args:
+            person_id: Person's unique identifier.
+            profile_data: Dictionary of section_id -> {field_id -> value} mappings.
+        """
+        if not profile_data:
+            return
+
+        field_values, file_uploads = self._split_profile_values(profile_data)
+
         with self.driver.session() as session:
             # First, batch delete existing field values for all fields we're updating
-            if field_values:
-                field_keys = [{"section_id": fv["section_id"], "field_id": fv["field_id"]} for fv in field_values]
-                session.run("""
-                    UNWIND $field_keys AS fk
-                    MATCH (person:Person {id: $person_id})-[r:HAS_FIELD_VALUE]->(fv:FieldValue)
-                    WHERE fv.section_id = fk.section_id AND fv.field_id = fk.field_id
-                    DELETE r, fv
-                """, person_id=person_id, field_keys=field_keys)
+            field_keys = [{"section_id": fv["section_id"], "field_id": fv["field_id"]} for fv in field_values]
+            project_safe_name = self._delete_field_values(session, person_id, field_keys)
 
-                # Batch create new field values
+            if field_values:
+                # Batch create new field values; the cached search text is now stale
                 session.run("""
                     MATCH (person:Person {id: $person_id})
+                    REMOVE person.search_text
+                    WITH person
                     UNWIND $field_values AS fv
                     CREATE (field_value:FieldValue {
                         section_id: fv.section_id,
@@ -878,10 +1606,21 @@ class Neo4jHandler:
                     CREATE (person)-[:HAS_FIELD_VALUE]->(field_value)
                 """, person_id=person_id, field_values=field_values)
 
+                updated_fields = {}
+                for fv in field_values:
+                    updated_fields.setdefault(fv["section_id"], {})[fv["field_id"]] = fv["value"]
+                self._sync_identifier_keys(session, person_id, updated_fields)
+
+            data_version = self._bump_data_version(session, project_safe_name) if project_safe_name else None
+
         # Handle file uploads using batch method
         if file_uploads:
             self.handle_file_uploads_batch(person_id, file_uploads)
 
+        self._notify_person_updated(
+            person_id, project_safe_name, "Tagged People" in profile_data, data_version
+        )
+
     def handle_file_uploads_batch(self, person_id, file_uploads):
         """
         Handle multiple file uploads in a batch operation.
@@ -932,6 +1671,8 @@ class Neo4jHandler:
             # Batch create new file nodes and relationships
             session.run("""
                 MATCH (person:Person {id: $person_id})
+                REMOVE person.search_text
+                WITH person
                 UNWIND $file_data_list AS fd
                 CREATE (file:File)
                 SET file = fd.file_props
@@ -948,6 +1689,17 @@ class Neo4jHandler:
         related data, avoiding multiple round trips to the database.
         """
         with self.driver.session() as session:
+            # Release identifier keys first so orphaned keys can be dropped
+            session.run("""
+                MATCH (project:Project {safe_name: $project_safe_name})
+                      -[:HAS_PERSON]->(person:Person {id: $person_id})
+                      -[r:HAS_IDENTIFIER_KEY]->(key:IdentifierKey)
+                DELETE r
+                WITH DISTINCT key
+                WHERE NOT (key)<-[:HAS_IDENTIFIER_KEY]-()
+                DELETE key
+            """, project_safe_name=project_safe_name, person_id=person_id)
+
             # Single query to verify, delete related data, and delete person
             result = session.run("""
                 MATCH (project:Project {safe_name: $project_safe_name})
@@ -967,8 +1719,328 @@ class Neo4jHandler:
             """, project_safe_name=project_safe_name, person_id=person_id)
 
             record = result.single()
-            return record is not None and record["deleted_count"] > 0
+            deleted = record is not None and record["deleted_count"] > 0
+            data_version = self._bump_data_version(session, project_safe_name) if deleted else None
+
+        if deleted:
+            self._notify_change("people_deleted", project_safe_name, [person_id], data_version)
+        return deleted
     
+    def get_identifier_paths(self):
+        """Get identifier field paths from the data configuration (cached)."""
+        if self._identifier_paths is None:
+            try:
+                self._identifier_paths = get_identifier_paths(load_config())
+            except Exception:
+                self._identifier_paths = []
+        return self._identifier_paths
+
+    def _build_identifier_keys(self, profile_data):
+        """
+        Compute normalized identifier keys for the given profile fields.
+
+        Args:
+            profile_data: Dictionary of section_id -> {field_id -> value} mappings.
+                String values are JSON-decoded the same way reads decode them.
+
+        Returns:
+            Tuple of (identifier field keys touched, list of key rows)
+        """
+        paths_by_field = {}
+        for id_path in self.get_identifier_paths():
+            paths_by_field.setdefault((id_path["section_id"], id_path["field_id"]), []).append(id_path)
+
+        field_keys = []
+        key_rows = []
+        for section_id, fields in profile_data.items():
+            if not isinstance(fields, dict):
+                continue
+            for field_id, value in fields.items():
+                id_paths = paths_by_field.get((section_id, field_id))
+                if not id_paths:
+                    continue
+
+                field_keys.append({"section_id": section_id, "field_id": field_id})
+
+                if isinstance(value, str):
+                    try:
+                        value = json.loads(value)
+                    except json.JSONDecodeError:
+                        pass
+
+                for id_path in id_paths:
+                    values = extract_identifier_values(
+                        value, id_path.get("component_id"), id_path.get("field_type") or "string"
+                    )
+                    for normalized in set(values):
+                        key_rows.append({
+                            "path": id_path["path"],
+                            "value": normalized,
+                            "section_id": section_id,
+                            "field_id": field_id
+                        })
+
+        return field_keys, key_rows
+
+    def _sync_identifier_keys(self, session, person_id, profile_data):
+        """
+        Replace a person's IdentifierKey links for the given fields.
+
+        Only identifier fields are touched, so updates to other fields cost nothing.
+        """
+        field_keys, key_rows = self._build_identifier_keys(profile_data)
+        if not field_keys:
+            return
+
+        session.run("""
+            UNWIND $field_keys AS fk
+            MATCH (person:Person {id: $person_id})-[r:HAS_IDENTIFIER_KEY]->(key:IdentifierKey)
+            WHERE r.section_id = fk.section_id AND r.field_id = fk.field_id
+            DELETE r
+            WITH DISTINCT key
+            WHERE NOT (key)<-[:HAS_IDENTIFIER_KEY]-()
+            DELETE key
+        """, person_id=person_id, field_keys=field_keys)
+
+        if key_rows:
+            session.run("""
+                MATCH (person:Person {id: $person_id})
+                UNWIND $key_rows AS k
+                MERGE (key:IdentifierKey {path: k.path, value: k.value})
+                MERGE (person)-[r:HAS_IDENTIFIER_KEY {section_id: k.section_id, field_id: k.field_id}]->(key)
+            """, person_id=person_id, key_rows=key_rows)
+
+    def _sync_identifier_keys_batch(self, session, profiles):
+        """
+        Replace the IdentifierKey links of several people at once.
+
+        Args:
+            session: Open Neo4j session or transaction
+            profiles: Dict mapping person ID to the profile fields written
+
+        Returns:
+            Number of identifier keys linked
+        """
+        field_keys = []
+        key_rows = []
+        for person_id, profile_data in profiles.items():
+            person_field_keys, person_key_rows = self._build_identifier_keys(profile_data)
+            field_keys.extend(dict(fk, person_id=person_id) for fk in person_field_keys)
+            key_rows.extend(dict(k, person_id=person_id) for k in person_key_rows)
+        if not field_keys:
+            return 0
+
+        session.run("""
+            UNWIND $field_keys AS fk
+            MATCH (person:Person {id: fk.person_id})-[r:HAS_IDENTIFIER_KEY]->(key:IdentifierKey)
+            WHERE r.section_id = fk.section_id AND r.field_id = fk.field_id
+            DELETE r
+            WITH DISTINCT key
+            WHERE NOT (key)<-[:HAS_IDENTIFIER_KEY]-()
+            DELETE key
+        """, field_keys=field_keys)
+
+        if key_rows:
+            session.run("""
+                UNWIND $key_rows AS k
+                MATCH (person:Person {id: k.person_id})
+                MERGE (key:IdentifierKey {path: k.path, value: k.value})
+                MERGE (person)-[r:HAS_IDENTIFIER_KEY {section_id: k.section_id, field_id: k.field_id}]->(key)
+            """, key_rows=key_rows)
+        return len(key_rows)
+
+    def rebuild_identifier_keys(self, project_safe_name, batch_size=1000):
+        """
+        Rebuild the IdentifierKey layer for every person in a project.
+
+        Needed once for projects created before the key layer existed, and
+        after identifier fields change in the data configuration.
+
+        The project is marked not ready first, so find_identifier_matches
+        falls back to a full scan while the layer is incomplete, including
+        after a rebuild that failed part-way. Person IDs are streamed and
+        each batch is re-read and rewritten in one write transaction, so
+        writes made during the rebuild are not overwritten by stale rows.
+
+        Args:
+            project_safe_name: The project's safe name
+            batch_size: Number of people rewritten per transaction
+
+        Returns:
+            Number of identifier keys linked
+        """
+        identifier_fields = sorted({
+            f"{path['section_id']}.{path['field_id']}" for path in self.get_identifier_paths()
+        })
+
+        with self.driver.session() as session:
+            session.run("""
+                MATCH (p:Project {safe_name: $project_safe_name})
+                SET p.identifier_keys_ready = false
+            """, project_safe_name=project_safe_name)
+
+            session.run("""
+                MATCH (project:Project {safe_name: $project_safe_name})
+                      -[:HAS_PERSON]->(:Person)-[r:HAS_IDENTIFIER_KEY]->(key:IdentifierKey)
+                DELETE r
+                WITH DISTINCT key
+                WHERE NOT (key)<-[:HAS_IDENTIFIER_KEY]-()
+                DELETE key
+            """, project_safe_name=project_safe_name)
+
+        linked = 0
+        with self.driver.session(fetch_size=batch_size) as id_session, \
+                self.driver.session() as write_session:
+            result = id_session.run("""
+                MATCH (project:Project {safe_name: $project_safe_name})-[:HAS_PERSON]->(person:Person)
+                RETURN person.id AS id
+            """, project_safe_name=project_safe_name)
+
+            person_ids = []
+            for record in result:
+                person_ids.append(record["id"])
+                if len(person_ids) >= batch_size:
+                    linked += write_session.execute_write(
+                        self._rewrite_identifier_keys_tx, project_safe_name, person_ids, identifier_fields
+                    )
+                    person_ids = []
+            if person_ids:
+                linked += write_session.execute_write(
+                    self._rewrite_identifier_keys_tx, project_safe_name, person_ids, identifier_fields
+                )
+
+            write_session.run("""
+                MATCH (p:Project {safe_name: $project_safe_name})
+                SET p.identifier_keys_ready = true
+            """, project_safe_name=project_safe_name)
+
+        return linked
+
+    def _rewrite_identifier_keys_tx(self, tx, project_safe_name, person_ids, identifier_fields):
+        """
+        Read a batch of people and rewrite their IdentifierKey links in one transaction.
+
+        Returns:
+            Number of identifier keys linked
+        """
+        people = self._read_people_batch(tx, project_safe_name, person_ids, fields=identifier_fields)
+        return self._sync_identifier_keys_batch(tx, {
+            person_id: person.get("profile", {}) for person_id, person in people.items()
+        })
+
+    def find_identifier_matches(self, project_safe_name, person_id):
+        """
+        Find people in the same project sharing identifier keys with a person.
+
+        This is a single indexed traversal through the IdentifierKey layer
+        instead of loading and comparing every profile in the project.
+
+        Args:
+            project_safe_name: The project's safe name
+            person_id: The person to find matches for
+
+        Returns:
+            List of dicts with entity_id, shared keys and the core name/alias
+            fields needed for display, or None if the project's key layer has
+            not been built yet (see rebuild_identifier_keys).
+        """
+        with self.driver.session() as session:
+            ready = session.run("""
+                MATCH (p:Project {safe_name: $project_safe_name})
+                RETURN coalesce(p.identifier_keys_ready, false) AS ready
+            """, project_safe_name=project_safe_name).single()
+
+            if not ready or not ready["ready"]:
+                return None
+
+            result = session.run("""
+                MATCH (project:Project {safe_name: $project_safe_name})
+                      -[:HAS_PERSON]->(source:Person {id: $person_id})
+                      -[:HAS_IDENTIFIER_KEY]->(key:IdentifierKey)
+                      <-[:HAS_IDENTIFIER_KEY]-(other:Person)<-[:HAS_PERSON]-(project)
+                WHERE other <> source
+                WITH other, COLLECT(DISTINCT {path: key.path, value: key.value}) AS keys
+                OPTIONAL MATCH (other)-[:HAS_FIELD_VALUE]->(fv:FieldValue)
+                WHERE fv.section_id = 'core' AND fv.field_id IN ['name', 'alias']
+                RETURN other.id AS entity_id, keys,
+                       COLLECT({field_id: fv.field_id, value: fv.value}) AS name_fields
+            """, project_safe_name=project_safe_name, person_id=person_id)
+
+            matches = []
+            for record in result:
+                core = {}
+                for name_field in record["name_fields"]:
+                    if name_field["field_id"] is None:
+                        continue
+                    value = name_field["value"]
+                    if isinstance(value, str):
+                        try:
+                            value = json.loads(value)
+                        except json.JSONDecodeError:
+                            pass
+                    core[name_field["field_id"]] = value
+
+                matches.append({
+                    "entity_id": record["entity_id"],
+                    "keys": [dict(k) for k in record["keys"]],
+                    "profile": {"core": core} if core else {}
+                })
+
+            return matches
+
+    def find_cross_project_identifier_matches(self, project_safe_name, person_id, target_projects=None):
+        """
+        Find people in other projects sharing identifier keys with a person.
+
+        IdentifierKey nodes are global, so one indexed traversal from the
+        person's keys reaches every other project instead of loading and
+        comparing each project's profiles.
+
+        Args:
+            project_safe_name: The person's project safe name
+            person_id: The person to find matches for
+            target_projects: Optional list of project safe names to search
+                (all other projects if None)
+
+        Returns:
+            List of dicts with project_safe_name, entity_id and the shared
+            {path, value} keys, or None if the key layer of the source project
+            or of a searched project has not been built yet.
+        """
+        with self.driver.session() as session:
+            pending = session.run("""
+                MATCH (p:Project)
+                WHERE coalesce(p.identifier_keys_ready, false) = false
+                  AND (p.safe_name = $project_safe_name
+                       OR $target_projects IS NULL
+                       OR p.safe_name IN $target_projects)
+                RETURN count(p) AS pending
+            """, project_safe_name=project_safe_name, target_projects=target_projects).single()
+
+            if pending and pending["pending"]:
+                return None
+
+            result = session.run("""
+                MATCH (:Project {safe_name: $project_safe_name})
+                      -[:HAS_PERSON]->(source:Person {id: $person_id})
+                      -[:HAS_IDENTIFIER_KEY]->(key:IdentifierKey)
+                      <-[:HAS_IDENTIFIER_KEY]-(other:Person)<-[:HAS_PERSON]-(project:Project)
+                WHERE project.safe_name <> $project_safe_name
+                  AND ($target_projects IS NULL OR project.safe_name IN $target_projects)
+                RETURN project.safe_name AS project_safe_name, other.id AS entity_id,
+                       COLLECT(DISTINCT {path: key.path, value: key.value}) AS keys
+            """, project_safe_name=project_safe_name, person_id=person_id,
+                target_projects=target_projects)
+
+            return [
+                {
+                    "project_safe_name": record["project_safe_name"],
+                    "entity_id": record["entity_id"],
+                    "keys": [dict(k) for k in record["keys"]]
+                }
+                for record in result
+            ]
+
     def handle_file_upload(self, person_id, section_id, field_id, file_id, filename, file_path, metadata=None):
         """Handle file upload and create appropriate relationships."""
         file_props = {
@@ -995,6 +2067,7 @@ class Neo4jHandler:
             # Create new file node and relationship with properties
             session.run("""
                 MATCH (person:Person {id: $person_id})
+                REMOVE person.search_text
                 MERGE (file:File {id: $file_id})
                 SET file = $file_properties
                 MERGE (person)-[r:HAS_FILE]->(file)
@@ -1020,6 +2093,8 @@ class Neo4jHandler:
         with self.driver.session() as session:
             result = session.run("""
                 MATCH (file:File {id: $file_id})
+                OPTIONAL MATCH (person:Person)-[:HAS_FILE]->(file)
+                REMOVE person.search_text
                 DETACH DELETE file
                 RETURN count(file) as deleted_count
             """, file_id=file_id)
@@ -1243,11 +2318,12 @@ class Neo4jHandler:
             outgoing_count = len(tagged_people)
 
             # Incoming: entities that tagged this person
-            all_people = self.get_all_people(project_safe_name)
             incoming_count = 0
             incoming_from = []
+            total_entities = 0
 
-            for person in all_people:
+            for person in self.iter_people(project_safe_name, fields=["Tagged People.tagged_people"]):
+                total_entities += 1
                 if person.get("id") == entity_id:
                     continue
                 person_tagged = person.get("profile", {}).get("Tagged People", {}).get("tagged_people", [])
@@ -1260,7 +2336,6 @@ class Neo4jHandler:
             total_connections = outgoing_count + incoming_count
 
             # Calculate normalized centrality (if there are other entities)
-            total_entities = len(all_people)
             max_possible = (total_entities - 1) * 2 if total_entities > 1 else 1
             normalized_centrality = total_connections / max_possible if max_possible > 0 else 0
 
@@ -1443,107 +2518,161 @@ class Neo4jHandler:
             "edges": edges
         }
 
-    def find_clusters(self, project_safe_name):
+    def get_tagged_edges(self, project_safe_name, include_types=False):
         """
-        Detect connected components/clusters in the project's entity graph.
+        Stream the project's tag graph as compact (person_id, tagged_ids) tuples.
 
-        Uses union-find algorithm to identify groups of entities that are
-        connected to each other but not to other groups.
+        Only the tagged_people field value is projected, so no other field
+        values or files are loaded or decoded. People without tags are still
+        yielded (with an empty list) so isolated entities are visible.
 
         Args:
             project_safe_name: The project's safe name
+            include_types: Whether to also project the relationship_types and
+                relationship_properties field values
 
-        Returns:
-            dict with cluster information including sizes and members
+        Yields:
+            Tuples of (person_id, list of tagged person IDs), followed by the
+            relationship types and properties dicts if include_types is set
         """
-        all_people = self.get_all_people(project_safe_name)
+        fields = ["tagged_people"]
+        if include_types:
+            fields += ["relationship_types", "relationship_properties"]
 
-        if not all_people:
-            return {"clusters": [], "cluster_count": 0, "isolated_count": 0}
+        with self.driver.session() as session:
+            result = session.run("""
+                MATCH (project:Project {safe_name: $project_safe_name})
+                      -[:HAS_PERSON]->(person:Person)
+                OPTIONAL MATCH (person)-[:HAS_FIELD_VALUE]->(fv:FieldValue)
+                WHERE fv.section_id = 'Tagged People' AND fv.field_id IN $fields
+                WITH person, collect([fv.field_id, fv.value]) AS values
+                RETURN person.id AS id, values
+                ORDER BY person.created_at DESC
+            """, project_safe_name=project_safe_name, fields=fields)
 
-        # Build adjacency map (bidirectional)
-        entity_ids = [p.get("id") for p in all_people]
-        adjacency = {eid: set() for eid in entity_ids}
+            for record in result:
+                values = {}
+                for field_id, value in record["values"]:
+                    if isinstance(value, str):
+                        try:
+                            value = json.loads(value)
+                        except json.JSONDecodeError:
+                            pass
+                    values[field_id] = value
 
-        for person in all_people:
-            person_id = person.get("id")
-            tagged_section = person.get("profile", {}).get("Tagged People", {})
-            tagged_people = tagged_section.get("tagged_people", [])
+                tagged = values.get("tagged_people")
+                if not isinstance(tagged, list):
+                    tagged = [tagged] if tagged else []
+                if not include_types:
+                    yield record["id"], tagged
+                    continue
 
-            if not isinstance(tagged_people, list):
-                tagged_people = [tagged_people] if tagged_people else []
+                relationship_types = values.get("relationship_types")
+                relationship_properties = values.get("relationship_properties")
+                yield (
+                    record["id"],
+                    tagged,
+                    relationship_types if isinstance(relationship_types, dict) else {},
+                    relationship_properties if isinstance(relationship_properties, dict) else {},
+                )
 
-            for tagged_id in tagged_people:
-                if tagged_id in adjacency:
-                    adjacency[person_id].add(tagged_id)
-                    adjacency[tagged_id].add(person_id)
+    def find_clusters(self, project_safe_name, include_entities=True, include_isolated=True,
+                      offset=0, limit=None, member_limit=None):
+        """
+        Detect connected components/clusters in the project's entity graph.
 
-        # Union-Find to detect connected components
-        parent = {eid: eid for eid in entity_ids}
+        The graph is read from the project's cached snapshot and clustered
+        with union-find over its integer indexes. Full entity data is only
+        fetched for the clusters in the requested page.
 
-        def find(x):
-            if parent[x] != x:
-                parent[x] = find(parent[x])
-            return parent[x]
-
-        def union(x, y):
-            px, py = find(x), find(y)
-            if px != py:
-                parent[px] = py
-
-        # Connect all adjacent entities
-        for eid, neighbors in adjacency.items():
-            for neighbor in neighbors:
-                union(eid, neighbor)
-
-        # Group entities by their root parent
-        clusters_map = {}
-        for eid in entity_ids:
-            root = find(eid)
-            if root not in clusters_map:
-                clusters_map[root] = []
-            clusters_map[root].append(eid)
-
-        # Fetch all entities once using batch query
-        all_entity_ids = list(entity_ids)
-        entities_map = self.get_people_batch(project_safe_name, all_entity_ids)
-
-        # Build cluster information
-        clusters = []
-        isolated_count = 0
+        Args:
+            project_safe_name: The project's safe name
+            include_entities: Whether to attach full entity data to clusters
+            include_isolated: Whether to include single-entity clusters
+            offset: Number of clusters (largest first) to skip
+            limit: Maximum number of clusters to return (None for all)
+            member_limit: Maximum entities to hydrate per cluster (None for all)
+
+        Returns:
+            dict with cluster information including sizes and members
+        """
+        snapshot = self.get_graph_snapshot(project_safe_name)
+        entity_ids = snapshot.entity_ids
+        if not entity_ids:
+            return {"clusters": [], "cluster_count": 0, "isolated_count": 0}
+
+        # Unique undirected edges between known entities (self-tags ignored)
+        edges = snapshot.undirected_pairs()
 
-        for root, members in clusters_map.items():
-            if len(members) == 1:
-                isolated_count += 1
+        # Union-Find with union by size and path halving
+        parent = list(range(len(entity_ids)))
+        size = [1] * len(entity_ids)
 
-            # Get entity data for cluster members from the batch-fetched map
-            member_entities = [entities_map[eid] for eid in members if eid in entities_map]
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for a, b in edges:
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                if size[ra] < size[rb]:
+                    ra, rb = rb, ra
+                parent[rb] = ra
+                size[ra] += size[rb]
+
+        # Group members and count internal edges per root
+        members_by_root = {}
+        for i in range(len(entity_ids)):
+            members_by_root.setdefault(find(i), []).append(i)
+
+        edge_counts = {}
+        for a, _ in edges:
+            root = find(a)
+            edge_counts[root] = edge_counts.get(root, 0) + 1
+
+        isolated_count = sum(1 for members in members_by_root.values() if len(members) == 1)
+
+        roots = [
+            root for root, members in members_by_root.items()
+            if include_isolated or len(members) > 1
+        ]
+        # Sort clusters by size (descending)
+        roots.sort(key=lambda root: len(members_by_root[root]), reverse=True)
 
-            # Count internal edges
-            internal_edges = 0
-            for eid in members:
-                for neighbor in adjacency.get(eid, set()):
-                    if neighbor in members:
-                        internal_edges += 1
-            internal_edges //= 2  # Divide by 2 since we count each edge twice
+        page = roots[offset:offset + limit] if limit is not None else roots[offset:]
 
+        entities_map = {}
+        if include_entities:
+            hydrate_ids = []
+            for root in page:
+                members = members_by_root[root]
+                if member_limit is not None:
+                    members = members[:member_limit]
+                hydrate_ids.extend(entity_ids[i] for i in members)
+            entities_map = self.get_people_batch(project_safe_name, hydrate_ids)
+
+        clusters = []
+        for root in page:
+            members = [entity_ids[i] for i in members_by_root[root]]
+            hydrated = members if member_limit is None else members[:member_limit]
             clusters.append({
-                "cluster_id": root,
+                "cluster_id": entity_ids[root],
                 "size": len(members),
                 "entity_ids": members,
-                "entities": member_entities,
-                "internal_edges": internal_edges,
+                "entities": [entities_map[eid] for eid in hydrated if eid in entities_map],
+                "internal_edges": edge_counts.get(root, 0),
                 "is_isolated": len(members) == 1
             })
 
-        # Sort clusters by size (descending)
-        clusters.sort(key=lambda x: x["size"], reverse=True)
-
         return {
-            "cluster_count": len(clusters),
+            "cluster_count": len(roots),
             "isolated_count": isolated_count,
-            "connected_clusters": len([c for c in clusters if not c["is_isolated"]]),
+            "connected_clusters": len(members_by_root) - isolated_count,
             "total_entities": len(entity_ids),
+            "offset": offset,
+            "limit": limit,
             "clusters": clusters
         }
 
@@ -1604,27 +2733,7 @@ class Neo4jHandler:
         relationship_types[target_id] = relationship_type
 
         # Set relationship properties
-        rel_props = {
-            "relationship_type": relationship_type,
-            "timestamp": properties.get("timestamp", datetime.now().isoformat()),
-        }
-        if "confidence" in properties:
-            rel_props["confidence"] = properties["confidence"]
-        if "source" in properties:
-            rel_props["source"] = properties["source"]
-        if "notes" in properties:
-            rel_props["notes"] = properties["notes"]
-        if "start_date" in properties:
-            rel_props["start_date"] = properties["start_date"]
-        if "end_date" in properties:
-            rel_props["end_date"] = properties["end_date"]
-        if "is_active" in properties:
-            rel_props["is_active"] = properties["is_active"]
-        if "verified_by" in properties:
-            rel_props["verified_by"] = properties["verified_by"]
-        if "verified_at" in properties:
-            rel_props["verified_at"] = properties["verified_at"]
-
+        rel_props = self._relationship_properties(relationship_type, properties)
         relationship_properties[target_id] = rel_props
 
         # Update the person
@@ -1650,6 +2759,85 @@ class Neo4jHandler:
             }
         return None
 
+    @staticmethod
+    def _relationship_properties(relationship_type, properties):
+        """Build the stored properties of a relationship from user-supplied ones."""
+        rel_props = {
+            "relationship_type": relationship_type,
+            "timestamp": properties.get("timestamp", datetime.now().isoformat()),
+        }
+        for key in ("confidence", "source", "notes", "start_date", "end_date",
+                    "is_active", "verified_by", "verified_at"):
+            if key in properties:
+                rel_props[key] = properties[key]
+        return rel_props
+
+    def create_relationships_batch(self, project_safe_name, relationships):
+        """
+        Create many named relationships with a fixed number of queries.
+
+        The source people's Tagged People sections are loaded in one query,
+        merged in memory and written back in one batched upsert, instead of
+        a read and an update per relationship as in create_relationship.
+
+        Args:
+            project_safe_name: The project's safe name
+            relationships: List of dicts with source_id, target_id and
+                optional relationship_type and properties
+
+        Returns:
+            List of created relationship dicts (as create_relationship
+            returns); relationships whose source or target is not in the
+            project are left out.
+        """
+        if not relationships:
+            return []
+
+        person_ids = {rel["source_id"] for rel in relationships} | {rel["target_id"] for rel in relationships}
+        people = self.get_people_batch(project_safe_name, list(person_ids), sections=["Tagged People"])
+
+        sections = {}
+        created = []
+        for rel in relationships:
+            source_id, target_id = rel["source_id"], rel["target_id"]
+            if source_id not in people or target_id not in people:
+                continue
+
+            section = sections.get(source_id)
+            if section is None:
+                stored = people[source_id].get("profile", {}).get("Tagged People", {})
+                tagged_ids = stored.get("tagged_people", []) or []
+                relationship_types = stored.get("relationship_types", {}) or {}
+                relationship_properties = stored.get("relationship_properties", {}) or {}
+                section = sections[source_id] = {
+                    "tagged_people": tagged_ids if isinstance(tagged_ids, list) else [tagged_ids],
+                    "transitive_relationships": stored.get("transitive_relationships", []) or [],
+                    "relationship_types": relationship_types if isinstance(relationship_types, dict) else {},
+                    "relationship_properties": (
+                        relationship_properties if isinstance(relationship_properties, dict) else {}
+                    ),
+                }
+
+            relationship_type = rel.get("relationship_type") or "RELATED_TO"
+            rel_props = self._relationship_properties(relationship_type, rel.get("properties") or {})
+            if target_id not in section["tagged_people"]:
+                section["tagged_people"].append(target_id)
+            section["relationship_types"][target_id] = relationship_type
+            section["relationship_properties"][target_id] = rel_props
+            created.append({
+                "source_id": source_id,
+                "target_id": target_id,
+                "relationship_type": relationship_type,
+                "properties": rel_props
+            })
+
+        if sections:
+            self.upsert_people_batch(project_safe_name, [
+                {"id": source_id, "profile": {"Tagged People": section}}
+                for source_id, section in sections.items()
+            ])
+        return created
+
     def get_relationship(self, project_safe_name, source_id, target_id):
         """
         Get a specific relationship between two persons.
@@ -1824,10 +3012,9 @@ class Neo4jHandler:
         Returns:
             List of relationship dicts
         """
-        people = self.get_all_people(project_safe_name)
         relationships = []
 
-        for person in people:
+        for person in self.iter_people(project_safe_name, sections=["Tagged People"]):
             if not person:
                 continue
 
@@ -89,6 +89,11 @@ def mock_neo4j_handler():
 
     handler.delete_person.return_value = True
 
+    # Identifier key layer not built; callers fall back to in-memory matching
+    handler.find_identifier_matches.return_value = None
+    handler.find_cross_project_identifier_matches.return_value = None
+    handler.find_fulltext_candidates.return_value = None
+
     # Mock file methods
     handler.get_file.return_value = {
         "id": "test-file-id",
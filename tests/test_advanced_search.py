@@ -129,6 +129,7 @@ def mock_neo4j_handler():
     }.get(id))
 
     handler.execute_query = MagicMock(return_value=[])
+    handler.find_fulltext_candidates = MagicMock(return_value=None)
 
     return handler
 
@@ -782,6 +783,74 @@ class TestAdvancedSearchIntegration:
         assert total >= 2
 
 
+# ----- Full-Text Pushdown Tests -----
+
+class TestFullTextPushdown:
+    """Tests for compiling boolean queries into a full-text pre-filter."""
+
+    def _compile(self, search_service, query_parser, query):
+        return search_service._compile_fulltext_query(query_parser.parse(query).tokens)
+
+    def test_compile_single_term(self, search_service, query_parser):
+        """Test a word compiles to a substring wildcard."""
+        assert self._compile(search_service, query_parser, "John") == "*john*"
+
+    def test_compile_splits_literal_fragments(self, search_service, query_parser):
+        """Test punctuation and wildcards split a term into required fragments."""
+        compiled = self._compile(search_service, query_parser, "email:john.doe@gmail.com")
+        assert compiled == "(*john* AND *doe* AND *gmail* AND *com*)"
+        assert self._compile(search_service, query_parser, "phone:555*") == "*555*"
+
+    def test_compile_and_or(self, search_service, query_parser):
+        """Test groups and operators are combined like the evaluator."""
+        compiled = self._compile(search_service, query_parser, "(john OR jane) AND gmail")
+        assert compiled == "((*john* OR *jane*) AND *gmail*)"
+
+    def test_compile_negation_is_unconstrained(self, search_service, query_parser):
+        """Test negated terms never narrow the candidates."""
+        assert self._compile(search_service, query_parser, "john AND NOT archived") == "*john*"
+        assert self._compile(search_service, query_parser, "john OR NOT archived") is None
+        assert self._compile(search_service, query_parser, "NOT archived") is None
+
+    def test_compile_short_fragments_are_unconstrained(self, search_service, query_parser):
+        """Test fragments below the minimum length are not pushed down."""
+        assert self._compile(search_service, query_parser, "jo") is None
+        assert self._compile(search_service, query_parser, "jo AND smith") == "*smith*"
+
+    @pytest.mark.asyncio
+    async def test_search_uses_candidates(self, search_service, mock_neo4j_handler):
+        """Test only full-text candidates are fetched and residually filtered."""
+        people = {p["id"]: p for p in mock_neo4j_handler.get_all_people.return_value}
+        mock_neo4j_handler.find_fulltext_candidates.return_value = {
+            "test_project": ["person-2", "person-1"]
+        }
+        mock_neo4j_handler.get_people_batch = MagicMock(
+            side_effect=lambda project, ids: {eid: people[eid] for eid in ids}
+        )
+        mock_neo4j_handler.get_all_people.reset_mock()
+
+        query = SearchQuery(query='"John Doe"', project_id="project-123", advanced=True)
+        results, total = await search_service.search(query)
+
+        assert [r.entity_id for r in results] == ["person-1"]
+        mock_neo4j_handler.find_fulltext_candidates.assert_called_once_with(
+            ["test_project"], "(*john* AND *doe*)"
+        )
+        mock_neo4j_handler.get_people_batch.assert_called_once_with(
+            "test_project", ["person-2", "person-1"]
+        )
+        mock_neo4j_handler.get_all_people.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_without_index_scans(self, search_service, mock_neo4j_handler):
+        """Test a missing full-text index falls back to scanning entities."""
+        query = SearchQuery(query='"John Doe"', project_id="project-123", advanced=True)
+        results, total = await search_service.search(query)
+
+        assert any(r.entity_id == "person-1" for r in results)
+        mock_neo4j_handler.get_all_people.assert_called_once_with("test_project")
+
+
 # ----- Performance and Stress Tests -----
 
 class TestPerformance:
@@ -30,6 +30,20 @@ class TestEntityEndpoints:
         assert isinstance(data, list)
         assert len(data) == 1
 
+    def test_list_entities_with_projection(self, mock_neo4j_handler):
+        """Test listing entities restricted to specific fields and sections."""
+        client = get_test_client(mock_neo4j_handler)
+
+        response = client.get(
+            "/api/v1/projects/test_project/entities/",
+            params={"fields": "core.name, core.email", "sections": "social"}
+        )
+
+        assert response.status_code == 200
+        mock_neo4j_handler.get_all_people.assert_called_once_with(
+            "test_project", fields=["core.name", "core.email"], sections=["social"]
+        )
+
     def test_list_entities_project_not_found(self, mock_neo4j_handler):
         """Test listing entities for non-existent project."""
         mock_neo4j_handler.get_project.return_value = None
@@ -39,6 +53,39 @@ class TestEntityEndpoints:
 
         assert response.status_code == 404
 
+    def test_list_entities_page(self, mock_neo4j_handler):
+        """Test listing one page of entities with a next cursor."""
+        mock_neo4j_handler.get_people_page.return_value = (
+            [{"id": "test-entity-id", "created_at": "2024-01-15T10:30:00", "profile": {}}],
+            "next-page"
+        )
+        client = get_test_client(mock_neo4j_handler)
+
+        response = client.get(
+            "/api/v1/projects/test_project/entities/page",
+            params={"cursor": "this-page", "limit": 1}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 1
+        assert data["next_cursor"] == "next-page"
+        mock_neo4j_handler.get_people_page.assert_called_once_with(
+            "test_project", cursor="this-page", limit=1, fields=None, sections=None
+        )
+
+    def test_list_entities_page_invalid_cursor(self, mock_neo4j_handler):
+        """Test that a malformed cursor is rejected."""
+        mock_neo4j_handler.get_people_page.side_effect = ValueError("Invalid cursor: 'x'")
+        client = get_test_client(mock_neo4j_handler)
+
+        response = client.get(
+            "/api/v1/projects/test_project/entities/page",
+            params={"cursor": "x"}
+        )
+
+        assert response.status_code == 400
+
     def test_create_entity(self, mock_neo4j_handler):
         """Test creating a new entity."""
         client = get_test_client(mock_neo4j_handler)
@@ -80,6 +127,20 @@ class TestEntityEndpoints:
         assert data["id"] == "test-person-id"
         assert "profile" in data
 
+    def test_get_entity_with_projection(self, mock_neo4j_handler):
+        """Test getting an entity restricted to specific sections."""
+        client = get_test_client(mock_neo4j_handler)
+
+        response = client.get(
+            "/api/v1/projects/test_project/entities/test-person-id",
+            params={"sections": "core"}
+        )
+
+        assert response.status_code == 200
+        mock_neo4j_handler.get_person.assert_called_once_with(
+            "test_project", "test-person-id", fields=None, sections=["core"]
+        )
+
     def test_get_entity_not_found(self, mock_neo4j_handler):
         """Test getting a non-existent entity."""
         mock_neo4j_handler.get_person.return_value = None
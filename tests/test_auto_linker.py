@@ -537,3 +537,209 @@ class TestAutoLinkerSingleton:
         new_handler = MagicMock()
         linker = get_auto_linker(new_handler)
         assert linker.neo4j_handler is new_handler
+
+
+class TestIdentifierIndex:
+    """Tests for the inverted identifier index used to block candidate pairs."""
+
+    @pytest.fixture
+    def index(self):
+        from api.services.auto_linker import IdentifierIndex
+        index = IdentifierIndex()
+        index.add_entity("e1", {"core.email": ["a@x.com", "b@x.com"]}, "One")
+        index.add_entity("e2", {"core.email": ["a@x.com"]}, "Two")
+        index.add_entity("e3", {"core.email": ["c@x.com"]}, "Three")
+        return index
+
+    def test_find_candidates(self, index):
+        """Only entities sharing a key are returned, excluding the source."""
+        candidates = index.find_candidates({"core.email": ["a@x.com"]}, exclude_id="e1")
+        assert candidates == {"e2": [("core.email", "a@x.com")]}
+
+    def test_candidate_pairs_only_share_keys(self, index):
+        """Entities without shared keys never form a pair."""
+        pairs = index.candidate_pairs()
+        assert list(pairs.keys()) == [("e1", "e2")]
+
+    def test_replace_and_remove_entity(self, index):
+        """Re-adding an entity replaces its keys; removing drops empty postings."""
+        index.add_entity("e2", {"core.email": ["c@x.com"]}, "Two")
+        assert list(index.candidate_pairs().keys()) == [("e2", "e3")]
+
+        index.remove_entity("e3")
+        assert index.candidate_pairs() == {}
+        assert "e3" not in index
+        assert index.key_count == 3
+
+    def test_auto_link_all_matches_all_pairs_scan(self, auto_linker_with_paths, sample_entities, mock_neo4j_handler):
+        """Blocked scan finds the shared-email and shared-username pairs."""
+        mock_neo4j_handler.get_all_people.return_value = sample_entities
+
+        result = auto_linker_with_paths.auto_link_all("test_project")
+
+        pairs = {
+            (s["source_entity_id"], s["target_entity_id"])
+            for s in result["potential_duplicates"] + result["suggested_links"]
+        }
+        assert pairs == {("entity-1", "entity-2"), ("entity-1", "entity-4")}
+        assert result["entities_with_identifiers"] == 4
+
+    def test_find_matching_entities_reuses_index(self, auto_linker_with_paths, sample_entities, mock_neo4j_handler):
+        """Repeated single-entity lookups do not reload the whole project."""
+        mock_neo4j_handler.get_person.return_value = sample_entities[0]
+        mock_neo4j_handler.get_all_people.return_value = sample_entities
+
+        auto_linker_with_paths.find_matching_entities("test_project", "entity-1", min_confidence=0)
+        suggestions = auto_linker_with_paths.find_matching_entities("test_project", "entity-1", min_confidence=0)
+
+        assert mock_neo4j_handler.get_all_people.call_count == 1
+        assert {s.target_entity_id for s in suggestions} == {"entity-2", "entity-4"}
+
+    def test_change_events_update_cached_index(self, auto_linker_with_paths, sample_entities, mock_neo4j_handler):
+        """Writes reported by the handler reach the cached index without a rebuild."""
+        mock_neo4j_handler.add_change_listener.assert_called_once_with(
+            auto_linker_with_paths._handle_entity_change
+        )
+        mock_neo4j_handler.get_all_people.return_value = sample_entities
+        index = auto_linker_with_paths.get_identifier_index("test_project")
+        mock_neo4j_handler.get_people_batch.return_value = {
+            "entity-5": {"id": "entity-5", "profile": {"core": {"email": ["jane.smith@example.com"]}}}
+        }
+
+        auto_linker_with_paths._handle_entity_change("people_created", "test_project", ["entity-5"])
+        auto_linker_with_paths._handle_entity_change("people_deleted", "test_project", ["entity-1"])
+
+        assert auto_linker_with_paths.get_identifier_index("test_project") is index
+        assert mock_neo4j_handler.get_all_people.call_count == 1
+        assert list(index.candidate_pairs().keys()) == [("entity-3", "entity-5")]
+
+        auto_linker_with_paths._handle_entity_change("project_deleted", "test_project", [])
+        assert auto_linker_with_paths.get_identifier_index("test_project") is not index
+
+    @pytest.fixture
+    def auto_linker_with_paths(self, mock_neo4j_handler):
+        from api.services.auto_linker import AutoLinker
+        linker = AutoLinker(mock_neo4j_handler)
+        linker.identifier_paths = [
+            {"path": "core.email", "section_id": "core", "field_id": "email",
+             "component_id": None, "field_type": "email", "multiple": True},
+            {"path": "social_major.instagram.username", "section_id": "social_major",
+             "field_id": "instagram", "component_id": "username", "field_type": "string", "multiple": True}
+        ]
+        return linker
+
+    @pytest.fixture
+    def sample_entities(self):
+        return [
+            {"id": "entity-1", "profile": {
+                "core": {"email": ["john.doe@example.com"]},
+                "social_major": {"instagram": [{"username": "johndoe123"}]}}},
+            {"id": "entity-2", "profile": {"core": {"email": ["John.Doe@example.com"]}}},
+            {"id": "entity-3", "profile": {"core": {"email": ["jane.smith@example.com"]}}},
+            {"id": "entity-4", "profile": {
+                "core": {"email": ["bob@example.com"]},
+                "social_major": {"instagram": [{"username": "johndoe123"}]}}},
+        ]
+
+
+class TestIdentifierKeyLayer:
+    """Tests for suggestions served from the Neo4j IdentifierKey layer."""
+
+    def test_find_matching_entities_uses_key_lookup(self, mock_neo4j_handler):
+        """When the key layer is built, no profiles are loaded."""
+        from api.services.auto_linker import AutoLinker
+
+        mock_neo4j_handler.find_identifier_matches.return_value = [
+            {
+                "entity_id": "entity-2",
+                "keys": [{"path": "core.email", "value": "john@example.com"}],
+                "profile": {"core": {"name": [{"first_name": "John", "last_name": "Doe"}]}}
+            }
+        ]
+        linker = AutoLinker(mock_neo4j_handler)
+
+        suggestions = linker.find_matching_entities("test_project", "entity-1", min_confidence=0)
+
+        assert len(suggestions) == 1
+        assert suggestions[0].target_entity_id == "entity-2"
+        assert suggestions[0].target_entity_name == "John Doe"
+        assert suggestions[0].matching_identifiers[0].path == "core.email"
+        mock_neo4j_handler.get_all_people.assert_not_called()
+
+    def test_handler_builds_keys_for_identifier_fields_only(self):
+        """Only configured identifier fields produce normalized keys."""
+        import json
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler._identifier_paths = [
+            {"path": "core.email", "section_id": "core", "field_id": "email",
+             "component_id": None, "field_type": "email", "multiple": True},
+            {"path": "social.twitter.handle", "section_id": "social", "field_id": "twitter",
+             "component_id": "handle", "field_type": "string", "multiple": True},
+        ]
+
+        field_keys, key_rows = handler._build_identifier_keys({
+            "core": {"email": json.dumps(["A@X.com", "a@x.com"]), "name": "John"},
+            "social": {"twitter": [{"handle": "@JDoe"}]},
+        })
+
+        assert field_keys == [
+            {"section_id": "core", "field_id": "email"},
+            {"section_id": "social", "field_id": "twitter"},
+        ]
+        assert sorted((r["path"], r["value"]) for r in key_rows) == [
+            ("core.email", "a@x.com"),
+            ("social.twitter.handle", "@jdoe"),
+        ]
+
+    def test_delete_project_drops_only_its_orphaned_keys(self):
+        """Deleting a project releases its own keys instead of scanning every key."""
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler.driver = MagicMock()
+        session = handler.driver.session.return_value.__enter__.return_value
+        session.run.return_value.single.return_value = {"deleted_count": 1}
+
+        assert handler.delete_project("test_project")
+
+        queries = [c.args[0] for c in session.run.call_args_list]
+        assert "HAS_IDENTIFIER_KEY" in queries[0] and "$safe_name" in queries[0]
+        assert all(
+            "HAS_IDENTIFIER_KEY" not in q or "{safe_name: $safe_name}" in q for q in queries
+        )
+
+    def test_rebuild_keys_is_not_ready_until_every_batch_is_written(self):
+        """The layer is marked not ready while rebuilding and after a failed rebuild."""
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler._identifier_paths = [
+            {"path": "core.email", "section_id": "core", "field_id": "email",
+             "component_id": None, "field_type": "email", "multiple": True},
+        ]
+        handler.driver = MagicMock()
+        session = handler.driver.session.return_value.__enter__.return_value
+        session.run.side_effect = lambda query, **params: (
+            [{"id": f"p{i}"} for i in range(3)] if "RETURN person.id" in query else MagicMock()
+        )
+        handler._read_people_batch = MagicMock(side_effect=lambda tx, project, ids, fields: {
+            person_id: {"id": person_id, "profile": {"core": {"email": f"{person_id}@x.com"}}}
+            for person_id in ids
+        })
+        tx = MagicMock()
+        session.execute_write.side_effect = lambda work, *args: work(tx, *args)
+
+        assert handler.rebuild_identifier_keys("test_project", batch_size=2) == 3
+
+        queries = [c.args[0] for c in session.run.call_args_list]
+        assert "identifier_keys_ready = false" in queries[0]
+        assert "identifier_keys_ready = true" in queries[-1]
+        assert [c.args[2] for c in session.execute_write.call_args_list] == [["p0", "p1"], ["p2"]]
+
+        session.run.reset_mock()
+        session.execute_write.side_effect = RuntimeError("connection lost")
+        with pytest.raises(RuntimeError):
+            handler.rebuild_identifier_keys("test_project", batch_size=2)
+        assert not any("identifier_keys_ready = true" in c.args[0] for c in session.run.call_args_list)
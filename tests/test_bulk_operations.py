@@ -72,6 +72,16 @@ def mock_neo4j_handler():
         }
     ]
 
+    handler.iter_people.side_effect = (
+        lambda project_id, **kwargs: iter(handler.get_all_people.return_value or [])
+    )
+    handler.iter_people_pages.side_effect = (
+        lambda project_id, **kwargs: iter(handler.get_all_people.return_value or [])
+    )
+    handler.get_people_count.side_effect = (
+        lambda project_id: len(handler.get_all_people.return_value or [])
+    )
+
     handler.get_person.return_value = None  # Default to not found
 
     def create_person_side_effect(project_id, person_data):
@@ -98,6 +108,24 @@ def mock_neo4j_handler():
 
     handler.update_person.side_effect = update_person_side_effect
 
+    def get_person_projects_side_effect(person_ids):
+        # Existing entities are the ones get_person finds in the test project
+        return {
+            person_id: "test_project" for person_id in person_ids
+            if handler.get_person("test_project", person_id)
+        }
+
+    handler.get_person_projects.side_effect = get_person_projects_side_effect
+
+    def upsert_people_batch_side_effect(project_id, people_data):
+        existing = get_person_projects_side_effect([p["id"] for p in people_data])
+        return {
+            "created": [p["id"] for p in people_data if p["id"] not in existing],
+            "updated": [p["id"] for p in people_data if p["id"] in existing],
+        }
+
+    handler.upsert_people_batch.side_effect = upsert_people_batch_side_effect
+
     return handler
 
 
@@ -274,6 +302,56 @@ class TestBulkOperationsService:
         assert result.successful == 1
         assert result.failed == 0
 
+    def test_import_entities_batches_round_trips(self, bulk_service, mock_neo4j_handler):
+        """Test mixed creates and updates cost one check and one upsert per batch."""
+        mock_neo4j_handler.get_person_projects.side_effect = (
+            lambda ids: {i: "test_project" for i in ids if i.startswith("old")}
+        )
+        mock_neo4j_handler.upsert_people_batch.side_effect = lambda project_id, people: {
+            "created": [p["id"] for p in people if not p["id"].startswith("old")],
+            "updated": [p["id"] for p in people if p["id"].startswith("old")],
+        }
+        entities = [{"id": f"old-{i}"} if i % 2 else {"profile": {}} for i in range(250)]
+
+        result = bulk_service.import_entities(
+            "test_project", entities, update_existing=True, batch_size=100
+        )
+
+        assert result.successful == 250
+        assert mock_neo4j_handler.get_person_projects.call_count == 3
+        assert mock_neo4j_handler.upsert_people_batch.call_count == 3
+        mock_neo4j_handler.get_person.assert_not_called()
+        mock_neo4j_handler.update_person.assert_not_called()
+        assert [b["size"] for b in result.batches] == [100, 100, 50]
+        assert all(b["duration_ms"] >= 0 and b["successful"] == b["size"] for b in result.batches)
+        assert result.to_dict()["batches"] == result.batches
+
+    def test_import_entities_rejects_foreign_and_duplicate_ids(self, bulk_service, mock_neo4j_handler):
+        """Test IDs owned by another project or repeated in the import fail alone."""
+        mock_neo4j_handler.get_person_projects.side_effect = (
+            lambda ids: {"foreign": "other_project"} if "foreign" in ids else {}
+        )
+        entities = [{"id": "foreign"}, {"id": "new"}, {"id": "new"}]
+
+        result = bulk_service.import_entities("test_project", entities, update_existing=True)
+
+        assert result.created_ids == ["new"]
+        assert [e["index"] for e in result.errors] == [0, 2]
+        assert "another project" in result.errors[0]["error"]
+        assert "Duplicate" in result.errors[1]["error"]
+
+    def test_import_entities_upsert_failure(self, bulk_service, mock_neo4j_handler):
+        """Test a failed upsert marks every row of its batch as failed."""
+        mock_neo4j_handler.upsert_people_batch.side_effect = RuntimeError("boom")
+
+        result = bulk_service.import_entities(
+            "test_project", [{"profile": {}} for _ in range(3)], batch_size=2
+        )
+
+        assert result.failed == 3
+        assert [b["failed"] for b in result.batches] == [2, 1]
+        assert "boom" in result.errors[0]["error"]
+
     def test_export_entities_json(self, bulk_service):
         """Test exporting entities to JSON format."""
         options = BulkExportOptions(format="json")
@@ -405,6 +483,26 @@ class TestBulkOperationsService:
         assert "id" in lines[0]
         assert "profile.core.email" in lines[0]
 
+    def test_export_to_csv_loads_only_requested_fields(self, bulk_service):
+        """Test CSV export streams people restricted to the requested profile fields."""
+        bulk_service.export_to_csv("test_project", ["id", "profile.core.email", "profile.Tagged People"])
+
+        bulk_service.neo4j_handler.iter_people.assert_called_once_with(
+            "test_project", fields=["core.email", "Tagged People"]
+        )
+
+    def test_streaming_export_uses_cursor_pages(self, bulk_service):
+        """Test streaming exports walk the project with cursor pagination."""
+        lines = list(bulk_service.stream_jsonl_export(
+            "test_project", BulkExportOptions(format="jsonl", batch_size=1)
+        ))
+
+        assert [json.loads(line)["id"] for line in lines] == ["person-1", "person-2"]
+        bulk_service.neo4j_handler.iter_people_pages.assert_called_once_with(
+            "test_project", page_size=1
+        )
+        bulk_service.neo4j_handler.get_all_people_paginated.assert_not_called()
+
     def test_export_to_csv_project_not_found(self, bulk_service):
         """Test CSV export from non-existent project."""
         bulk_service.neo4j_handler.get_project.return_value = None
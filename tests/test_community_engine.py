@@ -0,0 +1,220 @@
+"""
+Tests for the in-process community detection engine.
+
+These tests cover:
+- CSR construction and aggregation (with and without NumPy)
+- Louvain, label propagation and connected components
+- Modularity against known values
+- Hubs, bridges and community edge statistics
+- Caching of partitions per graph snapshot
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.services import community_engine
+from api.services.community_engine import (
+    CommunityGraph,
+    connected_components,
+    detect_communities,
+    get_project_communities,
+    label_propagation,
+    louvain,
+    modularity,
+)
+from graph_snapshot import GraphSnapshot
+
+
+# Two triangles joined by the edge c-d, plus an isolated entity
+ROWS = [
+    ("a", ["b", "c"]),
+    ("b", ["c"]),
+    ("c", ["d"]),
+    ("d", ["e", "f"]),
+    ("e", ["f"]),
+    ("f", []),
+    ("g", []),
+]
+
+
+def ring_of_cliques(clique_count, clique_size):
+    """Build undirected pairs of cliques connected in a ring."""
+    pairs = set()
+    for k in range(clique_count):
+        base = k * clique_size
+        for i in range(clique_size):
+            for j in range(i + 1, clique_size):
+                pairs.add((base + i, base + j))
+        neighbor = ((k + 1) % clique_count) * clique_size
+        pairs.add((min(base, neighbor), max(base, neighbor)))
+    return pairs
+
+
+@pytest.fixture
+def snapshot():
+    """Create a snapshot of the two-triangle graph."""
+    return GraphSnapshot.build("project", ROWS, version=2)
+
+
+class TestCommunityGraph:
+    """Tests for CommunityGraph."""
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_from_pairs(self, numpy_available):
+        """Test that pairs are stored in both directions."""
+        with patch.object(community_engine, "NUMPY_AVAILABLE", numpy_available and community_engine.NUMPY_AVAILABLE):
+            graph = CommunityGraph.from_pairs(3, {(0, 1), (1, 2)})
+
+        assert graph.offsets == [0, 1, 3, 4]
+        assert sorted(graph.targets[1:3]) == [0, 2]
+        assert graph.degrees == [1.0, 2.0, 1.0]
+        assert graph.total_weight == 4.0
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_aggregate_keeps_degrees(self, numpy_available):
+        """Test that aggregated nodes keep the summed degree of their members."""
+        with patch.object(community_engine, "NUMPY_AVAILABLE", numpy_available and community_engine.NUMPY_AVAILABLE):
+            graph = CommunityGraph.from_pairs(4, {(0, 1), (1, 2), (2, 3)})
+            aggregated = graph.aggregate([0, 0, 1, 1], 2)
+
+        assert aggregated.degrees == [3.0, 3.0]
+        assert aggregated.total_weight == graph.total_weight
+        edges = {
+            (i, aggregated.targets[e]): aggregated.weights[e]
+            for i in range(2)
+            for e in range(aggregated.offsets[i], aggregated.offsets[i + 1])
+        }
+        assert edges == {(0, 0): 2.0, (0, 1): 1.0, (1, 0): 1.0, (1, 1): 2.0}
+
+
+class TestAlgorithms:
+    """Tests for the detection algorithms and modularity."""
+
+    def test_modularity_of_two_triangles(self):
+        """Test modularity against the value computed by hand."""
+        graph = CommunityGraph.from_pairs(6, {(0, 1), (0, 2), (1, 2), (2, 3), (3, 4), (3, 5), (4, 5)})
+
+        assert modularity(graph, [0, 0, 0, 1, 1, 1]) == pytest.approx(5 / 14)
+        assert modularity(graph, [0] * 6) == pytest.approx(0.0)
+
+    def test_modularity_without_edges(self):
+        """Test that a graph without edges has zero modularity."""
+        assert modularity(CommunityGraph.from_pairs(3, []), [0, 1, 2]) == 0.0
+
+    def test_louvain_finds_cliques(self):
+        """Test that Louvain separates cliques joined by single edges."""
+        graph = CommunityGraph.from_pairs(40, ring_of_cliques(8, 5))
+
+        labels = louvain(graph)
+
+        assert len(set(labels)) == 8
+        for k in range(8):
+            assert len(set(labels[k * 5:(k + 1) * 5])) == 1
+
+    def test_louvain_resolution(self):
+        """Test that a low resolution merges communities."""
+        graph = CommunityGraph.from_pairs(40, ring_of_cliques(8, 5))
+
+        assert len(set(louvain(graph, resolution=0.1))) < len(set(louvain(graph, resolution=1.0)))
+
+    def test_louvain_is_deterministic(self):
+        """Test that the same seed gives the same partition."""
+        graph = CommunityGraph.from_pairs(40, ring_of_cliques(8, 5))
+
+        assert louvain(graph, seed=7) == louvain(graph, seed=7)
+
+    def test_label_propagation_finds_cliques(self):
+        """Test that label propagation keeps cliques together."""
+        graph = CommunityGraph.from_pairs(40, ring_of_cliques(8, 5))
+
+        labels = label_propagation(graph)
+
+        for k in range(8):
+            assert len(set(labels[k * 5 + 1:(k + 1) * 5])) == 1
+
+    def test_connected_components(self):
+        """Test component labels including isolated nodes."""
+        graph = CommunityGraph.from_pairs(5, {(0, 1), (2, 3)})
+
+        assert connected_components(graph) == [0, 0, 1, 1, 2]
+
+
+class TestDetectCommunities:
+    """Tests for partitions built from graph snapshots."""
+
+    def test_partition(self, snapshot):
+        """Test communities, modularity, hubs and bridges."""
+        partition = detect_communities(snapshot)
+
+        assert partition.modularity == pytest.approx(5 / 14)
+        assert partition.total_entities == 7
+        assert partition.version == 2
+        assert [c.community_id for c in partition.communities] == ["community_0", "community_1", "community_2"]
+
+        first, second, isolated = partition.communities
+        assert set(first.member_ids) == {"a", "b", "c"}
+        assert first.member_ids[0] == "c"
+        assert first.internal_edges == 3
+        assert first.external_edges == 1
+        assert first.density == 1.0
+        assert first.cohesion == 0.75
+        assert first.bridge_entities == ["c"]
+        assert first.connected_communities == ["community_1"]
+        assert set(second.member_ids) == {"d", "e", "f"}
+        assert isolated.member_ids == ["g"]
+        assert isolated.is_isolated and isolated.hub_entities == []
+
+    def test_entity_membership(self, snapshot):
+        """Test roles, membership scores and overlapping communities."""
+        partition = detect_communities(snapshot, hub_count=1)
+
+        assert partition.entity_membership("c") == {
+            "community_id": "community_0",
+            "role": "hub",
+            "membership_score": pytest.approx(2 / 3, abs=1e-4),
+            "overlapping_communities": [
+                {"community_id": "community_1", "edge_count": 1, "membership_score": pytest.approx(1 / 3, abs=1e-4)}
+            ],
+        }
+        assert partition.entity_membership("a")["role"] == "member"
+        assert partition.entity_membership("g")["role"] == "isolated"
+        assert partition.entity_membership("missing") is None
+
+    def test_connected_components_algorithm(self, snapshot):
+        """Test that components keep the bridged triangles together."""
+        partition = detect_communities(snapshot, algorithm="connected_components")
+
+        assert [c.size for c in partition.communities] == [6, 1]
+        assert partition.modularity == pytest.approx(0.0)
+
+    def test_unsupported_algorithm(self, snapshot):
+        """Test that unknown algorithms are rejected."""
+        with pytest.raises(ValueError):
+            detect_communities(snapshot, algorithm="girvan_newman")
+
+    def test_empty_snapshot(self):
+        """Test a project without entities."""
+        partition = detect_communities(GraphSnapshot.build("project", []))
+
+        assert partition.communities == []
+        assert partition.modularity == 0.0
+
+
+class TestProjectCommunities:
+    """Tests for caching partitions per graph snapshot."""
+
+    def test_partition_is_cached_per_snapshot(self):
+        """Test that a partition is computed once per snapshot and parameters."""
+        handler = MagicMock()
+        handler.get_graph_snapshot.return_value = GraphSnapshot.build("project", ROWS)
+
+        with patch.object(community_engine, "detect_communities", wraps=detect_communities) as detect:
+            first = get_project_communities(handler, "project")
+            assert get_project_communities(handler, "project") is first
+            get_project_communities(handler, "project", resolution=2.0)
+            assert detect.call_count == 2
+
+            handler.get_graph_snapshot.return_value = GraphSnapshot.build("project", ROWS, version=1)
+            assert get_project_communities(handler, "project") is not first
+            assert detect.call_count == 3
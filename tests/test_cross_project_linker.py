@@ -10,10 +10,15 @@ These tests cover cross-project linking functionality:
 
 import pytest
 from datetime import datetime
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import MagicMock, patch
 from fastapi.testclient import TestClient
 
 
+def handler_session(handler):
+    """Get the session a mocked handler's driver hands out."""
+    return handler.driver.session.return_value.__enter__.return_value
+
+
 def get_test_client(mock_handler):
     """Create a test client with mocked dependencies."""
     from api.main import app
@@ -121,15 +126,15 @@ class TestCrossProjectLinkerService:
     """Tests for the CrossProjectLinker service class."""
 
     @pytest.fixture
-    def async_mock_neo4j_handler(self):
-        """Create an async mock Neo4j handler."""
-        handler = MagicMock()
+    def mock_handler(self):
+        """Create a mock with the synchronous Neo4jHandler interface."""
+        from neo4j_handler import Neo4jHandler
 
-        # Setup async mocks
-        handler.get_person = AsyncMock()
-        handler.get_all_people = AsyncMock()
-        handler.get_all_projects = AsyncMock()
-        handler.session = MagicMock()
+        handler = MagicMock(spec=Neo4jHandler)
+        handler.driver = MagicMock()
+
+        # Identifier key layer not built; falls back to scanning projects
+        handler.find_cross_project_identifier_matches.return_value = None
 
         # Default return values
         handler.get_person.return_value = {
@@ -151,10 +156,10 @@ class TestCrossProjectLinkerService:
         return handler
 
     @pytest.fixture
-    def cross_project_linker(self, async_mock_neo4j_handler):
+    def cross_project_linker(self, mock_handler):
         """Create a CrossProjectLinker instance with mock handler."""
         from api.services.cross_project_linker import CrossProjectLinker
-        linker = CrossProjectLinker(async_mock_neo4j_handler)
+        linker = CrossProjectLinker(mock_handler)
         return linker
 
     def test_valid_link_types(self, cross_project_linker):
@@ -168,26 +173,34 @@ class TestCrossProjectLinkerService:
         assert "FAMILY" in valid_types
         assert "ORGANIZATION" in valid_types
 
-    def test_normalize_email(self, cross_project_linker):
+    def test_normalize_email(self):
         """Test email normalization."""
-        assert cross_project_linker._normalize_value("John.Doe@Example.COM", "email") == "john.doe@example.com"
-        assert cross_project_linker._normalize_value("  TEST@test.com  ", "email") == "test@test.com"
+        from config_loader import normalize_identifier_value
+
+        assert normalize_identifier_value("John.Doe@Example.COM", "email") == "john.doe@example.com"
+        assert normalize_identifier_value("  TEST@test.com  ", "email") == "test@test.com"
 
-    def test_normalize_phone(self, cross_project_linker):
+    def test_normalize_phone(self):
         """Test phone number normalization."""
-        assert cross_project_linker._normalize_value("+1 (555) 123-4567", "phone") == "+15551234567"
-        assert cross_project_linker._normalize_value("555.123.4567", "phone") == "5551234567"
+        from config_loader import normalize_identifier_value
 
-    def test_normalize_empty_values(self, cross_project_linker):
+        assert normalize_identifier_value("+1 (555) 123-4567", "phone") == "+15551234567"
+        assert normalize_identifier_value("555.123.4567", "phone") == "5551234567"
+
+    def test_normalize_empty_values(self):
         """Test normalization of empty values."""
-        assert cross_project_linker._normalize_value(None, "string") is None
-        assert cross_project_linker._normalize_value("", "string") is None
-        assert cross_project_linker._normalize_value("   ", "string") is None
+        from config_loader import normalize_identifier_value
+
+        assert normalize_identifier_value(None, "string") is None
+        assert normalize_identifier_value("", "string") is None
+        assert normalize_identifier_value("   ", "string") is None
 
-    def test_normalize_complex_values(self, cross_project_linker):
+    def test_normalize_complex_values(self):
         """Test that complex values (dict, list) return None."""
-        assert cross_project_linker._normalize_value({"key": "value"}, "string") is None
-        assert cross_project_linker._normalize_value(["a", "b"], "string") is None
+        from config_loader import normalize_identifier_value
+
+        assert normalize_identifier_value({"key": "value"}, "string") is None
+        assert normalize_identifier_value(["a", "b"], "string") is None
 
     def test_extract_identifiers(self, cross_project_linker):
         """Test identifier extraction from entity profiles."""
@@ -218,17 +231,10 @@ class TestCrossProjectLinkerService:
         assert "john@example.com" in identifiers["core.email"]
 
     @pytest.mark.asyncio
-    async def test_link_entities_success(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_link_entities_success(self, cross_project_linker, mock_handler):
         """Test successful entity linking."""
-        # Setup mock session context manager
-        mock_session = AsyncMock()
-        mock_session.run = AsyncMock()
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock()
-        async_mock_neo4j_handler.session.return_value = mock_session
-
         # Setup get_person to return different entities
-        async_mock_neo4j_handler.get_person.side_effect = [
+        mock_handler.get_person.side_effect = [
             {"id": "entity-123", "profile": {}},  # source
             {"id": "entity-456", "profile": {}}   # target
         ]
@@ -249,9 +255,10 @@ class TestCrossProjectLinkerService:
         assert link.target_entity_id == "entity-456"
         assert link.link_type == "SAME_PERSON"
         assert link.confidence == 0.95
+        assert "MERGE (source)-[r:CROSS_PROJECT_LINK" in handler_session(mock_handler).run.call_args.args[0]
 
     @pytest.mark.asyncio
-    async def test_link_entities_invalid_type(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_link_entities_invalid_type(self, cross_project_linker, mock_handler):
         """Test linking with invalid link type raises error."""
         with pytest.raises(ValueError, match="Invalid link type"):
             await cross_project_linker.link_entities(
@@ -263,9 +270,9 @@ class TestCrossProjectLinkerService:
             )
 
     @pytest.mark.asyncio
-    async def test_link_entities_self_linking(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_link_entities_self_linking(self, cross_project_linker, mock_handler):
         """Test that self-linking raises error."""
-        async_mock_neo4j_handler.get_person.return_value = {"id": "entity-123", "profile": {}}
+        mock_handler.get_person.return_value = {"id": "entity-123", "profile": {}}
 
         with pytest.raises(ValueError, match="Cannot link an entity to itself"):
             await cross_project_linker.link_entities(
@@ -277,9 +284,9 @@ class TestCrossProjectLinkerService:
             )
 
     @pytest.mark.asyncio
-    async def test_link_entities_source_not_found(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_link_entities_source_not_found(self, cross_project_linker, mock_handler):
         """Test linking when source entity doesn't exist."""
-        async_mock_neo4j_handler.get_person.return_value = None
+        mock_handler.get_person.return_value = None
 
         with pytest.raises(ValueError, match="Source entity.*not found"):
             await cross_project_linker.link_entities(
@@ -291,9 +298,9 @@ class TestCrossProjectLinkerService:
             )
 
     @pytest.mark.asyncio
-    async def test_link_entities_target_not_found(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_link_entities_target_not_found(self, cross_project_linker, mock_handler):
         """Test linking when target entity doesn't exist."""
-        async_mock_neo4j_handler.get_person.side_effect = [
+        mock_handler.get_person.side_effect = [
             {"id": "entity-123", "profile": {}},  # source exists
             None  # target doesn't exist
         ]
@@ -308,16 +315,9 @@ class TestCrossProjectLinkerService:
             )
 
     @pytest.mark.asyncio
-    async def test_link_entities_confidence_clamped(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_link_entities_confidence_clamped(self, cross_project_linker, mock_handler):
         """Test that confidence is clamped to 0.0-1.0 range."""
-        # Setup mock session
-        mock_session = AsyncMock()
-        mock_session.run = AsyncMock()
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock()
-        async_mock_neo4j_handler.session.return_value = mock_session
-
-        async_mock_neo4j_handler.get_person.side_effect = [
+        mock_handler.get_person.side_effect = [
             {"id": "entity-123", "profile": {}},
             {"id": "entity-456", "profile": {}}
         ]
@@ -334,7 +334,7 @@ class TestCrossProjectLinkerService:
         assert link.confidence == 1.0
 
         # Reset for negative test
-        async_mock_neo4j_handler.get_person.side_effect = [
+        mock_handler.get_person.side_effect = [
             {"id": "entity-123", "profile": {}},
             {"id": "entity-456", "profile": {}}
         ]
@@ -351,15 +351,9 @@ class TestCrossProjectLinkerService:
         assert link.confidence == 0.0
 
     @pytest.mark.asyncio
-    async def test_unlink_entities_success(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_unlink_entities_success(self, cross_project_linker, mock_handler):
         """Test successful entity unlinking."""
-        mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.single = AsyncMock(return_value={"deleted_count": 1})
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock()
-        async_mock_neo4j_handler.session.return_value = mock_session
+        handler_session(mock_handler).run.return_value.single.return_value = {"deleted_count": 1}
 
         result = await cross_project_linker.unlink_entities(
             source_project="project_alpha",
@@ -371,15 +365,9 @@ class TestCrossProjectLinkerService:
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_unlink_entities_not_found(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_unlink_entities_not_found(self, cross_project_linker, mock_handler):
         """Test unlinking when link doesn't exist."""
-        mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.single = AsyncMock(return_value={"deleted_count": 0})
-        mock_session.run = AsyncMock(return_value=mock_result)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock()
-        async_mock_neo4j_handler.session.return_value = mock_session
+        handler_session(mock_handler).run.return_value.single.return_value = {"deleted_count": 0}
 
         result = await cross_project_linker.unlink_entities(
             source_project="project_alpha",
@@ -391,13 +379,11 @@ class TestCrossProjectLinkerService:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_get_cross_project_links(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_get_cross_project_links(self, cross_project_linker, mock_handler):
         """Test getting cross-project links for an entity."""
-        mock_session = AsyncMock()
-
         # Mock outgoing links result
-        outgoing_result = AsyncMock()
-        outgoing_result.data = AsyncMock(return_value=[
+        outgoing_result = MagicMock()
+        outgoing_result.data.return_value = [
             {
                 "source_project_id": "project_alpha",
                 "source_entity_id": "entity-123",
@@ -408,11 +394,11 @@ class TestCrossProjectLinkerService:
                 "created_at": "2024-01-15T10:30:00",
                 "metadata": "{}"
             }
-        ])
+        ]
 
         # Mock incoming links result
-        incoming_result = AsyncMock()
-        incoming_result.data = AsyncMock(return_value=[
+        incoming_result = MagicMock()
+        incoming_result.data.return_value = [
             {
                 "source_project_id": "project_gamma",
                 "source_entity_id": "entity-789",
@@ -423,12 +409,9 @@ class TestCrossProjectLinkerService:
                 "created_at": "2024-01-16T14:00:00",
                 "metadata": "{}"
             }
-        ])
+        ]
 
-        mock_session.run = AsyncMock(side_effect=[outgoing_result, incoming_result])
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock()
-        async_mock_neo4j_handler.session.return_value = mock_session
+        handler_session(mock_handler).run.side_effect = [outgoing_result, incoming_result]
 
         links = await cross_project_linker.get_cross_project_links(
             project_id="project_alpha",
@@ -440,7 +423,7 @@ class TestCrossProjectLinkerService:
         assert links[1].link_type == "RELATED"
 
     @pytest.mark.asyncio
-    async def test_find_potential_matches(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_find_potential_matches(self, cross_project_linker, mock_handler):
         """Test finding potential matches across projects."""
         # Setup identifier paths
         cross_project_linker.identifier_paths = [
@@ -468,8 +451,8 @@ class TestCrossProjectLinkerService:
             }
         ]
 
-        async_mock_neo4j_handler.get_person.return_value = source_entity
-        async_mock_neo4j_handler.get_all_people.return_value = target_entities
+        mock_handler.get_person.return_value = source_entity
+        mock_handler.get_all_people.return_value = target_entities
 
         matches = await cross_project_linker.find_potential_matches(
             project_id="project_source",
@@ -482,7 +465,7 @@ class TestCrossProjectLinkerService:
         assert "matching_identifiers" in matches[0].metadata
 
     @pytest.mark.asyncio
-    async def test_find_potential_matches_no_identifiers(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_find_potential_matches_no_identifiers(self, cross_project_linker, mock_handler):
         """Test finding matches when entity has no identifiers."""
         cross_project_linker.identifier_paths = [
             {"path": "core.email", "section_id": "core", "field_id": "email",
@@ -495,7 +478,7 @@ class TestCrossProjectLinkerService:
             "profile": {"core": {"name": "John Doe"}}  # No email
         }
 
-        async_mock_neo4j_handler.get_person.return_value = source_entity
+        mock_handler.get_person.return_value = source_entity
 
         matches = await cross_project_linker.find_potential_matches(
             project_id="project_source",
@@ -505,9 +488,9 @@ class TestCrossProjectLinkerService:
         assert len(matches) == 0
 
     @pytest.mark.asyncio
-    async def test_find_potential_matches_entity_not_found(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_find_potential_matches_entity_not_found(self, cross_project_linker, mock_handler):
         """Test finding matches when source entity doesn't exist."""
-        async_mock_neo4j_handler.get_person.return_value = None
+        mock_handler.get_person.return_value = None
 
         matches = await cross_project_linker.find_potential_matches(
             project_id="project_source",
@@ -517,13 +500,81 @@ class TestCrossProjectLinkerService:
         assert len(matches) == 0
 
     @pytest.mark.asyncio
-    async def test_get_all_linked_entities(self, cross_project_linker, async_mock_neo4j_handler):
+    async def test_find_potential_matches_uses_identifier_keys(self, cross_project_linker, mock_handler):
+        """Test that the identifier key lookup replaces the project scan."""
+        mock_handler.find_cross_project_identifier_matches.return_value = [
+            {
+                "project_safe_name": "project_alpha",
+                "entity_id": "entity-alpha-1",
+                "keys": [{"path": "core.email", "value": "shared@example.com"}]
+            },
+            {
+                "project_safe_name": "project_beta",
+                "entity_id": "entity-beta-1",
+                "keys": [
+                    {"path": "core.email", "value": "shared@example.com"},
+                    {"path": "core.email", "value": "alt@example.com"},
+                    {"path": "social.username", "value": "jdoe"}
+                ]
+            }
+        ]
+
+        matches = await cross_project_linker.find_potential_matches(
+            project_id="project_source",
+            entity_id="entity-123",
+            target_projects=["project_alpha", "project_beta"]
+        )
+
+        mock_handler.find_cross_project_identifier_matches.assert_called_once_with(
+            "project_source", "entity-123", ["project_alpha", "project_beta"]
+        )
+        mock_handler.get_all_projects.assert_not_called()
+        mock_handler.get_all_people.assert_not_called()
+
+        assert [(m.target_project_id, m.target_entity_id) for m in matches] == [
+            ("project_beta", "entity-beta-1"),
+            ("project_alpha", "entity-alpha-1")
+        ]
+        assert matches[0].confidence == pytest.approx(0.6)
+        assert matches[0].metadata["matching_identifiers"][0] == {
+            "path": "core.email",
+            "matching_values": ["shared@example.com", "alt@example.com"]
+        }
+        assert matches[1].confidence == pytest.approx(0.3)
+
+    @pytest.mark.asyncio
+    async def test_handler_calls_run_in_worker_threads(self, cross_project_linker, mock_handler):
+        """Test that blocking handler calls never run on the event loop thread."""
+        import threading
+
+        loop_thread = threading.get_ident()
+        call_threads = []
+
+        def recording(result):
+            def call(*args):
+                call_threads.append(threading.get_ident())
+                return result
+            return call
+
+        mock_handler.get_person.side_effect = recording({"id": "entity-123"})
+        mock_handler.find_cross_project_identifier_matches.side_effect = recording([])
+
+        matches = await cross_project_linker.find_potential_matches(
+            project_id="project_source",
+            entity_id="entity-123"
+        )
+
+        assert matches == []
+        assert len(call_threads) == 2
+        assert loop_thread not in call_threads
+        mock_handler.get_all_people.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_all_linked_entities(self, cross_project_linker, mock_handler):
         """Test getting all linked entities across projects."""
         # Setup mock session for get_cross_project_links
-        mock_session = AsyncMock()
-
-        outgoing_result = AsyncMock()
-        outgoing_result.data = AsyncMock(return_value=[
+        outgoing_result = MagicMock()
+        outgoing_result.data.return_value = [
             {
                 "source_project_id": "project_alpha",
                 "source_entity_id": "entity-123",
@@ -534,18 +585,15 @@ class TestCrossProjectLinkerService:
                 "created_at": "2024-01-15T10:30:00",
                 "metadata": "{}"
             }
-        ])
+        ]
 
-        incoming_result = AsyncMock()
-        incoming_result.data = AsyncMock(return_value=[])
+        incoming_result = MagicMock()
+        incoming_result.data.return_value = []
 
-        mock_session.run = AsyncMock(side_effect=[outgoing_result, incoming_result])
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock()
-        async_mock_neo4j_handler.session.return_value = mock_session
+        handler_session(mock_handler).run.side_effect = [outgoing_result, incoming_result]
 
         # Setup get_person to return entity data
-        async_mock_neo4j_handler.get_person.return_value = {
+        mock_handler.get_person.return_value = {
             "id": "entity-456",
             "profile": {"core": {"name": [{"first_name": "Jane", "last_name": "Smith"}]}}
         }
@@ -562,6 +610,51 @@ class TestCrossProjectLinkerService:
         assert "entity_data" in linked[0]
 
 
+class TestCrossProjectIdentifierKeyLookup:
+    """Tests for Neo4jHandler.find_cross_project_identifier_matches."""
+
+    @pytest.fixture
+    def handler(self):
+        """Create a handler with a mocked driver session."""
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler.driver = MagicMock()
+        return handler
+
+    def _session(self, handler):
+        return handler.driver.session.return_value.__enter__.return_value
+
+    def test_returns_none_until_key_layer_is_built(self, handler):
+        """Test that unbuilt key layers make callers fall back to scanning."""
+        session = self._session(handler)
+        session.run.return_value.single.return_value = {"pending": 1}
+
+        assert handler.find_cross_project_identifier_matches("source", "entity-1") is None
+        assert session.run.call_count == 1
+
+    def test_returns_shared_keys_per_entity(self, handler):
+        """Test that matches are read from a single key traversal."""
+        session = self._session(handler)
+        pending = MagicMock()
+        pending.single.return_value = {"pending": 0}
+        rows = [{
+            "project_safe_name": "alpha",
+            "entity_id": "entity-2",
+            "keys": [{"path": "core.email", "value": "shared@example.com"}]
+        }]
+        session.run.side_effect = [pending, rows]
+
+        matches = handler.find_cross_project_identifier_matches("source", "entity-1", ["alpha"])
+
+        assert matches == rows
+        assert session.run.call_args.kwargs == {
+            "project_safe_name": "source",
+            "person_id": "entity-1",
+            "target_projects": ["alpha"]
+        }
+
+
 class TestCrossProjectLinkerSingleton:
     """Tests for CrossProjectLinker singleton pattern."""
 
@@ -602,33 +695,26 @@ class TestCrossProjectEndpoints:
     @pytest.fixture
     def mock_handler_for_endpoints(self, mock_neo4j_handler):
         """Extend mock handler for endpoint tests."""
-        # Make handler async-compatible
-        mock_neo4j_handler.get_person = AsyncMock(return_value={
+        mock_neo4j_handler.get_person.return_value = {
             "id": "entity-123",
             "profile": {"core": {"name": [{"first_name": "John", "last_name": "Doe"}]}}
-        })
-        mock_neo4j_handler.get_all_projects = AsyncMock(return_value=[
+        }
+        mock_neo4j_handler.get_all_projects.return_value = [
             {"safe_name": "project_alpha"},
             {"safe_name": "project_beta"}
-        ])
-        mock_neo4j_handler.get_all_people = AsyncMock(return_value=[])
-
-        # Setup mock session
-        mock_session = AsyncMock()
-        mock_session.run = AsyncMock()
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock()
-        mock_neo4j_handler.session = MagicMock(return_value=mock_session)
+        ]
+        mock_neo4j_handler.get_all_people.return_value = []
+        mock_neo4j_handler.find_cross_project_identifier_matches.return_value = None
 
         return mock_neo4j_handler
 
     def test_create_cross_project_link_endpoint(self, mock_handler_for_endpoints):
         """Test creating a cross-project link via API."""
         # Setup get_person to return entities
-        mock_handler_for_endpoints.get_person = AsyncMock(side_effect=[
+        mock_handler_for_endpoints.get_person.side_effect = [
             {"id": "entity-123", "profile": {}},
             {"id": "entity-456", "profile": {}}
-        ])
+        ]
 
         client = get_test_client(mock_handler_for_endpoints)
 
@@ -672,10 +758,7 @@ class TestCrossProjectEndpoints:
     def test_delete_cross_project_link_endpoint(self, mock_handler_for_endpoints):
         """Test deleting a cross-project link via API."""
         # Setup mock to indicate deletion success
-        mock_session = mock_handler_for_endpoints.session()
-        mock_result = AsyncMock()
-        mock_result.single = AsyncMock(return_value={"deleted_count": 1})
-        mock_session.run = AsyncMock(return_value=mock_result)
+        handler_session(mock_handler_for_endpoints).run.return_value.single.return_value = {"deleted_count": 1}
 
         client = get_test_client(mock_handler_for_endpoints)
 
@@ -697,14 +780,7 @@ class TestCrossProjectEndpoints:
     def test_get_entity_cross_links_endpoint(self, mock_handler_for_endpoints):
         """Test getting cross-project links for an entity."""
         # Setup mock to return links
-        mock_session = mock_handler_for_endpoints.session()
-
-        outgoing_result = AsyncMock()
-        outgoing_result.data = AsyncMock(return_value=[])
-        incoming_result = AsyncMock()
-        incoming_result.data = AsyncMock(return_value=[])
-
-        mock_session.run = AsyncMock(side_effect=[outgoing_result, incoming_result])
+        handler_session(mock_handler_for_endpoints).run.return_value.data.return_value = []
 
         client = get_test_client(mock_handler_for_endpoints)
 
@@ -719,7 +795,7 @@ class TestCrossProjectEndpoints:
 
     def test_get_entity_cross_links_not_found(self, mock_handler_for_endpoints):
         """Test getting links for non-existent entity."""
-        mock_handler_for_endpoints.get_person = AsyncMock(return_value=None)
+        mock_handler_for_endpoints.get_person.return_value = None
 
         client = get_test_client(mock_handler_for_endpoints)
 
@@ -756,14 +832,7 @@ class TestCrossProjectEndpoints:
     def test_get_all_linked_entities_endpoint(self, mock_handler_for_endpoints):
         """Test getting all linked entities via API."""
         # Setup mock to return empty links
-        mock_session = mock_handler_for_endpoints.session()
-
-        outgoing_result = AsyncMock()
-        outgoing_result.data = AsyncMock(return_value=[])
-        incoming_result = AsyncMock()
-        incoming_result.data = AsyncMock(return_value=[])
-
-        mock_session.run = AsyncMock(side_effect=[outgoing_result, incoming_result])
+        handler_session(mock_handler_for_endpoints).run.return_value.data.return_value = []
 
         client = get_test_client(mock_handler_for_endpoints)
 
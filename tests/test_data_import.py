@@ -0,0 +1,260 @@
+"""
+Tests for the streaming import pipeline of the OSINT import connectors.
+
+These tests cover:
+- Typed batching of entity, orphan and relationship writes
+- Per-record fallback when a batch fails
+- Parse errors in the background parser thread
+- Progress updates
+- Transactional batch creation and batched relationship writes in Neo4jHandler
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from api.services.data_import import ImportConnector
+
+
+class ListConnector(ImportConnector):
+    """Connector yielding prepared records, optionally failing after them."""
+
+    def __init__(self, neo4j_handler, orphan_service=None, records=None, fail_with=None):
+        super().__init__(neo4j_handler, orphan_service)
+        self.records = records or []
+        self.fail_with = fail_with
+
+    def parse(self, content):
+        yield from self.records
+        if self.fail_with:
+            raise self.fail_with
+
+    def get_tool_name(self):
+        return "list"
+
+
+def entity(entity_id, relationships=None):
+    """Create a parsed entity record."""
+    return {
+        "type": "entity",
+        "data": {"id": entity_id, "profile": {"core": {"name": entity_id}}},
+        "relationships": relationships or [],
+    }
+
+
+def orphan(value):
+    """Create a parsed orphan record."""
+    return {"type": "orphan", "data": {"identifier_type": "email", "identifier_value": value}}
+
+
+@pytest.fixture
+def neo4j():
+    """Create a handler mock that creates every batch."""
+    handler = MagicMock()
+    handler.get_all_projects.return_value = [{"id": "p-1", "safe_name": "project"}]
+    handler.create_people_batch.side_effect = lambda project, people: [p["id"] for p in people]
+    handler.create_relationships_batch.side_effect = lambda project, rels: list(rels)
+    return handler
+
+
+@pytest.fixture
+def orphan_service():
+    """Create an orphan service mock that imports every batch."""
+    service = MagicMock()
+    service.import_orphans_bulk.side_effect = lambda project_id, creates: {
+        "created": len(creates),
+        "failed": 0,
+        "orphan_ids": [c.id for c in creates],
+        "errors": [],
+    }
+    return service
+
+
+class TestImportPipeline:
+    """Tests for ImportConnector.import_data."""
+
+    def test_records_are_written_in_typed_batches(self, neo4j, orphan_service):
+        """Test that entities and orphans are grouped into batches."""
+        records = [entity(f"e{i}") for i in range(5)] + [orphan(f"{i}@example.com") for i in range(3)]
+        connector = ListConnector(neo4j, orphan_service, records)
+
+        result = connector.import_data("project", "", batch_size=2)
+
+        assert result.total_records == 8
+        assert result.entity_ids == ["e0", "e1", "e2", "e3", "e4"]
+        assert result.orphans_created == 3
+        assert [len(c.args[1]) for c in neo4j.create_people_batch.call_args_list] == [2, 2, 1]
+        assert [len(c.args[1]) for c in orphan_service.import_orphans_bulk.call_args_list] == [2, 1]
+        neo4j.create_person.assert_not_called()
+        orphan_service.create_orphan.assert_not_called()
+
+    def test_relationships_are_written_after_entities(self, neo4j, orphan_service):
+        """Test that relationships may point at entities parsed later."""
+        records = [
+            entity("e0", [{"target_id": "e2", "type": "WORKS_WITH"}, {"type": "RELATED_TO"}]),
+            entity("e1"),
+            entity("e2"),
+        ]
+        connector = ListConnector(neo4j, orphan_service, records)
+
+        result = connector.import_data("project", "", batch_size=2)
+
+        assert result.relationships_created == 1
+        neo4j.create_relationships_batch.assert_called_once_with("project", [{
+            "source_id": "e0",
+            "target_id": "e2",
+            "relationship_type": "WORKS_WITH",
+            "properties": {},
+        }])
+        assert neo4j.create_people_batch.call_count == 2
+
+    def test_failed_batch_is_retried_per_record(self, neo4j, orphan_service):
+        """Test that a failing batch attributes errors to single records."""
+        neo4j.create_people_batch.side_effect = RuntimeError("constraint violated")
+        neo4j.create_person.side_effect = lambda project, data: None if data["id"] == "e1" else data
+        connector = ListConnector(neo4j, orphan_service, [entity("e0"), entity("e1"), entity("e2")])
+
+        result = connector.import_data("project", "")
+
+        assert result.entity_ids == ["e0", "e2"]
+        assert [e.index for e in result.errors] == [1]
+        assert neo4j.create_person.call_count == 3
+
+    def test_retried_records_keep_their_ids(self, neo4j, orphan_service):
+        """Test that the per-record fallback reuses the batch payload IDs."""
+        neo4j.create_people_batch.side_effect = RuntimeError("connection lost")
+        neo4j.create_person.side_effect = lambda project, data: data
+        records = [entity("e0"), {"type": "entity", "data": {"profile": {}}}]
+        connector = ListConnector(neo4j, orphan_service, records)
+
+        result = connector.import_data("project", "")
+
+        batch_ids = [p["id"] for p in neo4j.create_people_batch.call_args.args[1]]
+        assert result.entity_ids == batch_ids
+        assert [c.args[1]["id"] for c in neo4j.create_person.call_args_list] == batch_ids
+
+    def test_only_records_missing_from_batch_are_retried(self, neo4j, orphan_service):
+        """Test that each record is checked against the created IDs."""
+        neo4j.create_people_batch.side_effect = lambda project, people: [people[0]["id"]]
+        neo4j.create_person.side_effect = lambda project, data: data
+        connector = ListConnector(neo4j, orphan_service, [entity("e0"), entity("e1")])
+
+        result = connector.import_data("project", "")
+
+        assert result.entity_ids == ["e0", "e1"]
+        assert [c.args[1]["id"] for c in neo4j.create_person.call_args_list] == ["e1"]
+
+    def test_parse_error_keeps_parsed_records(self, neo4j, orphan_service):
+        """Test that records parsed before a parser error are imported."""
+        connector = ListConnector(neo4j, orphan_service, [entity("e0")], fail_with=ValueError("bad row"))
+
+        result = connector.import_data("project", "")
+
+        assert result.entity_ids == ["e0"]
+        assert [(e.index, e.message) for e in result.errors] == [(-1, "Parse error: bad row")]
+
+    def test_dry_run_writes_nothing(self, neo4j, orphan_service):
+        """Test that validation only counts records."""
+        connector = ListConnector(neo4j, orphan_service, [entity("e0"), orphan("a@example.com")])
+
+        result = connector.validate("")
+
+        assert result.entities_created == 1
+        assert result.orphans_created == 1
+        neo4j.create_people_batch.assert_not_called()
+        orphan_service.import_orphans_bulk.assert_not_called()
+
+    def test_progress_updates(self, neo4j, orphan_service):
+        """Test that progress is reported after batches and on completion."""
+        updates = []
+        connector = ListConnector(neo4j, orphan_service, [entity(f"e{i}") for i in range(3)])
+
+        connector.import_data("project", "", batch_size=2, progress_callback=updates.append, job_id="job-1")
+
+        assert [(u.current_phase, u.records_processed) for u in updates] == [("importing", 2), ("complete", 3)]
+        assert updates[-1].progress_percent == 100.0
+        assert updates[-1].to_dict()["total_records"] == 3
+        assert {u.job_id for u in updates} == {"job-1"}
+
+
+class TestRelationshipsBatch:
+    """Tests for Neo4jHandler.create_relationships_batch."""
+
+    def test_merges_into_tagged_people_sections(self):
+        """Test that relationships are merged per source and written once."""
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler.get_people_batch = MagicMock(return_value={
+            "a": {"id": "a", "profile": {"Tagged People": {"tagged_people": ["b"]}}},
+            "b": {"id": "b", "profile": {}},
+            "c": {"id": "c", "profile": {}},
+        })
+        handler.upsert_people_batch = MagicMock()
+
+        created = handler.create_relationships_batch("project", [
+            {"source_id": "a", "target_id": "c", "relationship_type": "FRIEND", "properties": {"confidence": 0.5}},
+            {"source_id": "b", "target_id": "a"},
+            {"source_id": "a", "target_id": "missing"},
+        ])
+
+        assert [(r["source_id"], r["target_id"], r["relationship_type"]) for r in created] == [
+            ("a", "c", "FRIEND"), ("b", "a", "RELATED_TO")
+        ]
+        assert created[0]["properties"]["confidence"] == 0.5
+
+        project, people = handler.upsert_people_batch.call_args.args
+        sections = {p["id"]: p["profile"]["Tagged People"] for p in people}
+        assert project == "project"
+        assert sections["a"]["tagged_people"] == ["b", "c"]
+        assert sections["a"]["relationship_types"] == {"c": "FRIEND"}
+        assert sections["b"]["tagged_people"] == ["a"]
+        handler.get_people_batch.assert_called_once()
+
+
+class TestCreatePeopleBatch:
+    """Tests for Neo4jHandler.create_people_batch."""
+
+    @pytest.fixture
+    def handler(self):
+        """Create a handler whose session runs write transactions on a mock."""
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler.tx = MagicMock()
+        session = MagicMock()
+        session.execute_write.side_effect = lambda work, *args: work(handler.tx, *args)
+        handler.driver = MagicMock()
+        handler.driver.session.return_value.__enter__.return_value = session
+        handler.session = session
+        handler._write_profiles_batch = MagicMock(return_value={})
+        handler.handle_file_uploads_batch = MagicMock()
+        handler._notify_change = MagicMock()
+        return handler
+
+    def test_batch_runs_in_one_write_transaction(self, handler):
+        """Test that the project check, creates and profiles share a transaction."""
+        people = [{"id": "a", "profile": {"core": {"name": "A"}}}, {"id": "b"}]
+        handler.tx.run.return_value.single.return_value = {"version": 4}
+
+        assert handler.create_people_batch("project", people) == ["a", "b"]
+
+        handler.session.execute_write.assert_called_once()
+        handler.session.run.assert_not_called()
+        assert handler.tx.run.call_count == 3
+        handler._write_profiles_batch.assert_called_once_with(
+            handler.tx, {"a": {"core": {"name": "A"}}}
+        )
+        # The data version is bumped by the same transaction
+        assert "SET project.data_version" in handler.tx.run.call_args.args[0]
+        handler._notify_change.assert_called_once_with("people_created", "project", ["a", "b"], 4)
+
+    def test_missing_project_creates_nothing(self, handler):
+        """Test that a missing project ends the transaction before any write."""
+        handler.tx.run.return_value.single.return_value = None
+
+        assert handler.create_people_batch("missing", [{"id": "a"}]) == []
+
+        assert handler.tx.run.call_count == 1
+        handler._write_profiles_batch.assert_not_called()
+        handler._notify_change.assert_not_called()
@@ -461,6 +461,55 @@ class TestNeo4jHandlerGraphMethods:
         total_entities = sum(c["size"] for c in result["clusters"])
         assert total_entities == 5
 
+    def test_find_clusters_from_edge_tuples(self):
+        """Test clustering over projected edge tuples with paginated hydration."""
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler.get_tagged_edges = MagicMock(return_value=iter([
+            ("a", ["b", "c"]),
+            ("b", ["a"]),
+            ("c", ["c", "missing"]),
+            ("d", ["e"]),
+            ("e", []),
+            ("f", []),
+        ]))
+        handler.get_people_batch = MagicMock(
+            side_effect=lambda project, ids: {eid: {"id": eid} for eid in ids}
+        )
+
+        result = handler.find_clusters("project", limit=2, member_limit=2)
+
+        assert result["cluster_count"] == 3
+        assert result["connected_clusters"] == 2
+        assert result["isolated_count"] == 1
+        assert result["total_entities"] == 6
+        assert [c["size"] for c in result["clusters"]] == [3, 2]
+        assert set(result["clusters"][0]["entity_ids"]) == {"a", "b", "c"}
+        assert result["clusters"][0]["internal_edges"] == 2
+        assert result["clusters"][1]["internal_edges"] == 1
+        assert len(result["clusters"][0]["entities"]) == 2
+
+        # Only the requested page is hydrated
+        hydrated = handler.get_people_batch.call_args[0][1]
+        assert "f" not in hydrated
+        assert len(hydrated) == 4
+
+    def test_find_clusters_without_entities(self):
+        """Test clustering skips entity hydration when not requested."""
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler.get_tagged_edges = MagicMock(return_value=iter([("a", ["b"]), ("b", []), ("c", [])]))
+        handler.get_people_batch = MagicMock()
+
+        result = handler.find_clusters("project", include_entities=False, include_isolated=False)
+
+        handler.get_people_batch.assert_not_called()
+        assert result["cluster_count"] == 1
+        assert result["clusters"][0]["entities"] == []
+        assert result["isolated_count"] == 1
+
 
 class TestAnalysisResponseModels:
     """Tests for analysis response Pydantic models."""
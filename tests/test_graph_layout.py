@@ -0,0 +1,272 @@
+"""
+Tests for the graph visualization layout engine and graph metrics.
+
+These tests cover the force-directed layout:
+- Deterministic seeding
+- Canvas bounds
+- Early stopping on convergence
+- Barnes-Hut grid approximation of repulsion
+- Pure Python fallback without NumPy
+
+and Brandes betweenness centrality:
+- Exact scores, sampled estimates and their error bound
+- Process-pool parallelism over source batches
+- Node sizing by betweenness
+"""
+
+import random
+
+import pytest
+
+from api.services import graph_visualization
+from api.services.graph_visualization import (
+    GraphMetrics,
+    GraphVisualizationService,
+    LayoutAlgorithm,
+    LayoutEngine,
+    LayoutOptions,
+    NodeSizeMetric,
+    NUMPY_AVAILABLE,
+)
+
+
+requires_numpy = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+
+
+def make_graph(node_count, edge_count, seed=1):
+    """Create a random graph as node and edge dicts."""
+    rng = random.Random(seed)
+    nodes = [{"id": f"n{i}"} for i in range(node_count)]
+    edges = [
+        {"source": f"n{rng.randrange(node_count)}", "target": f"n{rng.randrange(node_count)}"}
+        for _ in range(edge_count)
+    ]
+    return nodes, edges
+
+
+@pytest.fixture
+def engine():
+    """Create a LayoutEngine instance."""
+    return LayoutEngine()
+
+
+class TestForceDirectedLayout:
+    """Tests for the force-directed layout."""
+
+    def test_empty_graph(self, engine):
+        """Test that an empty graph has no positions."""
+        assert engine._force_directed_layout_internal([], [], LayoutOptions()) == {}
+
+    def test_same_seed_is_deterministic(self, engine):
+        """Test that repeated layouts with the same seed are identical."""
+        nodes, edges = make_graph(50, 80)
+        options = LayoutOptions(algorithm=LayoutAlgorithm.FORCE_DIRECTED, seed=7)
+
+        first = engine._force_directed_layout_internal(nodes, edges, options)
+        second = engine._force_directed_layout_internal(nodes, edges, options)
+
+        assert first == second
+
+    def test_different_seed_changes_layout(self, engine):
+        """Test that the seed controls the initial positions."""
+        nodes, edges = make_graph(20, 30)
+
+        first = engine._force_directed_layout_internal(nodes, edges, LayoutOptions(seed=1))
+        second = engine._force_directed_layout_internal(nodes, edges, LayoutOptions(seed=2))
+
+        assert first != second
+
+    def test_positions_within_canvas(self, engine):
+        """Test that all nodes stay inside the padded canvas."""
+        nodes, edges = make_graph(100, 150)
+        options = LayoutOptions(width=600, height=400, padding=20)
+
+        positions = engine._force_directed_layout_internal(nodes, edges, options)
+
+        assert set(positions) == {node["id"] for node in nodes}
+        for position in positions.values():
+            assert 20 <= position.x <= 580
+            assert 20 <= position.y <= 380
+
+    def test_edges_to_unknown_nodes_are_ignored(self, engine):
+        """Test that dangling edges and self-loops do not break the layout."""
+        nodes = [{"id": "a"}, {"id": "b"}]
+        edges = [
+            {"source": "a", "target": "b"},
+            {"source": "a", "target": "missing"},
+            {"source": "b", "target": "b"},
+        ]
+
+        positions = engine._force_directed_layout_internal(nodes, edges, LayoutOptions())
+
+        assert set(positions) == {"a", "b"}
+
+    def test_convergence_stops_early(self, engine):
+        """Test that the simulation stops once movement drops below the threshold."""
+        nodes, edges = make_graph(30, 40)
+
+        short = engine._force_directed_layout_internal(
+            nodes, edges, LayoutOptions(iterations=10, convergence_threshold=1e9)
+        )
+        long = engine._force_directed_layout_internal(
+            nodes, edges, LayoutOptions(iterations=1000, convergence_threshold=1e9)
+        )
+
+        # Both runs stop after the first iteration
+        assert short == long
+
+    def test_python_fallback_matches_numpy(self, engine, monkeypatch):
+        """Test that the pure Python simulation matches the NumPy one."""
+        if not NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+
+        nodes, edges = make_graph(40, 60)
+        options = LayoutOptions(iterations=10, convergence_threshold=0)
+
+        vectorized = engine._force_directed_layout_internal(nodes, edges, options)
+        monkeypatch.setattr(graph_visualization, "NUMPY_AVAILABLE", False)
+        fallback = engine._force_directed_layout_internal(nodes, edges, options)
+
+        for node_id, position in vectorized.items():
+            assert fallback[node_id].x == pytest.approx(position.x, abs=1e-6)
+            assert fallback[node_id].y == pytest.approx(position.y, abs=1e-6)
+
+
+@requires_numpy
+class TestBarnesHutRepulsion:
+    """Tests for the Barnes-Hut grid approximation of repulsion."""
+
+    @pytest.fixture
+    def points(self):
+        """Create scattered points with a pile of coincident nodes."""
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        x = rng.uniform(0, 1000, 2000)
+        y = rng.uniform(0, 800, 2000)
+        x[:200] = 50.0
+        y[:200] = 50.0
+        return x, y
+
+    def test_grid_matches_exact_repulsion(self, engine, points):
+        """Test that the grid forces are close to the exact forces."""
+        import numpy as np
+
+        x, y = points
+        exact_x, exact_y = engine._exact_repulsion(x, y, 1e5)
+        grid_x, grid_y = engine._grid_repulsion(x, y, 1e5)
+
+        error = np.hypot(exact_x - grid_x, exact_y - grid_y) / np.hypot(exact_x, exact_y)
+        assert np.median(error) < 0.01
+        assert np.percentile(error, 95) < 0.05
+
+    def test_coincident_nodes_share_forces(self, engine, points):
+        """Test that nodes at the same position receive the same force."""
+        import numpy as np
+
+        x, y = points
+        grid_x, grid_y = engine._grid_repulsion(x, y, 1e5)
+
+        assert np.all(grid_x[:200] == grid_x[0])
+        assert np.all(grid_y[:200] == grid_y[0])
+
+    def test_large_graph_uses_grid(self, engine, monkeypatch):
+        """Test that graphs above the threshold use the grid approximation."""
+        nodes, edges = make_graph(300, 400)
+        calls = []
+
+        def grid_repulsion(x, y, strength):
+            calls.append(len(x))
+            return LayoutEngine._exact_repulsion(engine, x, y, strength)
+
+        monkeypatch.setattr(engine, "_grid_repulsion", grid_repulsion)
+        engine._force_directed_layout_internal(
+            nodes, edges, LayoutOptions(iterations=10, barnes_hut_threshold=100)
+        )
+
+        assert calls and calls[0] == 300
+
+
+class TestBetweenness:
+    """Tests for Brandes betweenness centrality."""
+
+    def test_path_graph(self):
+        """Test exact scores on a path a - b - c - d."""
+        nodes = [{"id": i} for i in "abcd"]
+        edges = [{"source": "a", "target": "b"}, {"source": "c", "target": "b"}, {"source": "c", "target": "d"}]
+
+        result = GraphMetrics.compute_betweenness(nodes, edges)
+
+        # b and c each lie on 2 of the 3 pairs of other nodes
+        assert result.scores == pytest.approx({"a": 0.0, "b": 2 / 3, "c": 2 / 3, "d": 0.0})
+        assert result.exact and result.sources_used == 4 and result.error_bound == 0.0
+
+    def test_relative_scores(self):
+        """Test that compute_betweenness_centrality scales to the maximum."""
+        nodes = [{"id": i} for i in "hxyz"]
+        edges = [{"source": "h", "target": leaf} for leaf in "xyz"] + [{"source": "x", "target": "x"}]
+
+        assert GraphMetrics.compute_betweenness_centrality(nodes, edges) == {"h": 1.0, "x": 0.0, "y": 0.0, "z": 0.0}
+
+    def test_small_graph(self):
+        """Test that graphs with fewer than three nodes score zero."""
+        result = GraphMetrics.compute_betweenness([{"id": "a"}, {"id": "b"}], [{"source": "a", "target": "b"}])
+
+        assert result.scores == {"a": 0.0, "b": 0.0}
+
+    def test_sampled_estimate_within_bound(self):
+        """Test that sampled scores stay within the reported error bound."""
+        nodes, edges = make_graph(300, 900)
+        exact = GraphMetrics.compute_betweenness(nodes, edges)
+
+        sampled = GraphMetrics.compute_betweenness(nodes, edges, samples=60, seed=3)
+
+        assert not sampled.exact and sampled.sources_used == 60
+        assert 0 < sampled.error_bound < 1
+        assert max(abs(sampled.scores[k] - exact.scores[k]) for k in exact.scores) <= sampled.error_bound
+
+    def test_sampling_all_sources_is_exact(self):
+        """Test that sampling at least every node gives exact scores."""
+        nodes, edges = make_graph(30, 60)
+
+        sampled = GraphMetrics.compute_betweenness(nodes, edges, samples=30)
+
+        assert sampled.exact
+        assert sampled.scores == GraphMetrics.compute_betweenness(nodes, edges).scores
+
+    def test_error_bound_shrinks_with_samples(self):
+        """Test the Hoeffding bound against more samples and confidence."""
+        bound = GraphMetrics.betweenness_error_bound
+
+        assert bound(1000, 400) < bound(1000, 100)
+        assert bound(1000, 100, confidence=0.99) > bound(1000, 100, confidence=0.9)
+        assert bound(1000, 1000) == 0.0
+
+    def test_process_pool_matches_serial(self, monkeypatch):
+        """Test that parallel source batches give the serial scores."""
+        nodes, edges = make_graph(40, 80)
+        monkeypatch.setattr(graph_visualization, "BETWEENNESS_PARALLEL_MIN_SOURCES", 10)
+        monkeypatch.setattr(graph_visualization.os, "cpu_count", lambda: 2)
+
+        parallel = GraphMetrics.compute_betweenness(nodes, edges, workers=2)
+
+        serial = GraphMetrics.compute_betweenness(nodes, edges)
+        assert parallel.scores == pytest.approx(serial.scores)
+
+    @pytest.mark.asyncio
+    async def test_node_size_by_betweenness(self):
+        """Test that visualization nodes can be sized by betweenness."""
+        nodes = [{"id": i} for i in "abc"]
+        edges = [{"source": "a", "target": "b"}, {"source": "b", "target": "c"}]
+        options = LayoutOptions(
+            algorithm=LayoutAlgorithm.GRID,
+            node_size_metric=NodeSizeMetric.BETWEENNESS,
+            betweenness_samples=2,
+        )
+
+        graph = await GraphVisualizationService()._build_visualization_graph(nodes, edges, options)
+
+        centrality = {node.id: node.centrality for node in graph.nodes}
+        assert centrality["b"] == 1.0
+        assert graph.metadata["node_size_metric"] == "betweenness"
+        assert graph.metadata["betweenness_sources"] == 2
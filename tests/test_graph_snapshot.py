@@ -0,0 +1,438 @@
+"""
+Tests for the in-memory graph snapshot.
+
+These tests cover:
+- CSR construction from tag rows
+- Edge, adjacency and pair views
+- Cache versioning, invalidation, expiry and data version checks
+- Handler wiring and invalidation on entity changes
+- Change reporting from the async service
+- GraphService consuming the snapshot
+"""
+
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graph_snapshot import DEFAULT_RELATIONSHIP_TYPE, GraphSnapshot, GraphSnapshotCache
+
+
+ROWS = [
+    ("a", ["b", "c"], {"b": "WORKS_WITH"}, {"b": {"confidence": 0.9}}),
+    ("b", ["a"], {"a": "WORKS_WITH"}, {}),
+    ("c", ["c", "missing"]),
+    ("d", []),
+]
+
+
+@pytest.fixture
+def snapshot():
+    """Create a snapshot of a small tag graph."""
+    return GraphSnapshot.build("project", ROWS, version=3)
+
+
+class TestGraphSnapshot:
+    """Tests for GraphSnapshot."""
+
+    def test_csr_layout(self, snapshot):
+        """Test that edges are grouped by source in CSR arrays."""
+        assert snapshot.entity_ids == ["a", "b", "c", "d"]
+        assert list(snapshot.offsets) == [0, 2, 3, 4, 4]
+        assert list(snapshot.targets) == [1, 2, 0, 2]
+        assert snapshot.edge_count == 4
+        assert snapshot.version == 3
+        assert len(snapshot) == 4
+        assert "d" in snapshot and "missing" not in snapshot
+
+    def test_unknown_tags_are_dropped(self, snapshot):
+        """Test that tags to entities outside the project are not edges."""
+        assert snapshot.neighbors("c") == ["c"]
+        assert snapshot.neighbors("missing") == []
+
+    def test_relationship_types_and_properties(self, snapshot):
+        """Test that edges keep their relationship types and properties."""
+        edges = {(e["source"], e["target"]): e for e in snapshot.edge_dicts()}
+
+        assert edges[("a", "b")]["type"] == "WORKS_WITH"
+        assert edges[("a", "b")]["properties"] == {"confidence": 0.9}
+        assert edges[("a", "c")]["type"] == DEFAULT_RELATIONSHIP_TYPE
+        assert edges[("a", "c")]["properties"] == {}
+        assert snapshot.type_names == ["WORKS_WITH", DEFAULT_RELATIONSHIP_TYPE]
+
+    def test_edge_dicts_filtered(self, snapshot):
+        """Test restricting edges to a set of entities."""
+        edges = snapshot.edge_dicts({"a", "b"})
+
+        assert {(e["source"], e["target"]) for e in edges} == {("a", "b"), ("b", "a")}
+
+    def test_undirected_pairs(self, snapshot):
+        """Test that pairs are unique, ordered and without self-loops."""
+        assert snapshot.undirected_pairs() == {(0, 1), (0, 2)}
+
+    def test_adjacency_and_connected_ids(self, snapshot):
+        """Test the dict-of-sets views used by traversals."""
+        assert snapshot.adjacency() == {"a": {"b", "c"}, "b": {"a"}, "c": {"a", "c"}}
+        assert snapshot.adjacency(bidirectional=False) == {"a": {"b", "c"}, "b": {"a"}, "c": {"c"}}
+        assert snapshot.connected_ids() == {"a", "b", "c"}
+
+    def test_derived_values_are_cached(self, snapshot):
+        """Test that derived values are computed once per snapshot."""
+        compute = MagicMock(return_value={"communities": []})
+
+        assert snapshot.derive("key", compute) is snapshot.derive("key", compute)
+        compute.assert_called_once_with()
+
+    def test_duplicate_rows_are_skipped(self):
+        """Test that a person repeated in the rows is only indexed once."""
+        snapshot = GraphSnapshot.build("project", [("a", ["b"]), ("b", []), ("a", ["a"])])
+
+        assert snapshot.entity_ids == ["a", "b"]
+        assert snapshot.neighbors("a") == ["b"]
+
+
+class TestGraphSnapshotCache:
+    """Tests for GraphSnapshotCache."""
+
+    def test_snapshot_is_reused(self):
+        """Test that the loader runs once until the project is invalidated."""
+        loader = MagicMock(side_effect=lambda project: iter(ROWS))
+        cache = GraphSnapshotCache(loader)
+
+        first = cache.get("project")
+        assert cache.get("project") is first
+        assert loader.call_count == 1
+
+        cache.invalidate("project")
+        second = cache.get("project")
+        assert second is not first
+        assert second.version == cache.version("project") == 1
+        assert loader.call_count == 2
+
+    def test_invalidate_all_projects(self):
+        """Test that invalidating without a project drops every snapshot."""
+        cache = GraphSnapshotCache(lambda project: iter(ROWS))
+        first = cache.get("one")
+        second = cache.get("two")
+
+        cache.invalidate()
+
+        assert cache.get("one") is not first
+        assert cache.get("two") is not second
+
+    def test_stale_build_is_not_cached(self):
+        """Test that a snapshot invalidated while building is not stored."""
+        cache = None
+        started = threading.Event()
+
+        def loader(project):
+            if not started.is_set():
+                started.set()
+                cache.invalidate()
+            return iter(ROWS)
+
+        cache = GraphSnapshotCache(loader)
+        stale = cache.get("project")
+        fresh = cache.get("project")
+
+        assert fresh is not stale
+        assert cache.get("project") is fresh
+
+    def test_snapshot_expires(self):
+        """Test that a snapshot older than the maximum age is rebuilt."""
+        loader = MagicMock(side_effect=lambda project: iter(ROWS))
+        cache = GraphSnapshotCache(loader, max_age_seconds=60)
+
+        with patch("graph_snapshot.time.monotonic", return_value=1000.0):
+            first = cache.get("project")
+        with patch("graph_snapshot.time.monotonic", return_value=1059.0):
+            assert cache.get("project") is first
+        with patch("graph_snapshot.time.monotonic", return_value=1060.0):
+            assert cache.get("project") is not first
+        assert loader.call_count == 2
+
+    def test_data_version_change_rebuilds(self):
+        """Test that a write seen only through the data version drops the snapshot."""
+        versions = {"project": 3}
+        loader = MagicMock(side_effect=lambda project: iter(ROWS))
+        cache = GraphSnapshotCache(loader, versions.get)
+
+        first = cache.get("project")
+        assert cache.get("project") is first
+
+        versions["project"] = 4
+        second = cache.get("project")
+        assert second is not first
+        assert cache.get("project") is second
+        assert loader.call_count == 2
+
+    def test_unknown_data_version_keeps_snapshot(self):
+        """Test that a failed version lookup falls back to the cached snapshot."""
+        cache = GraphSnapshotCache(lambda project: iter(ROWS), lambda project: None)
+        first = cache.get("project")
+
+        assert cache.get("project") is first
+
+
+class TestHandlerSnapshot:
+    """Tests for the snapshot wiring in Neo4jHandler."""
+
+    @pytest.fixture
+    def handler(self):
+        """Create a handler without a database connection."""
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler.get_tagged_edges = MagicMock(side_effect=lambda project, include_types=False: iter(ROWS))
+        handler.data_versions = {}
+        handler.get_data_version = MagicMock(side_effect=lambda project: handler.data_versions.get(project))
+        return handler
+
+    def test_snapshot_is_cached(self, handler):
+        """Test that the tag graph is loaded once per project."""
+        first = handler.get_graph_snapshot("project")
+
+        assert handler.get_graph_snapshot("project") is first
+        handler.get_tagged_edges.assert_called_once_with("project", include_types=True)
+
+    def test_entity_changes_invalidate(self, handler):
+        """Test that create/update/delete notifications drop the snapshot."""
+        first = handler.get_graph_snapshot("project")
+        other = handler.get_graph_snapshot("other")
+
+        handler._notify_change("people_updated", "project", ["a"])
+
+        assert handler.get_graph_snapshot("project") is not first
+        assert handler.get_graph_snapshot("other") is other
+
+    def test_field_setters_notify_change(self, handler):
+        """Test that field writes are reported for the person's project."""
+        handler.driver = MagicMock()
+        session = handler.driver.session.return_value.__enter__.return_value
+        session.run.return_value.single.return_value = {"safe_name": "project"}
+        handler._sync_identifier_keys = MagicMock()
+        listener = MagicMock()
+        handler.add_change_listener(listener)
+        first = handler.get_graph_snapshot("project")
+        other = handler.get_graph_snapshot("other")
+
+        handler.set_person_field("a", "core", "name", "Alice")
+        listener.assert_called_once_with("people_updated", "project", ["a"])
+        assert handler.get_graph_snapshot("project") is not first
+        assert handler.get_graph_snapshot("other") is other
+
+        handler.set_person_fields_batch("a", {"core": {"name": "Alicia"}})
+        assert listener.call_count == 2
+
+    def test_tag_field_setter_without_project_invalidates(self, handler):
+        """Test that tag writes drop all snapshots when the project is unknown."""
+        handler.driver = MagicMock()
+        session = handler.driver.session.return_value.__enter__.return_value
+        session.run.return_value.single.return_value = None
+        handler._sync_identifier_keys = MagicMock()
+        first = handler.get_graph_snapshot("project")
+
+        handler.set_person_field("a", "core", "name", "Alice")
+        assert handler.get_graph_snapshot("project") is first
+
+        handler.set_person_field("a", "Tagged People", "tagged_people", ["b"])
+        assert handler.get_graph_snapshot("project") is not first
+
+    def test_write_from_other_process_rebuilds(self, handler):
+        """Test that a data version bumped elsewhere drops the snapshot."""
+        handler.data_versions["project"] = 1
+        first = handler.get_graph_snapshot("project")
+        assert handler.get_graph_snapshot("project") is first
+
+        handler.data_versions["project"] = 2
+        assert handler.get_graph_snapshot("project") is not first
+
+    def test_report_change_invalidates_without_bump(self, handler):
+        """Test that reported writes reach snapshots and listeners only."""
+        handler._bump_data_version = MagicMock()
+        listener = MagicMock()
+        handler.add_change_listener(listener)
+        first = handler.get_graph_snapshot("project")
+
+        handler.report_change("people_updated", "project", ["a"], data_version=7)
+
+        assert handler.get_graph_snapshot("project") is not first
+        listener.assert_called_once_with("people_updated", "project", ["a"])
+        assert handler.get_notified_data_version("project") == 7
+        handler._bump_data_version.assert_not_called()
+
+    def test_data_version_reads_are_throttled(self, monkeypatch):
+        """Test that the stored version is re-read only after the check interval."""
+        import neo4j_handler
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler.driver = MagicMock()
+        session = handler.driver.session.return_value.__enter__.return_value
+        session.run.return_value.single.return_value = {"version": 1}
+
+        assert handler.get_data_version("project") == 1
+        assert handler.get_data_version("project") == 1
+        assert session.run.call_count == 1
+
+        # Reported writes are seen without a read
+        handler.report_change("people_updated", "project", ["a"], data_version=2)
+        assert handler.get_data_version("project") == 2
+        assert session.run.call_count == 1
+
+        monkeypatch.setattr(neo4j_handler, "DATA_VERSION_CHECK_INTERVAL", 0)
+        session.run.return_value.single.return_value = {"version": 5}
+        assert handler.get_data_version("project") == 5
+        assert session.run.call_count == 2
+
+
+class TestAsyncServiceReporting:
+    """Tests for change reporting from AsyncNeo4jService writes."""
+
+    @pytest.fixture
+    def reporter(self):
+        """Register a change reporter for the duration of a test."""
+        from api.services.neo4j_service import add_change_reporter, remove_change_reporter
+
+        reporter = MagicMock()
+        add_change_reporter(reporter)
+        yield reporter
+        remove_change_reporter(reporter)
+
+    @pytest.fixture
+    def service(self):
+        """Create a service with a mocked query runner."""
+        from api.services.neo4j_service import AsyncNeo4jService
+
+        service = AsyncNeo4jService()
+        service._execute_query = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_person_changes_are_reported_per_project(self, service, reporter):
+        """Test that changed people bump and report their projects."""
+        service._execute_query.return_value = [
+            {"safe_name": "one", "version": 4, "entity_ids": ["a", "b"]},
+            {"safe_name": "two", "version": 9, "entity_ids": ["c"]},
+        ]
+
+        await service.report_person_changes(["a", "b", "c", "a"])
+
+        query, params = service._execute_query.call_args.args
+        assert "data_version" in query
+        assert params == {"person_ids": ["a", "b", "c"]}
+        assert [c.args for c in reporter.call_args_list] == [
+            ("people_updated", "one", ["a", "b"], 4),
+            ("people_updated", "two", ["c"], 9),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failures_never_fail_the_write(self, service, reporter):
+        """Test that query and reporter errors are logged, not raised."""
+        service._execute_query.side_effect = RuntimeError("down")
+        await service.report_person_changes(["a"])
+        reporter.assert_not_called()
+
+        service._execute_query.side_effect = None
+        service._execute_query.return_value = [{"safe_name": "one", "version": 1, "entity_ids": ["a"]}]
+        reporter.side_effect = RuntimeError("listener")
+        await service.report_person_changes(["a"])
+        reporter.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_linking_merge_reports_both_entities(self, reporter):
+        """Test that merging entities reports the kept and discarded person."""
+        from api.services.linking_service import LinkingService
+
+        neo4j = AsyncMock()
+        neo4j.session = MagicMock()
+        session = AsyncMock()
+        neo4j.session.return_value.__aenter__.return_value = session
+        session.run.return_value.single.side_effect = [
+            {"id1": "a", "id2": "b"}, {"data_moved": 0}, None, {"relationships_moved": 0},
+        ]
+        service = LinkingService(neo4j, enable_notifications=False)
+        service._create_audit_trail = AsyncMock()
+
+        await service.merge_entities("a", "b", "a", reason="same person")
+
+        neo4j.report_person_changes.assert_awaited_once_with(["a", "b"])
+
+
+class TestGraphServiceSnapshot:
+    """Tests for GraphService reading edges from the snapshot."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a service whose node query returns bare records."""
+        from api.services.graph_service import GraphService
+
+        neo4j = MagicMock()
+        neo4j.get_graph_snapshot.return_value = GraphSnapshot.build("project", ROWS)
+        session = neo4j.driver.session.return_value.__enter__.return_value
+        session.run.side_effect = lambda query, project_safe_name, entity_ids: [
+            {"id": i, "created_at": None, "entity_type": None, "field_values": []}
+            for i in entity_ids
+        ]
+        return GraphService(neo4j)
+
+    def test_project_graph(self, service):
+        """Test edges from the snapshot and nodes in snapshot order."""
+        graph = service.get_project_graph("project", include_orphans=False)
+
+        assert [n["id"] for n in graph["nodes"]] == ["a", "b", "c"]
+        assert len(graph["edges"]) == 4
+
+    def test_subgraph_fetches_only_visited_nodes(self, service):
+        """Test that only the neighborhood's nodes are queried."""
+        service.neo4j.get_person.return_value = {"id": "b"}
+
+        graph = service.get_entity_subgraph("project", "b", depth=1)
+
+        assert [n["id"] for n in graph["nodes"]] == ["a", "b"]
+        assert {(e["source"], e["target"]) for e in graph["edges"]} == {("a", "b"), ("b", "a")}
+        session = service.neo4j.driver.session.return_value.__enter__.return_value
+        assert set(session.run.call_args.kwargs["entity_ids"]) == {"a", "b"}
+
+
+class TestVisualizationSnapshot:
+    """Tests for the visualization services reading the snapshot."""
+
+    @pytest.fixture
+    def neo4j(self):
+        """Create a handler mock that records the threads it is called on."""
+        neo4j = MagicMock()
+        neo4j.threads = []
+
+        def get_graph_snapshot(project):
+            neo4j.threads.append(threading.current_thread())
+            return GraphSnapshot.build(project, ROWS)
+
+        neo4j.get_graph_snapshot.side_effect = get_graph_snapshot
+        neo4j.get_people_batch.side_effect = lambda project, ids, **kwargs: {
+            i: {"id": i, "profile": {"core": {"name": [{"first_name": i.upper()}]}}} for i in ids
+        }
+        return neo4j
+
+    @pytest.mark.asyncio
+    async def test_project_graph_loads_label_sections_off_the_loop(self, neo4j):
+        """Test that nodes load only label sections in a worker thread."""
+        from api.services.graph_visualization import GRAPH_LABEL_SECTIONS, GraphVisualizationService
+
+        graph = await GraphVisualizationService(neo4j)._fetch_project_graph("project", include_orphans=False)
+
+        assert [n["label"] for n in graph["nodes"]] == ["A", "B", "C"]
+        assert neo4j.get_people_batch.call_args.kwargs["sections"] == list(GRAPH_LABEL_SECTIONS)
+        assert neo4j.threads and threading.main_thread() not in neo4j.threads
+
+    @pytest.mark.asyncio
+    async def test_similarity_graph_off_the_loop(self, neo4j):
+        """Test that the similarity service reads the snapshot in a worker thread."""
+        from api.services.similarity_service import SimilarityService
+
+        entity_ids, edges, adjacency = await SimilarityService(neo4j)._fetch_graph_data("project")
+
+        assert entity_ids == ["a", "b", "c", "d"]
+        assert adjacency["a"] == {"b", "c"}
+        assert threading.main_thread() not in neo4j.threads
+        neo4j.get_people_batch.assert_not_called()
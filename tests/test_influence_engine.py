@@ -0,0 +1,187 @@
+"""
+Tests for the in-process influence metrics engine.
+
+These tests cover:
+- PageRank, eigenvector and degree centrality with convergence tracking
+- Betweenness (shared sampled Brandes) and closeness centrality
+- NumPy and pure-Python power iterations giving the same scores
+- Rankings and caching of scores per graph snapshot
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.services import influence_engine
+from api.services.influence_engine import (
+    compute_betweenness,
+    compute_closeness,
+    compute_influence,
+    get_metric_scores,
+    get_project_influence,
+)
+from graph_snapshot import GraphSnapshot
+
+
+# A star around "hub" plus a path a - b - c and an isolated entity
+ROWS = [
+    ("hub", ["x", "y", "z"]),
+    ("x", ["hub"]),
+    ("y", []),
+    ("z", []),
+    ("a", ["b"]),
+    ("b", ["c"]),
+    ("c", []),
+    ("lonely", []),
+]
+
+
+@pytest.fixture
+def snapshot():
+    """Create a snapshot of the star and path graph."""
+    return GraphSnapshot.build("project", ROWS, version=4)
+
+
+def star(leaf_count):
+    """Create a snapshot of a single star."""
+    leaves = [f"leaf{i}" for i in range(leaf_count)]
+    return GraphSnapshot.build("project", [("center", leaves)] + [(leaf, []) for leaf in leaves])
+
+
+class TestSpectralMetrics:
+    """Tests for compute_influence."""
+
+    def test_pagerank_of_star(self):
+        """Test PageRank against the closed-form value for a star."""
+        scores = compute_influence(star(3))
+        pagerank = dict(zip(scores.entity_ids, scores.scores["pagerank"]))
+
+        # c = (1 - d) / n + d * (1 - c) with d = 0.85, n = 4
+        assert pagerank["center"] == pytest.approx(0.8875 / 1.85, abs=1e-5)
+        assert sum(pagerank.values()) == pytest.approx(1.0)
+
+    def test_convergence_is_tracked(self):
+        """Test that iterations stop early and are reported."""
+        scores = compute_influence(star(3), max_iterations=500)
+
+        assert scores.converged["pagerank"] and scores.converged["eigenvector"]
+        assert 1 < scores.iterations["pagerank"] < 500
+        assert 1 < scores.iterations["eigenvector"] < 500
+
+    def test_iteration_limit(self):
+        """Test that unconverged metrics report the iteration limit."""
+        scores = compute_influence(star(3), max_iterations=2)
+
+        assert scores.iterations["pagerank"] == 2
+        assert not scores.converged["pagerank"]
+
+    def test_dangling_entities_keep_rank(self, snapshot):
+        """Test that rank of isolated entities is spread, not lost."""
+        scores = compute_influence(snapshot)
+
+        assert sum(scores.scores["pagerank"]) == pytest.approx(1.0)
+
+    def test_eigenvector_and_degree(self, snapshot):
+        """Test eigenvector scaling and degree centrality."""
+        scores = compute_influence(snapshot)
+        index = {entity_id: i for i, entity_id in enumerate(scores.entity_ids)}
+
+        assert scores.scores["eigenvector"][index["hub"]] == 1.0
+        assert scores.scores["degree"][index["hub"]] == pytest.approx(3 / 7)
+        assert scores.scores["degree"][index["lonely"]] == 0.0
+        assert scores.degrees[index["b"]] == 2
+
+    def test_python_fallback_matches_numpy(self, snapshot):
+        """Test that both implementations compute the same scores."""
+        if not influence_engine.NUMPY_AVAILABLE:
+            pytest.skip("NumPy not installed")
+
+        vectorized = compute_influence(snapshot)
+        with patch.object(influence_engine, "NUMPY_AVAILABLE", False):
+            looped = compute_influence(snapshot)
+
+        for metric in ("pagerank", "eigenvector", "degree"):
+            assert looped.scores[metric] == pytest.approx(vectorized.scores[metric])
+        assert looped.iterations == vectorized.iterations
+
+    def test_empty_snapshot(self):
+        """Test a project without entities."""
+        scores = compute_influence(GraphSnapshot.build("project", []))
+
+        assert scores.entity_ids == []
+        assert scores.top("pagerank", 5) == []
+        assert scores.iterations["pagerank"] == 0
+
+
+class TestPathCentrality:
+    """Tests for compute_betweenness and compute_closeness."""
+
+    def test_betweenness_and_closeness(self, snapshot):
+        """Test exact Brandes betweenness and Wasserman-Faust closeness."""
+        betweenness_scores = compute_betweenness(snapshot)
+        betweenness = dict(zip(betweenness_scores.entity_ids, betweenness_scores.scores["betweenness"]))
+        closeness_scores = compute_closeness(snapshot)
+        closeness = dict(zip(closeness_scores.entity_ids, closeness_scores.scores["closeness"]))
+
+        # hub lies on the paths between the 3 leaf pairs, b on a - c
+        assert betweenness["hub"] == pytest.approx(3 / 21)
+        assert betweenness["b"] == pytest.approx(1 / 21)
+        assert betweenness["x"] == 0.0
+        assert betweenness_scores.iterations["betweenness"] == len(ROWS)
+        assert betweenness_scores.degrees == closeness_scores.degrees
+        assert closeness["b"] == pytest.approx(1.0 * 2 / 7)
+        assert closeness["a"] == pytest.approx(2 / 3 * 2 / 7)
+        assert closeness["lonely"] == 0.0
+
+    def test_betweenness_uses_shared_sampled_implementation(self, snapshot):
+        """Test that betweenness goes through GraphMetrics with sampling."""
+        with patch.object(
+            influence_engine.GraphMetrics, "compute_betweenness",
+            wraps=influence_engine.GraphMetrics.compute_betweenness
+        ) as shared:
+            scores = compute_betweenness(snapshot, samples=4)
+
+        assert shared.call_args.kwargs["samples"] == 4
+        assert scores.iterations["betweenness"] == 4
+
+
+class TestRankings:
+    """Tests for rankings and cached lookups."""
+
+    def test_top(self, snapshot):
+        """Test that rankings are ordered by score and reused."""
+        scores = compute_influence(snapshot)
+
+        top = scores.top("degree", 2)
+
+        assert [entity_id for entity_id, _ in top] == ["hub", "b"]
+        assert scores.ranking("degree") is scores.ranking("degree")
+        assert set(scores.metrics(0)) == {"pagerank", "eigenvector", "degree"}
+
+    def test_scores_are_cached_per_snapshot(self):
+        """Test that scores are computed once per snapshot and parameters."""
+        handler = MagicMock()
+        handler.get_graph_snapshot.return_value = GraphSnapshot.build("project", ROWS)
+
+        with patch.object(influence_engine, "compute_influence", wraps=compute_influence) as compute:
+            first = get_project_influence(handler, "project")
+            assert get_project_influence(handler, "project") is first
+            assert get_metric_scores(handler, "project", "eigenvector") is first
+            get_project_influence(handler, "project", damping_factor=0.5)
+            assert compute.call_count == 2
+
+            handler.get_graph_snapshot.return_value = GraphSnapshot.build("project", ROWS, version=1)
+            assert get_project_influence(handler, "project") is not first
+
+    def test_path_metrics_are_cached(self):
+        """Test that betweenness and closeness are cached separately."""
+        handler = MagicMock()
+        handler.get_graph_snapshot.return_value = GraphSnapshot.build("project", ROWS)
+
+        with patch.object(influence_engine, "compute_closeness", wraps=compute_closeness) as closeness:
+            betweenness = get_metric_scores(handler, "project", "betweenness")
+            assert get_metric_scores(handler, "project", "betweenness") is betweenness
+            closeness.assert_not_called()
+
+            assert get_metric_scores(handler, "project", "closeness") is not betweenness
+            assert get_metric_scores(handler, "project", "unknown") is None
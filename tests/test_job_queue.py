@@ -0,0 +1,323 @@
+"""
+Tests for the JobRunner queue backends.
+
+These tests cover:
+- The delayed job timing wheel
+- Priority ordering, delayed jobs and LRU limits of the in-memory queue
+- Claims, leases, acks and storage limits of the Redis queue
+- Runners sharing jobs through one Redis queue
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from api.services.job_queue import DelayedJobWheel, MemoryJobQueue, RedisJobQueue
+from api.services.job_runner import JobPriority, JobRunner, JobStatus, JobType
+
+
+def make_job(queue, job_id, status=JobStatus.PENDING):
+    """Store a job in a queue without enqueueing it."""
+    from api.services.job_runner import Job
+
+    job = Job(id=job_id, job_type=JobType.CUSTOM, status=status, created_at=datetime.now(timezone.utc))
+    queue.save_job(job)
+    return job
+
+
+@pytest.fixture
+def redis_client():
+    """Create an in-process Redis stand-in."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")  # Lua scripting support
+    return fakeredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def queue(request):
+    """Create each queue backend."""
+    if request.param == "memory":
+        return MemoryJobQueue()
+    return RedisJobQueue(client=request.getfixturevalue("redis_client"))
+
+
+class TestDelayedJobWheel:
+    """Tests for the delayed job timing wheel."""
+
+    def test_jobs_are_released_when_due(self):
+        """Test that jobs are released at, never before, their time."""
+        wheel = DelayedJobWheel(tick_seconds=1.0, slot_count=8, now=100.0)
+        wheel.add(102.5, "b")
+        wheel.add(101.0, "a")
+
+        assert wheel.next_deadline() == 101.0
+        assert wheel.advance(100.9) == []
+        assert wheel.advance(101.0) == ["a"]
+        assert wheel.advance(102.9) == []
+        assert wheel.next_deadline() == 103.0
+        assert wheel.advance(103.0) == ["b"]
+        assert len(wheel) == 0
+        assert wheel.next_deadline() is None
+
+    def test_jobs_beyond_one_revolution(self):
+        """Test that jobs sharing a slot wait for their own revolution."""
+        wheel = DelayedJobWheel(tick_seconds=1.0, slot_count=4, now=0.0)
+        wheel.add(2.0, "near")
+        wheel.add(6.0, "far")
+
+        assert wheel.advance(2.0) == ["near"]
+        assert wheel.next_deadline() == 6.0
+        assert wheel.advance(5.0) == []
+        assert wheel.advance(50.0) == ["far"]
+
+
+class TestQueueBackends:
+    """Tests shared by all queue backends."""
+
+    def test_claims_in_priority_order(self, queue):
+        """Test that jobs are claimed by rank, then due time."""
+        now = time.time()
+        queue.push("low", 3, now - 3)
+        queue.push("late", 1, now - 1)
+        queue.push("early", 1, now - 2)
+        queue.push("critical", 0, now)
+
+        claimed = [queue.claim(60) for _ in range(5)]
+
+        assert claimed == ["critical", "early", "late", "low", None]
+
+    def test_delayed_job(self, queue):
+        """Test that a future job is not claimed before it is due."""
+        queue.push("later", 0, time.time() + 0.15)
+
+        assert queue.claim(60) is None
+        assert queue.next_due() is not None
+        time.sleep(0.25)
+        assert queue.claim(60) == "later"
+
+    def test_push_replaces_and_remove_drops(self, queue):
+        """Test that re-pushing keeps one entry and removed jobs are not claimed."""
+        now = time.time()
+        queue.push("a", 2, now)
+        queue.push("a", 2, now)
+        queue.push("b", 2, now)
+        queue.remove("b")
+
+        assert queue.claim(60) == "a"
+        assert queue.claim(60) is None
+
+    def test_storage(self, queue):
+        """Test storing, listing and deleting jobs and results."""
+        from api.services.job_runner import JobResult
+
+        job = make_job(queue, "job-1")
+        make_job(queue, "job-2", JobStatus.COMPLETED)
+        queue.save_result(JobResult(job_id="job-2", status=JobStatus.COMPLETED, result={"rows": 1}))
+
+        assert queue.get_job("job-1") == job
+        assert queue.get_job("missing") is None
+        assert {j.id for j in queue.list_jobs()} == {"job-1", "job-2"}
+        assert queue.get_result("job-2").result == {"rows": 1}
+        assert queue.count_results() == 1
+
+        assert queue.delete_jobs(["job-2", "missing"]) == 1
+        assert queue.get_result("job-2") is None
+        assert queue.clear() == 1
+        assert queue.count_jobs() == 0
+
+    def test_status_filter_and_counts(self, queue):
+        """Test listing and counting jobs by status as they change."""
+        job = make_job(queue, "job-1")
+        make_job(queue, "job-2", JobStatus.FAILED)
+        job.status = JobStatus.COMPLETED
+        queue.save_job(job)
+
+        assert [j.id for j in queue.list_jobs("completed")] == ["job-1"]
+        assert queue.list_jobs("pending") == []
+        assert queue.count_jobs_by_status() == {"completed": 1, "failed": 1}
+
+        queue.delete_jobs(["job-1"])
+        assert queue.count_jobs_by_status() == {"failed": 1}
+
+
+class TestMemoryJobQueue:
+    """Tests for the in-memory queue."""
+
+    def test_only_finished_jobs_are_evicted(self):
+        """Test the LRU limit on stored jobs."""
+        queue = MemoryJobQueue(max_jobs=2)
+        make_job(queue, "pending")
+        make_job(queue, "done", JobStatus.COMPLETED)
+        make_job(queue, "new")
+
+        assert {j.id for j in queue.list_jobs()} == {"pending", "new"}
+
+
+class TestRedisJobQueue:
+    """Tests for leases of the Redis queue."""
+
+    def test_expired_lease_is_claimed_again(self, redis_client):
+        """Test that a job returns to the queue when its lease runs out."""
+        queue = RedisJobQueue(client=redis_client)
+        queue.push("job", 2, time.time())
+
+        assert queue.claim(0.05) == "job"
+        assert queue.claim(0.05) is None
+        time.sleep(0.1)
+        assert queue.claim(60) == "job"
+
+    def test_acked_and_renewed_leases_do_not_expire(self, redis_client):
+        """Test that acks and renewals keep a job from being claimed again."""
+        queue = RedisJobQueue(client=redis_client)
+        queue.push("acked", 2, time.time())
+        queue.push("renewed", 2, time.time())
+
+        assert queue.claim(0.05) == "acked"
+        assert queue.claim(0.05) == "renewed"
+        queue.ack("acked")
+        queue.extend_leases(["acked", "renewed"], 60)
+        time.sleep(0.1)
+
+        assert queue.claim(60) is None
+
+    def test_storage_is_bounded(self, redis_client):
+        """Test that the oldest finished jobs and results are dropped."""
+        from api.services.job_runner import JobResult
+
+        queue = RedisJobQueue(client=redis_client, max_jobs=2, max_results=1)
+        make_job(queue, "pending")
+        make_job(queue, "done", JobStatus.COMPLETED)
+        make_job(queue, "new", JobStatus.COMPLETED)
+        queue.save_result(JobResult(job_id="done", status=JobStatus.COMPLETED))
+        queue.save_result(JobResult(job_id="new", status=JobStatus.COMPLETED))
+
+        assert {j.id for j in queue.list_jobs()} == {"pending", "new"}
+        assert queue.count_jobs_by_status() == {"pending": 1, "completed": 1}
+        assert [r.job_id for r in queue.list_results()] == ["new"]
+
+    def test_prefixes_separate_queues(self, redis_client):
+        """Test that queues with different prefixes do not share jobs."""
+        RedisJobQueue(client=redis_client, prefix="a:").push("job", 2, time.time())
+
+        assert RedisJobQueue(client=redis_client, prefix="b:").claim(60) is None
+
+
+class TestSharedRunners:
+    """Tests for JobRunners sharing one Redis queue."""
+
+    @pytest.fixture
+    def make_runner(self, redis_client):
+        """Create runners connected to the same Redis server."""
+        def make_runner(**kwargs):
+            runner = JobRunner(queue_backend=RedisJobQueue(client=redis_client, poll_interval=0.02), **kwargs)
+
+            async def handler(job):
+                return {"ran_on": id(runner)}
+
+            runner.register_job_handler(JobType.CUSTOM, handler)
+            return runner
+
+        return make_runner
+
+    async def wait_for(self, condition, timeout=2.0):
+        """Wait until a condition holds."""
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not condition():
+            assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+            await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_job_enqueued_on_one_runner_runs_on_another(self, make_runner):
+        """Test that jobs are visible to and executed by other processes."""
+        api, worker = make_runner(), make_runner()
+        job = api.enqueue_job(JobType.CUSTOM, {}, priority=JobPriority.HIGH)
+
+        assert worker.get_job(job.id).status == JobStatus.PENDING
+
+        await worker.start_worker()
+        try:
+            await self.wait_for(lambda: api.get_job_status(job.id) == JobStatus.COMPLETED)
+        finally:
+            await worker.stop_worker()
+
+        assert api.get_job_result(job.id).result == {"ran_on": id(worker)}
+        assert api.get_job_stats().completed_count == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_calls_run_off_the_event_loop(self, make_runner):
+        """Test that the worker never calls Redis from the event loop thread."""
+        import threading
+
+        runner = make_runner()
+        loop_thread = threading.get_ident()
+        call_threads = set()
+        claim = runner._queue.claim
+
+        def recording_claim(lease_seconds):
+            call_threads.add(threading.get_ident())
+            return claim(lease_seconds)
+
+        runner._queue.claim = recording_claim
+        job = runner.enqueue_job(JobType.CUSTOM, {})
+
+        await runner.start_worker()
+        try:
+            await self.wait_for(lambda: runner.get_job_status(job.id) == JobStatus.COMPLETED)
+        finally:
+            await runner.stop_worker()
+
+        assert call_threads and loop_thread not in call_threads
+        assert runner.get_memory_stats()["jobs_capacity"] == runner._queue.max_jobs
+
+    @pytest.mark.asyncio
+    async def test_jobs_survive_restart(self, make_runner):
+        """Test that a new runner picks up jobs left by a stopped one."""
+        job = make_runner().enqueue_job(JobType.CUSTOM, {})
+
+        restarted = make_runner()
+        await restarted.start_worker()
+        try:
+            await self.wait_for(lambda: restarted.get_job_status(job.id) == JobStatus.COMPLETED)
+        finally:
+            await restarted.stop_worker()
+
+    @pytest.mark.asyncio
+    async def test_job_of_dead_worker_is_recovered(self, make_runner):
+        """Test that a running job whose lease expired is run again."""
+        crashed = make_runner()
+        job = crashed.enqueue_job(JobType.CUSTOM, {})
+        assert crashed._queue.claim(0.05) == job.id
+        stored = crashed.get_job(job.id)
+        stored.status = JobStatus.RUNNING
+        crashed._queue.save_job(stored)
+
+        survivor = make_runner()
+        await survivor.start_worker()
+        try:
+            await self.wait_for(lambda: survivor.get_job_status(job.id) == JobStatus.COMPLETED)
+        finally:
+            await survivor.stop_worker()
+
+    @pytest.mark.asyncio
+    async def test_cancel_from_another_runner(self, make_runner):
+        """Test that cancelling a job elsewhere stops its execution."""
+        api = make_runner()
+        worker = make_runner(lease_seconds=0.06)
+
+        async def slow(job):
+            await asyncio.sleep(10)
+
+        worker.register_job_handler(JobType.CUSTOM, slow)
+        job = api.enqueue_job(JobType.CUSTOM, {})
+
+        await worker.start_worker()
+        try:
+            await self.wait_for(lambda: worker.get_worker_status().running_job_ids == [job.id])
+            assert api.cancel_job(job.id) is True
+            await self.wait_for(lambda: not worker.get_worker_status().running_job_ids)
+        finally:
+            await worker.stop_worker()
+
+        assert api.get_job_status(job.id) == JobStatus.CANCELLED
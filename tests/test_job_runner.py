@@ -15,6 +15,7 @@ Comprehensive test coverage for:
 """
 
 import asyncio
+import threading
 import pytest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, AsyncMock, patch
@@ -852,6 +853,27 @@ class TestTimeoutHandling:
         assert result.status == JobStatus.FAILED
         assert "timed out" in result.error
 
+    @pytest.mark.asyncio
+    async def test_blocking_service_times_out(self):
+        """Test that a blocking report service runs off the loop and still times out."""
+        release = threading.Event()
+        scheduler = MagicMock()
+        scheduler.run_scheduled_report.side_effect = lambda schedule_id: release.wait(5) and b"report"
+        runner = JobRunner(report_scheduler=scheduler)
+        job = runner.enqueue_job(
+            job_type=JobType.REPORT,
+            payload={"schedule_id": "schedule-123"},
+            timeout_seconds=1
+        )
+
+        try:
+            result = await asyncio.wait_for(runner.execute_job(job.id), timeout=3)
+        finally:
+            release.set()
+
+        assert result.status == JobStatus.FAILED
+        assert "timed out" in result.error
+
 
 # ==================== Job Stats Tests ====================
 
@@ -963,6 +985,174 @@ class TestWorkerLifecycle:
         await runner.stop_worker()
 
 
+# ==================== Scheduling Tests ====================
+
+
+class TestScheduler:
+    """Tests for priority scheduling and concurrent execution."""
+
+    @pytest.fixture
+    def runner(self):
+        """Create a job runner that records the order jobs start in."""
+        runner = JobRunner(max_concurrent_jobs=1)
+        runner.started = []
+
+        async def handler(job):
+            runner.started.append(job.payload["name"])
+            await asyncio.sleep(job.payload.get("duration", 0))
+            return {}
+
+        runner._job_handlers[JobType.CUSTOM] = handler
+        return runner
+
+    async def wait_for(self, condition, timeout=2.0):
+        """Wait until a condition holds."""
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not condition():
+            assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+            await asyncio.sleep(0.005)
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_in_priority_order(self, runner):
+        """Test that higher priority jobs run first, equal ones in enqueue order."""
+        for name, priority in [("low", JobPriority.LOW), ("normal1", JobPriority.NORMAL),
+                               ("critical", JobPriority.CRITICAL), ("normal2", JobPriority.NORMAL)]:
+            runner.enqueue_job(JobType.CUSTOM, {"name": name}, priority=priority)
+
+        await runner.start_worker()
+        try:
+            await self.wait_for(lambda: len(runner.started) == 4)
+        finally:
+            await runner.stop_worker()
+
+        assert runner.started == ["critical", "normal1", "normal2", "low"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, runner):
+        """Test that at most max_concurrent_jobs jobs run at once."""
+        runner._max_concurrent_jobs = 2
+        running = []
+        peak = []
+
+        async def handler(job):
+            running.append(job.id)
+            peak.append(len(running))
+            await asyncio.sleep(0.05)
+            running.remove(job.id)
+
+        runner._job_handlers[JobType.CUSTOM] = handler
+        jobs = [runner.enqueue_job(JobType.CUSTOM, {"name": str(i)}) for i in range(5)]
+
+        await runner.start_worker()
+        try:
+            await self.wait_for(lambda: len(runner.get_worker_status().running_job_ids) == 2)
+            assert runner.get_worker_status().max_concurrent_jobs == 2
+            await self.wait_for(lambda: all(runner.get_job(j.id).status == JobStatus.COMPLETED for j in jobs))
+        finally:
+            await runner.stop_worker()
+
+        assert max(peak) == 2
+
+    @pytest.mark.asyncio
+    async def test_enqueue_wakes_idle_worker(self, runner):
+        """Test that an idle worker picks up a new job without polling."""
+        await runner.start_worker()
+        try:
+            await asyncio.sleep(0.01)
+            runner.enqueue_job(JobType.CUSTOM, {"name": "job"})
+            await asyncio.sleep(0.01)
+            assert runner.started == ["job"]
+        finally:
+            await runner.stop_worker()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_from_thread(self, runner):
+        """Test that jobs enqueued by threads wake the worker."""
+        await runner.start_worker()
+        try:
+            await asyncio.to_thread(runner.enqueue_job, JobType.CUSTOM, {"name": "job"})
+            await self.wait_for(lambda: runner.started == ["job"], timeout=0.5)
+        finally:
+            await runner.stop_worker()
+
+    @pytest.mark.asyncio
+    async def test_scheduled_job_waits_for_its_time(self, runner):
+        """Test that a job scheduled for the future runs once it is due."""
+        scheduled_for = datetime.now(timezone.utc) + timedelta(seconds=0.2)
+        job = runner.enqueue_job(JobType.CUSTOM, {"name": "later"}, scheduled_for=scheduled_for)
+        runner.enqueue_job(JobType.CUSTOM, {"name": "now"}, priority=JobPriority.LOW)
+
+        await runner.start_worker()
+        try:
+            await self.wait_for(lambda: runner.started == ["now"])
+            await self.wait_for(lambda: runner.started == ["now", "later"])
+        finally:
+            await runner.stop_worker()
+
+        assert runner.get_job(job.id).started_at >= scheduled_for
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_is_skipped(self, runner):
+        """Test that cancelled jobs are dropped from the queue."""
+        cancelled = runner.enqueue_job(JobType.CUSTOM, {"name": "cancelled"})
+        runner.enqueue_job(JobType.CUSTOM, {"name": "kept"})
+        runner.cancel_job(cancelled.id)
+
+        await runner.start_worker()
+        try:
+            await self.wait_for(lambda: runner.started == ["kept"])
+        finally:
+            await runner.stop_worker()
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_job(self, runner):
+        """Test that cancelling a running job stops its execution."""
+        job = runner.enqueue_job(JobType.CUSTOM, {"name": "slow", "duration": 10})
+
+        await runner.start_worker()
+        try:
+            await self.wait_for(lambda: runner.started == ["slow"])
+            assert runner.cancel_job(job.id) is True
+            await self.wait_for(lambda: not runner.get_worker_status().running_job_ids)
+        finally:
+            await runner.stop_worker()
+
+        assert runner.get_job(job.id).status == JobStatus.CANCELLED
+
+    @pytest.mark.asyncio
+    async def test_failed_jobs_are_requeued(self, runner):
+        """Test that automatic and manual retries run the job again."""
+        attempts = []
+
+        async def flaky(job):
+            attempts.append(job.retry_count)
+            raise RuntimeError("boom")
+
+        runner._job_handlers[JobType.CUSTOM] = flaky
+        job = runner.enqueue_job(JobType.CUSTOM, {"name": "flaky"}, max_retries=1)
+
+        await runner.start_worker()
+        try:
+            await self.wait_for(lambda: runner.get_job(job.id).status == JobStatus.FAILED)
+            assert attempts == [0, 1]
+
+            assert runner.retry_failed_job(job.id) is True
+            await self.wait_for(lambda: len(attempts) == 4)
+        finally:
+            await runner.stop_worker()
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_running_jobs(self, runner):
+        """Test that stopping the worker lets running jobs finish."""
+        job = runner.enqueue_job(JobType.CUSTOM, {"name": "job", "duration": 0.05})
+
+        await runner.start_worker()
+        await self.wait_for(lambda: runner.started == ["job"])
+        await runner.stop_worker()
+
+        assert runner.get_job(job.id).status == JobStatus.COMPLETED
+
+
 # ==================== Integration Hook Tests ====================
 
 
@@ -1038,7 +1228,7 @@ class TestUtilityMethods:
         count = runner.clear_all_jobs()
 
         assert count == 2
-        assert len(runner._jobs) == 0
+        assert runner.get_jobs_size() == 0
 
     def test_clear_completed_jobs(self, runner):
         """Test clearing old completed jobs."""
@@ -11,6 +11,7 @@ Tests for:
 
 import asyncio
 from datetime import datetime, timedelta, timezone
+from typing import Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -279,6 +280,162 @@ class TestQueryCacheService:
         assert result is None
 
 
+class TestQueryCacheIndexes:
+    """Test LRU order and indexed invalidation of the local cache."""
+
+    @pytest.fixture
+    def cache(self):
+        """Create a small cache for testing."""
+        from api.services.query_cache import CacheConfig, QueryCacheService
+
+        return QueryCacheService(config=CacheConfig(enabled=True), max_entries=3)
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_least_recently_used(self, cache):
+        """Test that reading an entry protects it from eviction."""
+        from api.services.query_cache import QueryType
+
+        for project in ("p1", "p2", "p3"):
+            await cache.set(value=project, query_type=QueryType.GRAPH_STRUCTURE, project_id=project)
+        await cache.get(QueryType.GRAPH_STRUCTURE, "p1")
+        await cache.set(value="p4", query_type=QueryType.GRAPH_STRUCTURE, project_id="p4")
+
+        assert await cache.get(QueryType.GRAPH_STRUCTURE, "p1") == "p1"
+        assert await cache.get(QueryType.GRAPH_STRUCTURE, "p2") is None
+        assert (await cache.get_stats()).evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_indexes_follow_evictions_and_replacements(self, cache):
+        """Test that invalidation counts only live entries."""
+        from api.services.query_cache import QueryType
+
+        await cache.set(value=1, query_type=QueryType.PATH_FINDING, project_id="p1", entity_ids=["e1"], source="a")
+        await cache.set(value=2, query_type=QueryType.PATH_FINDING, project_id="p1", entity_ids=["e1"], source="a")
+        await cache.set(value=3, query_type=QueryType.PATH_FINDING, project_id="p1", entity_ids=["e2"], source="b")
+
+        assert await cache.invalidate_entity("e1") == 1
+        assert await cache.invalidate_query_type(QueryType.PATH_FINDING) == 1
+        assert await cache.invalidate_project("p1") == 0
+        assert cache._project_keys == {} and cache._entity_keys == {} and cache._type_keys == {}
+
+    @pytest.mark.asyncio
+    async def test_cleanup_expired(self, cache):
+        """Test that only expired entries are cleaned up."""
+        from api.services.query_cache import QueryType
+
+        await cache.set(value=1, query_type=QueryType.SEARCH_RESULTS, project_id="p1", ttl_override=1)
+        await cache.set(value=2, query_type=QueryType.SEARCH_RESULTS, project_id="p2", ttl_override=60)
+        await asyncio.sleep(1.1)
+
+        assert await cache.cleanup_expired() == 1
+        assert await cache.get(QueryType.SEARCH_RESULTS, "p2") == 2
+
+    @pytest.mark.asyncio
+    async def test_result_computed_across_invalidation_is_dropped(self, cache):
+        """Test that set skips a result whose tags were invalidated meanwhile."""
+        from api.services.query_cache import QueryType
+
+        versions = await cache.get_versions(QueryType.PATH_FINDING, "p1", ["e1"])
+        await cache.invalidate_entity("e1")
+        await cache.set(value=1, query_type=QueryType.PATH_FINDING, project_id="p1",
+                        entity_ids=["e1"], versions=versions)
+        assert await cache.get(QueryType.PATH_FINDING, "p1") is None
+
+        versions = await cache.get_versions(QueryType.PATH_FINDING, "p1", ["e1"])
+        await cache.invalidate_project("p2")
+        await cache.set(value=2, query_type=QueryType.PATH_FINDING, project_id="p1",
+                        entity_ids=["e1"], versions=versions)
+        assert await cache.get(QueryType.PATH_FINDING, "p1") == 2
+
+
+def fake_redis_client():
+    """Create an async fakeredis client, skipping the test without fakeredis."""
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+
+class TestSharedQueryCache:
+    """Test the query cache on a shared Redis backend."""
+
+    @pytest.fixture
+    def backend(self):
+        """Create a RedisCache connected to a fake client."""
+        from api.services.cache_service import RedisCache
+
+        backend = RedisCache(prefix="basset:query:")
+        backend._client = fake_redis_client()
+        backend._connected = True
+        return backend
+
+    @pytest.fixture
+    def workers(self, backend):
+        """Create two cache services sharing the backend, like two workers."""
+        from api.services.query_cache import CacheConfig, QueryCacheService
+
+        config = CacheConfig(enabled=True)
+        return (
+            QueryCacheService(config=config, backend=backend),
+            QueryCacheService(config=config, backend=backend),
+        )
+
+    @pytest.mark.asyncio
+    async def test_results_are_shared(self, workers):
+        """Test that a result cached by one worker is a hit in another."""
+        from api.services.query_cache import QueryType
+
+        first, second = workers
+        await first.set(value={"score": 1}, query_type=QueryType.SIMILARITY_ANALYSIS, project_id="p1", top_k=5)
+
+        assert await second.get(QueryType.SIMILARITY_ANALYSIS, "p1", top_k=5) == {"score": 1}
+        assert await second.get(QueryType.SIMILARITY_ANALYSIS, "p1", top_k=10) is None
+        stats = await second.get_stats()
+        assert (stats.hits, stats.misses, stats.cache_size) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_invalidation_is_shared(self, workers):
+        """Test that invalidating in one worker removes results for all."""
+        from api.services.query_cache import QueryType
+
+        first, second = workers
+        await first.set(value=1, query_type=QueryType.PATH_FINDING, project_id="p1", entity_ids=["e1"])
+        await first.set(value=2, query_type=QueryType.GRAPH_STRUCTURE, project_id="p1")
+        await first.set(value=3, query_type=QueryType.GRAPH_STRUCTURE, project_id="p2")
+
+        assert await second.invalidate_entity("e1") == 1
+        assert await second.invalidate_project("p1") == 1
+        assert await first.get(QueryType.GRAPH_STRUCTURE, "p1") is None
+        assert await first.get(QueryType.GRAPH_STRUCTURE, "p2") == 3
+        assert await second.clear() >= 1
+        assert await first.get(QueryType.GRAPH_STRUCTURE, "p2") is None
+
+    @pytest.mark.asyncio
+    async def test_stale_result_is_not_shared(self, workers):
+        """Test that a result computed while another worker invalidated is dropped."""
+        from api.services.query_cache import QueryType
+
+        first, second = workers
+        versions = await first.get_versions(QueryType.GRAPH_STRUCTURE, "p1")
+        await second.invalidate_project("p1")
+        await first.set(value=1, query_type=QueryType.GRAPH_STRUCTURE, project_id="p1", versions=versions)
+        assert await second.get(QueryType.GRAPH_STRUCTURE, "p1") is None
+
+        versions = await first.get_versions(QueryType.GRAPH_STRUCTURE, "p1")
+        await first.set(value=2, query_type=QueryType.GRAPH_STRUCTURE, project_id="p1", versions=versions)
+        assert await second.get(QueryType.GRAPH_STRUCTURE, "p1") == 2
+        assert (await second.get_stats()).cache_size == 1
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_falls_back_to_local(self):
+        """Test that the shared initializer falls back to a local cache."""
+        from api.services.query_cache import initialize_shared_query_cache, reset_query_cache_service
+
+        with patch("api.services.cache_service.RedisCache.connect", AsyncMock(return_value=False)):
+            cache = await initialize_shared_query_cache("redis://unreachable:6379/0")
+
+        assert cache.backend is None
+        reset_query_cache_service()
+
+
 class TestCachedQueryDecorator:
     """Test the @cached_query decorator."""
 
@@ -317,6 +474,226 @@ class TestCachedQueryDecorator:
         # Cleanup
         reset_query_cache_service()
 
+    @pytest.mark.asyncio
+    async def test_excluded_params_are_not_in_key(self):
+        """Test that injected dependencies do not split the cache key."""
+        from api.services.query_cache import (
+            QueryType,
+            cached_query,
+            initialize_query_cache,
+            reset_query_cache_service,
+        )
+
+        cache = initialize_query_cache()
+
+        @cached_query(
+            QueryType.PATH_FINDING,
+            project_id_param="project",
+            entity_id_params=["entity_id"],
+            exclude_params=["neo4j_handler"],
+        )
+        async def find_path(project: str, entity_id: str, neo4j_handler=None) -> dict:
+            return neo4j_handler.find(entity_id)
+
+        first, second = MagicMock(), MagicMock()
+        first.find.return_value = {"path": ["a"]}
+
+        assert await find_path(project="p1", entity_id="a", neo4j_handler=first) == {"path": ["a"]}
+        assert await find_path(project="p1", entity_id="a", neo4j_handler=second) == {"path": ["a"]}
+        second.find.assert_not_called()
+
+        assert await cache.invalidate_entity("a") == 1
+        reset_query_cache_service()
+
+    @pytest.mark.asyncio
+    async def test_sync_function_runs_in_worker_thread(self):
+        """Test that sync functions are cached and run off the event loop."""
+        import threading
+
+        from api.services.query_cache import (
+            QueryType,
+            cached_query,
+            initialize_query_cache,
+            reset_query_cache_service,
+        )
+
+        threads = []
+
+        @cached_query(QueryType.INFLUENCE_METRICS, project_id_param="project")
+        def centrality(project: str) -> dict:
+            threads.append(threading.get_ident())
+            return {"project": project}
+
+        reset_query_cache_service()
+        assert await centrality(project="p1") == {"project": "p1"}
+
+        initialize_query_cache()
+        assert await centrality(project="p1") == {"project": "p1"}
+        assert await centrality(project="p1") == {"project": "p1"}
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+        reset_query_cache_service()
+
+    def test_fastapi_endpoint_with_shared_backend(self):
+        """Test a cached route whose response model round-trips through Redis."""
+        from fastapi import Depends, FastAPI
+        from fastapi.testclient import TestClient
+        from pydantic import BaseModel
+
+        from api.services.cache_service import RedisCache
+        from api.services.query_cache import (
+            QueryType,
+            cached_query,
+            initialize_query_cache,
+            reset_query_cache_service,
+        )
+
+        class Ranking(BaseModel):
+            entity_ids: list[str]
+            limit: int
+
+        calls = []
+        app = FastAPI()
+
+        def get_handler():
+            return object()
+
+        @app.get("/{project}/ranking", response_model=Ranking)
+        @cached_query(
+            QueryType.INFLUENCE_METRICS,
+            project_id_param="project",
+            exclude_params=["neo4j_handler"],
+        )
+        async def ranking(project: str, limit: int = 10, neo4j_handler=Depends(get_handler)):
+            calls.append(limit)
+            return Ranking(entity_ids=["a", "b"][:limit], limit=limit)
+
+        backend = RedisCache(prefix="basset:query:")
+        backend._client = fake_redis_client()
+        backend._connected = True
+        initialize_query_cache(backend=backend)
+
+        client = TestClient(app)
+        first = client.get("/p1/ranking", params={"limit": 1})
+        second = client.get("/p1/ranking", params={"limit": 1})
+        other = client.get("/p1/ranking", params={"limit": 2})
+
+        assert first.json() == second.json() == {"entity_ids": ["a"], "limit": 1}
+        assert other.json() == {"entity_ids": ["a", "b"], "limit": 2}
+        assert calls == [1, 2]
+        reset_query_cache_service()
+
+
+class TestQueryCacheChangeInvalidation:
+    """Test invalidating cached queries on Neo4jHandler writes."""
+
+    @pytest.fixture
+    def handler(self):
+        """Create a handler without a database connection."""
+        from neo4j_handler import Neo4jHandler
+
+        return Neo4jHandler.__new__(Neo4jHandler)
+
+    @pytest.fixture
+    def cache(self):
+        """Create a local query cache service."""
+        from api.services.query_cache import CacheConfig, QueryCacheService
+
+        return QueryCacheService(config=CacheConfig(enabled=True))
+
+    async def fill(self, cache):
+        """Cache one result in each of two projects."""
+        from api.services.query_cache import QueryType
+
+        await cache.set(value=1, query_type=QueryType.COMMUNITY_DETECTION, project_id="p1")
+        await cache.set(value=2, query_type=QueryType.COMMUNITY_DETECTION, project_id="p2")
+
+    @pytest.mark.asyncio
+    async def test_write_on_event_loop_invalidates_project(self, handler, cache):
+        """Test that a write from an async route drops the project's entries at once."""
+        from api.services.query_cache import QueryType
+
+        assert cache.enable_change_invalidation(handler)
+        await self.fill(cache)
+
+        handler._notify_change("people_updated", "p1", ["e1"])
+
+        assert await cache.get(QueryType.COMMUNITY_DETECTION, "p1") is None
+        assert await cache.get(QueryType.COMMUNITY_DETECTION, "p2") == 2
+        assert (await cache.get_stats()).invalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_write_from_worker_thread_invalidates_project(self, handler, cache):
+        """Test that a write from a threadpool route is applied on the loop."""
+        from api.services.query_cache import QueryType
+
+        cache.enable_change_invalidation(handler)
+        await self.fill(cache)
+
+        await asyncio.to_thread(handler._notify_change, "people_deleted", "p1", ["e1"])
+
+        assert await cache.get(QueryType.COMMUNITY_DETECTION, "p1") is None
+        assert await cache.get(QueryType.COMMUNITY_DETECTION, "p2") == 2
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_shared_backend(self, handler):
+        """Test that writes invalidate the project in the shared backend."""
+        from api.services.cache_service import RedisCache
+        from api.services.query_cache import CacheConfig, QueryCacheService, QueryType
+
+        backend = RedisCache(prefix="basset:query:")
+        backend._client = fake_redis_client()
+        backend._connected = True
+        cache = QueryCacheService(config=CacheConfig(enabled=True), backend=backend)
+        cache.enable_change_invalidation(handler)
+        await self.fill(cache)
+
+        handler._notify_change("project_deleted", "p1")
+        await asyncio.sleep(0)
+
+        assert await cache.get(QueryType.COMMUNITY_DETECTION, "p1") is None
+        assert await cache.get(QueryType.COMMUNITY_DETECTION, "p2") == 2
+
+    @pytest.mark.asyncio
+    async def test_write_from_other_process_invalidates_project(self, handler, cache):
+        """Test that entries computed before another process's write are dropped."""
+        from api.services.query_cache import QueryType
+
+        handler.get_data_version = MagicMock(return_value=1)
+        cache.enable_change_invalidation(handler)
+        await self.fill(cache)
+        assert await cache.get(QueryType.COMMUNITY_DETECTION, "p1") == 1
+
+        handler.get_data_version.side_effect = lambda project: 2 if project == "p1" else 1
+
+        assert await cache.get(QueryType.COMMUNITY_DETECTION, "p1") is None
+        assert await cache.get(QueryType.COMMUNITY_DETECTION, "p2") == 2
+
+    @pytest.mark.asyncio
+    async def test_write_from_other_process_invalidates_shared_backend(self, handler):
+        """Test that shared entries carry the data version they were computed from."""
+        from api.services.cache_service import RedisCache
+        from api.services.query_cache import CacheConfig, QueryCacheService, QueryType
+
+        backend = RedisCache(prefix="basset:query:")
+        backend._client = fake_redis_client()
+        backend._connected = True
+        cache = QueryCacheService(config=CacheConfig(enabled=True), backend=backend)
+        handler.get_data_version = MagicMock(return_value=1)
+        cache.enable_change_invalidation(handler)
+        await self.fill(cache)
+
+        handler.get_data_version.return_value = 2
+
+        assert await cache.get(QueryType.COMMUNITY_DETECTION, "p1") is None
+        await cache.set(value=3, query_type=QueryType.COMMUNITY_DETECTION, project_id="p1", data_version=2)
+        assert await cache.get(QueryType.COMMUNITY_DETECTION, "p1") == 3
+
+    def test_handler_without_change_events(self, cache):
+        """Test that handlers without change events are reported."""
+        assert cache.enable_change_invalidation(object()) is False
+
 
 # =============================================================================
 # RESULT STREAMING TESTS
@@ -632,6 +1009,23 @@ class TestNeo4jIndexes:
         assert "TAGGED" in source
 
 
+    def test_driver_pool_settings(self):
+        """Test that pool and fetch settings are passed to the driver."""
+        from neo4j_handler import Neo4jHandler
+
+        with patch("neo4j_handler.GraphDatabase") as graph_database, \
+                patch.object(Neo4jHandler, "ensure_constraints"):
+            Neo4jHandler(max_connection_pool_size=20, connection_acquisition_timeout=5.0, fetch_size=250)
+            Neo4jHandler()
+
+        first, second = graph_database.driver.call_args_list
+        assert first.kwargs["max_connection_pool_size"] == 20
+        assert first.kwargs["connection_acquisition_timeout"] == 5.0
+        assert first.kwargs["fetch_size"] == 250
+        assert "connection_timeout" not in first.kwargs
+        assert set(second.kwargs) == {"auth"}
+
+
 # =============================================================================
 # BATCH ORPHAN OPERATIONS TESTS
 # =============================================================================
@@ -665,3 +1059,217 @@ class TestBatchOrphanOperations:
         params = list(sig.parameters.keys())
         assert "project_id" in params
         assert "links" in params
+
+
+class TestPeopleUpsertBatch:
+    """Test the set-based people upsert used by bulk imports."""
+
+    @staticmethod
+    def _handler(upsert_records):
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler.driver = MagicMock()
+        handler.get_identifier_paths = MagicMock(return_value=[
+            {"path": "core.email", "section_id": "core", "field_id": "email", "field_type": "email"}
+        ])
+        session = handler.driver.session.return_value.__enter__.return_value
+        bump = MagicMock()
+        bump.single.return_value = {"version": 1}
+        session.run.side_effect = lambda query, **params: (
+            iter(upsert_records) if "MERGE (person:Person" in query
+            else bump if "data_version" in query else iter([])
+        )
+        return handler, session
+
+    def test_mixed_upsert_uses_fixed_queries(self):
+        """Test creates and updates share one MERGE and one field replacement."""
+        handler, session = self._handler([
+            {"id": "new", "created": True},
+            {"id": "old", "created": False},
+        ])
+        events = []
+        handler.add_change_listener(lambda event, project, ids: events.append((event, ids)))
+
+        outcome = handler.upsert_people_batch("proj", [
+            {"id": "new", "created_at": "2024-01-01", "profile": {"core": {"email": ["a@x.io"]}}},
+            {"id": "old", "label": "x", "profile": {"core": {"email": ["b@x.io"], "name": "B"}}},
+        ])
+
+        assert outcome == {"created": ["new"], "updated": ["old"]}
+        # Each reported event bumps the project's data version in the same session
+        queries = [c.args[0] for c in session.run.call_args_list if "data_version" not in c.args[0]]
+        assert len(queries) == 5
+
+        people = session.run.call_args_list[0].kwargs["people"]
+        assert people[0] == {"id": "new", "created_at": "2024-01-01", "properties": {}}
+        assert people[1]["properties"] == {"label": "x"}
+
+        # Only the updated person has stored values to replace
+        field_keys = session.run.call_args_list[1].kwargs["field_keys"]
+        assert {fk["person_id"] for fk in field_keys} == {"old"}
+        field_values = session.run.call_args_list[2].kwargs["field_values"]
+        assert {(fv["person_id"], fv["field_id"]) for fv in field_values} == {
+            ("new", "email"), ("old", "email"), ("old", "name")
+        }
+        key_rows = session.run.call_args_list[4].kwargs["key_rows"]
+        assert {(k["person_id"], k["value"]) for k in key_rows} == {("new", "a@x.io"), ("old", "b@x.io")}
+        assert events == [("people_created", ["new"]), ("people_updated", ["old"])]
+
+    def test_people_of_other_projects_are_skipped(self):
+        """Test rows filtered out by the MERGE query write no fields."""
+        handler, session = self._handler([])
+
+        outcome = handler.upsert_people_batch("proj", [{"id": "foreign", "profile": {"core": {"name": "X"}}}])
+
+        assert outcome == {"created": [], "updated": []}
+        assert session.run.call_count == 1
+
+    def test_get_person_projects(self):
+        """Test the existence check returns the owning project of each ID."""
+        handler, session = self._handler([])
+        session.run.side_effect = None
+        session.run.return_value = iter([{"id": "p1", "project_safe_name": "proj"}])
+
+        assert handler.get_person_projects(["p1", "p2"]) == {"p1": "proj"}
+        assert handler.get_person_projects([]) == {}
+        assert session.run.call_count == 1
+
+
+# =============================================================================
+# STREAMING PEOPLE TESTS
+# =============================================================================
+
+
+class TestStreamingPeople:
+    """Test streaming person retrieval from the driver cursor."""
+
+    @staticmethod
+    def _handler(records):
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler.driver = MagicMock()
+        session = handler.driver.session.return_value.__enter__.return_value
+        session.run.return_value = iter(records)
+        return handler, session
+
+    def test_iter_people_streams_hydrated_records(self):
+        """Test records are hydrated lazily with JSON values and files."""
+        records = [
+            {
+                "person": {"id": "p1"},
+                "field_values": [
+                    {"section_id": "core", "field_id": "name", "value": '[{"first_name": "Ann"}]'},
+                    {"section_id": None, "field_id": None, "value": None},
+                ],
+                "files": [{"file": {"id": "f1"}, "section_id": "media", "field_id": "photos"}],
+            },
+            {"person": {"id": "p2"}, "field_values": [], "files": [{"file": None}]},
+        ]
+        handler, session = self._handler(records)
+
+        people = handler.iter_people("proj", batch_size=50)
+        assert isinstance(people, Generator)
+        first = next(people)
+
+        assert first["profile"]["core"]["name"] == [{"first_name": "Ann"}]
+        assert first["profile"]["media"]["photos"] == [{"id": "f1"}]
+        assert next(people) == {"id": "p2", "profile": {}}
+        handler.driver.session.assert_called_once_with(fetch_size=50)
+
+    def test_iter_people_field_restriction(self):
+        """Test sections and section.field keys are passed as query filters."""
+        handler, session = self._handler([])
+
+        list(handler.iter_people("proj", fields=["Tagged People", "core.name"]))
+
+        params = session.run.call_args.kwargs
+        assert params["all_fields"] is False
+        assert params["sections"] == ["Tagged People"]
+        assert params["field_keys"] == ["core.name"]
+
+    def test_get_all_people_uses_stream(self):
+        """Test get_all_people loads every field through iter_people."""
+        handler, session = self._handler([{"person": {"id": "p1"}, "field_values": [], "files": []}])
+
+        assert handler.get_all_people("proj") == [{"id": "p1", "profile": {}}]
+        assert session.run.call_args.kwargs["all_fields"] is True
+
+    def test_get_people_batch_projection(self):
+        """Test batch retrieval pushes fields and sections into the query."""
+        handler, session = self._handler([
+            {
+                "person": {"id": "p1"},
+                "field_values": [{"section_id": "core", "field_id": "name", "value": '"Ann"'}],
+                "files": [],
+            }
+        ])
+
+        result = handler.get_people_batch("proj", ["p1"], fields=["core.name"], sections=["social"])
+
+        assert result == {"p1": {"id": "p1", "profile": {"core": {"name": "Ann"}}}}
+        params = session.run.call_args.kwargs
+        assert params["sections"] == ["social"]
+        assert params["field_keys"] == ["core.name"]
+        assert params["all_fields"] is False
+
+    def test_get_people_page_returns_cursor(self):
+        """Test a full page seeks past its last person on the next request."""
+        records = [
+            {"person": {"id": f"p{i}", "created_at": f"2024-01-0{9 - i}"}, "field_values": [], "files": []}
+            for i in range(3)
+        ]
+        handler, session = self._handler(records)
+
+        people, cursor = handler.get_people_page("proj", limit=2)
+
+        assert [p["id"] for p in people] == ["p0", "p1"]
+        assert session.run.call_args.kwargs["fetch_limit"] == 3
+        assert session.run.call_args.kwargs["after_id"] is None
+        first_query = session.run.call_args.args[0]
+        assert "SKIP" not in first_query
+        assert "$after_id" not in first_query
+
+        session.run.return_value = iter(records[2:])
+        people, next_cursor = handler.get_people_page("proj", cursor=cursor, limit=2)
+
+        assert [p["id"] for p in people] == ["p2"]
+        assert next_cursor is None
+        params = session.run.call_args.kwargs
+        assert (params["after_created_at"], params["after_id"]) == ("2024-01-08", "p1")
+        # A plain range on created_at the index can seek, with an id tiebreak
+        next_query = session.run.call_args.args[0]
+        assert "person.created_at <= $after_created_at" in next_query
+        assert "IS NULL" not in next_query
+
+    def test_get_people_page_after_person_without_created_at(self):
+        """Test paging on from a legacy person without created_at."""
+        handler, session = self._handler([])
+        cursor = handler._encode_people_cursor({"id": "p5", "created_at": None})
+
+        handler.get_people_page("proj", cursor=cursor, limit=2)
+
+        query = session.run.call_args.args[0]
+        assert "person.created_at IS NOT NULL OR person.id < $after_id" in query
+        assert session.run.call_args.kwargs["after_created_at"] is None
+
+    def test_get_people_page_invalid_cursor(self):
+        """Test that malformed cursors raise ValueError before querying."""
+        handler, session = self._handler([])
+
+        for cursor in ["not base64!", "W10", "WzEsMl0"]:
+            with pytest.raises(ValueError):
+                handler.get_people_page("proj", cursor=cursor)
+        session.run.assert_not_called()
+
+    def test_iter_people_pages(self):
+        """Test iterating every person across cursor pages."""
+        handler, _ = self._handler([])
+        pages = {None: ([{"id": "p1"}, {"id": "p2"}], "c1"), "c1": ([{"id": "p3"}], None)}
+        handler.get_people_page = MagicMock(side_effect=lambda project, cursor, **kwargs: pages[cursor])
+
+        people = list(handler.iter_people_pages("proj", page_size=2))
+
+        assert [p["id"] for p in people] == ["p1", "p2", "p3"]
+        assert handler.get_people_page.call_count == 2
@@ -16,6 +16,7 @@ Key Features:
 """
 
 import asyncio
+import random
 import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -713,6 +714,175 @@ class TestDeduplicationReport:
         assert report.project_id == "project-123"
 
 
+class TestDeduplicationBlocking:
+    """Tests for candidate blocking and parallel scoring in find_all_duplicates."""
+
+    @pytest.fixture
+    def entities(self):
+        return [
+            {"id": "b1", "profile": {"email": "john.doe@example.com", "phone": "555-1234"}},
+            {"id": "b2", "profile": {"email": "John.Doe@Example.com"}},
+            {"id": "b3", "profile": {"email": "john.doe@exampel.com"}},
+            {"id": "b4", "profile": {"email": "zed@unrelated.org", "phone": "555-1234"}},
+            {"id": "b5", "profile": {"email": "alice@wonder.land"}},
+            {"id": "b6", "profile": {"username": "quux"}},
+        ]
+
+    @staticmethod
+    def _pairs(all_duplicates):
+        return {
+            (entity_id, c.entity_id, round(c.confidence, 6))
+            for entity_id, candidates in all_duplicates.items()
+            for c in candidates
+        }
+
+    @pytest.mark.asyncio
+    async def test_blocking_matches_exhaustive_scan(self, entities):
+        """Blocking finds the same duplicates as comparing every pair."""
+        blocked = DeduplicationService(DeduplicationConfig())
+        exhaustive = DeduplicationService(DeduplicationConfig(blocking_enabled=False))
+
+        blocked_result, stats = await blocked.find_all_duplicates_with_stats("p", entities)
+        exhaustive_result, full_stats = await exhaustive.find_all_duplicates_with_stats("p", entities)
+
+        assert self._pairs(blocked_result) == self._pairs(exhaustive_result)
+        assert ("b1", "b2") in {(a, b) for a, b, _ in self._pairs(blocked_result)}
+        assert stats.total_pairs == 15
+        assert stats.pairs_considered < full_stats.pairs_considered == 15
+        assert stats.pairs_pruned == stats.total_pairs - stats.pairs_considered
+
+    @pytest.mark.asyncio
+    async def test_blocking_recall_with_repeated_values(self):
+        """Blocking finds every exhaustive pair when names and emails repeat."""
+        rng = random.Random(7)
+        first_names = ["Jane", "Janet", "John", "Jon", "Mary", "Marie", "Bob", "Robert"]
+        last_names = ["Dough", "Doe", "Smith", "Smyth", "Brown", "Browne"]
+        entities = []
+        for i in range(120):
+            first, last = rng.choice(first_names), rng.choice(last_names)
+            entities.append({"id": f"r{i}", "profile": {
+                "name": f"{first} {last}",
+                "email": f"{first.lower()}.{last.lower()}@{rng.choice(['example.com', 'mail.org'])}",
+            }})
+        config = {"identifier_fields": ["name", "email"]}
+
+        blocked, stats = await DeduplicationService(
+            DeduplicationConfig(**config)
+        ).find_all_duplicates_with_stats("p", entities)
+        exhaustive = await DeduplicationService(
+            DeduplicationConfig(blocking_enabled=False, **config)
+        ).find_all_duplicates("p", entities)
+
+        assert self._pairs(blocked) == self._pairs(exhaustive)
+        assert stats.pairs_pruned > 0
+
+    @pytest.mark.asyncio
+    async def test_window_spans_distinct_values(self):
+        """A value repeated more than the window size still meets its neighbor."""
+        entities = [{"id": f"w{i}", "profile": {"username": "jdough"}} for i in range(6)]
+        entities.append({"id": "near", "profile": {"username": "jdougha"}})
+        service = DeduplicationService(DeduplicationConfig(sorted_neighborhood_window=2))
+
+        result = await service.find_all_duplicates("p", entities, [MatchType.EXACT, MatchType.FUZZY])
+
+        assert {c.entity_id for c in result["w0"]} >= {"near"}
+
+    @pytest.mark.asyncio
+    async def test_parallel_scoring_matches_inline(self, entities):
+        """Process-pool scoring returns the same results as inline scoring."""
+        inline = DeduplicationService(DeduplicationConfig())
+        parallel = DeduplicationService(DeduplicationConfig(
+            parallel_min_pairs=1, scoring_chunk_size=2, scoring_workers=2,
+        ))
+
+        inline_result = await inline.find_all_duplicates("p", entities)
+        parallel_result = await parallel.find_all_duplicates("p", entities)
+
+        assert self._pairs(parallel_result) == self._pairs(inline_result)
+
+    @pytest.mark.asyncio
+    async def test_oversized_blocks_are_skipped(self):
+        """Blocks above max_block_size are counted and not expanded."""
+        entities = [{"id": f"s{i}", "profile": {"domain": "example.com"}} for i in range(5)]
+        service = DeduplicationService(DeduplicationConfig(
+            max_block_size=3, sorted_neighborhood_window=0,
+        ))
+
+        _, stats = await service.find_all_duplicates_with_stats("p", entities)
+
+        assert stats.oversized_blocks_skipped >= 1
+        assert stats.pairs_considered == 0
+
+    @pytest.mark.asyncio
+    async def test_report_includes_pair_counters(self, entities):
+        """Reports expose pairs considered vs pruned."""
+        report = await DeduplicationService().generate_report("p", entities)
+        data = report.to_dict()
+
+        assert data["pairs_considered"] + data["pairs_pruned"] == 15
+        assert data["pairs_pruned"] > 0
+
+
+class TestDeduplicationBatchScoring:
+    """Tests for column-wise batch scoring of candidate profiles."""
+
+    @pytest.fixture
+    def candidates(self):
+        return [
+            {"email": "john.doe@example.com", "phone": "555-1234"},
+            {"email": "John.Doe@Example.com"},
+            {"email": "jon.doe@example.com", "username": "jdoe"},
+            {"email": "zed@unrelated.org", "phone": ""},
+            {"username": "jhon_doe"},
+            {},
+        ]
+
+    @pytest.fixture
+    def query(self):
+        return {"email": "john.doe@example.com", "phone": "555-1234", "username": "john_doe"}
+
+    @staticmethod
+    def _summary(result):
+        return (
+            round(result["confidence"], 9),
+            result["reasons"],
+            [(m.field_id, m.match_type, round(m.similarity, 9), m.is_match) for m in result["matches"]],
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_pairwise(self, query, candidates):
+        """Batch scoring returns the same results as pairwise comparison."""
+        service = DeduplicationService()
+        match_types = list(MatchType)
+
+        batch = service.score_candidates_batch(query, candidates, match_types)
+        pairwise = [
+            await service._compare_entities(query, candidate, match_types)
+            for candidate in candidates
+        ]
+
+        assert [self._summary(r) for r in batch] == [self._summary(r) for r in pairwise]
+        assert batch[0]["confidence"] == 1.0
+        assert batch[-1]["matches"] == []
+
+    @pytest.mark.asyncio
+    async def test_batch_fallback_without_rapidfuzz(self, query, candidates):
+        """The pure-Python path produces identical results."""
+        service = DeduplicationService()
+        with_rapidfuzz = service.score_candidates_batch(query, candidates)
+
+        with patch("api.services.deduplication.RAPIDFUZZ_AVAILABLE", False):
+            without_rapidfuzz = service.score_candidates_batch(query, candidates)
+
+        assert [self._summary(r) for r in without_rapidfuzz] == [
+            self._summary(r) for r in with_rapidfuzz
+        ]
+
+    def test_batch_empty_candidates(self, query):
+        """Scoring against no candidates returns an empty list."""
+        assert DeduplicationService().score_candidates_batch(query, []) == []
+
+
 # ==================== Singleton Pattern Tests ====================
 
 
@@ -1000,3 +1000,243 @@ class TestSearchServiceMultiProject:
         # All results should be from project-1
         for result in results:
             assert result.project_id in ["project-1", "project_one"]
+
+
+class TestSearchServiceTextIndex:
+    """Tests for searching through the in-memory text index."""
+
+    PEOPLE = [
+        {
+            "id": "entity-1",
+            "created_at": "2024-01-15T10:30:00",
+            "profile": {
+                "core": {
+                    "name": [{"first_name": "John", "last_name": "Doe"}],
+                    "email": ["john.doe@example.com"],
+                },
+                "social": {"twitter": ["@jdoe"]},
+            },
+        },
+        {
+            "id": "entity-2",
+            "created_at": "2024-01-14T10:30:00",
+            "profile": {
+                "core": {
+                    "name": [{"first_name": "Jane", "last_name": "Johnson"}],
+                    "email": ["jane@corp.org"],
+                },
+            },
+        },
+        {
+            "id": "entity-3",
+            "created_at": "2024-01-13T10:30:00",
+            "profile": {
+                "core": {"name": ["Doe John"], "email": ["archived@example.com"]},
+            },
+        },
+    ]
+
+    @pytest.fixture
+    def mock_handler(self):
+        """Create a mock Neo4j handler for one project."""
+        handler = MagicMock()
+        handler.execute_query = MagicMock(side_effect=Exception("No full-text index"))
+        handler.get_all_projects = MagicMock(return_value=[
+            {"id": "project-1", "safe_name": "project_one", "name": "Project One"}
+        ])
+        handler.get_project = MagicMock(return_value={
+            "id": "project-1", "safe_name": "project_one", "name": "Project One"
+        })
+        handler.get_all_people = MagicMock(return_value=[dict(p) for p in self.PEOPLE])
+        handler.find_fulltext_candidates = MagicMock(return_value=None)
+        handler.get_people_count = MagicMock(return_value=len(self.PEOPLE))
+        return handler
+
+    @pytest.fixture
+    def search_service(self, mock_handler, mock_config):
+        """Create a SearchService with mocks."""
+        from api.services.search_service import SearchService
+        return SearchService(mock_handler, mock_config)
+
+    async def _search_both_ways(self, search_service, mock_handler, **kwargs):
+        """Run a query by scanning and then through the built text index."""
+        from api.services.search_service import SearchQuery
+
+        query = SearchQuery(project_id="project_one", limit=100, **kwargs)
+        scanned, _ = await search_service.search(query)
+
+        await search_service.build_search_index("project_one")
+        mock_handler.get_all_people.reset_mock()
+        indexed, _ = await search_service.search(query)
+        mock_handler.get_all_people.assert_not_called()
+
+        return scanned, indexed
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query_text", [
+        'john',
+        '"john doe"',
+        'doe AND NOT jane',
+        '(jane OR jdoe) AND example',
+        '*@corp.org',
+        'j?ne',
+        'NOT john',
+    ])
+    async def test_advanced_search_matches_scan(self, search_service, mock_handler, query_text):
+        scanned, indexed = await self._search_both_ways(
+            search_service, mock_handler, query=query_text, advanced=True
+        )
+
+        assert [r.to_dict() for r in indexed] == [r.to_dict() for r in scanned]
+
+    @pytest.mark.asyncio
+    async def test_property_search_matches_scan(self, search_service, mock_handler):
+        scanned, indexed = await self._search_both_ways(
+            search_service, mock_handler, query="example.com", fuzzy=False
+        )
+
+        assert {r.entity_id for r in indexed} == {"entity-1", "entity-3"}
+        assert [r.to_dict() for r in indexed] == [r.to_dict() for r in scanned]
+
+    @pytest.mark.asyncio
+    async def test_change_events_update_index(self, search_service, mock_handler):
+        from api.services.search_service import SearchQuery
+
+        await search_service.build_search_index("project_one")
+        mock_handler.get_people_batch = MagicMock(return_value={
+            "entity-4": {"id": "entity-4", "profile": {"core": {"name": ["Johnny Walker"]}}}
+        })
+
+        search_service._handle_entity_change("people_created", "project_one", ["entity-4"])
+        search_service._handle_entity_change("people_deleted", "project_one", ["entity-1"])
+
+        results, _ = await search_service.search(
+            SearchQuery(query="john", project_id="project_one", advanced=True)
+        )
+        assert {r.entity_id for r in results} == {"entity-2", "entity-3", "entity-4"}
+
+        search_service._handle_entity_change("project_deleted", "project_one", [])
+        assert search_service.get_text_index("project_one") is None
+
+    @pytest.mark.asyncio
+    async def test_field_setter_updates_index(self, search_service, mock_handler):
+        from api.services.search_service import SearchQuery
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler.driver = MagicMock()
+        session = handler.driver.session.return_value.__enter__.return_value
+        session.run.return_value.single.return_value = {"safe_name": "project_one"}
+        handler._sync_identifier_keys = MagicMock()
+        handler.add_change_listener(search_service._handle_entity_change)
+
+        await search_service.build_search_index("project_one")
+        mock_handler.get_people_batch = MagicMock(return_value={
+            "entity-2": {"id": "entity-2", "profile": {"core": {"email": ["linked@orphan.net"]}}}
+        })
+
+        handler.set_person_field("entity-2", "core", "email", ["linked@orphan.net"])
+
+        mock_handler.get_people_batch.assert_called_once_with("project_one", ["entity-2"])
+        results, _ = await search_service.search(
+            SearchQuery(query="orphan.net", project_id="project_one", fuzzy=False)
+        )
+        assert [r.entity_id for r in results] == ["entity-2"]
+
+    @pytest.mark.asyncio
+    async def test_data_version_tracks_changes(self, search_service, mock_handler):
+        """Own changes advance the index version; changes from elsewhere trigger a rebuild."""
+        mock_handler.get_data_version = MagicMock(return_value=4)
+        await search_service.build_search_index("project_one")
+        index = search_service.get_text_index("project_one")
+        assert index.data_version == 4
+
+        mock_handler.get_people_batch = MagicMock(return_value={})
+        mock_handler.get_notified_data_version = MagicMock(return_value=5)
+        mock_handler.get_data_version.return_value = 5
+        search_service._handle_entity_change("people_deleted", "project_one", ["entity-1"])
+        mock_handler.get_all_people.reset_mock()
+        assert search_service.get_text_index("project_one") is index
+        mock_handler.get_all_people.assert_not_called()
+
+        # Another worker wrote version 6
+        mock_handler.get_data_version.return_value = 6
+        rebuilt = search_service.get_text_index("project_one")
+        assert rebuilt is not index
+        assert rebuilt.data_version == 6
+        assert "entity-1" in rebuilt
+
+    def test_handler_bumps_data_version_and_logs_listener_failures(self, caplog):
+        from neo4j_handler import Neo4jHandler
+
+        handler = Neo4jHandler.__new__(Neo4jHandler)
+        handler.driver = MagicMock()
+        session = handler.driver.session.return_value.__enter__.return_value
+        session.run.return_value.single.return_value = {"safe_name": "project_one", "version": 3}
+        handler._sync_identifier_keys = MagicMock()
+        handler.add_change_listener(MagicMock(side_effect=RuntimeError("boom")))
+
+        with caplog.at_level("ERROR", logger="neo4j_handler"):
+            handler.set_person_field("entity-1", "core", "name", "Alice")
+
+        assert "SET project.data_version" in session.run.call_args.args[0]
+        assert handler.get_notified_data_version("project_one") == 3
+        assert "Change listener failed" in caplog.text and "boom" in caplog.text
+
+    def test_missed_change_clears_version(self, search_service, mock_handler):
+        from api.services.text_index import ProjectTextIndex
+
+        index = ProjectTextIndex("project_one")
+        index.data_version = 4
+        search_service._text_indexes["project_one"] = index
+        mock_handler.get_notified_data_version = MagicMock(return_value=7)
+
+        search_service._handle_entity_change("people_deleted", "project_one", ["entity-1"])
+
+        assert index.data_version is None
+
+    @pytest.mark.asyncio
+    async def test_snapshot_with_outdated_version_is_rebuilt(self, mock_handler, mock_config, tmp_path):
+        from api.services.search_service import SearchService
+
+        mock_handler.get_data_version = MagicMock(return_value=1)
+        service = SearchService(mock_handler, mock_config, snapshot_dir=str(tmp_path))
+        await service.build_search_index("project_one")
+        mock_handler.get_data_version.return_value = 2
+
+        restarted = SearchService(mock_handler, mock_config, snapshot_dir=str(tmp_path))
+        index = restarted.get_text_index("project_one")
+
+        assert index.data_version == 2
+        assert mock_handler.get_all_people.call_count == 2
+
+    def test_enable_incremental_indexing(self, search_service, mock_handler):
+        assert search_service.enable_incremental_indexing() is True
+        mock_handler.add_change_listener.assert_called_once_with(
+            search_service._handle_entity_change
+        )
+
+    @pytest.mark.asyncio
+    async def test_snapshot_restores_index(self, mock_handler, mock_config, tmp_path):
+        from api.services.search_service import SearchService
+
+        service = SearchService(mock_handler, mock_config, snapshot_dir=str(tmp_path))
+        await service.build_search_index("project_one")
+
+        restarted = SearchService(mock_handler, mock_config, snapshot_dir=str(tmp_path))
+        index = restarted.get_text_index("project_one")
+
+        assert index is not None
+        assert len(index) == len(self.PEOPLE)
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_is_discarded(self, mock_handler, mock_config, tmp_path):
+        from api.services.search_service import SearchService
+
+        service = SearchService(mock_handler, mock_config, snapshot_dir=str(tmp_path))
+        await service.build_search_index("project_one")
+        mock_handler.get_people_count.return_value = len(self.PEOPLE) + 1
+
+        restarted = SearchService(mock_handler, mock_config, snapshot_dir=str(tmp_path))
+
+        assert restarted.get_text_index("project_one") is None
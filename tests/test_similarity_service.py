@@ -0,0 +1,325 @@
+"""
+Tests for SimRank in the similarity service.
+
+These tests cover:
+- Sparse matrix SimRank against the pure Python computation
+- Monte Carlo estimates for single entities and selected pairs
+- Service methods using the whole project graph
+- Top-k similarity without scoring every pair
+"""
+
+import random
+from collections import defaultdict
+from unittest.mock import AsyncMock
+
+import pytest
+
+from api.services import similarity_service
+from api.services.similarity_service import (
+    SPARSE_AVAILABLE,
+    MinHashLSH,
+    SimilarityConfig,
+    SimilarityMethod,
+    SimilarityService,
+    SimRankCalculator,
+)
+
+
+requires_sparse = pytest.mark.skipif(not SPARSE_AVAILABLE, reason="numpy/scipy not installed")
+
+
+def make_graph(entity_count, edge_count, seed=3):
+    """Create a random undirected graph as entity IDs and adjacency."""
+    rng = random.Random(seed)
+    entity_ids = [f"e{i}" for i in range(entity_count)]
+    adjacency = defaultdict(set)
+    for _ in range(edge_count):
+        a, b = rng.sample(entity_ids, 2)
+        adjacency[a].add(b)
+        adjacency[b].add(a)
+    return entity_ids, adjacency
+
+
+@pytest.fixture
+def graph():
+    """Create a small graph with a neighbor outside the entity list."""
+    entity_ids, adjacency = make_graph(40, 80)
+    adjacency["outside"].add("e1")
+    adjacency["e2"].add("outside")
+    return entity_ids, adjacency
+
+
+@requires_sparse
+class TestSparseSimRank:
+    """Tests for the sparse matrix SimRank engine."""
+
+    def test_matrix_matches_python(self, graph):
+        """Test that the matrix formulation matches the dictionary loops."""
+        entity_ids, adjacency = graph
+        calculator = SimRankCalculator(iterations=5)
+
+        expected = calculator._compute_simrank_python(adjacency, entity_ids)
+        scores = calculator.compute_simrank(adjacency, entity_ids)
+
+        for pair, score in scores.items():
+            assert score == pytest.approx(expected.get(pair, 0.0), abs=1e-12)
+
+    def test_single_entity_matches_python(self, graph):
+        """Test exact single-entity scores against the dictionary loops."""
+        entity_ids, adjacency = graph
+        calculator = SimRankCalculator(iterations=4)
+
+        expected = calculator._compute_simrank_for_entity_python("e3", adjacency, entity_ids)
+        scores = calculator.compute_simrank_for_entity("e3", adjacency, entity_ids)
+
+        assert set(scores) == set(expected)
+        for entity_id, score in scores.items():
+            assert score == pytest.approx(expected[entity_id], abs=1e-12)
+
+    def test_monte_carlo_single_entity(self, graph):
+        """Test that random walk estimates are close to the exact scores."""
+        entity_ids, adjacency = graph
+        exact = SimRankCalculator(iterations=5).compute_simrank_for_entity("e3", adjacency, entity_ids)
+
+        estimator = SimRankCalculator(iterations=5, exact_limit=0, walks=4000)
+        estimated = estimator.compute_simrank_for_entity("e3", adjacency, entity_ids)
+
+        for entity_id, score in exact.items():
+            assert estimated[entity_id] == pytest.approx(score, abs=0.03)
+
+    def test_monte_carlo_is_deterministic(self, graph):
+        """Test that the seed makes estimates repeatable."""
+        entity_ids, adjacency = graph
+        estimator = SimRankCalculator(exact_limit=0, walks=100, seed=5)
+
+        first = estimator.compute_simrank_for_entity("e3", adjacency, entity_ids)
+        second = estimator.compute_simrank_for_entity("e3", adjacency, entity_ids)
+
+        assert first == second
+
+    def test_pairs(self, graph):
+        """Test scores for selected pairs, exact and estimated."""
+        entity_ids, adjacency = graph
+        pairs = [("e3", "e5"), ("e7", "e9"), ("e4", "e4"), ("missing", "e1")]
+        expected = SimRankCalculator()._compute_simrank_python(adjacency, entity_ids)
+
+        exact = SimRankCalculator().compute_simrank_pairs(adjacency, entity_ids, pairs)
+        estimated = SimRankCalculator(exact_limit=0, walks=4000).compute_simrank_pairs(
+            adjacency, entity_ids, pairs
+        )
+
+        assert exact[("e4", "e4")] == 1.0
+        assert estimated[("e4", "e4")] == 1.0
+        assert exact[("missing", "e1")] == 0.0
+        assert estimated[("missing", "e1")] == 0.0
+        for pair in pairs[:2]:
+            assert exact[pair] == pytest.approx(expected[pair], abs=1e-12)
+            assert estimated[pair] == pytest.approx(expected[pair], abs=0.03)
+
+    def test_entity_without_in_neighbors(self):
+        """Test that isolated entities have zero similarity."""
+        adjacency = {"a": {"b"}, "b": {"a"}}
+        calculator = SimRankCalculator(exact_limit=0, walks=50)
+
+        scores = calculator.compute_simrank_for_entity("c", adjacency, ["a", "b", "c"])
+
+        assert scores == {"a": 0.0, "b": 0.0}
+
+
+class TestSimRankFallback:
+    """Tests for SimRank without NumPy and SciPy."""
+
+    def test_pairs_without_sparse(self, graph, monkeypatch):
+        """Test that selected pairs fall back to the dictionary loops."""
+        entity_ids, adjacency = graph
+        monkeypatch.setattr(similarity_service, "SPARSE_AVAILABLE", False)
+        calculator = SimRankCalculator()
+
+        expected = calculator._compute_simrank_python(adjacency, entity_ids)
+        scores = calculator.compute_simrank_pairs(adjacency, entity_ids, [("e3", "e5")])
+
+        assert scores == {("e3", "e5"): expected[("e3", "e5")]}
+
+
+class TestSimilarityServiceSimRank:
+    """Tests for service methods using SimRank."""
+
+    @pytest.fixture
+    def service(self, graph):
+        """Create a service with a mocked project graph."""
+        entity_ids, adjacency = graph
+        service = SimilarityService()
+        service._fetch_graph_data = AsyncMock(return_value=(entity_ids, [], adjacency))
+        return service
+
+    @pytest.mark.asyncio
+    async def test_similarity_matrix_uses_whole_graph(self, service, graph):
+        """Test that a sub-matrix is computed over the whole project graph."""
+        entity_ids, adjacency = graph
+        config = SimilarityConfig(method=SimilarityMethod.SIMRANK)
+        expected = SimRankCalculator()._compute_simrank_python(adjacency, entity_ids)
+
+        matrix = await service.get_similarity_matrix("project", ["e3", "e5", "e7"], config)
+
+        assert matrix["e3"]["e3"] == 1.0
+        assert matrix["e3"]["e5"] == matrix["e5"]["e3"]
+        assert matrix["e3"]["e5"] == pytest.approx(expected[("e3", "e5")], abs=1e-12)
+
+    @pytest.mark.asyncio
+    async def test_pairwise_similarity(self, service, graph):
+        """Test SimRank for a single pair of entities."""
+        entity_ids, adjacency = graph
+        config = SimilarityConfig(method=SimilarityMethod.SIMRANK)
+        expected = SimRankCalculator()._compute_simrank_python(adjacency, entity_ids)
+
+        result = await service.compute_pairwise_similarity("project", "e7", "e9", config)
+
+        assert result.score == pytest.approx(expected[("e7", "e9")], abs=1e-12)
+
+
+class TestTopKSimilarity:
+    """Tests for pruned top-k similarity queries."""
+
+    @pytest.fixture
+    def edges(self, graph):
+        """Create typed edges matching the graph fixture."""
+        entity_ids, adjacency = graph
+        types = ["KNOWS", "WORKS_WITH"]
+        return [
+            {"source": a, "target": b, "type": types[len(a + b) % 2], "properties": {}}
+            for a in entity_ids
+            for b in sorted(adjacency.get(a, ()))
+            if a < b
+        ]
+
+    @pytest.fixture
+    def service(self, graph, edges):
+        """Create a service with a mocked project graph and edges."""
+        entity_ids, adjacency = graph
+        service = SimilarityService()
+        service._fetch_graph_data = AsyncMock(return_value=(entity_ids, edges, adjacency))
+        return service
+
+    def exhaustive(self, service, graph, edges, method, entity_id, config):
+        """Score every entity like the unpruned implementation."""
+        entity_ids, adjacency = graph
+        vectors = service.encoder.encode_all_entities(entity_ids, edges)
+        results = []
+        for other_id in entity_ids:
+            if other_id == entity_id:
+                continue
+            if method == SimilarityMethod.JACCARD:
+                result = service.compute_jaccard_similarity(entity_id, other_id, adjacency)
+            elif method == SimilarityMethod.COSINE:
+                result = service.compute_cosine_similarity(entity_id, other_id, vectors, adjacency)
+            else:
+                result = service.compute_common_neighbors_score(
+                    entity_id, other_id, adjacency, len(entity_ids)
+                )
+            if result.score >= config.threshold:
+                results.append(result)
+        results.sort(key=lambda r: r.score, reverse=True)
+        return [(r.entity2_id, pytest.approx(r.score)) for r in results[:config.top_n]]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", [
+        SimilarityMethod.JACCARD,
+        SimilarityMethod.COSINE,
+        SimilarityMethod.COMMON_NEIGHBORS,
+    ])
+    @pytest.mark.parametrize("threshold", [0.0, 0.3])
+    async def test_similar_entities_match_exhaustive(self, service, graph, edges, method, threshold):
+        """Test that pruned rankings equal scoring every entity."""
+        config = SimilarityConfig(method=method, threshold=threshold, top_n=15)
+
+        report = await service.find_similar_entities("project", "e3", config)
+
+        expected = self.exhaustive(service, graph, edges, method, "e3", config)
+        assert [(r.entity2_id, r.score) for r in report.similar_entities] == expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", [
+        SimilarityMethod.JACCARD,
+        SimilarityMethod.COSINE,
+        SimilarityMethod.COMMON_NEIGHBORS,
+        SimilarityMethod.SIMRANK,
+    ])
+    async def test_top_k_matrix_rows(self, service, method):
+        """Test that top-k rows hold the best entries of the full matrix."""
+        config = SimilarityConfig(method=method)
+        targets = [f"e{i}" for i in range(20)]
+
+        full = await service.get_similarity_matrix("project", targets, config)
+        top = await service.get_similarity_matrix("project", targets, config, top_k=3, min_score=0.01)
+
+        for entity_id in targets:
+            row = sorted(
+                (score for other, score in full[entity_id].items() if other != entity_id and score >= 0.01),
+                reverse=True
+            )
+            assert entity_id not in top[entity_id]
+            assert list(top[entity_id].values()) == pytest.approx(row[:3])
+
+    @pytest.mark.asyncio
+    async def test_potential_links_match_exhaustive(self, service, graph):
+        """Test that only pairs sharing a neighbor are suggested, best first."""
+        entity_ids, adjacency = graph
+
+        links = await service.find_potential_links("project", max_results=10)
+
+        scores = sorted(
+            (
+                service.algorithms.common_neighbors_score(adjacency[a], adjacency[b], len(entity_ids))
+                for i, a in enumerate(entity_ids)
+                for b in entity_ids[i + 1:]
+                if b not in adjacency[a] and adjacency[a] & adjacency[b]
+            ),
+            reverse=True
+        )
+        assert [link.score for link in links] == scores[:10]
+        for link in links:
+            assert link.entity2_id not in adjacency[link.entity1_id]
+
+    def test_cosine_fallback_matches_sparse(self, service, graph, edges, monkeypatch):
+        """Test that sparse and pure Python cosine rankings agree."""
+        if not SPARSE_AVAILABLE:
+            pytest.skip("numpy/scipy not installed")
+        entity_ids, _ = graph
+        vectors = service.encoder.encode_all_entities(entity_ids, edges)
+
+        expected = service._top_k_cosine(entity_ids[:10], entity_ids, vectors, 5)
+        monkeypatch.setattr(similarity_service, "SPARSE_AVAILABLE", False)
+        ranked = service._top_k_cosine(entity_ids[:10], entity_ids, vectors, 5)
+
+        for entity_id, row in expected.items():
+            assert [other for other, _ in ranked[entity_id]] == [other for other, _ in row]
+
+
+class TestMinHashLSH:
+    """Tests for MinHash LSH candidate generation."""
+
+    def test_similar_sets_share_buckets(self):
+        """Test that near-duplicate sets are candidates and disjoint ones are not."""
+        base = {f"n{i}" for i in range(20)}
+        sets = {
+            "a": base,
+            "b": base | {"extra"},
+            "c": {f"m{i}" for i in range(20)},
+            "empty": set(),
+        }
+
+        candidates = MinHashLSH().candidate_pairs(sets)
+
+        assert "b" in candidates["a"]
+        assert "c" not in candidates["a"]
+        assert "empty" not in candidates
+
+    def test_signature_is_deterministic(self):
+        """Test that signatures do not depend on the process hash seed."""
+        assert MinHashLSH().signature({"x", "y"}) == MinHashLSH().signature({"y", "x"})
+        assert MinHashLSH().signature(set()) is None
+
+    def test_bands_must_divide_permutations(self):
+        """Test that an invalid banding is rejected."""
+        with pytest.raises(ValueError):
+            MinHashLSH(num_perm=100, bands=64)
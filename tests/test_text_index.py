@@ -0,0 +1,151 @@
+"""
+Tests for the in-memory text index used by the search service.
+
+These tests cover:
+- Substring, phrase, wildcard and field-scoped term lookups
+- Incremental updates, removals and compaction
+- Snapshot round trips
+"""
+
+import pytest
+
+from api.services.text_index import (
+    MIN_COMPACTION_DELETES,
+    ProjectTextIndex,
+    iter_field_text,
+    tokenize,
+)
+
+
+def entity_ids(index, ordinals):
+    """Map candidate ordinals to entity IDs."""
+    return {entity_id for entity_id, _, _ in index.get_documents(ordinals)}
+
+
+@pytest.fixture
+def index():
+    """Create an index with a few entities."""
+    index = ProjectTextIndex("test_project")
+    index.add_document("e1", {
+        "core": {
+            "name": [{"first_name": "John", "last_name": "Doe"}],
+            "email": ["john.doe@example.com"],
+        },
+        "notes": {"text": "Met at the harbour cafe"},
+    })
+    index.add_document("e2", {
+        "core": {
+            "name": [{"first_name": "Jane", "last_name": "Johnson"}],
+            "email": ["jane@corp.org"],
+        },
+    })
+    index.add_document("e3", {
+        "core": {"name": ["Doe", "John"]},
+        "age": 42,
+    })
+    return index
+
+
+class TestTokenization:
+    """Tests for text tokenization and profile walking."""
+
+    def test_tokenize_splits_on_non_word_characters(self):
+        assert tokenize("John.Doe@Example_com") == ["john", "doe", "example", "com"]
+
+    def test_iter_field_text_paths(self):
+        pairs = list(iter_field_text(
+            {"name": [{"first_name": "John"}], "email": ["", "a@b.c"]},
+            "core"
+        ))
+
+        assert pairs == [("core.name.first_name", "John"), ("core.email", "a@b.c")]
+
+
+class TestTermLookup:
+    """Tests for ProjectTextIndex.match_term."""
+
+    def test_substring_inside_token(self, index):
+        assert entity_ids(index, index.match_term("ohn")) == {"e1", "e2", "e3"}
+
+    def test_short_run_scans_vocabulary(self, index):
+        assert entity_ids(index, index.match_term("rb")) == {"e1"}
+
+    def test_phrase_requires_consecutive_tokens(self, index):
+        assert entity_ids(index, index.match_term("john.doe@exa")) == {"e1"}
+        assert entity_ids(index, index.match_term("at the harbour")) == {"e1"}
+        assert index.match_term("harbour the") == set()
+
+    def test_phrase_does_not_span_values(self, index):
+        # e3 stores "Doe" and "John" as separate values of core.name
+        assert index.match_term("doe john") == set()
+
+    def test_field_scope(self, index):
+        assert entity_ids(index, index.match_term("john", field="core.email")) == {"e1"}
+        assert entity_ids(index, index.match_term("john", field="core.name")) == {"e1", "e2", "e3"}
+        assert index.match_term("john", field="core.unknown") == set()
+
+    def test_wildcard_terms(self, index):
+        assert entity_ids(index, index.match_term("*@corp.org", wildcard=True)) == {"e2"}
+        assert entity_ids(index, index.match_term("j?ne", wildcard=True)) == {"e2"}
+
+    def test_numbers_are_indexed(self, index):
+        assert entity_ids(index, index.match_term("42")) == {"e3"}
+
+    def test_term_without_words_is_unconstrained(self, index):
+        assert index.match_term("*") is None
+
+
+class TestIncrementalUpdates:
+    """Tests for adding, replacing and removing documents."""
+
+    def test_replace_document(self, index):
+        index.add_document("e2", {"core": {"name": ["Jane Smith"]}})
+
+        assert len(index) == 3
+        assert index.match_term("johnson") == set()
+        assert entity_ids(index, index.match_term("smith")) == {"e2"}
+
+    def test_remove_document(self, index):
+        assert index.remove_document("e1") is True
+        assert index.remove_document("e1") is False
+
+        assert "e1" not in index
+        assert entity_ids(index, index.match_term("john")) == {"e2", "e3"}
+        assert entity_ids(index, None) == {"e2", "e3"}
+
+    def test_compaction_keeps_live_documents(self):
+        index = ProjectTextIndex("test_project")
+        for i in range(MIN_COMPACTION_DELETES * 2):
+            index.add_document(f"e{i}", {"core": {"name": [f"Person {i}"]}})
+        for i in range(MIN_COMPACTION_DELETES):
+            index.remove_document(f"e{i}")
+
+        assert index._deleted == 0
+        assert len(index) == MIN_COMPACTION_DELETES
+        assert entity_ids(index, index.match_term("person 100")) == {"e100"}
+
+
+class TestSnapshots:
+    """Tests for saving and loading index snapshots."""
+
+    def test_snapshot_round_trip(self, index, tmp_path):
+        index.remove_document("e3")
+        path = str(tmp_path / "snapshots" / "test_project.json")
+
+        index.save(path)
+        restored = ProjectTextIndex.load(path)
+
+        assert restored.project_safe_name == "test_project"
+        assert len(restored) == 2
+        assert entity_ids(restored, restored.match_term("john doe")) == {"e1"}
+        assert entity_ids(restored, restored.match_term("jane", field="core.email")) == {"e2"}
+
+        restored.add_document("e4", {"core": {"name": ["Johnny"]}})
+        assert entity_ids(restored, restored.match_term("johnny")) == {"e4"}
+
+    def test_unsupported_snapshot_version(self, index):
+        data = index.to_dict()
+        data["version"] = -1
+
+        with pytest.raises(ValueError):
+            ProjectTextIndex.from_dict(data)